@@ -19,6 +19,8 @@ from tink import _keyset_reader
 from tink import _keyset_writer
 from tink import _kms_clients
 from tink import _proto_keyset_format as proto_keyset_format
+from tink import _raw_key_order
+from tink import _ttl_cache
 from tink import core
 
 new_keyset_handle = _keyset_handle.new_keyset_handle
@@ -43,6 +45,12 @@ has_secret_key_access = _keyset_handle.has_secret_key_access
 
 KmsClient = _kms_clients.KmsClient
 
+RawKeyOrderStats = _raw_key_order.RawKeyOrderStats
+raw_key_order_stats = _raw_key_order.stats
+with_adaptive_raw_key_order = _raw_key_order.with_adaptive_raw_key_order
+
+CacheStats = _ttl_cache.CacheStats
+
 # Deprecated. It is preferable to not register KMS clients. Instead, get the
 # KMS AEAD with kms_aead = client.get_aead(key_uri) and then use it to encrypt
 # a keyset with KeysetHandle.write, or to create an envelope AEAD using
@@ -0,0 +1,309 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers for the batch APIs of the primitives.
+
+Besides sequences of bytes-like objects, some batch APIs accept and return a
+flat layout, in which all items are stored back to back in a single buffer.
+Item i is data[offsets[i]:offsets[i + 1]], where offsets is a sequence of
+len(items) + 1 int64 values. This is the layout of Apache Arrow's LargeBinary
+arrays, so columns can be passed without creating a bytes object per item.
+"""
+
+import array
+import collections
+import itertools
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from tink.core import _crypto_format
+from tink.core import _tink_error
+
+# Decrypts a batch with one primitive: called with the primitive, the
+# ciphertexts and the associated data, it returns the results of the items.
+DecryptMany = Callable[
+    [Any, List[memoryview], List[Any]],
+    List[Union[bytes, _tink_error.TinkError]],
+]
+
+_INT64_FORMATS = frozenset(['q', 'l'])
+
+
+def check_same_length(inputs: Sequence[Any],
+                      associated_datas: Sequence[Any]) -> None:
+  """Raises ValueError if the two sequences have different lengths."""
+  if len(inputs) != len(associated_datas):
+    raise ValueError(
+        'Expected {} associated data items, got {}'.format(
+            len(inputs), len(associated_datas)))
+
+
+def to_batch_results(
+    results: List[Union[bytes, str]],
+) -> List[Union[bytes, _tink_error.TinkError]]:
+  """Converts the results of a C++ batch function to those of a batch API.
+
+  The C++ batch functions return the error message of failed items as str.
+  """
+  return [
+      r if isinstance(r, bytes) else _tink_error.TinkError(r) for r in results
+  ]
+
+
+def to_offsets(offsets: Any) -> memoryview:
+  """Returns offsets as a one-dimensional memoryview of int64.
+
+  Args:
+    offsets: a buffer of int64 values, for example an array.array('q') or a
+      NumPy int64 array, or a sequence of ints, which is copied.
+  Returns:
+    a memoryview of offsets with format 'q'.
+  Raises:
+    ValueError if offsets is a buffer of another type, or is empty.
+  """
+  try:
+    view = memoryview(offsets)
+  except TypeError:
+    view = memoryview(array.array('q', offsets))
+  if (
+      view.ndim != 1
+      or view.itemsize != 8
+      or view.format.lstrip('@=') not in _INT64_FORMATS
+  ):
+    raise ValueError('offsets must be a one-dimensional array of int64')
+  if not view:
+    raise ValueError('offsets must contain at least one value')
+  return view.cast('B').cast('q')
+
+
+def split(data: Any, offsets: memoryview) -> List[memoryview]:
+  """Returns the items of a flat batch as views into data."""
+  data_view = memoryview(data).cast('B')
+  if any(start > end for start, end in zip(offsets, offsets[1:])):
+    raise ValueError('offsets must be non-decreasing')
+  if offsets[0] < 0 or offsets[-1] > len(data_view):
+    raise ValueError('offsets are out of the bounds of data')
+  return [data_view[start:end] for start, end in zip(offsets, offsets[1:])]
+
+
+def join(items: Sequence[bytes]) -> Tuple[bytes, memoryview]:
+  """Returns the flat layout (data, offsets) of items."""
+  offsets = array.array('q', [0])
+  offsets.extend(itertools.accumulate(len(item) for item in items))
+  return b''.join(items), memoryview(offsets)
+
+
+def equal_size_offsets(values: Any, count: int) -> Optional[memoryview]:
+  """Returns the offsets of count items of the same size stored in values.
+
+  Args:
+    values: either a sequence of items, or a buffer that holds count items of
+      the same size back to back, for example the MACs returned by
+      compute_mac_many.
+    count: the number of items.
+  Returns:
+    None if values is not a buffer, and otherwise int64 offsets that split it
+    into count items of the same size.
+  Raises:
+    ValueError if values cannot be split into count items of the same size.
+  """
+  try:
+    size = memoryview(values).nbytes
+  except TypeError:
+    return None
+  if count == 0:
+    if size:
+      raise ValueError('Expected an empty buffer for an empty batch')
+    return memoryview(array.array('q', [0]))
+  if size % count:
+    raise ValueError(
+        'A buffer of {} bytes cannot hold {} items of the same size'.format(
+            size, count))
+  return memoryview(array.array('q', range(0, size + 1, size // count)))
+
+
+def _decrypt_with_entries(
+    entries: Sequence[Any],
+    ciphertexts: List[memoryview],
+    indices: List[int],
+    associated_datas: Sequence[Any],
+    results: List[Union[bytes, _tink_error.TinkError, None]],
+    decrypt_many: DecryptMany,
+    decryption_monitor: Optional[Any],
+    raw_key_order: Optional[Any] = None,
+) -> None:
+  """Tries the entries in order on ciphertexts and fills in results.
+
+  ciphertexts[j] is the ciphertext of item indices[j] of the batch, with
+  the output prefix removed. Items that no entry can decrypt are left as
+  None in results. If raw_key_order is set, it is told the outcome of each
+  item, as if the item had been decrypted on its own.
+  """
+  for failed_attempts, entry in enumerate(entries):
+    if not indices:
+      return
+    batch_results = decrypt_many(
+        entry.primitive, ciphertexts, [associated_datas[i] for i in indices]
+    )
+    failed_ciphertexts = []
+    failed_indices = []
+    for ciphertext, i, result in zip(ciphertexts, indices, batch_results):
+      if isinstance(result, _tink_error.TinkError):
+        failed_ciphertexts.append(ciphertext)
+        failed_indices.append(i)
+        continue
+      results[i] = result
+      if raw_key_order:
+        raw_key_order.record_success(entry, failed_attempts)
+      if decryption_monitor:
+        decryption_monitor.log(entry.key_id, len(ciphertext))
+    ciphertexts = failed_ciphertexts
+    indices = failed_indices
+  if raw_key_order:
+    for _ in indices:
+      raw_key_order.record_failure(len(entries))
+
+
+def decrypt_one_with_primitive_set(
+    primitive_set: Any,
+    raw_entries: Sequence[Any],
+    raw_key_order: Optional[Any],
+    ciphertext: Any,
+    decrypt: Callable[[Any, Any], Any],
+    decryption_monitor: Optional[Any] = None,
+) -> Any:
+  """Decrypts a single ciphertext with the keys of a primitive set.
+
+  The keys with the output prefix of the ciphertext are tried first, then the
+  RAW keys.
+
+  Args:
+    primitive_set: the core.PrimitiveSet of the keyset.
+    raw_entries: the entries of the RAW keys, in the order they are tried.
+    raw_key_order: if set, the RawKeyOrder which is told which RAW key
+      succeeded.
+    ciphertext: the bytes-like ciphertext.
+    decrypt: decrypts the ciphertext, without its output prefix, with the
+      primitive of an entry and returns the result. RAW keys get ciphertext
+      itself, the other keys a memoryview.
+    decryption_monitor: if set, the KeyUsageMonitor which logs the key that
+      decrypted, or the failure.
+  Returns:
+    the result of the first successful call of decrypt.
+  Raises:
+    tink.TinkError if no key can decrypt the ciphertext.
+  """
+  ciphertext_view = memoryview(ciphertext).cast('B')
+  prefix_size = _crypto_format.NON_RAW_PREFIX_SIZE
+  if len(ciphertext_view) > prefix_size:
+    prefix = bytes(ciphertext_view[:prefix_size])
+    ciphertext_no_prefix = ciphertext_view[prefix_size:]
+    for entry in primitive_set.primitive_from_identifier(prefix):
+      try:
+        result = decrypt(entry.primitive, ciphertext_no_prefix)
+        if decryption_monitor:
+          decryption_monitor.log(entry.key_id, len(ciphertext_no_prefix))
+        return result
+      except _tink_error.TinkError:
+        pass
+  # Let's try all RAW keys.
+  for failed_attempts, entry in enumerate(raw_entries):
+    try:
+      result = decrypt(entry.primitive, ciphertext)
+      if raw_key_order:
+        raw_key_order.record_success(entry, failed_attempts)
+      if decryption_monitor:
+        decryption_monitor.log(entry.key_id, len(ciphertext_view))
+      return result
+    except _tink_error.TinkError:
+      pass
+  if raw_key_order:
+    raw_key_order.record_failure(len(raw_entries))
+
+  # nothing works.
+  if decryption_monitor:
+    decryption_monitor.log_failure()
+  raise _tink_error.TinkError('Decryption failed.')
+
+
+def decrypt_with_primitive_set(
+    primitive_set: Any,
+    raw_entries: Sequence[Any],
+    ciphertexts: Sequence[Any],
+    associated_datas: Sequence[Any],
+    decrypt_many: DecryptMany,
+    decryption_monitor: Optional[Any] = None,
+    raw_key_order: Optional[Any] = None,
+) -> List[Union[bytes, _tink_error.TinkError]]:
+  """Decrypts a batch with the keys of a primitive set, like a wrapper does.
+
+  Ciphertexts are grouped by their output prefix, so that each candidate key
+  decrypts all of its ciphertexts in a single batch. The items that no key
+  with their prefix decrypts are then tried with the RAW keys.
+
+  Args:
+    primitive_set: the core.PrimitiveSet of the keyset.
+    raw_entries: the entries of the RAW keys, in the order they are tried.
+    ciphertexts: a sequence of bytes-like objects to be decrypted.
+    associated_datas: a sequence of the same length with the associated data
+      for each ciphertext.
+    decrypt_many: decrypts a batch with the primitive of an entry.
+    decryption_monitor: if set, the KeyUsageMonitor which logs the key of
+      every decryption, and every failure.
+    raw_key_order: if set, the RawKeyOrder which is told which RAW key
+      decrypted each item that was tried with the RAW keys.
+  Returns:
+    a list that contains, for each ciphertext, either the plaintext as bytes
+    or a tink.TinkError.
+  Raises:
+    ValueError if ciphertexts and associated_datas have different lengths.
+  """
+  check_same_length(ciphertexts, associated_datas)
+  results: List[Union[bytes, _tink_error.TinkError, None]] = [None] * len(
+      ciphertexts
+  )
+  prefix_size = _crypto_format.NON_RAW_PREFIX_SIZE
+  views = [memoryview(c).cast('B') for c in ciphertexts]
+  by_prefix: Dict[bytes, List[int]] = collections.defaultdict(list)
+  for i, view in enumerate(views):
+    if len(view) > prefix_size:
+      by_prefix[bytes(view[:prefix_size])].append(i)
+  for prefix, indices in by_prefix.items():
+    _decrypt_with_entries(
+        primitive_set.primitive_from_identifier(prefix),
+        [views[i][prefix_size:] for i in indices],
+        indices,
+        associated_datas,
+        results,
+        decrypt_many,
+        decryption_monitor,
+    )
+  # Let's try all RAW keys on what is left.
+  pending = [i for i, result in enumerate(results) if result is None]
+  _decrypt_with_entries(
+      raw_entries,
+      [views[i] for i in pending],
+      pending,
+      associated_datas,
+      results,
+      decrypt_many,
+      decryption_monitor,
+      raw_key_order,
+  )
+
+  for i, result in enumerate(results):
+    if result is None:
+      if decryption_monitor:
+        decryption_monitor.log_failure()
+      results[i] = _tink_error.TinkError('Decryption failed.')
+  return results
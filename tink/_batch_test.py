@@ -0,0 +1,221 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for tink.python.tink._batch."""
+
+import array
+import collections
+from unittest import mock
+
+from absl.testing import absltest
+
+from tink import _batch
+from tink.core import _tink_error
+
+
+_Entry = collections.namedtuple('_Entry', ['primitive', 'key_id'])
+
+
+class _FakeDecrypter:
+  """Decrypts the ciphertexts that start with its tag."""
+
+  def __init__(self, tag: bytes):
+    self._tag = tag
+    self.batch_sizes = []
+
+  def decrypt(self, ciphertext, associated_data):
+    ciphertext = bytes(ciphertext)
+    if not ciphertext.startswith(self._tag):
+      raise _tink_error.TinkError('wrong key')
+    return ciphertext[len(self._tag):] + associated_data
+
+  def decrypt_many(self, ciphertexts, associated_datas):
+    self.batch_sizes.append(len(ciphertexts))
+    results = []
+    for ciphertext, associated_data in zip(ciphertexts, associated_datas):
+      try:
+        results.append(self.decrypt(ciphertext, associated_data))
+      except _tink_error.TinkError as e:
+        results.append(e)
+    return results
+
+
+class _FakePrimitiveSet:
+
+  def __init__(self, entries_by_prefix):
+    self._entries_by_prefix = entries_by_prefix
+
+  def primitive_from_identifier(self, identifier):
+    return self._entries_by_prefix.get(identifier, [])
+
+
+class BatchTest(absltest.TestCase):
+
+  def test_check_same_length(self):
+    _batch.check_same_length([b'a', b'b'], [b'', b''])
+    with self.assertRaises(ValueError):
+      _batch.check_same_length([b'a', b'b'], [b''])
+
+  def test_to_batch_results(self):
+    results = _batch.to_batch_results([b'a', 'error', b''])
+    self.assertEqual(results[0], b'a')
+    self.assertIsInstance(results[1], _tink_error.TinkError)
+    self.assertEqual(str(results[1]), 'error')
+    self.assertEqual(results[2], b'')
+
+  def test_to_offsets(self):
+    self.assertEqual(
+        _batch.to_offsets(array.array('q', [0, 2, 5])).tolist(), [0, 2, 5]
+    )
+    self.assertEqual(_batch.to_offsets([0, 2, 5]).tolist(), [0, 2, 5])
+    self.assertEqual(_batch.to_offsets([0, 2, 5]).format, 'q')
+
+  def test_to_offsets_invalid_fails(self):
+    with self.assertRaises(ValueError):
+      _batch.to_offsets(array.array('i', [0, 2, 5]))
+    with self.assertRaises(ValueError):
+      _batch.to_offsets(array.array('d', [0, 2, 5]))
+    with self.assertRaises(ValueError):
+      _batch.to_offsets([])
+
+  def test_split_join(self):
+    offsets = _batch.to_offsets([0, 2, 2, 5])
+    items = _batch.split(b'abcde', offsets)
+    self.assertEqual([bytes(item) for item in items], [b'ab', b'', b'cde'])
+    data, joined_offsets = _batch.join([bytes(item) for item in items])
+    self.assertEqual(data, b'abcde')
+    self.assertEqual(joined_offsets.tolist(), [0, 2, 2, 5])
+
+  def test_split_with_non_zero_start(self):
+    items = _batch.split(b'xxabc', _batch.to_offsets([2, 3, 5]))
+    self.assertEqual([bytes(item) for item in items], [b'a', b'bc'])
+
+  def test_split_invalid_offsets_fails(self):
+    with self.assertRaises(ValueError):
+      _batch.split(b'abcde', _batch.to_offsets([0, 3, 2]))
+    with self.assertRaises(ValueError):
+      _batch.split(b'abcde', _batch.to_offsets([0, 6]))
+    with self.assertRaises(ValueError):
+      _batch.split(b'abcde', _batch.to_offsets([-1, 2]))
+
+  def test_join_empty(self):
+    data, offsets = _batch.join([])
+    self.assertEqual(data, b'')
+    self.assertEqual(offsets.tolist(), [0])
+
+  def test_equal_size_offsets(self):
+    self.assertIsNone(_batch.equal_size_offsets([b'ab', b'cd'], 2))
+    self.assertEqual(
+        _batch.equal_size_offsets(b'abcdef', 3).tolist(), [0, 2, 4, 6]
+    )
+    self.assertEqual(_batch.equal_size_offsets(b'', 0).tolist(), [0])
+    with self.assertRaises(ValueError):
+      _batch.equal_size_offsets(b'abcde', 2)
+    with self.assertRaises(ValueError):
+      _batch.equal_size_offsets(b'ab', 0)
+
+  def test_decrypt_with_primitive_set(self):
+    prefix = b'\x01\x00\x00\x00\x2a'
+    tink_key = _FakeDecrypter(b't')
+    raw_key = _FakeDecrypter(b'r')
+    primitive_set = _FakePrimitiveSet({prefix: [_Entry(tink_key, 42)]})
+    monitor = mock.Mock()
+    results = _batch.decrypt_with_primitive_set(
+        primitive_set,
+        [_Entry(raw_key, 7)],
+        [prefix + b'ta', b'rb', prefix + b'tc', prefix + b'x', b'y'],
+        [b'1', b'2', b'3', b'4', b'5'],
+        lambda primitive, batch, datas: primitive.decrypt_many(batch, datas),
+        monitor,
+    )
+    self.assertEqual(results[:3], [b'a1', b'b2', b'c3'])
+    self.assertIsInstance(results[3], _tink_error.TinkError)
+    self.assertIsInstance(results[4], _tink_error.TinkError)
+    # The ciphertexts with the same prefix are decrypted in one batch.
+    self.assertEqual(tink_key.batch_sizes, [3])
+    self.assertEqual(raw_key.batch_sizes, [3])
+    monitor.log.assert_has_calls(
+        [mock.call(42, 2), mock.call(42, 2), mock.call(7, 2)], any_order=True
+    )
+    self.assertEqual(monitor.log_failure.call_count, 2)
+
+  def test_decrypt_with_primitive_set_records_raw_key_order(self):
+    prefix = b'\x01\x00\x00\x00\x2a'
+    primitive_set = _FakePrimitiveSet(
+        {prefix: [_Entry(_FakeDecrypter(b't'), 42)]}
+    )
+    raw_entries = [
+        _Entry(_FakeDecrypter(b'q'), 6),
+        _Entry(_FakeDecrypter(b'r'), 7),
+    ]
+    raw_key_order = mock.Mock()
+    _batch.decrypt_with_primitive_set(
+        primitive_set,
+        raw_entries,
+        [prefix + b'ta', b'qa', b'rb', b'x', b'y'],
+        [b'1', b'2', b'3', b'4', b'5'],
+        lambda primitive, batch, datas: primitive.decrypt_many(batch, datas),
+        raw_key_order=raw_key_order,
+    )
+    # The item of the prefixed key is not recorded.
+    raw_key_order.record_success.assert_has_calls(
+        [mock.call(raw_entries[0], 0), mock.call(raw_entries[1], 1)]
+    )
+    self.assertEqual(raw_key_order.record_success.call_count, 2)
+    raw_key_order.record_failure.assert_has_calls(
+        [mock.call(2), mock.call(2)]
+    )
+    self.assertEqual(raw_key_order.record_failure.call_count, 2)
+
+  def test_decrypt_one_with_primitive_set(self):
+    prefix = b'\x01\x00\x00\x00\x2a'
+    primitive_set = _FakePrimitiveSet(
+        {prefix: [_Entry(_FakeDecrypter(b't'), 42)]}
+    )
+    raw_entries = [
+        _Entry(_FakeDecrypter(b'q'), 6),
+        _Entry(_FakeDecrypter(b'r'), 7),
+    ]
+    raw_key_order = mock.Mock()
+    monitor = mock.Mock()
+
+    def decrypt_one(ciphertext):
+      return _batch.decrypt_one_with_primitive_set(
+          primitive_set,
+          raw_entries,
+          raw_key_order,
+          ciphertext,
+          lambda primitive, view: primitive.decrypt(view, b'!'),
+          monitor,
+      )
+
+    self.assertEqual(decrypt_one(prefix + b'ta'), b'a!')
+    monitor.log.assert_called_with(42, 2)
+    self.assertEqual(decrypt_one(b'rb'), b'b!')
+    raw_key_order.record_success.assert_called_once_with(raw_entries[1], 1)
+    monitor.log.assert_called_with(7, 2)
+    with self.assertRaises(_tink_error.TinkError):
+      decrypt_one(prefix + b'x')
+    raw_key_order.record_failure.assert_called_once_with(2)
+    monitor.log_failure.assert_called_once()
+
+  def test_decrypt_with_primitive_set_different_lengths_fails(self):
+    with self.assertRaises(ValueError):
+      _batch.decrypt_with_primitive_set(
+          _FakePrimitiveSet({}), [], [b'a'], [], lambda *args: []
+      )
+
+
+if __name__ == '__main__':
+  absltest.main()
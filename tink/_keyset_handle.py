@@ -272,6 +272,10 @@ class KeysetHandle:
     to create the primitive. This function is the most common way of creating a
     primitive.
 
+    The AEAD, Deterministic AEAD, MAC and PRF primitives returned by this
+    function accept any C-contiguous bytes-like object (for example bytearray,
+    memoryview or mmap) in place of bytes, and read it without making a copy.
+
     Args:
       primitive_class: The class of the primitive.
 
@@ -15,9 +15,11 @@
 """This module provides a global list of KMS Clients."""
 
 import abc
-from typing import List
+import heapq
+from typing import Dict, List, Optional, Tuple
 
 from tink.aead import _aead
+from tink.aead import _async_aead
 from tink.core import _tink_error
 
 
@@ -31,9 +33,38 @@ class KmsClient(metaclass=abc.ABCMeta):
   def get_aead(self, key_uri: str) -> _aead.Aead:
     raise NotImplementedError()
 
+  def get_async_aead(self, key_uri: str) -> _async_aead.AsyncAead:
+    """Returns an AsyncAead backed by the KMS key specified by key_uri.
+
+    By default, the methods of the Aead returned by get_aead run on the default
+    executor of the event loop. Clients whose KMS library has an asyncio API
+    can override this.
+    """
+    return _async_aead.as_async(self.get_aead(key_uri))
+
+  def key_uri_prefix(self) -> Optional[str]:
+    """Returns the scheme which all supported key URIs start with, or None.
+
+    The scheme includes '://', e.g. 'gcp-kms://'. kms_client_from_uri only
+    calls does_support of the clients whose scheme matches the key URI, and of
+    the clients which return None.
+    """
+    return None
+
 
 _kms_clients: List[KmsClient] = []
 
+# The registered clients with their position in _kms_clients, by scheme.
+_clients_by_prefix: Dict[str, List[Tuple[int, KmsClient]]] = {}
+# The registered clients whose key_uri_prefix is None or not a scheme.
+_unindexed_clients: List[Tuple[int, KmsClient]] = []
+
+
+def _uri_prefix(key_uri: str) -> str:
+  """Returns the scheme of key_uri, including '://', or '' if it has none."""
+  end = key_uri.find('://')
+  return key_uri[: end + 3] if end >= 0 else ''
+
 
 # Adds client to a global list of KmsClients.
 #
@@ -52,12 +83,24 @@ def register_kms_client(client: KmsClient) -> None:
   Args:
       client: KmsClient to be registered
   """
+  entry = (len(_kms_clients), client)
   _kms_clients.append(client)
+  prefix = client.key_uri_prefix()
+  if prefix and _uri_prefix(prefix) == prefix:
+    _clients_by_prefix.setdefault(prefix, []).append(entry)
+  else:
+    _unindexed_clients.append(entry)
 
 
 def kms_client_from_uri(key_uri: str) -> KmsClient:
   """Returns the first KMS client that supports key_uri."""
-  for client in _kms_clients:
+  candidates = _clients_by_prefix.get(_uri_prefix(key_uri), [])
+  if _unindexed_clients:
+    # Clients are tried in the order in which they were registered.
+    candidates = heapq.merge(
+        candidates, _unindexed_clients, key=lambda entry: entry[0]
+    )
+  for _, client in candidates:
     if client.does_support(key_uri):
       return client
   raise _tink_error.TinkError('No KMS client does support: ' + key_uri)
@@ -66,3 +109,5 @@ def kms_client_from_uri(key_uri: str) -> KmsClient:
 def reset_kms_clients() -> None:
   """Removes all registered clients. Internal and only used for tests."""
   _kms_clients.clear()
+  _clients_by_prefix.clear()
+  _unindexed_clients.clear()
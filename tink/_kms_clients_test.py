@@ -27,12 +27,18 @@ def setUpModule():
 
 class FakeClient(_kms_clients.KmsClient):
 
-  def __init__(self, key_uri):
+  def __init__(self, key_uri, prefix=None):
     self.key_uri = key_uri
+    self.prefix = prefix
+    self.does_support_calls = 0
 
   def does_support(self, key_uri: str) -> bool:
+    self.does_support_calls += 1
     return key_uri == self.key_uri
 
+  def key_uri_prefix(self):
+    return self.prefix
+
   def get_aead(self, key_uri: str) -> aead.Aead:
     raise ValueError('unknown key_uri')
 
@@ -57,6 +63,47 @@ class KmsClientsTest(absltest.TestCase):
     with self.assertRaises(tink.TinkError):
       tink.kms_client_from_uri('key_uri1')
 
+  def test_clients_are_indexed_by_scheme(self):
+    self.addCleanup(_kms_clients.reset_kms_clients)
+    aws_client = FakeClient('aws-kms://key1', prefix='aws-kms://')
+    gcp_client1 = FakeClient('gcp-kms://key1', prefix='gcp-kms://')
+    gcp_client2 = FakeClient('gcp-kms://key2', prefix='gcp-kms://')
+    tink.register_kms_client(aws_client)
+    tink.register_kms_client(gcp_client1)
+    tink.register_kms_client(gcp_client2)
+
+    self.assertEqual(tink.kms_client_from_uri('gcp-kms://key2'), gcp_client2)
+    self.assertEqual(aws_client.does_support_calls, 0)
+    self.assertEqual(gcp_client1.does_support_calls, 1)
+    with self.assertRaises(tink.TinkError):
+      tink.kms_client_from_uri('hcvault://key1')
+    self.assertEqual(aws_client.does_support_calls, 0)
+
+  def test_first_registered_client_wins_with_unindexed_clients(self):
+    self.addCleanup(_kms_clients.reset_kms_clients)
+    indexed_client1 = FakeClient('gcp-kms://key1', prefix='gcp-kms://')
+    unindexed_client = FakeClient('gcp-kms://key1')
+    # A prefix that is not a scheme is not indexed.
+    partly_indexed_client = FakeClient('gcp-kms://key2', prefix='gcp-kms://k')
+    indexed_client2 = FakeClient('gcp-kms://key2', prefix='gcp-kms://')
+    tink.register_kms_client(indexed_client1)
+    tink.register_kms_client(unindexed_client)
+    tink.register_kms_client(partly_indexed_client)
+    tink.register_kms_client(indexed_client2)
+
+    self.assertEqual(
+        tink.kms_client_from_uri('gcp-kms://key1'), indexed_client1
+    )
+    self.assertEqual(
+        tink.kms_client_from_uri('gcp-kms://key2'), partly_indexed_client
+    )
+    self.assertEqual(unindexed_client.does_support_calls, 1)
+    self.assertEqual(indexed_client2.does_support_calls, 0)
+
+    _kms_clients.reset_kms_clients()
+    with self.assertRaises(tink.TinkError):
+      tink.kms_client_from_uri('gcp-kms://key1')
+
 
 if __name__ == '__main__':
   absltest.main()
@@ -0,0 +1,62 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers for the methods that write their output into a caller's buffer."""
+
+from typing import Callable
+
+
+def copy_into(data: bytes, out) -> int:
+  """Copies data to the beginning of out and returns its length.
+
+  Raises:
+    ValueError if out is too small.
+  """
+  out_view = memoryview(out).cast('B')
+  if len(data) > len(out_view):
+    raise ValueError(
+        'out is too small, {} bytes are required'.format(len(data)))
+  out_view[: len(data)] = data
+  return len(data)
+
+
+def write_prefixed_into(
+    prefix: bytes, write: Callable[[memoryview], int], out
+) -> int:
+  """Writes prefix and then the output of write to the beginning of out.
+
+  The prefix is only written after write succeeded, so that a failing write
+  does not leave a prefix in out.
+
+  Args:
+    prefix: the bytes written first, e.g. the output prefix of a key.
+    write: writes its output into the buffer it is given, which is the part of
+      out after the prefix, and returns the number of bytes written.
+    out: a writable bytes-like object.
+  Returns:
+    the number of bytes written to out.
+  Raises:
+    ValueError if out is too small.
+  """
+  out_view = memoryview(out).cast('B')
+  prefix_size = len(prefix)
+  if len(out_view) < prefix_size:
+    raise ValueError(
+        'out is too small, at least {} bytes are required'.format(
+            prefix_size))
+  # The output prefix and the ciphertext are written next to each other,
+  # which avoids concatenating them.
+  size = write(out_view[prefix_size:])
+  out_view[:prefix_size] = prefix
+  return prefix_size + size
@@ -0,0 +1,63 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for tink.python.tink._out_buffer."""
+
+from absl.testing import absltest
+
+from tink import _out_buffer
+
+
+def _write_abc(out_view: memoryview) -> int:
+  out_view[:3] = b'abc'
+  return 3
+
+
+def _fail(out_view: memoryview) -> int:
+  del out_view  # Unused.
+  raise ValueError('failed')
+
+
+class OutBufferTest(absltest.TestCase):
+
+  def test_copy_into(self):
+    out = bytearray(5)
+    self.assertEqual(_out_buffer.copy_into(b'abc', out), 3)
+    self.assertEqual(out, b'abc\x00\x00')
+    with self.assertRaises(ValueError):
+      _out_buffer.copy_into(b'abc', bytearray(2))
+
+  def test_write_prefixed_into(self):
+    out = bytearray(10)
+    self.assertEqual(_out_buffer.write_prefixed_into(b'xy', _write_abc, out), 5)
+    self.assertEqual(out[:5], b'xyabc')
+
+  def test_write_prefixed_into_without_prefix(self):
+    out = bytearray(3)
+    self.assertEqual(_out_buffer.write_prefixed_into(b'', _write_abc, out), 3)
+    self.assertEqual(out, b'abc')
+
+  def test_failing_write_leaves_out_unchanged(self):
+    out = bytearray(b'0123456789')
+    with self.assertRaises(ValueError):
+      _out_buffer.write_prefixed_into(b'xy', _fail, out)
+    self.assertEqual(out, b'0123456789')
+
+  def test_out_smaller_than_prefix_fails(self):
+    with self.assertRaises(ValueError):
+      _out_buffer.write_prefixed_into(b'xyz', _write_abc, bytearray(2))
+
+
+if __name__ == '__main__':
+  absltest.main()
@@ -0,0 +1,145 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Adaptive ordering of the RAW keys tried by decrypting wrappers.
+
+A ciphertext of a RAW key has no output prefix, so wrappers try all RAW keys
+until one of them succeeds, and every failed attempt raises a TinkError. With
+adaptive ordering, the key that decrypted the last ciphertext is moved to the
+front, so that it is tried first on the next one.
+"""
+
+import collections
+import threading
+from typing import Any, Optional, Sequence, Tuple, TypeVar
+
+from tink.core import _tink_error
+
+P = TypeVar('P')
+
+
+class RawKeyOrderStats(
+    collections.namedtuple(
+        'RawKeyOrderStats', 'hits, misses, failures, failed_attempts'
+    )
+):
+  """Counters of the decryptions that tried RAW keys.
+
+  Attributes:
+    hits: decryptions that succeeded with the first RAW key tried.
+    misses: decryptions that succeeded with another RAW key.
+    failures: decryptions that tried RAW keys, none of which worked.
+    failed_attempts: RAW keys that were tried and failed.
+  """
+
+  __slots__ = ()
+
+  @property
+  def hit_rate(self) -> float:
+    """Returns the fraction of successful decryptions that were hits."""
+    successes = self.hits + self.misses
+    return self.hits / successes if successes else 0.0
+
+
+class RawKeyOrder:
+  """The RAW entries of a primitive set, most recently successful first.
+
+  This class is thread-safe. The order is replaced, never modified in place,
+  so entries() can be iterated while other threads record results.
+  """
+
+  def __init__(self, entries: Sequence[Any]):
+    self._entries = tuple(entries)
+    self._lock = threading.Lock()
+    self._hits = 0
+    self._misses = 0
+    self._failures = 0
+    self._failed_attempts = 0
+
+  def entries(self) -> Tuple[Any, ...]:
+    """Returns the entries in the order in which they should be tried."""
+    return self._entries
+
+  def record_success(self, entry: Any, failed_attempts: int) -> None:
+    """Records that entry succeeded after failed_attempts other entries."""
+    with self._lock:
+      self._failed_attempts += failed_attempts
+      if not failed_attempts:
+        self._hits += 1
+        return
+      self._misses += 1
+      if self._entries[0] is not entry:
+        self._entries = (entry,) + tuple(
+            e for e in self._entries if e is not entry
+        )
+
+  def record_failure(self, failed_attempts: int) -> None:
+    """Records that none of the failed_attempts entries succeeded."""
+    if not failed_attempts:
+      return
+    with self._lock:
+      self._failures += 1
+      self._failed_attempts += failed_attempts
+
+  def stats(self) -> RawKeyOrderStats:
+    with self._lock:
+      return RawKeyOrderStats(
+          self._hits, self._misses, self._failures, self._failed_attempts
+      )
+
+
+def with_adaptive_raw_key_order(primitive: P) -> P:
+  """Returns a primitive with the keys of primitive that orders its RAW keys.
+
+  The returned primitive tries the RAW key that succeeded most recently
+  first, and counts how often that key is the right one, see stats. This only
+  applies to the returned primitive: primitive and the other primitives of
+  the keyset are not changed.
+
+  Example:
+    primitive = tink.with_adaptive_raw_key_order(
+        keyset_handle.primitive(aead.Aead))
+
+  Args:
+    primitive: an Aead, DeterministicAead or HybridDecrypt returned by
+      KeysetHandle.primitive.
+
+  Returns:
+    The primitive with adaptive RAW key ordering.
+
+  Raises:
+    tink.TinkError if primitive does not support adaptive RAW key ordering.
+  """
+  with_order = getattr(primitive, 'with_adaptive_raw_key_order', None)
+  if not with_order:
+    raise _tink_error.TinkError(
+        'adaptive RAW key ordering is only supported for the Aead, '
+        'DeterministicAead and HybridDecrypt primitives of a keyset handle'
+    )
+  return with_order()
+
+
+def stats(primitive: Any) -> Optional[RawKeyOrderStats]:
+  """Returns the RAW key counters of a primitive.
+
+  Args:
+    primitive: a primitive returned by KeysetHandle.primitive or by
+      with_adaptive_raw_key_order.
+
+  Returns:
+    The counters, or None if adaptive RAW key ordering is not enabled for the
+    primitive, see with_adaptive_raw_key_order.
+  """
+  raw_key_order_stats = getattr(primitive, 'raw_key_order_stats', None)
+  return raw_key_order_stats() if raw_key_order_stats else None
@@ -0,0 +1,83 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for tink.python.tink._raw_key_order."""
+
+from absl.testing import absltest
+
+from tink import _raw_key_order
+from tink.core import _tink_error
+
+
+class RawKeyOrderTest(absltest.TestCase):
+
+  def test_initial_order(self):
+    order = _raw_key_order.RawKeyOrder(['a', 'b', 'c'])
+    self.assertEqual(order.entries(), ('a', 'b', 'c'))
+    self.assertEqual(order.stats(), _raw_key_order.RawKeyOrderStats(0, 0, 0, 0))
+
+  def test_success_moves_entry_to_front(self):
+    order = _raw_key_order.RawKeyOrder(['a', 'b', 'c'])
+    order.record_success('c', 2)
+    self.assertEqual(order.entries(), ('c', 'a', 'b'))
+    order.record_success('b', 2)
+    self.assertEqual(order.entries(), ('b', 'c', 'a'))
+    order.record_success('b', 0)
+    self.assertEqual(order.entries(), ('b', 'c', 'a'))
+
+  def test_stats(self):
+    order = _raw_key_order.RawKeyOrder(['a', 'b', 'c'])
+    order.record_success('a', 0)
+    order.record_success('c', 2)
+    order.record_success('c', 0)
+    order.record_failure(3)
+    order.record_failure(0)
+    stats = order.stats()
+    self.assertEqual(stats.hits, 2)
+    self.assertEqual(stats.misses, 1)
+    self.assertEqual(stats.failures, 1)
+    self.assertEqual(stats.failed_attempts, 5)
+    self.assertAlmostEqual(stats.hit_rate, 2 / 3)
+
+  def test_hit_rate_without_successes(self):
+    self.assertEqual(
+        _raw_key_order.RawKeyOrderStats(0, 0, 1, 3).hit_rate, 0.0)
+
+  def test_stats_of_primitive(self):
+
+    class Primitive:
+
+      def raw_key_order_stats(self):
+        return _raw_key_order.RawKeyOrderStats(1, 2, 3, 4)
+
+    self.assertEqual(
+        _raw_key_order.stats(Primitive()),
+        _raw_key_order.RawKeyOrderStats(1, 2, 3, 4))
+    self.assertIsNone(_raw_key_order.stats(object()))
+
+  def test_with_adaptive_raw_key_order(self):
+
+    class Primitive:
+
+      def with_adaptive_raw_key_order(self):
+        return 'adaptive'
+
+    self.assertEqual(
+        _raw_key_order.with_adaptive_raw_key_order(Primitive()), 'adaptive')
+    with self.assertRaises(_tink_error.TinkError):
+      _raw_key_order.with_adaptive_raw_key_order(object())
+
+
+if __name__ == '__main__':
+  absltest.main()
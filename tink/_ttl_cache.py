@@ -0,0 +1,124 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""A bounded cache whose entries expire after a time to live."""
+
+import collections
+import threading
+import time
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+class CacheStats(
+    collections.namedtuple(
+        'CacheStats', 'hits, misses, evictions, expirations, size'
+    )
+):
+  """Counters of a cache.
+
+  Attributes:
+    hits: lookups that found an entry.
+    misses: lookups that found no entry, including expired ones.
+    evictions: entries that were removed to make room for new ones.
+    expirations: entries that were removed because they were too old.
+    size: the number of entries in the cache.
+  """
+
+  __slots__ = ()
+
+  @property
+  def hit_rate(self) -> float:
+    """Returns the fraction of lookups that were hits."""
+    lookups = self.hits + self.misses
+    return self.hits / lookups if lookups else 0.0
+
+
+class TtlCache(Generic[K, V]):
+  """A least recently used cache whose entries expire after ttl seconds.
+
+  This class is thread-safe.
+  """
+
+  def __init__(self, max_size: int, ttl: float = 0.0):
+    """Creates an empty cache.
+
+    Args:
+      max_size: the maximum number of entries. The least recently used entry
+        is removed when an entry is added to a full cache.
+      ttl: the number of seconds after which an entry expires, counted from
+        when it was added. 0 means that entries do not expire.
+    """
+    if max_size <= 0:
+      raise ValueError('max_size must be positive')
+    if ttl < 0:
+      raise ValueError('ttl must not be negative')
+    self._max_size = max_size
+    self._ttl = ttl
+    self._lock = threading.Lock()
+    # Maps keys to (value, expiry time), least recently used first.
+    self._entries: 'collections.OrderedDict[K, Tuple[V, float]]' = (
+        collections.OrderedDict()
+    )
+    self._hits = 0
+    self._misses = 0
+    self._evictions = 0
+    self._expirations = 0
+
+  def get(self, key: K) -> Optional[V]:
+    """Returns the value of key, or None if it is not cached or expired."""
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is not None and self._ttl and time.monotonic() >= entry[1]:
+        del self._entries[key]
+        self._expirations += 1
+        entry = None
+      if entry is None:
+        self._misses += 1
+        return None
+      self._hits += 1
+      self._entries.move_to_end(key)
+      return entry[0]
+
+  def put(self, key: K, value: V) -> None:
+    """Adds or replaces the value of key."""
+    with self._lock:
+      self._entries[key] = (value, time.monotonic() + self._ttl)
+      self._entries.move_to_end(key)
+      while len(self._entries) > self._max_size:
+        self._entries.popitem(last=False)
+        self._evictions += 1
+
+  def invalidate(self, key: K) -> None:
+    """Removes the value of key, if it is cached."""
+    with self._lock:
+      self._entries.pop(key, None)
+
+  def clear(self) -> None:
+    """Removes all entries."""
+    with self._lock:
+      self._entries.clear()
+
+  def stats(self) -> CacheStats:
+    with self._lock:
+      return CacheStats(
+          self._hits,
+          self._misses,
+          self._evictions,
+          self._expirations,
+          len(self._entries),
+      )
@@ -0,0 +1,94 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for tink.python.tink._ttl_cache."""
+
+from unittest import mock
+
+from absl.testing import absltest
+
+from tink import _ttl_cache
+
+
+class TtlCacheTest(absltest.TestCase):
+
+  def test_get_put(self):
+    cache = _ttl_cache.TtlCache(max_size=10)
+    self.assertIsNone(cache.get(b'a'))
+    cache.put(b'a', 1)
+    cache.put(b'b', 2)
+    self.assertEqual(cache.get(b'a'), 1)
+    self.assertEqual(cache.get(b'b'), 2)
+    cache.put(b'a', 3)
+    self.assertEqual(cache.get(b'a'), 3)
+    self.assertEqual(
+        cache.stats(),
+        _ttl_cache.CacheStats(
+            hits=3, misses=1, evictions=0, expirations=0, size=2
+        ),
+    )
+    self.assertEqual(cache.stats().hit_rate, 0.75)
+
+  def test_evicts_least_recently_used(self):
+    cache = _ttl_cache.TtlCache(max_size=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.put('c', 3)
+    self.assertIsNone(cache.get('b'))
+    self.assertEqual(cache.get('a'), 1)
+    self.assertEqual(cache.get('c'), 3)
+    self.assertEqual(cache.stats().evictions, 1)
+    self.assertEqual(cache.stats().size, 2)
+
+  def test_entries_expire(self):
+    cache = _ttl_cache.TtlCache(max_size=10, ttl=60)
+    with mock.patch.object(
+        _ttl_cache.time, 'monotonic', autospec=True
+    ) as monotonic:
+      monotonic.return_value = 1000.0
+      cache.put('a', 1)
+      monotonic.return_value = 1059.0
+      self.assertEqual(cache.get('a'), 1)
+      monotonic.return_value = 1060.0
+      self.assertIsNone(cache.get('a'))
+    self.assertEqual(
+        cache.stats(),
+        _ttl_cache.CacheStats(
+            hits=1, misses=1, evictions=0, expirations=1, size=0
+        ),
+    )
+
+  def test_invalidate_and_clear(self):
+    cache = _ttl_cache.TtlCache(max_size=10)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.invalidate('a')
+    cache.invalidate('unknown')
+    self.assertIsNone(cache.get('a'))
+    self.assertEqual(cache.get('b'), 2)
+    cache.clear()
+    self.assertIsNone(cache.get('b'))
+    self.assertEqual(cache.stats().size, 0)
+
+  def test_invalid_arguments_fail(self):
+    with self.assertRaises(ValueError):
+      _ttl_cache.TtlCache(max_size=0)
+    with self.assertRaises(ValueError):
+      _ttl_cache.TtlCache(max_size=1, ttl=-1)
+
+
+if __name__ == '__main__':
+  absltest.main()
@@ -17,10 +17,20 @@
 from tink.aead import _aead
 from tink.aead import _aead_key_manager
 from tink.aead import _aead_key_templates as aead_key_templates
+from tink.aead import _async_aead
+from tink.aead import _async_kms_envelope_aead
+from tink.aead import _kms_aead_key_manager
 from tink.aead import _kms_envelope_aead
 
 
 Aead = _aead.Aead
 AeadCcToPyWrapper = _aead_key_manager.AeadCcToPyWrapper
 register = _aead_key_manager.register
+set_default_remote_aead_cache = (
+    _kms_aead_key_manager.set_default_remote_aead_cache
+)
 KmsEnvelopeAead = _kms_envelope_aead.KmsEnvelopeAead
+DekReuseStats = _kms_envelope_aead.DekReuseStats
+AsyncAead = _async_aead.AsyncAead
+as_async = _async_aead.as_async
+AsyncKmsEnvelopeAead = _async_kms_envelope_aead.AsyncKmsEnvelopeAead
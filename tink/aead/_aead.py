@@ -15,6 +15,11 @@
 """This module defines the interface for AEAD."""
 
 import abc
+from typing import List, Sequence, Union
+
+from tink import _batch
+from tink import _out_buffer
+from tink import core
 
 
 class Aead(metaclass=abc.ABCMeta):
@@ -24,6 +29,9 @@ class Aead(metaclass=abc.ABCMeta):
   chosen ciphertext attacks.  Encryption with associated data ensures
   authenticity and integrity of that data, but not its secrecy.
   (see RFC 5116, https://tools.ietf.org/html/rfc5116)
+
+  For the bytes-like arguments that keyset primitives accept, see
+  KeysetHandle.primitive.
   """
 
   @abc.abstractmethod
@@ -59,3 +67,114 @@ class Aead(metaclass=abc.ABCMeta):
       tink.TinkError if the decryption fails.
     """
     raise NotImplementedError()
+
+  def ciphertext_size(self, plaintext_length: int) -> int:
+    """Returns the length of the ciphertext of a plaintext of the given length.
+
+    This can be used to allocate the buffer passed to encrypt_into.
+
+    Args:
+      plaintext_length: int. The length of the plaintext in bytes.
+    Returns:
+      the length of the ciphertext in bytes.
+    Raises:
+      NotImplementedError if the length of the ciphertext is not determined by
+      the length of the plaintext.
+    """
+    raise NotImplementedError()
+
+  def encrypt_into(self, plaintext: bytes, associated_data: bytes, out) -> int:
+    """Encrypts plaintext with associated_data into a caller-provided buffer.
+
+    The ciphertext is written to the beginning of out, which must be large
+    enough to hold it, see ciphertext_size. The primitives returned by a
+    KeysetHandle write the ciphertext directly into out, without allocating a
+    bytes object for it.
+
+    Args:
+      plaintext: bytes. The data to be encrypted.
+      associated_data: bytes. The associated data, that will be authenticated.
+      out: a writable bytes-like object, for example a bytearray.
+    Returns:
+      the length of the ciphertext written to out.
+    Raises:
+      tink.TinkError if the encryption fails.
+      ValueError if out is too small.
+    """
+    return _out_buffer.copy_into(self.encrypt(plaintext, associated_data), out)
+
+  def decrypt_into(self, ciphertext: bytes, associated_data: bytes,
+                   out) -> int:
+    """Decrypts ciphertext with associated_data into a caller-provided buffer.
+
+    The plaintext is written to the beginning of out. A buffer of the length of
+    the ciphertext is always large enough.
+
+    Args:
+      ciphertext: bytes. The data to be decrypted.
+      associated_data: bytes. The associated data.
+      out: a writable bytes-like object, for example a bytearray.
+    Returns:
+      the length of the plaintext written to out.
+    Raises:
+      tink.TinkError if the decryption fails.
+      ValueError if out is too small.
+    """
+    return _out_buffer.copy_into(self.decrypt(ciphertext, associated_data), out)
+
+  def encrypt_many(
+      self, plaintexts: Sequence[bytes], associated_datas: Sequence[bytes]
+  ) -> List[Union[bytes, core.TinkError]]:
+    """Encrypts a batch of plaintexts.
+
+    Each plaintext is encrypted with the associated data at the same index.
+    The primitives returned by a KeysetHandle encrypt the whole batch in a
+    single call into C++ that releases the GIL, which is much faster than
+    calling encrypt for each item when the items are small.
+
+    Args:
+      plaintexts: a sequence of bytes-like objects to be encrypted.
+      associated_datas: a sequence of the same length with the associated data
+        for each plaintext.
+    Returns:
+      a list that contains, for each plaintext, either the ciphertext as bytes
+      or the tink.TinkError that caused its encryption to fail. A failing item
+      does not abort the batch.
+    Raises:
+      ValueError if plaintexts and associated_datas have different lengths.
+    """
+    _batch.check_same_length(plaintexts, associated_datas)
+    results = []
+    for plaintext, associated_data in zip(plaintexts, associated_datas):
+      try:
+        results.append(self.encrypt(plaintext, associated_data))
+      except core.TinkError as e:
+        results.append(e)
+    return results
+
+  def decrypt_many(
+      self, ciphertexts: Sequence[bytes], associated_datas: Sequence[bytes]
+  ) -> List[Union[bytes, core.TinkError]]:
+    """Decrypts a batch of ciphertexts.
+
+    Each ciphertext is decrypted with the associated data at the same index.
+
+    Args:
+      ciphertexts: a sequence of bytes-like objects to be decrypted.
+      associated_datas: a sequence of the same length with the associated data
+        for each ciphertext.
+    Returns:
+      a list that contains, for each ciphertext, either the plaintext as bytes
+      or the tink.TinkError that caused its decryption to fail. A failing item
+      does not abort the batch.
+    Raises:
+      ValueError if ciphertexts and associated_datas have different lengths.
+    """
+    _batch.check_same_length(ciphertexts, associated_datas)
+    results = []
+    for ciphertext, associated_data in zip(ciphertexts, associated_datas):
+      try:
+        results.append(self.decrypt(ciphertext, associated_data))
+      except core.TinkError as e:
+        results.append(e)
+    return results
@@ -14,6 +14,9 @@
 
 """Python wrapper of the wrapped C++ AEAD key manager."""
 
+from typing import List, Optional, Sequence, Union
+
+from tink import _batch
 from tink import core
 from tink.aead import _aead
 from tink.aead import _aead_wrapper
@@ -26,6 +29,7 @@ class AeadCcToPyWrapper(_aead.Aead):
 
   def __init__(self, cc_primitive: tink_bindings.Aead):
     self._aead = cc_primitive
+    self._ciphertext_overhead: Optional[int] = None
 
   @core.use_tink_errors
   def encrypt(self, plaintext: bytes, associated_data: bytes) -> bytes:
@@ -35,6 +39,35 @@ class AeadCcToPyWrapper(_aead.Aead):
   def decrypt(self, plaintext: bytes, associated_data: bytes) -> bytes:
     return self._aead.decrypt(plaintext, associated_data)
 
+  @core.use_tink_errors
+  def encrypt_into(self, plaintext: bytes, associated_data: bytes,
+                   out) -> int:
+    return self._aead.encrypt_into(plaintext, associated_data, out)
+
+  @core.use_tink_errors
+  def decrypt_into(self, ciphertext: bytes, associated_data: bytes,
+                   out) -> int:
+    return self._aead.decrypt_into(ciphertext, associated_data, out)
+
+  def encrypt_many(
+      self, plaintexts: Sequence[bytes], associated_datas: Sequence[bytes]
+  ) -> List[Union[bytes, core.TinkError]]:
+    return _batch.to_batch_results(
+        self._aead.encrypt_many(plaintexts, associated_datas))
+
+  def decrypt_many(
+      self, ciphertexts: Sequence[bytes], associated_datas: Sequence[bytes]
+  ) -> List[Union[bytes, core.TinkError]]:
+    return _batch.to_batch_results(
+        self._aead.decrypt_many(ciphertexts, associated_datas))
+
+  def ciphertext_size(self, plaintext_length: int) -> int:
+    # All AEADs implemented in C++ add a constant number of bytes (IV and tag)
+    # to the plaintext, which is measured once by encrypting an empty message.
+    if self._ciphertext_overhead is None:
+      self._ciphertext_overhead = len(self.encrypt(b'', b''))
+    return plaintext_length + self._ciphertext_overhead
+
 
 def register() -> None:
   """Registers all AEAD key managers and AEAD wrapper in the Registry."""
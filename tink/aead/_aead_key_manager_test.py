@@ -14,6 +14,8 @@
 
 """Tests for tink.python.tink.aead_key_manager."""
 
+from concurrent import futures
+
 from absl.testing import absltest
 from absl.testing import parameterized
 
@@ -161,6 +163,19 @@ class AeadKeyManagerTest(parameterized.TestCase):
     ciphertext = primitive.encrypt(plaintext, associated_data)
     self.assertEqual(primitive.decrypt(ciphertext, associated_data), plaintext)
 
+  def test_encrypt_decrypt_from_multiple_threads_success(self):
+    keyset_handle = tink.new_keyset_handle(aead.aead_key_templates.AES256_GCM)
+    primitive = keyset_handle.primitive(aead.Aead)
+    plaintexts = [bytes([i]) * (1 << 16) for i in range(32)]
+
+    def encrypt_decrypt(plaintext: bytes) -> bytes:
+      ciphertext = primitive.encrypt(plaintext, b'associated_data')
+      return primitive.decrypt(ciphertext, b'associated_data')
+
+    with futures.ThreadPoolExecutor(max_workers=8) as executor:
+      results = list(executor.map(encrypt_decrypt, plaintexts))
+    self.assertEqual(results, plaintexts)
+
   def test_kms_aead_encrypt_decrypt_success(self):
     template = aead.aead_key_templates.create_kms_aead_key_template(
         key_uri=FAKE_KMS_URI)
@@ -171,6 +186,16 @@ class AeadKeyManagerTest(parameterized.TestCase):
     ciphertext = primitive.encrypt(plaintext, associated_data)
     self.assertEqual(primitive.decrypt(ciphertext, associated_data), plaintext)
 
+  def test_kms_aead_encrypt_decrypt_bytes_like_objects(self):
+    template = aead.aead_key_templates.create_kms_aead_key_template(
+        key_uri=FAKE_KMS_URI)
+    keyset_handle = tink.new_keyset_handle(template)
+    primitive = keyset_handle.primitive(aead.Aead)
+    ciphertext = primitive.encrypt(bytearray(b'plaintext'), b'ad')
+    self.assertEqual(
+        primitive.decrypt(memoryview(ciphertext), bytearray(b'ad')),
+        b'plaintext')
+
   def test_kms_aead_with_unknown_key_uri_fails(self):
     template = aead.aead_key_templates.create_kms_aead_key_template(
         key_uri='unknown-kms://key_uri')
@@ -189,6 +214,17 @@ class AeadKeyManagerTest(parameterized.TestCase):
     ciphertext = primitive.encrypt(plaintext, associated_data)
     self.assertEqual(primitive.decrypt(ciphertext, associated_data), plaintext)
 
+  def test_kms_envelope_aead_encrypt_decrypt_bytes_like_objects(self):
+    template = aead.aead_key_templates.create_kms_envelope_aead_key_template(
+        kek_uri=FAKE_KMS_URI, dek_template=aead.aead_key_templates.AES128_GCM
+    )
+    keyset_handle = tink.new_keyset_handle(template)
+    primitive = keyset_handle.primitive(aead.Aead)
+    ciphertext = primitive.encrypt(bytearray(b'plaintext'), b'ad')
+    self.assertEqual(
+        primitive.decrypt(memoryview(ciphertext), bytearray(b'ad')),
+        b'plaintext')
+
   def test_kms_envelope_aead_with_unknown_key_uri_fails(self):
     template = aead.aead_key_templates.create_kms_envelope_aead_key_template(
         kek_uri='unknown-kms://key_uri',
@@ -14,9 +14,12 @@
 
 """AEAD wrapper."""
 
-from typing import Optional, Type
+from typing import Any, List, Optional, Sequence, Type, Union
 
+from tink import _batch
 from tink import _monitoring
+from tink import _out_buffer
+from tink import _raw_key_order
 from tink import core
 from tink.aead import _aead
 
@@ -29,10 +32,34 @@ class _WrappedAead(_aead.Aead):
       pset: core.PrimitiveSet,
       encryption_monitor: Optional[_monitoring.KeyUsageMonitor] = None,
       decryption_monitor: Optional[_monitoring.KeyUsageMonitor] = None,
+      adaptive_raw_key_order: bool = False,
   ):
     self._primitive_set = pset
     self._encryption_monitor = encryption_monitor
     self._decryption_monitor = decryption_monitor
+    self._raw_key_order = (
+        _raw_key_order.RawKeyOrder(pset.raw_primitives())
+        if adaptive_raw_key_order
+        else None
+    )
+
+  def _raw_entries(self) -> Sequence[Any]:
+    if self._raw_key_order:
+      return self._raw_key_order.entries()
+    return self._primitive_set.raw_primitives()
+
+  def raw_key_order_stats(self) -> Optional[_raw_key_order.RawKeyOrderStats]:
+    return self._raw_key_order.stats() if self._raw_key_order else None
+
+  def with_adaptive_raw_key_order(self) -> '_WrappedAead':
+    if self._raw_key_order:
+      return self
+    return _WrappedAead(
+        self._primitive_set,
+        self._encryption_monitor,
+        self._decryption_monitor,
+        adaptive_raw_key_order=True,
+    )
 
   def encrypt(self, plaintext: bytes, associated_data: bytes) -> bytes:
     primary = self._primitive_set.primary()
@@ -45,39 +72,80 @@ class _WrappedAead(_aead.Aead):
 
     return result
 
+  def encrypt_into(self, plaintext: bytes, associated_data: bytes,
+                   out) -> int:
+    primary = self._primitive_set.primary()
+    result = _out_buffer.write_prefixed_into(
+        primary.identifier,
+        lambda out_view: primary.primitive.encrypt_into(
+            plaintext, associated_data, out_view
+        ),
+        out,
+    )
+
+    if self._encryption_monitor:
+      self._encryption_monitor.log(primary.key_id, len(plaintext))
+
+    return result
+
+  def encrypt_many(
+      self, plaintexts: Sequence[bytes], associated_datas: Sequence[bytes]
+  ) -> List[Union[bytes, core.TinkError]]:
+    primary = self._primitive_set.primary()
+    results = primary.primitive.encrypt_many(plaintexts, associated_datas)
+    identifier = primary.identifier
+    for i, result in enumerate(results):
+      if isinstance(result, core.TinkError):
+        continue
+      if identifier:
+        results[i] = identifier + result
+      if self._encryption_monitor:
+        self._encryption_monitor.log(primary.key_id, len(plaintexts[i]))
+    return results
+
+  def ciphertext_size(self, plaintext_length: int) -> int:
+    primary = self._primitive_set.primary()
+    return len(primary.identifier) + primary.primitive.ciphertext_size(
+        plaintext_length
+    )
+
   def decrypt(self, ciphertext: bytes, associated_data: bytes) -> bytes:
-    if len(ciphertext) > core.crypto_format.NON_RAW_PREFIX_SIZE:
-      prefix = ciphertext[: core.crypto_format.NON_RAW_PREFIX_SIZE]
-      ciphertext_no_prefix = ciphertext[
-          core.crypto_format.NON_RAW_PREFIX_SIZE :
-      ]
-      for entry in self._primitive_set.primitive_from_identifier(prefix):
-        try:
-          result = entry.primitive.decrypt(
-              ciphertext_no_prefix, associated_data
-          )
-          if self._decryption_monitor:
-            self._decryption_monitor.log(
-                entry.key_id, len(ciphertext_no_prefix)
-            )
-          return result
-        except core.TinkError:
-          pass
-    # Let's try all RAW keys.
-    for entry in self._primitive_set.raw_primitives():
-      try:
-        result = entry.primitive.decrypt(ciphertext, associated_data)
-        if self._decryption_monitor:
-          self._decryption_monitor.log(entry.key_id, len(ciphertext))
-        return result
-      except core.TinkError:
-        pass
-
-    # nothing works.
-    if self._decryption_monitor:
-      self._decryption_monitor.log_failure()
-
-    raise core.TinkError('Decryption failed.')
+    return _batch.decrypt_one_with_primitive_set(
+        self._primitive_set,
+        self._raw_entries(),
+        self._raw_key_order,
+        ciphertext,
+        lambda primitive, ciphertext: primitive.decrypt(
+            ciphertext, associated_data
+        ),
+        self._decryption_monitor,
+    )
+
+  def decrypt_into(self, ciphertext: bytes, associated_data: bytes,
+                   out) -> int:
+    return _batch.decrypt_one_with_primitive_set(
+        self._primitive_set,
+        self._raw_entries(),
+        self._raw_key_order,
+        ciphertext,
+        lambda primitive, ciphertext_view: primitive.decrypt_into(
+            ciphertext_view, associated_data, out
+        ),
+        self._decryption_monitor,
+    )
+
+  def decrypt_many(
+      self, ciphertexts: Sequence[bytes], associated_datas: Sequence[bytes]
+  ) -> List[Union[bytes, core.TinkError]]:
+    return _batch.decrypt_with_primitive_set(
+        self._primitive_set,
+        self._raw_entries(),
+        ciphertexts,
+        associated_datas,
+        lambda primitive, batch, datas: primitive.decrypt_many(batch, datas),
+        self._decryption_monitor,
+        self._raw_key_order,
+    )
 
 
 class AeadWrapper(core.PrimitiveWrapper[_aead.Aead, _aead.Aead]):
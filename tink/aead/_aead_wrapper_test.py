@@ -45,6 +45,107 @@ class AeadWrapperTest(parameterized.TestCase):
         primitive.decrypt(ciphertext, b'associated_data'), b'plaintext'
     )
 
+  @parameterized.parameters([AEAD_TEMPLATE, RAW_AEAD_TEMPLATE])
+  def test_encrypt_decrypt_bytes_like_objects(self, template):
+    keyset_handle = tink.new_keyset_handle(template)
+    primitive = keyset_handle.primitive(aead.Aead)
+    ciphertext = primitive.encrypt(
+        bytearray(b'plaintext'), memoryview(b'associated_data')
+    )
+    self.assertEqual(
+        primitive.decrypt(bytearray(ciphertext), b'associated_data'),
+        b'plaintext',
+    )
+    self.assertEqual(
+        primitive.decrypt(
+            memoryview(ciphertext), bytearray(b'associated_data')
+        ),
+        b'plaintext',
+    )
+
+  @parameterized.parameters([AEAD_TEMPLATE, RAW_AEAD_TEMPLATE])
+  def test_encrypt_into_decrypt_into(self, template):
+    keyset_handle = tink.new_keyset_handle(template)
+    primitive = keyset_handle.primitive(aead.Aead)
+    ciphertext_size = primitive.ciphertext_size(len(b'plaintext'))
+    out = bytearray(ciphertext_size + 10)
+    self.assertEqual(
+        primitive.encrypt_into(b'plaintext', b'associated_data', out),
+        ciphertext_size,
+    )
+    ciphertext = bytes(out[:ciphertext_size])
+    self.assertEqual(
+        primitive.decrypt(ciphertext, b'associated_data'), b'plaintext'
+    )
+
+    plaintext_out = bytearray(len(ciphertext))
+    self.assertEqual(
+        primitive.decrypt_into(ciphertext, b'associated_data', plaintext_out),
+        len(b'plaintext'),
+    )
+    self.assertEqual(plaintext_out[: len(b'plaintext')], b'plaintext')
+
+  @parameterized.parameters([AEAD_TEMPLATE, RAW_AEAD_TEMPLATE])
+  def test_ciphertext_size(self, template):
+    keyset_handle = tink.new_keyset_handle(template)
+    primitive = keyset_handle.primitive(aead.Aead)
+    for plaintext in [b'', b'plaintext', b'x' * 1000]:
+      self.assertLen(
+          primitive.encrypt(plaintext, b'associated_data'),
+          primitive.ciphertext_size(len(plaintext)),
+      )
+
+  @parameterized.parameters([AEAD_TEMPLATE, RAW_AEAD_TEMPLATE])
+  def test_encrypt_into_decrypt_into_too_small_fails(self, template):
+    keyset_handle = tink.new_keyset_handle(template)
+    primitive = keyset_handle.primitive(aead.Aead)
+    ciphertext_size = primitive.ciphertext_size(len(b'plaintext'))
+    with self.assertRaises(ValueError):
+      primitive.encrypt_into(
+          b'plaintext', b'associated_data', bytearray(ciphertext_size - 1)
+      )
+    ciphertext = primitive.encrypt(b'plaintext', b'associated_data')
+    with self.assertRaises(ValueError):
+      primitive.decrypt_into(ciphertext, b'associated_data', bytearray(3))
+
+  @parameterized.parameters([AEAD_TEMPLATE, RAW_AEAD_TEMPLATE])
+  def test_encrypt_into_failure_leaves_out_unchanged(self, template):
+    keyset_handle = tink.new_keyset_handle(template)
+    primitive = keyset_handle.primitive(aead.Aead)
+    ciphertext_size = primitive.ciphertext_size(len(b'plaintext'))
+    out = bytearray(b'\xaa' * (ciphertext_size - 1))
+    with self.assertRaises(ValueError):
+      primitive.encrypt_into(b'plaintext', b'associated_data', out)
+    self.assertEqual(out, b'\xaa' * (ciphertext_size - 1))
+
+  def test_encrypt_into_read_only_buffer_fails(self):
+    keyset_handle = tink.new_keyset_handle(AEAD_TEMPLATE)
+    primitive = keyset_handle.primitive(aead.Aead)
+    with self.assertRaises(TypeError):
+      primitive.encrypt_into(b'plaintext', b'associated_data', bytes(100))
+
+  def test_decrypt_into_unknown_ciphertext_fails(self):
+    unknown_primitive = tink.new_keyset_handle(AEAD_TEMPLATE).primitive(
+        aead.Aead
+    )
+    unknown_ciphertext = unknown_primitive.encrypt(
+        b'plaintext', b'associated_data'
+    )
+    primitive = tink.new_keyset_handle(AEAD_TEMPLATE).primitive(aead.Aead)
+    with self.assertRaises(tink.TinkError):
+      primitive.decrypt_into(
+          unknown_ciphertext,
+          b'associated_data',
+          bytearray(len(unknown_ciphertext)),
+      )
+
+  @parameterized.parameters([AEAD_TEMPLATE, RAW_AEAD_TEMPLATE])
+  def test_encrypt_non_bytes_like_object_fails(self, template):
+    keyset_handle = tink.new_keyset_handle(template)
+    primitive = keyset_handle.primitive(aead.Aead)
+    with self.assertRaises(TypeError):
+      primitive.encrypt('plaintext', b'associated_data')
+
   @parameterized.parameters([AEAD_TEMPLATE, RAW_AEAD_TEMPLATE])
   def test_decrypt_unknown_ciphertext_fails(self, template):
     unknown_handle = tink.new_keyset_handle(template)
@@ -126,6 +227,148 @@ class AeadWrapperTest(parameterized.TestCase):
     self.assertEqual(p3.decrypt(ciphertext4, b'ad'), b'plaintext')
     self.assertEqual(p4.decrypt(ciphertext4, b'ad'), b'plaintext')
 
+  @parameterized.parameters([AEAD_TEMPLATE, RAW_AEAD_TEMPLATE])
+  def test_encrypt_many_decrypt_many(self, template):
+    keyset_handle = tink.new_keyset_handle(template)
+    primitive = keyset_handle.primitive(aead.Aead)
+    plaintexts = [b'', b'plaintext', bytearray(b'x' * 1000)]
+    associated_datas = [b'ad0', b'ad1', memoryview(b'ad2')]
+    ciphertexts = primitive.encrypt_many(plaintexts, associated_datas)
+    self.assertLen(ciphertexts, 3)
+    for ciphertext, plaintext, associated_data in zip(
+        ciphertexts, plaintexts, associated_datas
+    ):
+      self.assertEqual(primitive.decrypt(ciphertext, associated_data),
+                       plaintext)
+    self.assertEqual(
+        primitive.decrypt_many(ciphertexts, associated_datas), plaintexts
+    )
+
+  @parameterized.parameters([AEAD_TEMPLATE, RAW_AEAD_TEMPLATE])
+  def test_decrypt_many_reports_errors_per_item(self, template):
+    keyset_handle = tink.new_keyset_handle(template)
+    primitive = keyset_handle.primitive(aead.Aead)
+    ciphertexts = primitive.encrypt_many(
+        [b'plaintext0', b'plaintext1', b'plaintext2'], [b'ad'] * 3
+    )
+    results = primitive.decrypt_many(
+        [ciphertexts[0], b'invalid', ciphertexts[2], ciphertexts[1]],
+        [b'ad', b'ad', b'ad', b'wrong_ad'],
+    )
+    self.assertLen(results, 4)
+    self.assertEqual(results[0], b'plaintext0')
+    self.assertIsInstance(results[1], tink.TinkError)
+    self.assertEqual(results[2], b'plaintext2')
+    self.assertIsInstance(results[3], tink.TinkError)
+
+  def test_decrypt_many_with_key_rotation(self):
+    builder = keyset_builder.new_keyset_builder()
+    older_key_id = builder.add_new_key(AEAD_TEMPLATE)
+    builder.set_primary_key(older_key_id)
+    p1 = builder.keyset_handle().primitive(aead.Aead)
+    newer_key_id = builder.add_new_key(RAW_AEAD_TEMPLATE)
+    builder.set_primary_key(newer_key_id)
+    p2 = builder.keyset_handle().primitive(aead.Aead)
+
+    ciphertexts = [
+        p1.encrypt(b'plaintext1', b'ad'),
+        p2.encrypt(b'plaintext2', b'ad'),
+        p1.encrypt(b'plaintext3', b'ad'),
+    ]
+    self.assertEqual(
+        p2.decrypt_many(ciphertexts, [b'ad'] * 3),
+        [b'plaintext1', b'plaintext2', b'plaintext3'],
+    )
+    results = p1.decrypt_many(ciphertexts, [b'ad'] * 3)
+    self.assertEqual(results[0], b'plaintext1')
+    self.assertIsInstance(results[1], tink.TinkError)
+    self.assertEqual(results[2], b'plaintext3')
+
+  def test_encrypt_many_decrypt_many_empty_batch(self):
+    primitive = tink.new_keyset_handle(AEAD_TEMPLATE).primitive(aead.Aead)
+    self.assertEqual(primitive.encrypt_many([], []), [])
+    self.assertEqual(primitive.decrypt_many([], []), [])
+
+  def test_encrypt_many_decrypt_many_different_lengths_fails(self):
+    primitive = tink.new_keyset_handle(AEAD_TEMPLATE).primitive(aead.Aead)
+    with self.assertRaises(ValueError):
+      primitive.encrypt_many([b'a', b'b'], [b'ad'])
+    with self.assertRaises(ValueError):
+      primitive.decrypt_many([b'a', b'b'], [b'ad'])
+
+  def test_adaptive_raw_key_order(self):
+    builder = keyset_builder.new_keyset_builder()
+    ciphertexts = []
+    for _ in range(3):
+      key_id = builder.add_new_key(RAW_AEAD_TEMPLATE)
+      builder.set_primary_key(key_id)
+      ciphertexts.append(
+          builder.keyset_handle()
+          .primitive(aead.Aead)
+          .encrypt(b'plaintext', b'ad')
+      )
+    primitive = tink.with_adaptive_raw_key_order(
+        builder.keyset_handle().primitive(aead.Aead)
+    )
+
+    # The RAW keys are first tried in the order of the keyset.
+    self.assertEqual(primitive.decrypt(ciphertexts[0], b'ad'), b'plaintext')
+    self.assertEqual(primitive.decrypt(ciphertexts[2], b'ad'), b'plaintext')
+    # The last key is now tried first.
+    self.assertEqual(primitive.decrypt(ciphertexts[2], b'ad'), b'plaintext')
+    with self.assertRaises(tink.TinkError):
+      primitive.decrypt(ciphertexts[0], b'wrong ad')
+
+    self.assertEqual(
+        tink.raw_key_order_stats(primitive),
+        tink.RawKeyOrderStats(
+            hits=2, misses=1, failures=1, failed_attempts=5
+        ),
+    )
+
+  def test_adaptive_raw_key_order_decrypt_many(self):
+    builder = keyset_builder.new_keyset_builder()
+    ciphertexts = []
+    for _ in range(2):
+      key_id = builder.add_new_key(RAW_AEAD_TEMPLATE)
+      builder.set_primary_key(key_id)
+      ciphertexts.append(
+          builder.keyset_handle()
+          .primitive(aead.Aead)
+          .encrypt(b'plaintext', b'ad')
+      )
+    primitive = tink.with_adaptive_raw_key_order(
+        builder.keyset_handle().primitive(aead.Aead)
+    )
+
+    results = primitive.decrypt_many(
+        [ciphertexts[1], ciphertexts[0], ciphertexts[1]],
+        [b'ad', b'ad', b'wrong ad'],
+    )
+
+    self.assertEqual(results[:2], [b'plaintext', b'plaintext'])
+    self.assertIsInstance(results[2], tink.TinkError)
+    self.assertEqual(
+        tink.raw_key_order_stats(primitive),
+        tink.RawKeyOrderStats(
+            hits=1, misses=1, failures=1, failed_attempts=3
+        ),
+    )
+    # The second key decrypted an item after the first one failed, so it is
+    # now tried first.
+    self.assertEqual(primitive.decrypt(ciphertexts[1], b'ad'), b'plaintext')
+    self.assertEqual(tink.raw_key_order_stats(primitive).hits, 2)
+
+  def test_raw_key_order_stats_disabled_by_default(self):
+    primitive = tink.new_keyset_handle(RAW_AEAD_TEMPLATE).primitive(aead.Aead)
+    primitive.decrypt(primitive.encrypt(b'plaintext', b'ad'), b'ad')
+    self.assertIsNone(tink.raw_key_order_stats(primitive))
+    self.assertIsNotNone(
+        tink.raw_key_order_stats(tink.with_adaptive_raw_key_order(primitive))
+    )
+    # The original primitive is not changed.
+    self.assertIsNone(tink.raw_key_order_stats(primitive))
+
 
 class KeyUsageMonitorTest(absltest.TestCase):
 
@@ -166,6 +409,30 @@ class KeyUsageMonitorTest(absltest.TestCase):
         )],
     )
 
+  def test_key_usage_monitor_log_many(self):
+    keyset_handle = _keyset_handle._new_keyset_handle_with_annotations(
+        AEAD_TEMPLATE, {'test': 'test'}
+    )
+    key_id = keyset_handle.keyset_info().key_info[0].key_id
+    primitive = keyset_handle.primitive(aead.Aead)
+
+    ciphertexts = primitive.encrypt_many([b'a', b'bc'], [b'ad', b'ad'])
+    primitive.decrypt_many([ciphertexts[1], b'x'], [b'ad', b'ad'])
+
+    self.assertSequenceEqual(
+        self.encryption_key_usage_monitor.log_calls, [(key_id, 1), (key_id, 2)]
+    )
+    self.assertSequenceEqual(
+        self.decryption_key_usage_monitor.log_calls,
+        [(
+            key_id,
+            len(ciphertexts[1]) - core.crypto_format.NON_RAW_PREFIX_SIZE,
+        )],
+    )
+    self.assertEqual(
+        self.decryption_key_usage_monitor.log_failure_calls_count, 1
+    )
+
   def test_key_usage_monitor_log_failure(self):
     keyset_handle = _keyset_handle._new_keyset_handle_with_annotations(
         AEAD_TEMPLATE, {'test': 'test'}
@@ -0,0 +1,97 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""This module defines the interface for AEAD with asyncio."""
+
+import abc
+import asyncio
+from concurrent import futures
+import functools
+from typing import Optional
+
+from tink.aead import _aead
+
+
+class AsyncAead(metaclass=abc.ABCMeta):
+  """The interface for authenticated encryption with associated data in asyncio.
+
+  It is the counterpart of Aead for primitives that do network I/O, like the
+  AEADs of a KMS. Their methods are awaited, so that they do not block the
+  event loop and many of them can run concurrently.
+  """
+
+  @abc.abstractmethod
+  async def encrypt(self, plaintext: bytes, associated_data: bytes) -> bytes:
+    """Encrypts plaintext with associated_data.
+
+    Args:
+      plaintext: bytes. The data to be encrypted.
+      associated_data: bytes. The associated data, that will be authenticated.
+    Returns:
+      the resulting ciphertext as bytes.
+    Raises:
+      tink.TinkError if the encryption fails.
+    """
+    raise NotImplementedError()
+
+  @abc.abstractmethod
+  async def decrypt(self, ciphertext: bytes, associated_data: bytes) -> bytes:
+    """Decrypts ciphertext with associated_data.
+
+    Args:
+      ciphertext: bytes. The data to be decrypted.
+      associated_data: bytes. The associated data.
+    Returns:
+      the resulting plaintext as bytes.
+    Raises:
+      tink.TinkError if the decryption fails.
+    """
+    raise NotImplementedError()
+
+
+class _ExecutorAsyncAead(AsyncAead):
+  """Runs the methods of a blocking Aead on an executor."""
+
+  def __init__(self, primitive: _aead.Aead,
+               executor: Optional[futures.Executor]):
+    self._primitive = primitive
+    self._executor = executor
+
+  async def _run(self, method, data: bytes, associated_data: bytes) -> bytes:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        self._executor, functools.partial(method, data, associated_data))
+
+  async def encrypt(self, plaintext: bytes, associated_data: bytes) -> bytes:
+    return await self._run(self._primitive.encrypt, plaintext, associated_data)
+
+  async def decrypt(self, ciphertext: bytes, associated_data: bytes) -> bytes:
+    return await self._run(self._primitive.decrypt, ciphertext,
+                           associated_data)
+
+
+def as_async(primitive: _aead.Aead,
+             executor: Optional[futures.Executor] = None) -> AsyncAead:
+  """Returns an AsyncAead which runs the methods of primitive on an executor.
+
+  This is meant for AEADs whose client library has no asyncio API. The calls
+  still block a thread each, so the number of concurrent calls is limited by
+  the number of threads of the executor.
+
+  Args:
+    primitive: The Aead whose methods are run.
+    executor: The executor on which they run. If None, the default executor
+      of the event loop is used.
+  """
+  return _ExecutorAsyncAead(primitive, executor)
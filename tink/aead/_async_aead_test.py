@@ -0,0 +1,102 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for tink.python.tink.aead._async_aead."""
+
+import asyncio
+from concurrent import futures
+import threading
+from typing import List
+
+from absl.testing import absltest
+
+import tink
+from tink import aead
+from tink.testing import fake_kms
+
+
+FAKE_KMS_URI = 'fake-kms://CM2b3_MDElQKSAowdHlwZS5nb29nbGVhcGlzLmNvbS9nb29nbGUuY3J5cHRvLnRpbmsuQWVzR2NtS2V5EhIaEIK75t5L-adlUwVhWvRuWUwYARABGM2b3_MDIAE'
+
+
+def setUpModule():
+  aead.register()
+
+
+class _ThreadRecordingAead(aead.Aead):
+  """Records the names of the threads on which it is called."""
+
+  def __init__(self, primitive: aead.Aead):
+    self._primitive = primitive
+    self.threads: List[str] = []
+
+  def encrypt(self, plaintext: bytes, associated_data: bytes) -> bytes:
+    self.threads.append(threading.current_thread().name)
+    return self._primitive.encrypt(plaintext, associated_data)
+
+  def decrypt(self, ciphertext: bytes, associated_data: bytes) -> bytes:
+    self.threads.append(threading.current_thread().name)
+    return self._primitive.decrypt(ciphertext, associated_data)
+
+
+class AsyncAeadTest(absltest.TestCase):
+
+  def test_as_async_encrypt_decrypt(self):
+    primitive = fake_kms.FakeKmsClient().get_aead(FAKE_KMS_URI)
+    async_primitive = aead.as_async(primitive)
+
+    async def run():
+      ciphertext = await async_primitive.encrypt(b'plaintext', b'aad')
+      return ciphertext, await async_primitive.decrypt(ciphertext, b'aad')
+
+    ciphertext, plaintext = asyncio.run(run())
+    self.assertEqual(plaintext, b'plaintext')
+    self.assertEqual(primitive.decrypt(ciphertext, b'aad'), b'plaintext')
+
+  def test_as_async_decrypt_fails(self):
+    primitive = fake_kms.FakeKmsClient().get_aead(FAKE_KMS_URI)
+    async_primitive = aead.as_async(primitive)
+    ciphertext = primitive.encrypt(b'plaintext', b'aad')
+    with self.assertRaises(tink.TinkError):
+      asyncio.run(async_primitive.decrypt(ciphertext, b'bad aad'))
+
+  def test_as_async_runs_on_executor(self):
+    primitive = _ThreadRecordingAead(
+        fake_kms.FakeKmsClient().get_aead(FAKE_KMS_URI))
+    executor = futures.ThreadPoolExecutor(
+        max_workers=2, thread_name_prefix='test-executor')
+    self.addCleanup(executor.shutdown)
+    async_primitive = aead.as_async(primitive, executor)
+
+    async def run():
+      ciphertexts = await asyncio.gather(
+          *[async_primitive.encrypt(b'%d' % i, b'') for i in range(10)])
+      return await asyncio.gather(
+          *[async_primitive.decrypt(c, b'') for c in ciphertexts])
+
+    self.assertEqual(asyncio.run(run()), [b'%d' % i for i in range(10)])
+    self.assertLen(primitive.threads, 20)
+    for name in primitive.threads:
+      self.assertStartsWith(name, 'test-executor')
+
+  def test_kms_client_get_async_aead(self):
+    client = fake_kms.FakeKmsClient()
+    async_primitive = client.get_async_aead(FAKE_KMS_URI)
+    ciphertext = asyncio.run(async_primitive.encrypt(b'plaintext', b'aad'))
+    self.assertEqual(
+        client.get_aead(FAKE_KMS_URI).decrypt(ciphertext, b'aad'),
+        b'plaintext')
+
+
+if __name__ == '__main__':
+  absltest.main()
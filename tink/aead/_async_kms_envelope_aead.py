@@ -0,0 +1,159 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for envelope encryption with an asyncio KMS."""
+
+import asyncio
+from typing import Dict, List, Sequence, Union
+
+from tink.proto import tink_pb2
+from tink import _batch
+from tink import core
+from tink.aead import _aead
+from tink.aead import _async_aead
+from tink.aead import _kms_envelope_aead
+
+DEFAULT_MAX_CONCURRENCY = 32
+
+
+class AsyncKmsEnvelopeAead(_async_aead.AsyncAead):
+  """Implements envelope encryption with an AsyncAead as the remote AEAD.
+
+  The ciphertexts are the same as those of KmsEnvelopeAead, and each of them
+  can be decrypted by both. The remote AEAD is awaited, so many DEKs can be
+  encrypted or decrypted by the KMS concurrently. The payload is encrypted and
+  decrypted on the event loop, as the local AEAD does no I/O.
+
+  encrypt_many and decrypt_many process a batch of messages with at most
+  max_concurrency calls to the remote AEAD at the same time. decrypt_many
+  calls the remote AEAD only once for each distinct encrypted DEK.
+  """
+
+  def __init__(
+      self,
+      key_template: tink_pb2.KeyTemplate,
+      remote: _async_aead.AsyncAead,
+      max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+  ):
+    if max_concurrency < 1:
+      raise ValueError('max_concurrency must be positive')
+    if not _kms_envelope_aead.is_supported_dek_key_type(key_template.type_url):
+      raise core.TinkError(
+          'Unsupported DEK key type: %s' % key_template.type_url
+      )
+    # Like KmsEnvelopeAead, fail when created and not just when used.
+    _ = core.Registry.new_key_data(key_template)
+
+    self.key_template = key_template
+    self.remote_aead = remote
+    self._max_concurrency = max_concurrency
+
+  async def encrypt(self, plaintext: bytes, associated_data: bytes) -> bytes:
+    dek = core.Registry.new_key_data(self.key_template)
+    dek_aead = core.Registry.primitive(dek, _aead.Aead)
+    encrypted_dek = await self.remote_aead.encrypt(dek.value, b'')
+    prefix = _kms_envelope_aead.dek_prefix(encrypted_dek)
+    return prefix + dek_aead.encrypt(plaintext, associated_data)
+
+  async def _dek_aead(self, encrypted_dek: bytes) -> _aead.Aead:
+    dek_bytes = await self.remote_aead.decrypt(encrypted_dek, b'')
+    dek = _kms_envelope_aead.dek_key_data(self.key_template.type_url,
+                                          dek_bytes)
+    return core.Registry.primitive(dek, _aead.Aead)
+
+  async def decrypt(self, ciphertext: bytes, associated_data: bytes) -> bytes:
+    encrypted_dek, payload = _kms_envelope_aead.split_ciphertext(ciphertext)
+    dek_aead = await self._dek_aead(encrypted_dek)
+    return dek_aead.decrypt(payload, associated_data)
+
+  async def encrypt_many(
+      self, plaintexts: Sequence[bytes], associated_datas: Sequence[bytes]
+  ) -> List[Union[bytes, core.TinkError]]:
+    """Encrypts a batch of plaintexts, each with a new DEK.
+
+    Args:
+      plaintexts: a sequence of bytes-like objects to be encrypted.
+      associated_datas: a sequence of the same length with the associated data
+        for each plaintext.
+    Returns:
+      a list that contains, for each plaintext, either the ciphertext as bytes
+      or the tink.TinkError that caused its encryption to fail. A failing item
+      does not abort the batch.
+    Raises:
+      ValueError if plaintexts and associated_datas have different lengths.
+    """
+    _batch.check_same_length(plaintexts, associated_datas)
+    semaphore = asyncio.Semaphore(self._max_concurrency)
+
+    async def encrypt_one(
+        plaintext: bytes, associated_data: bytes
+    ) -> Union[bytes, core.TinkError]:
+      try:
+        async with semaphore:
+          return await self.encrypt(plaintext, associated_data)
+      except core.TinkError as e:
+        return e
+
+    return list(
+        await asyncio.gather(
+            *map(encrypt_one, plaintexts, associated_datas)
+        )
+    )
+
+  async def decrypt_many(
+      self, ciphertexts: Sequence[bytes], associated_datas: Sequence[bytes]
+  ) -> List[Union[bytes, core.TinkError]]:
+    """Decrypts a batch of ciphertexts.
+
+    Args:
+      ciphertexts: a sequence of bytes-like objects to be decrypted.
+      associated_datas: a sequence of the same length with the associated data
+        for each ciphertext.
+    Returns:
+      a list that contains, for each ciphertext, either the plaintext as bytes
+      or the tink.TinkError that caused its decryption to fail. A failing item
+      does not abort the batch.
+    Raises:
+      ValueError if ciphertexts and associated_datas have different lengths.
+    """
+    _batch.check_same_length(ciphertexts, associated_datas)
+    semaphore = asyncio.Semaphore(self._max_concurrency)
+    # The unwrapping of each distinct encrypted DEK in the batch.
+    unwraps: Dict[bytes, asyncio.Task] = {}
+
+    async def unwrap(encrypted_dek: bytes) -> _aead.Aead:
+      async with semaphore:
+        return await self._dek_aead(encrypted_dek)
+
+    async def decrypt_one(
+        ciphertext: bytes, associated_data: bytes
+    ) -> Union[bytes, core.TinkError]:
+      try:
+        encrypted_dek, payload = _kms_envelope_aead.split_ciphertext(
+            ciphertext
+        )
+        if encrypted_dek not in unwraps:
+          unwraps[encrypted_dek] = asyncio.ensure_future(
+              unwrap(encrypted_dek)
+          )
+        dek_aead = await unwraps[encrypted_dek]
+        return dek_aead.decrypt(payload, associated_data)
+      except core.TinkError as e:
+        return e
+
+    return list(
+        await asyncio.gather(
+            *map(decrypt_one, ciphertexts, associated_datas)
+        )
+    )
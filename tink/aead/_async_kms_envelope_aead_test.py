@@ -0,0 +1,169 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for tink.python.tink.aead._async_kms_envelope_aead."""
+
+import asyncio
+
+from absl.testing import absltest
+from absl.testing import parameterized
+
+import tink
+from tink import aead
+from tink import core
+from tink.testing import fake_kms
+
+
+FAKE_KMS_URI = 'fake-kms://CM2b3_MDElQKSAowdHlwZS5nb29nbGVhcGlzLmNvbS9nb29nbGUuY3J5cHRvLnRpbmsuQWVzR2NtS2V5EhIaEIK75t5L-adlUwVhWvRuWUwYARABGM2b3_MDIAE'
+DEK_TEMPLATE = aead.aead_key_templates.AES128_GCM
+
+
+def setUpModule():
+  aead.register()
+
+
+class _FakeAsyncKms(aead.AsyncAead):
+  """An asyncio stand-in for a KMS, backed by a fake KMS AEAD.
+
+  Each call yields to the event loop, like a network request would, and the
+  calls in flight are counted.
+  """
+
+  def __init__(self):
+    self.remote = fake_kms.FakeKmsClient().get_aead(FAKE_KMS_URI)
+    self.encrypt_calls = 0
+    self.decrypt_calls = 0
+    self.in_flight = 0
+    self.max_in_flight = 0
+
+  async def _call(self, method, data: bytes, associated_data: bytes) -> bytes:
+    self.in_flight += 1
+    self.max_in_flight = max(self.max_in_flight, self.in_flight)
+    try:
+      await asyncio.sleep(0.001)
+      return method(data, associated_data)
+    finally:
+      self.in_flight -= 1
+
+  async def encrypt(self, plaintext: bytes, associated_data: bytes) -> bytes:
+    self.encrypt_calls += 1
+    return await self._call(self.remote.encrypt, plaintext, associated_data)
+
+  async def decrypt(self, ciphertext: bytes, associated_data: bytes) -> bytes:
+    self.decrypt_calls += 1
+    return await self._call(self.remote.decrypt, ciphertext, associated_data)
+
+
+class AsyncKmsEnvelopeAeadTest(parameterized.TestCase):
+
+  @parameterized.parameters([
+      aead.aead_key_templates.AES128_EAX,
+      aead.aead_key_templates.AES256_GCM,
+      aead.aead_key_templates.AES256_GCM_SIV,
+      aead.aead_key_templates.AES128_CTR_HMAC_SHA256,
+      aead.aead_key_templates.XCHACHA20_POLY1305,
+  ])
+  def test_encrypt_decrypt(self, dek_template):
+    env_aead = aead.AsyncKmsEnvelopeAead(dek_template, _FakeAsyncKms())
+
+    async def run():
+      ciphertext = await env_aead.encrypt(b'plaintext', b'aad')
+      return await env_aead.decrypt(ciphertext, b'aad')
+
+    self.assertEqual(asyncio.run(run()), b'plaintext')
+
+  def test_ciphertexts_are_compatible_with_kms_envelope_aead(self):
+    remote = _FakeAsyncKms()
+    async_aead = aead.AsyncKmsEnvelopeAead(DEK_TEMPLATE, remote)
+    sync_aead = aead.KmsEnvelopeAead(DEK_TEMPLATE, remote.remote)
+
+    ciphertext = asyncio.run(async_aead.encrypt(b'plaintext', b'aad'))
+    self.assertEqual(sync_aead.decrypt(ciphertext, b'aad'), b'plaintext')
+    ciphertext = sync_aead.encrypt(b'plaintext', b'aad')
+    self.assertEqual(
+        asyncio.run(async_aead.decrypt(ciphertext, b'aad')), b'plaintext')
+
+  def test_decrypt_with_wrong_associated_data_fails(self):
+    env_aead = aead.AsyncKmsEnvelopeAead(DEK_TEMPLATE, _FakeAsyncKms())
+    ciphertext = asyncio.run(env_aead.encrypt(b'plaintext', b'aad'))
+    with self.assertRaises(tink.TinkError):
+      asyncio.run(env_aead.decrypt(ciphertext, b'bad aad'))
+
+  def test_decrypt_short_ciphertext_fails(self):
+    env_aead = aead.AsyncKmsEnvelopeAead(DEK_TEMPLATE, _FakeAsyncKms())
+    with self.assertRaises(tink.TinkError):
+      asyncio.run(env_aead.decrypt(b'\x00\x00', b''))
+    with self.assertRaises(tink.TinkError):
+      asyncio.run(env_aead.decrypt(b'\x00\x00\x10\x00abc', b''))
+
+  def test_encrypt_many_decrypt_many(self):
+    remote = _FakeAsyncKms()
+    env_aead = aead.AsyncKmsEnvelopeAead(
+        DEK_TEMPLATE, remote, max_concurrency=4)
+    plaintexts = [b'%d' % i for i in range(50)]
+    associated_datas = [b'aad'] * 50
+
+    async def run():
+      ciphertexts = await env_aead.encrypt_many(plaintexts, associated_datas)
+      return await env_aead.decrypt_many(ciphertexts, associated_datas)
+
+    self.assertEqual(asyncio.run(run()), plaintexts)
+    self.assertEqual(remote.encrypt_calls, 50)
+    self.assertEqual(remote.decrypt_calls, 50)
+    self.assertGreater(remote.max_in_flight, 1)
+    self.assertLessEqual(remote.max_in_flight, 4)
+
+  def test_decrypt_many_unwraps_each_encrypted_dek_once(self):
+    remote = _FakeAsyncKms()
+    env_aead = aead.AsyncKmsEnvelopeAead(DEK_TEMPLATE, remote)
+    sync_aead = aead.KmsEnvelopeAead(
+        DEK_TEMPLATE, remote.remote, max_dek_uses=10)
+    ciphertexts = [sync_aead.encrypt(b'%d' % i, b'') for i in range(20)]
+
+    plaintexts = asyncio.run(env_aead.decrypt_many(ciphertexts, [b''] * 20))
+    self.assertEqual(plaintexts, [b'%d' % i for i in range(20)])
+    self.assertEqual(remote.decrypt_calls, 2)
+
+  def test_decrypt_many_returns_errors_of_failing_items(self):
+    env_aead = aead.AsyncKmsEnvelopeAead(DEK_TEMPLATE, _FakeAsyncKms())
+
+    async def run():
+      ciphertext = await env_aead.encrypt(b'plaintext', b'aad')
+      return await env_aead.decrypt_many(
+          [ciphertext, b'\x00', ciphertext], [b'aad', b'aad', b'bad aad'])
+
+    results = asyncio.run(run())
+    self.assertEqual(results[0], b'plaintext')
+    self.assertIsInstance(results[1], tink.TinkError)
+    self.assertIsInstance(results[2], tink.TinkError)
+
+  def test_batches_of_different_lengths_fail(self):
+    env_aead = aead.AsyncKmsEnvelopeAead(DEK_TEMPLATE, _FakeAsyncKms())
+    with self.assertRaises(ValueError):
+      asyncio.run(env_aead.encrypt_many([b'a', b'b'], [b'']))
+    with self.assertRaises(ValueError):
+      asyncio.run(env_aead.decrypt_many([b'a'], []))
+
+  def test_invalid_arguments_fail(self):
+    with self.assertRaises(ValueError):
+      aead.AsyncKmsEnvelopeAead(
+          DEK_TEMPLATE, _FakeAsyncKms(), max_concurrency=0)
+    with self.assertRaises(core.TinkError):
+      aead.AsyncKmsEnvelopeAead(
+          aead.aead_key_templates.create_kms_aead_key_template(FAKE_KMS_URI),
+          _FakeAsyncKms())
+
+
+if __name__ == '__main__':
+  absltest.main()
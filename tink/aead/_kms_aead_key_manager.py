@@ -15,12 +15,13 @@
 """Python KMS AEAD key manager."""
 
 
-from typing import Type
+from typing import Optional, Tuple, Type
 
 from tink.proto import kms_aead_pb2
 from tink.proto import kms_envelope_pb2
 from tink.proto import tink_pb2
 from tink import _kms_clients
+from tink import _ttl_cache
 from tink import core
 from tink.aead import _aead
 from tink.aead import _kms_envelope_aead
@@ -32,8 +33,83 @@ _KMS_ENVELOPE_AEAD_KEY_TYPE_URL = (
 )
 
 
+class _BytesArgumentsAead(_aead.Aead):
+  """Passes all arguments to the wrapped Aead as bytes.
+
+  Keyset primitives accept any bytes-like object, but KMS clients typically
+  only accept bytes.
+  """
+
+  def __init__(self, remote: _aead.Aead):
+    self._remote = remote
+
+  def encrypt(self, plaintext: bytes, associated_data: bytes) -> bytes:
+    return self._remote.encrypt(bytes(plaintext), bytes(associated_data))
+
+  def decrypt(self, ciphertext: bytes, associated_data: bytes) -> bytes:
+    return self._remote.decrypt(bytes(ciphertext), bytes(associated_data))
+
+
+RemoteAeadCache = _ttl_cache.TtlCache[
+    Tuple[_kms_clients.KmsClient, str], _aead.Aead
+]
+
+# The cache of the key managers that were created without one.
+_default_remote_aead_cache: Optional[RemoteAeadCache] = None
+
+
+def set_default_remote_aead_cache(max_size: int, ttl: float = 0.0) -> None:
+  """Sets up the cache of the key managers that were created without one.
+
+  With a cache, the primitives of KMS AEAD and KMS envelope AEAD keys reuse
+  the AEADs that the KMS clients returned, instead of calling get_aead of the
+  client every time. This avoids setting up a connection to the KMS for each
+  primitive. The key managers read the cache for every primitive, so it also
+  applies to the key managers that are already registered. There is no cache
+  by default.
+
+  Args:
+    max_size: the number of key URIs whose AEADs are kept. 0 turns the cache
+      off.
+    ttl: if positive, a cached AEAD is only reused for ttl seconds.
+
+  Raises:
+    ValueError if max_size or ttl is negative.
+  """
+  if max_size < 0 or ttl < 0:
+    raise ValueError('max_size and ttl must not be negative')
+  global _default_remote_aead_cache
+  _default_remote_aead_cache = (
+      _ttl_cache.TtlCache(max_size, ttl) if max_size else None
+  )
+
+
+def _remote_aead(key_uri: str, cache: Optional[RemoteAeadCache]) -> _aead.Aead:
+  """Returns the AEAD of the registered KMS client that supports key_uri."""
+  if cache is None:
+    cache = _default_remote_aead_cache
+  client = _kms_clients.kms_client_from_uri(key_uri)
+  if cache is None:
+    return client.get_aead(key_uri=key_uri)
+  # The client is part of the key, so that clients which are registered after
+  # reset_kms_clients() do not get the AEADs of the old ones.
+  remote = cache.get((client, key_uri))
+  if remote is None:
+    remote = client.get_aead(key_uri=key_uri)
+    cache.put((client, key_uri), remote)
+  return remote
+
+
 class KmsAeadKeyManager(core.KeyManager[_aead.Aead]):
-  """KmsAeadKeyManager."""
+  """KmsAeadKeyManager.
+
+  If remote_aead_cache is set, the AEADs returned by the KMS clients are kept
+  in it, so that the primitives of the same key URI share one AEAD. Otherwise
+  the cache set by set_default_remote_aead_cache is used, if any.
+  """
+
+  def __init__(self, remote_aead_cache: Optional[RemoteAeadCache] = None):
+    self._remote_aead_cache = remote_aead_cache
 
   def primitive_class(self) -> Type[_aead.Aead]:
     return _aead.Aead
@@ -42,8 +118,9 @@ class KmsAeadKeyManager(core.KeyManager[_aead.Aead]):
     if key_data.type_url != _KMS_AEAD_KEY_TYPE_URL:
       raise core.TinkError('wrong key type: ' + key_data.type_url)
     kms_key = kms_aead_pb2.KmsAeadKey.FromString(key_data.value)
-    client = _kms_clients.kms_client_from_uri(kms_key.params.key_uri)
-    return client.get_aead(key_uri=kms_key.params.key_uri)
+    return _BytesArgumentsAead(
+        _remote_aead(kms_key.params.key_uri, self._remote_aead_cache)
+    )
 
   def key_type(self) -> str:
     return _KMS_AEAD_KEY_TYPE_URL
@@ -68,7 +145,18 @@ class KmsAeadKeyManager(core.KeyManager[_aead.Aead]):
 
 
 class KmsEnvelopeAeadKeyManager(core.KeyManager[_aead.Aead]):
-  """KmsEnvelopeAeadKeyManager."""
+  """KmsEnvelopeAeadKeyManager.
+
+  If remote_aead_cache is set, the AEADs returned by the KMS clients for the
+  KEKs are kept in it, see KmsAeadKeyManager.
+
+  The primitives use the default DEK options of KmsEnvelopeAead, so they
+  neither reuse nor cache DEKs. To use these options, construct a
+  KmsEnvelopeAead directly.
+  """
+
+  def __init__(self, remote_aead_cache: Optional[RemoteAeadCache] = None):
+    self._remote_aead_cache = remote_aead_cache
 
   def primitive_class(self) -> Type[_aead.Aead]:
     return _aead.Aead
@@ -77,11 +165,10 @@ class KmsEnvelopeAeadKeyManager(core.KeyManager[_aead.Aead]):
     if key_data.type_url != _KMS_ENVELOPE_AEAD_KEY_TYPE_URL:
       raise core.TinkError('wrong key type: ' + key_data.type_url)
     env_key = kms_envelope_pb2.KmsEnvelopeAeadKey.FromString(key_data.value)
-    client = _kms_clients.kms_client_from_uri(env_key.params.kek_uri)
 
     return _kms_envelope_aead.KmsEnvelopeAead(
         env_key.params.dek_template,
-        client.get_aead(key_uri=env_key.params.kek_uri),
+        _remote_aead(env_key.params.kek_uri, self._remote_aead_cache),
     )
 
   def key_type(self) -> str:
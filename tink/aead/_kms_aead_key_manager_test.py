@@ -14,13 +14,18 @@
 
 """Tests for kms_aead_key_manager."""
 
+from unittest import mock
+
 from absl.testing import absltest
 from tink.proto import kms_aead_pb2
 from tink.proto import kms_envelope_pb2
 from tink.proto import tink_pb2
 import tink
+from tink import _kms_clients
+from tink import _ttl_cache
 from tink import aead
 from tink.aead import _kms_aead_key_manager
+from tink.testing import fake_kms
 
 
 def setUpModule():
@@ -39,6 +44,19 @@ class FakeClient(tink.KmsClient):
     raise NotImplementedError('not implemented')
 
 
+class _CountingFakeKmsClient(fake_kms.FakeKmsClient):
+  """Counts the calls to get_aead."""
+
+  def __init__(self):
+    super().__init__()
+    self.get_aead_calls = 0
+
+  def get_aead(self, key_uri: str) -> aead.Aead:
+    self.get_aead_calls += 1
+    return super().get_aead(key_uri)
+
+
+FAKE_KMS_URI = 'fake-kms://CM2b3_MDElQKSAowdHlwZS5nb29nbGVhcGlzLmNvbS9nb29nbGUuY3J5cHRvLnRpbmsuQWVzR2NtS2V5EhIaEIK75t5L-adlUwVhWvRuWUwYARABGM2b3_MDIAE'
 KMS_AEAD_KEY_TYPE_URL = 'type.googleapis.com/google.crypto.tink.KmsAeadKey'
 KMS_ENVELOPE_AEAD_KEY_TYPE_URL = (
     'type.googleapis.com/google.crypto.tink.KmsEnvelopeAeadKey'
@@ -119,5 +137,121 @@ class KmsAeadKeyManagerTest(absltest.TestCase):
       )
 
 
+class RemoteAeadCacheTest(absltest.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    _kms_clients.reset_kms_clients()
+    self.addCleanup(_kms_clients.reset_kms_clients)
+    self.client = _CountingFakeKmsClient()
+    tink.register_kms_client(self.client)
+    self.kms_key_data = _kms_aead_key_manager.KmsAeadKeyManager().new_key_data(
+        aead.aead_key_templates.create_kms_aead_key_template(FAKE_KMS_URI)
+    )
+    self.envelope_key_data = (
+        _kms_aead_key_manager.KmsEnvelopeAeadKeyManager().new_key_data(
+            aead.aead_key_templates.create_kms_envelope_aead_key_template(
+                kek_uri=FAKE_KMS_URI,
+                dek_template=aead.aead_key_templates.AES128_GCM,
+            )
+        )
+    )
+
+  def test_primitives_share_remote_aead(self):
+    cache = _ttl_cache.TtlCache(10)
+    kms_manager = _kms_aead_key_manager.KmsAeadKeyManager(cache)
+    envelope_manager = _kms_aead_key_manager.KmsEnvelopeAeadKeyManager(cache)
+
+    primitive1 = kms_manager.primitive(self.kms_key_data)
+    primitive2 = kms_manager.primitive(self.kms_key_data)
+    envelope_primitive = envelope_manager.primitive(self.envelope_key_data)
+    self.assertEqual(self.client.get_aead_calls, 1)
+
+    ciphertext = primitive1.encrypt(b'plaintext', b'ad')
+    self.assertEqual(primitive2.decrypt(ciphertext, b'ad'), b'plaintext')
+    ciphertext = envelope_primitive.encrypt(b'plaintext', b'ad')
+    self.assertEqual(
+        envelope_manager.primitive(self.envelope_key_data).decrypt(
+            ciphertext, b'ad'
+        ),
+        b'plaintext',
+    )
+    self.assertEqual(self.client.get_aead_calls, 1)
+
+  def test_remote_aead_expires(self):
+    kms_manager = _kms_aead_key_manager.KmsAeadKeyManager(
+        _ttl_cache.TtlCache(10, ttl=60)
+    )
+    with mock.patch.object(
+        _ttl_cache.time, 'monotonic', autospec=True
+    ) as monotonic:
+      monotonic.return_value = 1000.0
+      kms_manager.primitive(self.kms_key_data)
+      monotonic.return_value = 1059.0
+      kms_manager.primitive(self.kms_key_data)
+      self.assertEqual(self.client.get_aead_calls, 1)
+      monotonic.return_value = 1060.0
+      kms_manager.primitive(self.kms_key_data)
+      self.assertEqual(self.client.get_aead_calls, 2)
+
+  def test_remote_aead_of_new_client_after_reset(self):
+    kms_manager = _kms_aead_key_manager.KmsAeadKeyManager(
+        _ttl_cache.TtlCache(10)
+    )
+    kms_manager.primitive(self.kms_key_data)
+    _kms_clients.reset_kms_clients()
+    new_client = _CountingFakeKmsClient()
+    tink.register_kms_client(new_client)
+    kms_manager.primitive(self.kms_key_data)
+    self.assertEqual(self.client.get_aead_calls, 1)
+    self.assertEqual(new_client.get_aead_calls, 1)
+
+  def test_no_cache_by_default(self):
+    kms_manager = _kms_aead_key_manager.KmsAeadKeyManager()
+    kms_manager.primitive(self.kms_key_data)
+    kms_manager.primitive(self.kms_key_data)
+    self.assertEqual(self.client.get_aead_calls, 2)
+
+  def test_default_cache(self):
+    # setUpModule registered the key managers without a cache already.
+    aead.set_default_remote_aead_cache(10, ttl=60)
+    self.addCleanup(aead.set_default_remote_aead_cache, 0)
+    handle = tink.new_keyset_handle(
+        aead.aead_key_templates.create_kms_aead_key_template(FAKE_KMS_URI)
+    )
+    envelope_handle = tink.new_keyset_handle(
+        aead.aead_key_templates.create_kms_envelope_aead_key_template(
+            kek_uri=FAKE_KMS_URI,
+            dek_template=aead.aead_key_templates.AES128_GCM,
+        )
+    )
+    handle.primitive(aead.Aead)
+    handle.primitive(aead.Aead)
+    envelope_handle.primitive(aead.Aead)
+    self.assertEqual(self.client.get_aead_calls, 1)
+
+  def test_register_keeps_default_cache(self):
+    aead.set_default_remote_aead_cache(10)
+    self.addCleanup(aead.set_default_remote_aead_cache, 0)
+    handle = tink.new_keyset_handle(
+        aead.aead_key_templates.create_kms_aead_key_template(FAKE_KMS_URI)
+    )
+    handle.primitive(aead.Aead)
+    aead.register()
+    handle.primitive(aead.Aead)
+    self.assertEqual(self.client.get_aead_calls, 1)
+
+    aead.set_default_remote_aead_cache(0)
+    handle.primitive(aead.Aead)
+    handle.primitive(aead.Aead)
+    self.assertEqual(self.client.get_aead_calls, 3)
+
+  def test_default_cache_negative_arguments_fail(self):
+    with self.assertRaises(ValueError):
+      aead.set_default_remote_aead_cache(-1)
+    with self.assertRaises(ValueError):
+      aead.set_default_remote_aead_cache(10, ttl=-1)
+
+
 if __name__ == '__main__':
   absltest.main()
@@ -13,9 +13,17 @@
 # limitations under the License.
 """Module for envelope encryption with KMS."""
 
+import collections
+from concurrent import futures
+import contextlib
 import struct
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 from tink.proto import tink_pb2
+from tink import _batch
+from tink import _ttl_cache
 from tink import core
 from tink.aead import _aead
 
@@ -29,11 +37,89 @@ _SUPPORTED_DEK_KEY_TYPES = frozenset({
 
 _MAX_ENCRYPTED_DEK_LEN = 4096
 
+DEFAULT_DECRYPT_MANY_WORKERS = 8
+
+# decrypt_many does not split the payloads of a DEK into smaller batches.
+_MIN_DECRYPT_SLICE = 256
+
 
 def is_supported_dek_key_type(type_url: str) -> bool:
   return type_url in _SUPPORTED_DEK_KEY_TYPES
 
 
+def dek_prefix(encrypted_dek: bytes) -> bytes:
+  """Returns the ciphertext prefix, i.e. the DEK length and encrypted DEK."""
+  if len(encrypted_dek) > _MAX_ENCRYPTED_DEK_LEN:
+    raise core.TinkError('length of encrypted DEK too large')
+
+  # DEK length encoded as big endian
+  return struct.pack('>I', len(encrypted_dek)) + encrypted_dek
+
+
+def split_ciphertext(ciphertext: bytes) -> Tuple[bytes, memoryview]:
+  """Splits an envelope ciphertext into the encrypted DEK and the payload."""
+  ct_len = len(ciphertext)
+
+  if ct_len < KmsEnvelopeAead.DEK_LEN_BYTES:
+    raise core.TinkError
+
+  # Parse first 4 bytes as big endian unsigned int
+  dek_len = struct.unpack(
+      '>I', ciphertext[0:KmsEnvelopeAead.DEK_LEN_BYTES])[0]
+  if (
+      dek_len < 0
+      or dek_len > _MAX_ENCRYPTED_DEK_LEN
+      or dek_len > (ct_len - KmsEnvelopeAead.DEK_LEN_BYTES)
+  ):
+    raise core.TinkError('length of encrypted DEK too large')
+
+  payload_start = KmsEnvelopeAead.DEK_LEN_BYTES + dek_len
+  encrypted_dek_bytes = bytes(
+      ciphertext[KmsEnvelopeAead.DEK_LEN_BYTES : payload_start]
+  )
+  return encrypted_dek_bytes, memoryview(ciphertext)[payload_start:]
+
+
+def dek_key_data(type_url: str, dek_bytes: bytes) -> tink_pb2.KeyData:
+  """Returns the KeyData of a decrypted DEK."""
+  return tink_pb2.KeyData(
+      type_url=type_url,
+      value=dek_bytes,
+      key_material_type=tink_pb2.KeyData.SYMMETRIC,
+  )
+
+
+class DekReuseStats(
+    collections.namedtuple(
+        'DekReuseStats', 'encryptions, kms_calls, kms_calls_saved'
+    )
+):
+  """Counters of the encryptions of a KmsEnvelopeAead.
+
+  Attributes:
+    encryptions: messages that were encrypted.
+    kms_calls: DEKs that were generated and encrypted by the remote AEAD.
+    kms_calls_saved: encryptions that reused a DEK, and so did not call the
+      remote AEAD.
+  """
+
+  __slots__ = ()
+
+
+class _ReusableDek:
+  """A DEK, its encrypted form, and how much it has been used."""
+
+  __slots__ = ('aead', 'prefix', 'uses', 'encrypted_bytes', 'created')
+
+  def __init__(self, dek_aead: _aead.Aead, prefix: bytes, created: float):
+    self.aead = dek_aead
+    # The ciphertext prefix, i.e. the DEK length and the encrypted DEK.
+    self.prefix = prefix
+    self.uses = 0
+    self.encrypted_bytes = 0
+    self.created = created
+
+
 class KmsEnvelopeAead(_aead.Aead):
   """Implements envelope encryption.
 
@@ -56,12 +142,48 @@ class KmsEnvelopeAead(_aead.Aead):
   * Length of the encrypted DEK: 4 bytes (big endian)
   * Encrypted DEK: variable length, specified by the previous 4 bytes
   * AEAD payload: variable length
+
+  By default, every encryption generates a new DEK and calls the remote AEAD.
+  If max_dek_uses is larger than 1, a DEK is reused for up to max_dek_uses
+  messages, and it is replaced earlier once it is max_dek_age seconds old or
+  has encrypted max_dek_bytes bytes of plaintext, if these limits are
+  positive. The ciphertexts are the same as without reuse, except that
+  several of them hold the same encrypted DEK. max_dek_uses must stay far
+  below the number of messages that the DEK key type can safely encrypt with
+  one key, e.g. 2^32 for AES-GCM. Messages encrypted with the same DEK can be
+  linked to each other by their encrypted DEK.
+
+  If dek_cache_size is positive, decryption keeps the DEK primitives of up to
+  dek_cache_size encrypted DEKs, so that further ciphertexts with the same
+  encrypted DEK are decrypted without calling the remote AEAD. Cached DEKs
+  expire after dek_cache_ttl seconds, if it is positive. Note that the cached
+  DEKs stay in memory until they are evicted, expire or are invalidated.
+
+  These DEK options only apply to a KmsEnvelopeAead that is constructed
+  directly. The primitives of KmsEnvelopeAeadKey keys in a keyset, as returned
+  by KeysetHandle.primitive, always use the defaults: a new DEK for every
+  encryption and no DEK cache.
   """
 
   # Defines in how many bytes the DEK length will be encoded.
   DEK_LEN_BYTES = 4
 
-  def __init__(self, key_template: tink_pb2.KeyTemplate, remote: _aead.Aead):
+  def __init__(
+      self,
+      key_template: tink_pb2.KeyTemplate,
+      remote: _aead.Aead,
+      max_dek_uses: int = 1,
+      max_dek_age: float = 0.0,
+      max_dek_bytes: int = 0,
+      dek_cache_size: int = 0,
+      dek_cache_ttl: float = 0.0,
+  ):
+    if max_dek_uses < 1:
+      raise ValueError('max_dek_uses must be positive')
+    if max_dek_age < 0 or max_dek_bytes < 0:
+      raise ValueError('max_dek_age and max_dek_bytes must not be negative')
+    if dek_cache_size < 0 or dek_cache_ttl < 0:
+      raise ValueError('dek_cache_size and dek_cache_ttl must not be negative')
     if not is_supported_dek_key_type(key_template.type_url):
       raise core.TinkError(
           'Unsupported DEK key type: %s' % key_template.type_url
@@ -74,54 +196,208 @@ class KmsEnvelopeAead(_aead.Aead):
 
     self.key_template = key_template
     self.remote_aead = remote
+    self._max_dek_uses = max_dek_uses
+    self._max_dek_age = max_dek_age
+    self._max_dek_bytes = max_dek_bytes
+    self._lock = threading.Lock()
+    self._dek: Optional[_ReusableDek] = None
+    self._encryptions = 0
+    self._kms_calls = 0
+    self._dek_cache: Optional[_ttl_cache.TtlCache[bytes, _aead.Aead]] = None
+    if dek_cache_size:
+      self._dek_cache = _ttl_cache.TtlCache(dek_cache_size, dek_cache_ttl)
 
-  def encrypt(self, plaintext: bytes, associated_data: bytes) -> bytes:
+  def _new_dek(self) -> Tuple[_aead.Aead, bytes]:
+    """Returns a new DEK primitive and the ciphertext prefix of the DEK."""
     # Get new key from template
     dek = core.Registry.new_key_data(self.key_template)
     dek_aead = core.Registry.primitive(dek, _aead.Aead)
 
-    # Encrypt plaintext
-    ciphertext = dek_aead.encrypt(plaintext, associated_data)
-
     # Wrap DEK key values with remote
     encrypted_dek = self.remote_aead.encrypt(dek.value, b'')
 
-    if len(encrypted_dek) > _MAX_ENCRYPTED_DEK_LEN:
-      raise core.TinkError('length of encrypted DEK too large')
+    return dek_aead, dek_prefix(encrypted_dek)
+
+  def _is_usable(self, dek: _ReusableDek, plaintext_len: int,
+                 now: float) -> bool:
+    if dek.uses >= self._max_dek_uses:
+      return False
+    if self._max_dek_age and now - dek.created >= self._max_dek_age:
+      return False
+    return not self._max_dek_bytes or (
+        dek.encrypted_bytes + plaintext_len <= self._max_dek_bytes
+    )
+
+  def _reusable_dek(self, plaintext_len: int) -> Tuple[_aead.Aead, bytes]:
+    """Returns the current DEK, after replacing it if it is used up."""
+    with self._lock:
+      now = time.monotonic()
+      dek = self._dek
+      if dek is None or not self._is_usable(dek, plaintext_len, now):
+        # Holding the lock while the remote AEAD is called ensures that
+        # concurrent encryptions do not replace the DEK several times.
+        dek_aead, prefix = self._new_dek()
+        self._kms_calls += 1
+        dek = self._dek = _ReusableDek(dek_aead, prefix, now)
+      self._encryptions += 1
+      dek.uses += 1
+      dek.encrypted_bytes += plaintext_len
+      return dek.aead, dek.prefix
 
-    # Construct ciphertext, DEK length encoded as big endian
-    enc_dek_len = struct.pack('>I', len(encrypted_dek))
-    return enc_dek_len + encrypted_dek + ciphertext
+  def encrypt(self, plaintext: bytes, associated_data: bytes) -> bytes:
+    if self._max_dek_uses > 1:
+      dek_aead, prefix = self._reusable_dek(memoryview(plaintext).nbytes)
+    else:
+      dek_aead, prefix = self._new_dek()
+      with self._lock:
+        self._encryptions += 1
+        self._kms_calls += 1
+
+    # Construct ciphertext
+    return prefix + dek_aead.encrypt(plaintext, associated_data)
+
+  def dek_reuse_stats(self) -> DekReuseStats:
+    """Returns the counters of the encryptions, see DekReuseStats."""
+    with self._lock:
+      return DekReuseStats(
+          self._encryptions,
+          self._kms_calls,
+          self._encryptions - self._kms_calls,
+      )
 
   def decrypt(self, ciphertext: bytes, associated_data: bytes) -> bytes:
-    ct_len = len(ciphertext)
+    encrypted_dek_bytes, ct_bytes = split_ciphertext(ciphertext)
+    dek_aead = self._dek_aead(encrypted_dek_bytes)
 
-    if ct_len < self.DEK_LEN_BYTES:
-      raise core.TinkError
+    # Decrypt the ciphertext payload
+    return dek_aead.decrypt(ct_bytes, associated_data)
 
-    # Parse first 4 bytes as big endian unsigned int
-    dek_len = struct.unpack('>I', ciphertext[0:self.DEK_LEN_BYTES])[0]
-    if (
-        dek_len < 0
-        or dek_len > _MAX_ENCRYPTED_DEK_LEN
-        or dek_len > (ct_len - self.DEK_LEN_BYTES)
-    ):
-      raise core.TinkError('length of encrypted DEK too large')
+  def _dek_aead(self, encrypted_dek: bytes) -> _aead.Aead:
+    """Returns the AEAD primitive of an encrypted DEK."""
+    if self._dek_cache is not None:
+      dek_aead = self._dek_cache.get(encrypted_dek)
+      if dek_aead is not None:
+        return dek_aead
 
     # Decrypt DEK with remote AEAD
-    encrypted_dek_bytes = ciphertext[self.DEK_LEN_BYTES:self.DEK_LEN_BYTES +
-                                     dek_len]
-    dek_bytes = self.remote_aead.decrypt(encrypted_dek_bytes, b'')
+    dek_bytes = self.remote_aead.decrypt(encrypted_dek, b'')
 
     # Get AEAD primitive based on DEK
-    dek = tink_pb2.KeyData(
-        type_url=self.key_template.type_url,
-        value=dek_bytes,
-        key_material_type=tink_pb2.KeyData.SYMMETRIC,
-    )
+    dek = dek_key_data(self.key_template.type_url, dek_bytes)
     dek_aead = core.Registry.primitive(dek, _aead.Aead)
+    if self._dek_cache is not None:
+      self._dek_cache.put(encrypted_dek, dek_aead)
+    return dek_aead
 
-    # Extract ciphertext payload and decrypt
-    ct_bytes = ciphertext[self.DEK_LEN_BYTES + dek_len:]
+  def _try_dek_aead(
+      self, encrypted_dek: bytes
+  ) -> Union[_aead.Aead, core.TinkError]:
+    try:
+      return self._dek_aead(encrypted_dek)
+    except core.TinkError as e:
+      return e
 
-    return dek_aead.decrypt(ct_bytes, associated_data)
+  def decrypt_many(
+      self,
+      ciphertexts: Sequence[bytes],
+      associated_datas: Sequence[bytes],
+      max_workers: int = DEFAULT_DECRYPT_MANY_WORKERS,
+  ) -> List[Union[bytes, core.TinkError]]:
+    """Decrypts a batch of ciphertexts.
+
+    Ciphertexts that hold the same encrypted DEK share a single call to the
+    remote AEAD, or a single lookup in the DEK cache. The distinct encrypted
+    DEKs are decrypted by the remote AEAD on up to max_workers threads, so
+    the remote AEAD must be thread-safe. Then the payloads of each DEK are
+    decrypted in batches, which also run on these threads.
+
+    Args:
+      ciphertexts: a sequence of bytes-like objects to be decrypted.
+      associated_datas: a sequence of the same length with the associated data
+        for each ciphertext.
+      max_workers: the number of threads. If it is 1, everything is decrypted
+        on the calling thread.
+    Returns:
+      a list that contains, for each ciphertext, either the plaintext as bytes
+      or the tink.TinkError that caused its decryption to fail. A failing item
+      does not abort the batch.
+    Raises:
+      ValueError if ciphertexts and associated_datas have different lengths,
+      or max_workers is not positive.
+    """
+    _batch.check_same_length(ciphertexts, associated_datas)
+    if max_workers < 1:
+      raise ValueError('max_workers must be positive')
+    results: List[Union[bytes, core.TinkError, None]] = [None] * len(
+        ciphertexts
+    )
+    payloads: List[Optional[memoryview]] = [None] * len(ciphertexts)
+    # The indices of the ciphertexts of each distinct encrypted DEK.
+    by_dek: Dict[bytes, List[int]] = collections.defaultdict(list)
+    for i, ciphertext in enumerate(ciphertexts):
+      try:
+        encrypted_dek, payloads[i] = split_ciphertext(ciphertext)
+      except core.TinkError as e:
+        results[i] = e
+        continue
+      by_dek[encrypted_dek].append(i)
+
+    slice_size = max(_MIN_DECRYPT_SLICE, -(-len(ciphertexts) // max_workers))
+    slices = [
+        (encrypted_dek, indices[start : start + slice_size])
+        for encrypted_dek, indices in by_dek.items()
+        for start in range(0, len(indices), slice_size)
+    ]
+
+    def decrypt_slice(encrypted_dek: bytes, indices: List[int]) -> None:
+      dek_aead = dek_aeads[encrypted_dek]
+      if isinstance(dek_aead, core.TinkError):
+        for i in indices:
+          results[i] = dek_aead
+        return
+      plaintexts = dek_aead.decrypt_many(
+          [payloads[i] for i in indices],
+          [associated_datas[i] for i in indices],
+      )
+      for i, plaintext in zip(indices, plaintexts):
+        results[i] = plaintext
+
+    with contextlib.ExitStack() as stack:
+      run = map
+      if max_workers > 1 and len(slices) > 1:
+        executor = stack.enter_context(
+            futures.ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix='tink-kms-envelope-aead',
+            )
+        )
+        run = executor.map
+      dek_aeads = dict(zip(by_dek, run(self._try_dek_aead, by_dek)))
+      list(
+          run(
+              decrypt_slice,
+              [encrypted_dek for encrypted_dek, _ in slices],
+              [indices for _, indices in slices],
+          )
+      )
+    return results
+
+  def invalidate_dek_cache(self, encrypted_dek: Optional[bytes] = None) -> None:
+    """Removes an encrypted DEK, or all of them, from the DEK cache.
+
+    Args:
+      encrypted_dek: the encrypted DEK to remove, as it appears in the
+        ciphertexts. If None, all DEKs are removed.
+    """
+    if self._dek_cache is None:
+      return
+    if encrypted_dek is None:
+      self._dek_cache.clear()
+    else:
+      self._dek_cache.invalidate(bytes(encrypted_dek))
+
+  def dek_cache_stats(self) -> Optional[_ttl_cache.CacheStats]:
+    """Returns the counters of the DEK cache, or None if it is disabled."""
+    if self._dek_cache is None:
+      return None
+    return self._dek_cache.stats()
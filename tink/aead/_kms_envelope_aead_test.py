@@ -13,15 +13,19 @@
 # limitations under the License.
 
 import struct
+import threading
+from unittest import mock
 
 from absl.testing import absltest
 from absl.testing import parameterized
 
 from tink.proto import aes_gcm_pb2
 import tink
+from tink import _ttl_cache
 from tink import aead
 from tink import core
 from tink import mac
+from tink.aead import _kms_envelope_aead
 from tink.testing import fake_kms
 
 
@@ -29,6 +33,31 @@ def setUpModule():
   aead.register()
 
 
+class _CountingAead(aead.Aead):
+  """Counts the calls to a wrapped Aead, which may come from several threads."""
+
+  def __init__(self, remote: aead.Aead):
+    self._remote = remote
+    self._lock = threading.Lock()
+    self.encrypt_calls = 0
+    self.decrypt_calls = 0
+
+  def encrypt(self, plaintext: bytes, associated_data: bytes) -> bytes:
+    with self._lock:
+      self.encrypt_calls += 1
+    return self._remote.encrypt(plaintext, associated_data)
+
+  def decrypt(self, ciphertext: bytes, associated_data: bytes) -> bytes:
+    with self._lock:
+      self.decrypt_calls += 1
+    return self._remote.decrypt(ciphertext, associated_data)
+
+
+def _encrypted_dek(ciphertext: bytes) -> bytes:
+  dek_len = struct.unpack('>I', ciphertext[:4])[0]
+  return ciphertext[4:4 + dek_len]
+
+
 class KmsEnvelopeAeadTest(parameterized.TestCase):
 
   def remote_aead(self):
@@ -57,6 +86,27 @@ class KmsEnvelopeAeadTest(parameterized.TestCase):
     with self.assertRaises(core.TinkError):
       _ = env_aead.decrypt(ciphertext, b'invalid_associated_data')
 
+  def test_encrypt_into_decrypt_into(self):
+    env_aead = aead.KmsEnvelopeAead(
+        aead.aead_key_templates.AES256_GCM, self.remote_aead()
+    )
+    out = bytearray(1000)
+    ciphertext_length = env_aead.encrypt_into(
+        b'plaintext', b'associated_data', out
+    )
+    ciphertext = bytes(out[:ciphertext_length])
+    self.assertEqual(
+        env_aead.decrypt(ciphertext, b'associated_data'), b'plaintext'
+    )
+    plaintext_out = bytearray(len(ciphertext))
+    self.assertEqual(
+        env_aead.decrypt_into(ciphertext, b'associated_data', plaintext_out),
+        len(b'plaintext'),
+    )
+    self.assertEqual(plaintext_out[: len(b'plaintext')], b'plaintext')
+    with self.assertRaises(ValueError):
+      env_aead.encrypt_into(b'plaintext', b'associated_data', bytearray(10))
+
   def test_encrypt_decrypt_missing_ad(self):
     key_template = aead.aead_key_templates.AES256_GCM
     env_aead = aead.KmsEnvelopeAead(key_template, self.remote_aead())
@@ -184,5 +234,238 @@ class KmsEnvelopeAeadTest(parameterized.TestCase):
     self.assertEqual(aead1.decrypt(ciphertext2, associated_data), plaintext)
 
 
+  def test_dek_reuse(self):
+    remote_aead = _CountingAead(self.remote_aead())
+    env_aead = aead.KmsEnvelopeAead(
+        aead.aead_key_templates.AES256_GCM, remote_aead, max_dek_uses=3
+    )
+    ciphertexts = [
+        env_aead.encrypt(b'plaintext %d' % i, b'ad') for i in range(7)
+    ]
+    self.assertEqual(remote_aead.encrypt_calls, 3)
+    self.assertEqual(
+        env_aead.dek_reuse_stats(),
+        aead.DekReuseStats(encryptions=7, kms_calls=3, kms_calls_saved=4),
+    )
+    encrypted_deks = [_encrypted_dek(c) for c in ciphertexts]
+    self.assertLen(set(encrypted_deks[:3]), 1)
+    self.assertLen(set(encrypted_deks[3:6]), 1)
+    self.assertLen(set(encrypted_deks), 3)
+    self.assertLen(set(ciphertexts), 7)
+
+    # The ciphertexts can be decrypted by a KmsEnvelopeAead without reuse.
+    decrypting_aead = aead.KmsEnvelopeAead(
+        aead.aead_key_templates.AES256_GCM, remote_aead
+    )
+    for i, ciphertext in enumerate(ciphertexts):
+      self.assertEqual(
+          decrypting_aead.decrypt(ciphertext, b'ad'), b'plaintext %d' % i
+      )
+
+  def test_dek_reuse_max_bytes(self):
+    remote_aead = _CountingAead(self.remote_aead())
+    env_aead = aead.KmsEnvelopeAead(
+        aead.aead_key_templates.AES256_GCM,
+        remote_aead,
+        max_dek_uses=100,
+        max_dek_bytes=25,
+    )
+    for _ in range(5):
+      env_aead.encrypt(b'0123456789', b'ad')
+    # A DEK encrypts at most 2 plaintexts of 10 bytes.
+    self.assertEqual(remote_aead.encrypt_calls, 3)
+    # A plaintext larger than max_dek_bytes gets a DEK of its own.
+    env_aead.encrypt(b'x' * 100, b'ad')
+    env_aead.encrypt(b'0123456789', b'ad')
+    self.assertEqual(remote_aead.encrypt_calls, 5)
+
+  def test_dek_reuse_max_age(self):
+    remote_aead = _CountingAead(self.remote_aead())
+    env_aead = aead.KmsEnvelopeAead(
+        aead.aead_key_templates.AES256_GCM,
+        remote_aead,
+        max_dek_uses=100,
+        max_dek_age=60,
+    )
+    with mock.patch.object(
+        _kms_envelope_aead.time, 'monotonic', autospec=True
+    ) as monotonic:
+      monotonic.return_value = 1000.0
+      env_aead.encrypt(b'plaintext', b'ad')
+      monotonic.return_value = 1059.0
+      env_aead.encrypt(b'plaintext', b'ad')
+      self.assertEqual(remote_aead.encrypt_calls, 1)
+      monotonic.return_value = 1060.0
+      env_aead.encrypt(b'plaintext', b'ad')
+      self.assertEqual(remote_aead.encrypt_calls, 2)
+
+  def test_no_dek_reuse_by_default(self):
+    remote_aead = _CountingAead(self.remote_aead())
+    env_aead = aead.KmsEnvelopeAead(
+        aead.aead_key_templates.AES256_GCM, remote_aead
+    )
+    ciphertexts = [env_aead.encrypt(b'plaintext', b'ad') for _ in range(3)]
+    self.assertEqual(remote_aead.encrypt_calls, 3)
+    self.assertLen(set(_encrypted_dek(c) for c in ciphertexts), 3)
+    self.assertEqual(
+        env_aead.dek_reuse_stats(),
+        aead.DekReuseStats(encryptions=3, kms_calls=3, kms_calls_saved=0),
+    )
+
+  def test_invalid_dek_reuse_limits_fail(self):
+    remote_aead = self.remote_aead()
+    template = aead.aead_key_templates.AES256_GCM
+    with self.assertRaises(ValueError):
+      aead.KmsEnvelopeAead(template, remote_aead, max_dek_uses=0)
+    with self.assertRaises(ValueError):
+      aead.KmsEnvelopeAead(template, remote_aead, max_dek_age=-1)
+    with self.assertRaises(ValueError):
+      aead.KmsEnvelopeAead(template, remote_aead, max_dek_bytes=-1)
+
+
+  def test_dek_cache(self):
+    remote_aead = _CountingAead(self.remote_aead())
+    template = aead.aead_key_templates.AES256_GCM
+    encrypting_aead = aead.KmsEnvelopeAead(
+        template, remote_aead, max_dek_uses=10
+    )
+    ciphertexts = [
+        encrypting_aead.encrypt(b'plaintext %d' % i, b'ad') for i in range(5)
+    ]
+    env_aead = aead.KmsEnvelopeAead(template, remote_aead, dek_cache_size=10)
+    for i, ciphertext in enumerate(ciphertexts):
+      self.assertEqual(
+          env_aead.decrypt(ciphertext, b'ad'), b'plaintext %d' % i
+      )
+    self.assertEqual(remote_aead.decrypt_calls, 1)
+    self.assertEqual(
+        env_aead.dek_cache_stats(),
+        tink.CacheStats(hits=4, misses=1, evictions=0, expirations=0, size=1),
+    )
+    # A wrong associated data fails also with a cached DEK.
+    with self.assertRaises(core.TinkError):
+      env_aead.decrypt(ciphertexts[0], b'wrong ad')
+
+    env_aead.invalidate_dek_cache(_encrypted_dek(ciphertexts[0]))
+    env_aead.decrypt(ciphertexts[0], b'ad')
+    self.assertEqual(remote_aead.decrypt_calls, 2)
+    env_aead.invalidate_dek_cache()
+    self.assertEqual(env_aead.dek_cache_stats().size, 0)
+
+  def test_dek_cache_size_and_ttl(self):
+    remote_aead = _CountingAead(self.remote_aead())
+    template = aead.aead_key_templates.AES256_GCM
+    encrypting_aead = aead.KmsEnvelopeAead(template, remote_aead)
+    ciphertexts = [encrypting_aead.encrypt(b'plaintext', b'') for _ in range(3)]
+    env_aead = aead.KmsEnvelopeAead(
+        template, remote_aead, dek_cache_size=2, dek_cache_ttl=60
+    )
+    with mock.patch.object(
+        _ttl_cache.time, 'monotonic', autospec=True
+    ) as monotonic:
+      monotonic.return_value = 1000.0
+      for ciphertext in ciphertexts:
+        env_aead.decrypt(ciphertext, b'')
+      self.assertEqual(env_aead.dek_cache_stats().evictions, 1)
+      env_aead.decrypt(ciphertexts[2], b'')
+      self.assertEqual(remote_aead.decrypt_calls, 3)
+      monotonic.return_value = 1060.0
+      env_aead.decrypt(ciphertexts[2], b'')
+      self.assertEqual(remote_aead.decrypt_calls, 4)
+      self.assertEqual(env_aead.dek_cache_stats().expirations, 1)
+
+  def test_dek_cache_does_not_cache_failures(self):
+    env_aead = aead.KmsEnvelopeAead(
+        aead.aead_key_templates.AES256_GCM,
+        self.remote_aead(),
+        dek_cache_size=10,
+    )
+    ciphertext = bytearray(env_aead.encrypt(b'plaintext', b'ad'))
+    ciphertext[4] ^= 0x1
+    for _ in range(2):
+      with self.assertRaises(core.TinkError):
+        env_aead.decrypt(bytes(ciphertext), b'ad')
+    self.assertEqual(env_aead.dek_cache_stats().size, 0)
+
+  def test_dek_cache_disabled_by_default(self):
+    env_aead = aead.KmsEnvelopeAead(
+        aead.aead_key_templates.AES256_GCM, self.remote_aead()
+    )
+    self.assertIsNone(env_aead.dek_cache_stats())
+    env_aead.invalidate_dek_cache()
+    with self.assertRaises(ValueError):
+      aead.KmsEnvelopeAead(
+          aead.aead_key_templates.AES256_GCM,
+          self.remote_aead(),
+          dek_cache_size=-1,
+      )
+
+  @parameterized.parameters([1, 4])
+  def test_decrypt_many(self, max_workers):
+    remote_aead = _CountingAead(self.remote_aead())
+    template = aead.aead_key_templates.AES256_GCM
+    encrypting_aead = aead.KmsEnvelopeAead(
+        template, remote_aead, max_dek_uses=100
+    )
+    plaintexts = [b'plaintext %d' % i for i in range(1000)]
+    ciphertexts = [encrypting_aead.encrypt(p, b'ad') for p in plaintexts]
+    # Ciphertexts with a new DEK each are also decrypted.
+    single_dek_aead = aead.KmsEnvelopeAead(template, remote_aead)
+    ciphertexts.append(single_dek_aead.encrypt(b'single', b'ad'))
+    plaintexts.append(b'single')
+
+    env_aead = aead.KmsEnvelopeAead(template, remote_aead)
+    self.assertEqual(
+        env_aead.decrypt_many(
+            ciphertexts, [b'ad'] * len(ciphertexts), max_workers=max_workers
+        ),
+        plaintexts,
+    )
+    # Only the 11 distinct encrypted DEKs are decrypted by the remote AEAD.
+    self.assertEqual(remote_aead.decrypt_calls, 11)
+
+  def test_decrypt_many_returns_errors_of_failing_items(self):
+    env_aead = aead.KmsEnvelopeAead(
+        aead.aead_key_templates.AES256_GCM, self.remote_aead(), max_dek_uses=5
+    )
+    ciphertexts = [env_aead.encrypt(b'plaintext', b'ad') for _ in range(2)]
+    corrupted_dek = bytearray(env_aead.encrypt(b'plaintext', b'ad'))
+    corrupted_dek[4] ^= 0x1
+    ciphertexts += [b'\x00', bytes(corrupted_dek), ciphertexts[0]]
+
+    results = env_aead.decrypt_many(ciphertexts, [b'ad'] * 4 + [b'wrong ad'])
+    self.assertEqual(results[:2], [b'plaintext'] * 2)
+    for result in results[2:]:
+      self.assertIsInstance(result, core.TinkError)
+
+  def test_decrypt_many_uses_dek_cache(self):
+    remote_aead = _CountingAead(self.remote_aead())
+    template = aead.aead_key_templates.AES256_GCM
+    encrypting_aead = aead.KmsEnvelopeAead(
+        template, remote_aead, max_dek_uses=10
+    )
+    ciphertexts = [
+        encrypting_aead.encrypt(b'plaintext %d' % i, b'ad') for i in range(20)
+    ]
+    env_aead = aead.KmsEnvelopeAead(template, remote_aead, dek_cache_size=10)
+    env_aead.decrypt(ciphertexts[0], b'ad')
+    env_aead.decrypt_many(ciphertexts, [b'ad'] * 20)
+    self.assertEqual(remote_aead.decrypt_calls, 2)
+    self.assertEqual(
+        env_aead.dek_cache_stats(),
+        tink.CacheStats(hits=1, misses=2, evictions=0, expirations=0, size=2),
+    )
+
+  def test_decrypt_many_invalid_arguments_fail(self):
+    env_aead = aead.KmsEnvelopeAead(
+        aead.aead_key_templates.AES256_GCM, self.remote_aead()
+    )
+    self.assertEqual(env_aead.decrypt_many([], []), [])
+    with self.assertRaises(ValueError):
+      env_aead.decrypt_many([b'ciphertext'], [])
+    with self.assertRaises(ValueError):
+      env_aead.decrypt_many([b'ciphertext'], [b''], max_workers=0)
+
+
 if __name__ == '__main__':
   absltest.main()
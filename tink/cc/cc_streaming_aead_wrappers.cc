@@ -24,6 +24,7 @@
 #include "absl/strings/string_view.h"
 #include "tink/input_stream.h"
 #include "tink/output_stream.h"
+#include "tink/random_access_stream.h"
 #include "tink/cc/output_stream_adapter.h"
 
 namespace crypto {
@@ -50,10 +51,11 @@ absl::StatusOr<std::unique_ptr<OutputStreamAdapter>> NewCcEncryptingStream(
 
 absl::StatusOr<std::unique_ptr<InputStreamAdapter>> NewCcDecryptingStream(
     StreamingAead* streaming_aead, absl::string_view aad,
-    std::shared_ptr<PythonFileObjectAdapter> ciphertext_source) {
+    std::shared_ptr<PythonFileObjectAdapter> ciphertext_source,
+    int read_ahead_size) {
   // Get a source InputStream from the source PythonFileObjectAdapter.
   std::unique_ptr<InputStream> source_os =
-      std::make_unique<PythonInputStream>(ciphertext_source);
+      std::make_unique<PythonInputStream>(ciphertext_source, read_ahead_size);
 
   // Get a DecryptingStream from the source InputStream.
   auto result = streaming_aead->NewDecryptingStream(std::move(source_os), aad);
@@ -65,5 +67,15 @@ absl::StatusOr<std::unique_ptr<InputStreamAdapter>> NewCcDecryptingStream(
   return std::make_unique<InputStreamAdapter>(std::move(result.value()));
 }
 
+absl::StatusOr<std::unique_ptr<RandomAccessStream>>
+NewCcDecryptingRandomAccessStream(
+    StreamingAead* streaming_aead, absl::string_view aad,
+    std::shared_ptr<PythonFileObjectAdapter> ciphertext_source) {
+  std::unique_ptr<RandomAccessStream> source_ras =
+      std::make_unique<PythonRandomAccessStream>(ciphertext_source);
+  return streaming_aead->NewDecryptingRandomAccessStream(
+      std::move(source_ras), aad);
+}
+
 }  // namespace tink
 }  // namespace crypto
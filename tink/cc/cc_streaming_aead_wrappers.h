@@ -27,6 +27,8 @@
 #include "tink/cc/python_file_object_adapter.h"
 #include "tink/cc/python_input_stream.h"
 #include "tink/cc/python_output_stream.h"
+#include "tink/cc/python_random_access_stream.h"
+#include "tink/random_access_stream.h"
 
 namespace crypto {
 namespace tink {
@@ -49,7 +51,22 @@ absl::StatusOr<std::unique_ptr<OutputStreamAdapter>> NewCcEncryptingStream(
 // returns an InputStreamAdapter that wraps this DecryptingStream.
 // Taking a raw pointer signals to pybind that the object is borrowed -
 // ownership is not taken, and the value is not copied.
+//
+// 'read_ahead_size' is the number of bytes requested from 'ciphertext_source'
+// by each read. If it is not positive, a default of 128 KiB is used.
 absl::StatusOr<std::unique_ptr<InputStreamAdapter>> NewCcDecryptingStream(
+    StreamingAead* streaming_aead, absl::string_view aad,
+    std::shared_ptr<PythonFileObjectAdapter> ciphertext_source,
+    int read_ahead_size = 0);
+
+// Wrapper function for StreamingAead.NewDecryptingRandomAccessStream
+//
+// It uses 'streaming_aead' to create a decrypting RandomAccessStream that reads
+// the ciphertext from 'ciphertext_source' through a PythonRandomAccessStream.
+// Taking a raw pointer signals to pybind that the object is borrowed -
+// ownership is not taken, and the value is not copied.
+absl::StatusOr<std::unique_ptr<RandomAccessStream>>
+NewCcDecryptingRandomAccessStream(
     StreamingAead* streaming_aead, absl::string_view aad,
     std::shared_ptr<PythonFileObjectAdapter> ciphertext_source);
 
@@ -18,8 +18,10 @@
 
 #include <algorithm>
 #include <cstdint>
+#include <cstring>
 #include <string>
 
+#include "absl/status/status.h"
 #include "absl/status/statusor.h"
 #include "absl/strings/string_view.h"
 
@@ -38,5 +40,20 @@ absl::StatusOr<std::string> InputStreamAdapter::Read(int64_t size) {
       absl::string_view(static_cast<const char*>(buffer), read_count));
 }
 
+absl::StatusOr<int64_t> InputStreamAdapter::ReadInto(char* dest,
+                                                     int64_t size) {
+  if (size < 0) {
+    return absl::InvalidArgumentError("size must not be negative");
+  }
+  const void* buffer;
+  auto next_result = stream_->Next(&buffer);
+  if (!next_result.ok()) return next_result.status();
+  int available = next_result.value();
+  int read_count = std::min(static_cast<int64_t>(available), size);
+  if (read_count < available) stream_->BackUp(available - read_count);
+  std::memcpy(dest, buffer, read_count);
+  return read_count;
+}
+
 }  // namespace tink
 }  // namespace crypto
@@ -40,6 +40,11 @@ class InputStreamAdapter {
   // Returns OUT_OF_RANGE status if the stream is already at EOF.
   absl::StatusOr<std::string> Read(int64_t size);
 
+  // Like Read(), but copies at most 'size' bytes to 'dest' instead of
+  // allocating a string, and returns their number. 'size' must not be
+  // negative.
+  absl::StatusOr<int64_t> ReadInto(char* dest, int64_t size);
+
  private:
   std::unique_ptr<InputStream> stream_;
 };
@@ -105,6 +105,39 @@ TEST(InputStreamAdapterTest, ReadFromEmptyStream) {
   EXPECT_EQ(read_result.status().code(), absl::StatusCode::kOutOfRange);
 }
 
+TEST(InputStreamAdapterTest, ReadInto) {
+  std::string data = subtle::Random::GetRandomBytes(15);
+  auto adapter = GetInputStreamAdapter(-1, data);
+  std::string out(10, 'x');
+  auto read_result = adapter->ReadInto(&out[0], 10);
+  ASSERT_TRUE(read_result.status().ok()) << read_result.status();
+  EXPECT_EQ(read_result.value(), 10);
+  EXPECT_EQ(out, data.substr(0, 10));
+  read_result = adapter->ReadInto(&out[0], 10);
+  ASSERT_TRUE(read_result.status().ok()) << read_result.status();
+  EXPECT_EQ(read_result.value(), 5);
+  EXPECT_EQ(out.substr(0, 5), data.substr(10, 5));
+  read_result = adapter->ReadInto(&out[0], 10);
+  EXPECT_EQ(read_result.status().code(), absl::StatusCode::kOutOfRange);
+}
+
+TEST(InputStreamAdapterTest, ReadIntoOnlyOneNext) {
+  std::string data = subtle::Random::GetRandomBytes(40);
+  auto adapter = GetInputStreamAdapter(10, data);
+  std::string out(35, 'x');
+  auto read_result = adapter->ReadInto(&out[0], 35);
+  ASSERT_TRUE(read_result.status().ok()) << read_result.status();
+  EXPECT_EQ(read_result.value(), 10);
+  EXPECT_EQ(out.substr(0, 10), data.substr(0, 10));
+}
+
+TEST(InputStreamAdapterTest, ReadIntoNegativeSizeFails) {
+  auto adapter = GetInputStreamAdapter(-1, "data");
+  char out[4];
+  auto read_result = adapter->ReadInto(out, -1);
+  EXPECT_EQ(read_result.status().code(), absl::StatusCode::kInvalidArgument);
+}
+
 }  // namespace
 }  // namespace tink
 }  // namespace crypto
@@ -16,23 +16,36 @@
 
 #include "tink/cc/pybind/aead.h"
 
+#include <cstddef>
 #include <string>
 #include <utility>
 
 #include "absl/status/statusor.h"
+#include "absl/strings/string_view.h"
 #include "pybind11/pybind11.h"
 #include "tink/aead.h"
+#include "tink/cc/pybind/batch.h"
+#include "tink/cc/pybind/buffer_view.h"
 #include "tink/cc/pybind/tink_exception.h"
 
 namespace crypto {
 namespace tink {
 
+using pybind11::google_tink::ApplyToBatch;
+using pybind11::google_tink::BufferView;
+using pybind11::google_tink::ThrowBufferTooSmall;
 using pybind11::google_tink::TinkException;
 
 void PybindRegisterAead(pybind11::module* module) {
   namespace py = pybind11;
   py::module& m = *module;
 
+  // The arguments may be any object implementing the buffer protocol. They
+  // are read in place, without being copied. The GIL is released while the
+  // thread-safe C++ primitive runs, so that other Python threads can make
+  // progress. Acquiring the buffers and building the result requires the GIL,
+  // and is done outside of the released section.
+  //
   // TODO(b/146492561): Reduce the number of complicated lambdas.
   py::class_<Aead>(
       m, "Aead",
@@ -44,10 +57,17 @@ void PybindRegisterAead(pybind11::module* module) {
 
       .def(
           "encrypt",
-          [](const Aead &self, const py::bytes &plaintext,
-             const py::bytes &associated_data) -> py::bytes {
-            absl::StatusOr<std::string> result = self.Encrypt(
-                std::string(plaintext), std::string(associated_data));
+          [](const Aead &self, const py::buffer &plaintext,
+             const py::buffer &associated_data) -> py::bytes {
+            BufferView plaintext_view = BufferView::ReadOnly(plaintext);
+            BufferView associated_data_view =
+                BufferView::ReadOnly(associated_data);
+            absl::StatusOr<std::string> result;
+            {
+              py::gil_scoped_release release;
+              result = self.Encrypt(plaintext_view.view(),
+                                    associated_data_view.view());
+            }
             if (!result.ok()) {
               throw TinkException(result.status());
             }
@@ -58,13 +78,64 @@ void PybindRegisterAead(pybind11::module* module) {
           "and returns the resulting ciphertext. "
           "The ciphertext allows for checking authenticity and integrity "
           "of the associated data, but does not guarantee its secrecy.")
+      .def(
+          "encrypt_into",
+          [](const Aead &self, const py::buffer &plaintext,
+             const py::buffer &associated_data,
+             const py::buffer &out) -> size_t {
+            BufferView plaintext_view = BufferView::ReadOnly(plaintext);
+            BufferView associated_data_view =
+                BufferView::ReadOnly(associated_data);
+            BufferView out_view = BufferView::Writable(out);
+            absl::StatusOr<std::string> result;
+            bool copied = false;
+            {
+              py::gil_scoped_release release;
+              result = self.Encrypt(plaintext_view.view(),
+                                    associated_data_view.view());
+              copied = result.ok() && out_view.CopyFrom(*result);
+            }
+            if (!result.ok()) {
+              throw TinkException(result.status());
+            }
+            if (!copied) {
+              ThrowBufferTooSmall(result->size());
+            }
+            return result->size();
+          },
+          py::arg("plaintext"), py::arg("associated_data"), py::arg("out"),
+          "Like encrypt(), but writes the ciphertext to the beginning of the "
+          "writable buffer 'out' and returns its length. Raises ValueError "
+          "if 'out' is too small.")
+      .def(
+          "encrypt_many",
+          [](const Aead &self, const py::sequence &plaintexts,
+             const py::sequence &associated_datas) -> py::list {
+            return ApplyToBatch(
+                plaintexts, associated_datas,
+                [&self](absl::string_view plaintext,
+                        absl::string_view associated_data) {
+                  return self.Encrypt(plaintext, associated_data);
+                });
+          },
+          py::arg("plaintexts"), py::arg("associated_datas"),
+          "Encrypts each plaintext with the associated data at the same "
+          "index, in a single call. Returns a list that contains, for each "
+          "item, either the ciphertext as bytes or the error message as str.")
       .def(
           "decrypt",
-          [](const Aead &self, const py::bytes &ciphertext,
-             const py::bytes &associated_data) -> py::bytes {
+          [](const Aead &self, const py::buffer &ciphertext,
+             const py::buffer &associated_data) -> py::bytes {
             // TODO(b/145925674)
-            absl::StatusOr<std::string> result = self.Decrypt(
-                std::string(ciphertext), std::string(associated_data));
+            BufferView ciphertext_view = BufferView::ReadOnly(ciphertext);
+            BufferView associated_data_view =
+                BufferView::ReadOnly(associated_data);
+            absl::StatusOr<std::string> result;
+            {
+              py::gil_scoped_release release;
+              result = self.Decrypt(ciphertext_view.view(),
+                                    associated_data_view.view());
+            }
             if (!result.ok()) {
               throw TinkException(result.status());
             }
@@ -75,7 +146,51 @@ void PybindRegisterAead(pybind11::module* module) {
           "and returns the resulting plaintext. "
           "The decryption verifies the authenticity and integrity "
           "of the associated data, but there are no guarantees wrt. secrecy "
-          "of that data.");
+          "of that data.")
+      .def(
+          "decrypt_into",
+          [](const Aead &self, const py::buffer &ciphertext,
+             const py::buffer &associated_data,
+             const py::buffer &out) -> size_t {
+            BufferView ciphertext_view = BufferView::ReadOnly(ciphertext);
+            BufferView associated_data_view =
+                BufferView::ReadOnly(associated_data);
+            BufferView out_view = BufferView::Writable(out);
+            absl::StatusOr<std::string> result;
+            bool copied = false;
+            {
+              py::gil_scoped_release release;
+              result = self.Decrypt(ciphertext_view.view(),
+                                    associated_data_view.view());
+              copied = result.ok() && out_view.CopyFrom(*result);
+            }
+            if (!result.ok()) {
+              throw TinkException(result.status());
+            }
+            if (!copied) {
+              ThrowBufferTooSmall(result->size());
+            }
+            return result->size();
+          },
+          py::arg("ciphertext"), py::arg("associated_data"), py::arg("out"),
+          "Like decrypt(), but writes the plaintext to the beginning of the "
+          "writable buffer 'out' and returns its length. Raises ValueError "
+          "if 'out' is too small.")
+      .def(
+          "decrypt_many",
+          [](const Aead &self, const py::sequence &ciphertexts,
+             const py::sequence &associated_datas) -> py::list {
+            return ApplyToBatch(
+                ciphertexts, associated_datas,
+                [&self](absl::string_view ciphertext,
+                        absl::string_view associated_data) {
+                  return self.Decrypt(ciphertext, associated_data);
+                });
+          },
+          py::arg("ciphertexts"), py::arg("associated_datas"),
+          "Decrypts each ciphertext with the associated data at the same "
+          "index, in a single call. Returns a list that contains, for each "
+          "item, either the plaintext as bytes or the error message as str.");
 }
 
 }  // namespace tink
@@ -0,0 +1,212 @@
+// Copyright 2026 Google LLC
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+///////////////////////////////////////////////////////////////////////////////
+
+#ifndef TINK_PYTHON_TINK_CC_PYBIND_BATCH_H_
+#define TINK_PYTHON_TINK_CC_PYBIND_BATCH_H_
+
+#include <cstddef>
+#include <cstdint>
+#include <cstring>
+#include <memory>
+#include <string>
+#include <vector>
+
+#include "absl/status/status.h"
+#include "absl/status/statusor.h"
+#include "absl/strings/str_cat.h"
+#include "absl/strings/string_view.h"
+#include "pybind11/pybind11.h"
+#include "tink/cc/pybind/buffer_view.h"
+
+namespace pybind11 {
+namespace google_tink {
+
+// Returns read-only views of all items of 'items', which must implement the
+// buffer protocol. Must be called while holding the GIL.
+inline std::vector<BufferView> ReadOnlyViews(const sequence& items) {
+  std::vector<BufferView> views;
+  views.reserve(items.size());
+  for (handle item : items) {
+    views.push_back(BufferView::ReadOnly(item));
+  }
+  return views;
+}
+
+// Converts the results of a batch to a list that contains, for each item,
+// either the result as bytes or, if the operation failed, the error message as
+// str. Must be called while holding the GIL.
+inline list ToBatchResultList(
+    const std::vector<absl::StatusOr<std::string>>& results) {
+  list result_list(results.size());
+  for (size_t i = 0; i < results.size(); ++i) {
+    if (results[i].ok()) {
+      result_list[i] = bytes(*results[i]);
+    } else {
+      result_list[i] = str(results[i].status().ToString());
+    }
+  }
+  return result_list;
+}
+
+// Calls 'op(input, associated_data)' for each pair of items of 'inputs' and
+// 'associated_datas', which must have the same length. The items are read in
+// place, and the GIL is released while the whole batch runs, so 'op' must be
+// thread-safe and must not touch Python objects. A failing item does not abort
+// the batch; see ToBatchResultList for the returned list.
+template <typename Op>
+list ApplyToBatch(const sequence& inputs, const sequence& associated_datas,
+                  Op op) {
+  if (inputs.size() != associated_datas.size()) {
+    throw value_error("inputs and associated_datas must have the same length");
+  }
+  std::vector<BufferView> input_views = ReadOnlyViews(inputs);
+  std::vector<BufferView> associated_data_views =
+      ReadOnlyViews(associated_datas);
+  std::vector<absl::StatusOr<std::string>> results;
+  results.reserve(input_views.size());
+  {
+    gil_scoped_release release;
+    for (size_t i = 0; i < input_views.size(); ++i) {
+      results.push_back(
+          op(input_views[i].view(), associated_data_views[i].view()));
+    }
+  }
+  return ToBatchResultList(results);
+}
+
+// A read-only view of a batch of byte strings that are stored back to back in
+// one buffer, in the layout of Apache Arrow's LargeBinary arrays: item i is
+// data[offsets[i], offsets[i + 1]), where 'offsets' is a buffer of int64.
+//
+// Must be created and destroyed while holding the GIL, but may be read without.
+class FlatBatchView {
+ public:
+  // Raises a Python ValueError if 'offsets' does not describe a valid batch
+  // within 'data'.
+  FlatBatchView(handle data, handle offsets)
+      : data_(BufferView::ReadOnly(data)),
+        offsets_(BufferView::ReadOnly(offsets)) {
+    if (offsets_.size() % sizeof(int64_t) != 0 ||
+        offsets_.size() < sizeof(int64_t)) {
+      throw value_error("offsets must contain at least one int64 value");
+    }
+    size_ = offsets_.size() / sizeof(int64_t) - 1;
+    if (Offset(0) < 0 ||
+        static_cast<uint64_t>(Offset(size_)) > data_.size()) {
+      throw value_error("offsets are out of the bounds of data");
+    }
+    for (size_t i = 0; i < size_; ++i) {
+      if (Offset(i) > Offset(i + 1)) {
+        throw value_error("offsets must be non-decreasing");
+      }
+    }
+  }
+
+  size_t size() const { return size_; }
+
+  absl::string_view operator[](size_t i) const {
+    return data_.view().substr(Offset(i), Offset(i + 1) - Offset(i));
+  }
+
+ private:
+  // The offsets buffer is not necessarily aligned.
+  int64_t Offset(size_t i) const {
+    int64_t offset;
+    std::memcpy(&offset, offsets_.view().data() + i * sizeof(int64_t),
+                sizeof(int64_t));
+    return offset;
+  }
+
+  BufferView data_;
+  BufferView offsets_;
+  size_t size_;
+};
+
+// Builds the flat layout of a batch, see FlatBatchView. May be used without
+// holding the GIL, except for Build().
+class FlatBatchBuilder {
+ public:
+  explicit FlatBatchBuilder(size_t expected_size) {
+    offsets_.reserve(expected_size + 1);
+    offsets_.push_back(0);
+  }
+
+  // Appends an item that consists of 'prefix' followed by 'item'.
+  void Add(absl::string_view prefix, absl::string_view item) {
+    data_.append(prefix.data(), prefix.size());
+    data_.append(item.data(), item.size());
+    offsets_.push_back(static_cast<int64_t>(data_.size()));
+  }
+
+  // Returns a tuple (data, offsets) of two bytes objects, where offsets holds
+  // the int64 offsets in native byte order.
+  tuple Build() const {
+    return make_tuple(
+        bytes(data_),
+        bytes(reinterpret_cast<const char*>(offsets_.data()),
+              offsets_.size() * sizeof(int64_t)));
+  }
+
+ private:
+  std::string data_;
+  std::vector<int64_t> offsets_;
+};
+
+// The items of a batch, given either as a sequence of bytes-like objects or,
+// if 'offsets' is not None, as a flat batch (see FlatBatchView).
+//
+// Must be created and destroyed while holding the GIL, but may be read without.
+class BatchInput {
+ public:
+  BatchInput(handle items, handle offsets) {
+    if (offsets.is_none()) {
+      if (!isinstance<sequence>(items)) {
+        throw type_error("items must be a sequence of bytes-like objects");
+      }
+      views_ = ReadOnlyViews(reinterpret_borrow<sequence>(items));
+      items_.reserve(views_.size());
+      for (const BufferView& view : views_) {
+        items_.push_back(view.view());
+      }
+    } else {
+      flat_ = std::make_unique<FlatBatchView>(items, offsets);
+      items_.reserve(flat_->size());
+      for (size_t i = 0; i < flat_->size(); ++i) {
+        items_.push_back((*flat_)[i]);
+      }
+    }
+  }
+
+  size_t size() const { return items_.size(); }
+
+  absl::string_view operator[](size_t i) const { return items_[i]; }
+
+ private:
+  std::vector<BufferView> views_;
+  std::unique_ptr<FlatBatchView> flat_;
+  std::vector<absl::string_view> items_;
+};
+
+// Adds the index of the failing item of a batch to 'status'.
+inline absl::Status BatchItemError(size_t index, const absl::Status& status) {
+  return absl::Status(status.code(),
+                      absl::StrCat("item ", index, ": ", status.message()));
+}
+
+}  // namespace google_tink
+}  // namespace pybind11
+
+#endif  // TINK_PYTHON_TINK_CC_PYBIND_BATCH_H_
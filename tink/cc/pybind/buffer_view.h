@@ -0,0 +1,103 @@
+// Copyright 2026 Google LLC
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+///////////////////////////////////////////////////////////////////////////////
+
+#ifndef TINK_PYTHON_TINK_CC_PYBIND_BUFFER_VIEW_H_
+#define TINK_PYTHON_TINK_CC_PYBIND_BUFFER_VIEW_H_
+
+#include <cstddef>
+#include <cstring>
+#include <string>
+
+#include "absl/strings/string_view.h"
+#include "pybind11/pybind11.h"
+
+namespace pybind11 {
+namespace google_tink {
+
+// A view of the memory of a Python object that implements the buffer protocol
+// and is C-contiguous, such as bytes, bytearray, memoryview or mmap. The memory
+// is not copied.
+//
+// BufferView must be created and destroyed while holding the GIL. The exported
+// buffer cannot be resized while it is held, so the view itself may be used
+// after the GIL is released.
+class BufferView {
+ public:
+  // Returns a read-only view of 'obj'. Raises a Python TypeError if 'obj' does
+  // not export a C-contiguous buffer.
+  static BufferView ReadOnly(handle obj) {
+    return BufferView(obj, PyBUF_SIMPLE);
+  }
+
+  // Returns a writable view of 'obj'. Raises a Python TypeError if 'obj' does
+  // not export a writable, C-contiguous buffer.
+  static BufferView Writable(handle obj) {
+    return BufferView(obj, PyBUF_WRITABLE);
+  }
+
+  BufferView(BufferView&& other) noexcept : view_(other.view_) {
+    other.view_.obj = nullptr;
+  }
+
+  BufferView(const BufferView&) = delete;
+  BufferView& operator=(const BufferView&) = delete;
+  BufferView& operator=(BufferView&&) = delete;
+
+  ~BufferView() {
+    if (view_.obj != nullptr) {
+      PyBuffer_Release(&view_);
+    }
+  }
+
+  absl::string_view view() const {
+    return absl::string_view(static_cast<const char*>(view_.buf), size());
+  }
+
+  char* mutable_data() const { return static_cast<char*>(view_.buf); }
+
+  size_t size() const { return static_cast<size_t>(view_.len); }
+
+  // Copies 'data' to the beginning of a writable buffer. Returns false, without
+  // copying anything, if 'data' does not fit into the buffer.
+  bool CopyFrom(absl::string_view data) const {
+    if (data.size() > size()) {
+      return false;
+    }
+    std::memcpy(mutable_data(), data.data(), data.size());
+    return true;
+  }
+
+ private:
+  BufferView(handle obj, int flags) {
+    if (PyObject_GetBuffer(obj.ptr(), &view_, flags) != 0) {
+      throw error_already_set();
+    }
+  }
+
+  Py_buffer view_;
+};
+
+// Raises a Python ValueError for a result of 'required_size' bytes that does
+// not fit into the writable buffer passed by the caller.
+[[noreturn]] inline void ThrowBufferTooSmall(size_t required_size) {
+  throw value_error("out is too small, " + std::to_string(required_size) +
+                    " bytes are required");
+}
+
+}  // namespace google_tink
+}  // namespace pybind11
+
+#endif  // TINK_PYTHON_TINK_CC_PYBIND_BUFFER_VIEW_H_
@@ -20,6 +20,7 @@
 #include <utility>
 
 #include "pybind11/pybind11.h"
+#include "tink/random_access_stream.h"
 #include "tink/cc/cc_streaming_aead_wrappers.h"
 #include "tink/cc/pybind/import_helper.h"
 #include "tink/cc/pybind/tink_exception.h"
@@ -56,19 +57,37 @@ void PybindRegisterCcStreamingAeadWrappers(pybind11::module* module) {
       "new_cc_decrypting_stream",
       // TODO(b/145925674)
       [](StreamingAead* streaming_aead, const py::bytes& aad,
-         std::shared_ptr<PythonFileObjectAdapter> ciphertext_source)
-          -> std::unique_ptr<InputStreamAdapter> {
+         std::shared_ptr<PythonFileObjectAdapter> ciphertext_source,
+         int read_ahead_size) -> std::unique_ptr<InputStreamAdapter> {
         absl::StatusOr<std::unique_ptr<InputStreamAdapter>> result_stream =
             NewCcDecryptingStream(streaming_aead, std::string(aad),
-                                  ciphertext_source);
+                                  ciphertext_source, read_ahead_size);
         if (!result_stream.ok()) {
           throw TinkException(result_stream.status());
         }
         return *std::move(result_stream);
       },
       py::arg("primitive"), py::arg("aad"), py::arg("source"),
+      py::arg("read_ahead_size") = 0,
       // Keep source alive at least as long as InputStreamAdapter.
       py::keep_alive<0, 3>());
+
+  m.def(
+      "new_cc_decrypting_random_access_stream",
+      [](StreamingAead* streaming_aead, const py::bytes& aad,
+         std::shared_ptr<PythonFileObjectAdapter> ciphertext_source)
+          -> std::unique_ptr<RandomAccessStream> {
+        absl::StatusOr<std::unique_ptr<RandomAccessStream>> result_stream =
+            NewCcDecryptingRandomAccessStream(streaming_aead, std::string(aad),
+                                              ciphertext_source);
+        if (!result_stream.ok()) {
+          throw TinkException(result_stream.status());
+        }
+        return *std::move(result_stream);
+      },
+      py::arg("primitive"), py::arg("aad"), py::arg("source"),
+      // Keep source alive at least as long as the RandomAccessStream.
+      py::keep_alive<0, 3>());
 }
 
 }  // namespace tink
@@ -16,23 +16,40 @@
 
 #include "tink/cc/pybind/deterministic_aead.h"
 
+#include <cstddef>
 #include <string>
 #include <utility>
+#include <vector>
 
+#include "absl/status/status.h"
 #include "absl/status/statusor.h"
+#include "absl/strings/match.h"
+#include "absl/strings/string_view.h"
 #include "pybind11/pybind11.h"
 #include "tink/deterministic_aead.h"
+#include "tink/cc/pybind/batch.h"
+#include "tink/cc/pybind/buffer_view.h"
 #include "tink/cc/pybind/tink_exception.h"
 
 namespace crypto {
 namespace tink {
 
+using pybind11::google_tink::ApplyToBatch;
+using pybind11::google_tink::BatchItemError;
+using pybind11::google_tink::BufferView;
+using pybind11::google_tink::FlatBatchBuilder;
+using pybind11::google_tink::FlatBatchView;
+using pybind11::google_tink::ThrowBufferTooSmall;
 using pybind11::google_tink::TinkException;
 
 void PybindRegisterDeterministicAead(pybind11::module* module) {
   namespace py = pybind11;
   py::module& m = *module;
 
+  // The arguments may be any object implementing the buffer protocol, and are
+  // read in place. The GIL is released while the thread-safe C++ primitive
+  // runs.
+  //
   // TODO(b/146492561): Reduce the number of complicated lambdas.
   py::class_<DeterministicAead>(
       m, "DeterministicAead",
@@ -57,32 +74,217 @@ void PybindRegisterDeterministicAead(pybind11::module* module) {
 
       .def(
           "encrypt_deterministically",
-          [](const DeterministicAead& self, const py::bytes& plaintext,
-             const py::bytes& associated_data) -> py::bytes {
+          [](const DeterministicAead& self, const py::buffer& plaintext,
+             const py::buffer& associated_data) -> py::bytes {
             // TODO(b/145925674)
-            absl::StatusOr<std::string> encrypt_result =
-                self.EncryptDeterministically(std::string(plaintext),
-                                              std::string(associated_data));
+            BufferView plaintext_view = BufferView::ReadOnly(plaintext);
+            BufferView associated_data_view =
+                BufferView::ReadOnly(associated_data);
+            absl::StatusOr<std::string> encrypt_result;
+            {
+              py::gil_scoped_release release;
+              encrypt_result = self.EncryptDeterministically(
+                  plaintext_view.view(), associated_data_view.view());
+            }
             if (!encrypt_result.ok()) {
               throw TinkException(encrypt_result.status());
             }
             return *std::move(encrypt_result);
           },
           py::arg("plaintext"), py::arg("associated_data"))
+      .def(
+          "encrypt_deterministically_into",
+          [](const DeterministicAead& self, const py::buffer& plaintext,
+             const py::buffer& associated_data,
+             const py::buffer& out) -> size_t {
+            BufferView plaintext_view = BufferView::ReadOnly(plaintext);
+            BufferView associated_data_view =
+                BufferView::ReadOnly(associated_data);
+            BufferView out_view = BufferView::Writable(out);
+            absl::StatusOr<std::string> encrypt_result;
+            bool copied = false;
+            {
+              py::gil_scoped_release release;
+              encrypt_result = self.EncryptDeterministically(
+                  plaintext_view.view(), associated_data_view.view());
+              copied =
+                  encrypt_result.ok() && out_view.CopyFrom(*encrypt_result);
+            }
+            if (!encrypt_result.ok()) {
+              throw TinkException(encrypt_result.status());
+            }
+            if (!copied) {
+              ThrowBufferTooSmall(encrypt_result->size());
+            }
+            return encrypt_result->size();
+          },
+          py::arg("plaintext"), py::arg("associated_data"), py::arg("out"))
       .def(
           "decrypt_deterministically",
-          [](const DeterministicAead& self, const py::bytes& ciphertext,
-             const py::bytes& associated_data) -> py::bytes {
+          [](const DeterministicAead& self, const py::buffer& ciphertext,
+             const py::buffer& associated_data) -> py::bytes {
             // TODO(b/145925674)
-            absl::StatusOr<std::string> decrypt_result =
-                self.DecryptDeterministically(std::string(ciphertext),
-                                              std::string(associated_data));
+            BufferView ciphertext_view = BufferView::ReadOnly(ciphertext);
+            BufferView associated_data_view =
+                BufferView::ReadOnly(associated_data);
+            absl::StatusOr<std::string> decrypt_result;
+            {
+              py::gil_scoped_release release;
+              decrypt_result = self.DecryptDeterministically(
+                  ciphertext_view.view(), associated_data_view.view());
+            }
             if (!decrypt_result.ok()) {
               throw TinkException(decrypt_result.status());
             }
             return *std::move(decrypt_result);
           },
-          py::arg("ciphertext"), py::arg("associated_data"));
+          py::arg("ciphertext"), py::arg("associated_data"))
+      .def(
+          "decrypt_deterministically_into",
+          [](const DeterministicAead& self, const py::buffer& ciphertext,
+             const py::buffer& associated_data,
+             const py::buffer& out) -> size_t {
+            BufferView ciphertext_view = BufferView::ReadOnly(ciphertext);
+            BufferView associated_data_view =
+                BufferView::ReadOnly(associated_data);
+            BufferView out_view = BufferView::Writable(out);
+            absl::StatusOr<std::string> decrypt_result;
+            bool copied = false;
+            {
+              py::gil_scoped_release release;
+              decrypt_result = self.DecryptDeterministically(
+                  ciphertext_view.view(), associated_data_view.view());
+              copied =
+                  decrypt_result.ok() && out_view.CopyFrom(*decrypt_result);
+            }
+            if (!decrypt_result.ok()) {
+              throw TinkException(decrypt_result.status());
+            }
+            if (!copied) {
+              ThrowBufferTooSmall(decrypt_result->size());
+            }
+            return decrypt_result->size();
+          },
+          py::arg("ciphertext"), py::arg("associated_data"), py::arg("out"))
+      .def(
+          "encrypt_deterministically_many",
+          [](const DeterministicAead& self, const py::sequence& plaintexts,
+             const py::sequence& associated_datas) -> py::list {
+            return ApplyToBatch(
+                plaintexts, associated_datas,
+                [&self](absl::string_view plaintext,
+                        absl::string_view associated_data) {
+                  return self.EncryptDeterministically(plaintext,
+                                                       associated_data);
+                });
+          },
+          py::arg("plaintexts"), py::arg("associated_datas"))
+      .def(
+          "decrypt_deterministically_many",
+          [](const DeterministicAead& self, const py::sequence& ciphertexts,
+             const py::sequence& associated_datas) -> py::list {
+            return ApplyToBatch(
+                ciphertexts, associated_datas,
+                [&self](absl::string_view ciphertext,
+                        absl::string_view associated_data) {
+                  return self.DecryptDeterministically(ciphertext,
+                                                       associated_data);
+                });
+          },
+          py::arg("ciphertexts"), py::arg("associated_datas"))
+      .def(
+          "encrypt_deterministically_flat",
+          [](const DeterministicAead& self, const py::buffer& plaintexts,
+             const py::buffer& offsets, const py::buffer& associated_data,
+             const py::bytes& output_prefix) -> py::tuple {
+            FlatBatchView batch(plaintexts, offsets);
+            BufferView associated_data_view =
+                BufferView::ReadOnly(associated_data);
+            std::string prefix(output_prefix);
+            FlatBatchBuilder builder(batch.size());
+            absl::Status status;
+            {
+              py::gil_scoped_release release;
+              for (size_t i = 0; i < batch.size(); ++i) {
+                absl::StatusOr<std::string> encrypt_result =
+                    self.EncryptDeterministically(batch[i],
+                                                  associated_data_view.view());
+                if (!encrypt_result.ok()) {
+                  status = BatchItemError(i, encrypt_result.status());
+                  break;
+                }
+                builder.Add(prefix, *encrypt_result);
+              }
+            }
+            if (!status.ok()) {
+              throw TinkException(status);
+            }
+            return builder.Build();
+          },
+          py::arg("plaintexts"), py::arg("offsets"),
+          py::arg("associated_data"), py::arg("output_prefix") = py::bytes(),
+          "Encrypts a flat batch of plaintexts, see FlatBatchView, with the "
+          "same associated data, and prepends 'output_prefix' to each "
+          "ciphertext. Returns the ciphertexts as a tuple (data, offsets) of "
+          "bytes in the same layout.");
+
+  m.def(
+      "decrypt_deterministically_flat",
+      [](const py::sequence& candidates, const py::buffer& ciphertexts,
+         const py::buffer& offsets,
+         const py::buffer& associated_data) -> py::tuple {
+        std::vector<std::pair<std::string, const DeterministicAead*>>
+            candidate_list;
+        candidate_list.reserve(candidates.size());
+        for (py::handle candidate : candidates) {
+          py::tuple pair = py::reinterpret_borrow<py::tuple>(candidate);
+          candidate_list.emplace_back(
+              pair[0].cast<std::string>(),
+              pair[1].cast<const DeterministicAead*>());
+        }
+        FlatBatchView batch(ciphertexts, offsets);
+        BufferView associated_data_view = BufferView::ReadOnly(associated_data);
+        FlatBatchBuilder builder(batch.size());
+        absl::Status status;
+        {
+          py::gil_scoped_release release;
+          for (size_t i = 0; i < batch.size() && status.ok(); ++i) {
+            absl::string_view ciphertext = batch[i];
+            bool decrypted = false;
+            for (const auto& candidate : candidate_list) {
+              const std::string& prefix = candidate.first;
+              if (!absl::StartsWith(ciphertext, prefix)) {
+                continue;
+              }
+              absl::StatusOr<std::string> decrypt_result =
+                  candidate.second->DecryptDeterministically(
+                      ciphertext.substr(prefix.size()),
+                      associated_data_view.view());
+              if (decrypt_result.ok()) {
+                builder.Add("", *decrypt_result);
+                decrypted = true;
+                break;
+              }
+            }
+            if (!decrypted) {
+              status = BatchItemError(
+                  i, absl::InvalidArgumentError("Decryption failed."));
+            }
+          }
+        }
+        if (!status.ok()) {
+          throw TinkException(status);
+        }
+        return builder.Build();
+      },
+      py::arg("candidates"), py::arg("ciphertexts"), py::arg("offsets"),
+      py::arg("associated_data"),
+      "Decrypts a flat batch of ciphertexts, see FlatBatchView, with the same "
+      "associated data. 'candidates' is a sequence of (output_prefix, "
+      "DeterministicAead) pairs, which are tried in order on the ciphertexts "
+      "that start with the output prefix; the prefix is removed before "
+      "decryption. Returns the plaintexts as a tuple (data, offsets) of bytes "
+      "in the same layout.");
 }
 
 }  // namespace tink
@@ -41,8 +41,14 @@ void PybindRegisterHybridDecrypt(pybind11::module* module) {
           [](const HybridDecrypt& self, const py::bytes& ciphertext,
              const py::bytes& context_info) -> py::bytes {
             // TODO(b/145925674)
-            absl::StatusOr<std::string> decrypt_result = self.Decrypt(
-                std::string(ciphertext), std::string(context_info));
+            std::string ciphertext_str(ciphertext);
+            std::string context_info_str(context_info);
+            absl::StatusOr<std::string> decrypt_result;
+            {
+              // The GIL is released while the thread-safe C++ primitive runs.
+              py::gil_scoped_release release;
+              decrypt_result = self.Decrypt(ciphertext_str, context_info_str);
+            }
             if (!decrypt_result.ok()) {
               throw TinkException(decrypt_result.status());
             }
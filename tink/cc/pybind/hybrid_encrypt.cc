@@ -40,8 +40,14 @@ void PybindRegisterHybridEncrypt(pybind11::module* module) {
           [](const HybridEncrypt& self, const py::bytes& plaintext,
              const py::bytes& context_info) -> py::bytes {
             // TODO(b/145925674)
-            absl::StatusOr<std::string> encrypt_result =
-                self.Encrypt(std::string(plaintext), std::string(context_info));
+            std::string plaintext_str(plaintext);
+            std::string context_info_str(context_info);
+            absl::StatusOr<std::string> encrypt_result;
+            {
+              // The GIL is released while the thread-safe C++ primitive runs.
+              py::gil_scoped_release release;
+              encrypt_result = self.Encrypt(plaintext_str, context_info_str);
+            }
             if (!encrypt_result.ok()) {
               throw TinkException(encrypt_result.status());
             }
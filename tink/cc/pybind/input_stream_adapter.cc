@@ -25,6 +25,7 @@
 #include "absl/status/statusor.h"
 #include "pybind11/pybind11.h"
 #include "tink/cc/input_stream_adapter.h"
+#include "tink/cc/pybind/buffer_view.h"
 #include "tink/cc/pybind/tink_exception.h"
 
 namespace crypto {
@@ -49,6 +50,7 @@ class TinkStreamFinishedException : public std::exception {
 
 }  // namespace
 
+using pybind11::google_tink::BufferView;
 using pybind11::google_tink::TinkException;
 
 void PybindRegisterInputStreamAdapter(pybind11::module* module) {
@@ -73,7 +75,34 @@ void PybindRegisterInputStreamAdapter(pybind11::module* module) {
             }
             return *std::move(read_result);
           },
-          py::arg("size"));
+          py::arg("size"))
+      .def(
+          "read_into",
+          [](InputStreamAdapter* self, py::handle out) -> int64_t {
+            BufferView out_view = BufferView::Writable(out);
+            absl::StatusOr<int64_t> read_result;
+            {
+              // The plaintext is copied directly into 'out'. The source is
+              // read through PythonFileObjectAdapter, which reacquires the GIL.
+              py::gil_scoped_release release;
+              read_result = self->ReadInto(
+                  static_cast<char*>(out_view.mutable_data()),
+                  static_cast<int64_t>(out_view.size()));
+            }
+            if (read_result.status().code() == absl::StatusCode::kOutOfRange) {
+              throw TinkStreamFinishedException(
+                  std::move(read_result).status());
+            }
+            if (!read_result.ok()) {
+              throw TinkException(read_result.status());
+            }
+            return *read_result;
+          },
+          py::arg("out"),
+          "Reads at most len(out) bytes into the writable buffer 'out' and "
+          "returns their number, which is 0 if no data is available at the "
+          "moment. Raises PythonTinkStreamFinishedException at the end of the "
+          "stream.");
 }
 
 }  // namespace tink
@@ -16,25 +16,37 @@
 
 #include "tink/cc/pybind/mac.h"
 
+#include <cstddef>
 #include <string>
 #include <utility>
+#include <vector>
 
 #include "absl/status/status.h"
 #include "absl/status/statusor.h"
+#include "absl/strings/match.h"
+#include "absl/strings/string_view.h"
 #include "pybind11/pybind11.h"
 #include "tink/mac.h"
+#include "tink/cc/pybind/batch.h"
+#include "tink/cc/pybind/buffer_view.h"
 #include "tink/cc/pybind/tink_exception.h"
 
 namespace crypto {
 namespace tink {
 
+using pybind11::google_tink::BatchInput;
+using pybind11::google_tink::BatchItemError;
+using pybind11::google_tink::BufferView;
 using pybind11::google_tink::TinkException;
 
 void PybindRegisterMac(pybind11::module* module) {
   namespace py = pybind11;
   py::module& m = *module;
 
-
+  // The arguments may be any object implementing the buffer protocol, and are
+  // read in place. The GIL is released while the thread-safe C++ primitive
+  // runs.
+  //
   // TODO(b/146492561): Reduce the number of complicated lambdas.
   py::class_<Mac>(
       m, "Mac",
@@ -45,10 +57,14 @@ void PybindRegisterMac(pybind11::module* module) {
 
       .def(
           "compute_mac",
-          [](const Mac& self, const py::bytes& data) -> py::bytes {
+          [](const Mac& self, const py::buffer& data) -> py::bytes {
             // TODO(b/145925674)
-            absl::StatusOr<std::string> result =
-                self.ComputeMac(std::string(data));
+            BufferView data_view = BufferView::ReadOnly(data);
+            absl::StatusOr<std::string> result;
+            {
+              py::gil_scoped_release release;
+              result = self.ComputeMac(data_view.view());
+            }
             if (!result.ok()) {
               throw TinkException(result.status());
             }
@@ -59,10 +75,15 @@ void PybindRegisterMac(pybind11::module* module) {
           "'data'.")
       .def(
           "verify_mac",
-          [](const Mac& self, const py::bytes& mac,
-             const py::bytes& data) -> void {
-            absl::Status result =
-                self.VerifyMac(std::string(mac), std::string(data));
+          [](const Mac& self, const py::buffer& mac,
+             const py::buffer& data) -> void {
+            BufferView mac_view = BufferView::ReadOnly(mac);
+            BufferView data_view = BufferView::ReadOnly(data);
+            absl::Status result;
+            {
+              py::gil_scoped_release release;
+              result = self.VerifyMac(mac_view.view(), data_view.view());
+            }
             if (!result.ok()) {
               throw TinkException(result);
             }
@@ -70,7 +91,90 @@ void PybindRegisterMac(pybind11::module* module) {
           py::arg("mac"), py::arg("data"),
           "Verifies if 'mac' is a correct authentication code (MAC) for "
           "'data'. "
-          "Raises a StatusNotOk exception if the verification fails.");
+          "Raises a StatusNotOk exception if the verification fails.")
+      .def(
+          "compute_mac_many",
+          [](const Mac& self, const py::object& data, const py::object& offsets,
+             const py::bytes& output_prefix) -> py::bytes {
+            BatchInput batch(data, offsets);
+            std::string prefix(output_prefix);
+            std::string macs;
+            absl::Status status;
+            {
+              py::gil_scoped_release release;
+              for (size_t i = 0; i < batch.size(); ++i) {
+                absl::StatusOr<std::string> result = self.ComputeMac(batch[i]);
+                if (!result.ok()) {
+                  status = BatchItemError(i, result.status());
+                  break;
+                }
+                if (i == 0) {
+                  macs.reserve(batch.size() * (prefix.size() + result->size()));
+                }
+                macs.append(prefix);
+                macs.append(*result);
+              }
+            }
+            if (!status.ok()) {
+              throw TinkException(status);
+            }
+            return macs;
+          },
+          py::arg("data"), py::arg("offsets") = py::none(),
+          py::arg("output_prefix") = py::bytes(),
+          "Computes the MACs of a batch of messages, given either as a "
+          "sequence or, if 'offsets' is not None, as a flat batch, and "
+          "prepends 'output_prefix' to each of them. Returns the "
+          "concatenation of the MACs, which all have the same length.");
+
+  m.def(
+      "verify_mac_many",
+      [](const py::sequence& candidates, const py::object& macs,
+         const py::object& mac_offsets, const py::object& data,
+         const py::object& data_offsets, size_t min_mac_size) -> py::bytes {
+        std::vector<std::pair<std::string, const Mac*>> candidate_list;
+        candidate_list.reserve(candidates.size());
+        for (py::handle candidate : candidates) {
+          py::tuple pair = py::reinterpret_borrow<py::tuple>(candidate);
+          candidate_list.emplace_back(pair[0].cast<std::string>(),
+                                      pair[1].cast<const Mac*>());
+        }
+        BatchInput mac_batch(macs, mac_offsets);
+        BatchInput data_batch(data, data_offsets);
+        if (mac_batch.size() != data_batch.size()) {
+          throw py::value_error("macs and data must have the same length");
+        }
+        std::string valid(data_batch.size(), '\0');
+        {
+          py::gil_scoped_release release;
+          for (size_t i = 0; i < data_batch.size(); ++i) {
+            absl::string_view mac = mac_batch[i];
+            if (mac.size() < min_mac_size) {
+              continue;
+            }
+            for (const auto& candidate : candidate_list) {
+              const std::string& prefix = candidate.first;
+              if (absl::StartsWith(mac, prefix) &&
+                  candidate.second
+                      ->VerifyMac(mac.substr(prefix.size()), data_batch[i])
+                      .ok()) {
+                valid[i] = 1;
+                break;
+              }
+            }
+          }
+        }
+        return valid;
+      },
+      py::arg("candidates"), py::arg("macs"), py::arg("mac_offsets"),
+      py::arg("data"), py::arg("data_offsets"), py::arg("min_mac_size"),
+      "Verifies a batch of MACs. 'macs' and 'data' are given either as "
+      "sequences or, if the corresponding offsets are not None, as flat "
+      "batches. 'candidates' is a sequence of (output_prefix, Mac) pairs, "
+      "which are tried in order on the MACs that start with the output "
+      "prefix; the prefix is removed before verification. MACs shorter than "
+      "'min_mac_size' are invalid. Returns one byte per item, which is 1 if "
+      "the MAC is valid and 0 otherwise.");
 }
 
 }  // namespace tink
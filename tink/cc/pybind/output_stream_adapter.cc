@@ -16,16 +16,19 @@
 #include "tink/cc/pybind/output_stream_adapter.h"
 
 #include <algorithm>
-#include <string>
 #include <utility>
 
+#include "absl/status/status.h"
+#include "absl/status/statusor.h"
 #include "pybind11/pybind11.h"
 #include "tink/cc/output_stream_adapter.h"
+#include "tink/cc/pybind/buffer_view.h"
 #include "tink/cc/pybind/tink_exception.h"
 
 namespace crypto {
 namespace tink {
 
+using pybind11::google_tink::BufferView;
 using pybind11::google_tink::TinkException;
 
 void PybindRegisterOutputStreamAdapter(pybind11::module* module) {
@@ -36,8 +39,18 @@ void PybindRegisterOutputStreamAdapter(pybind11::module* module) {
   py::class_<OutputStreamAdapter>(m, "OutputStreamAdapter")
       .def(
           "write",
-          [](OutputStreamAdapter* self, const py::bytes& data) -> int64_t {
-            absl::StatusOr<int64_t> result = self->Write(std::string(data));
+          [](OutputStreamAdapter* self, py::handle data) -> int64_t {
+            // Any C-contiguous buffer is accepted, e.g. a bytearray or a
+            // memoryview, and written without copying it to a string first.
+            BufferView data_view = BufferView::ReadOnly(data);
+            absl::StatusOr<int64_t> result;
+            {
+              // The destination is written through PythonFileObjectAdapter,
+              // which reacquires the GIL, so other threads can run while the
+              // data is encrypted.
+              py::gil_scoped_release release;
+              result = self->Write(data_view.view());
+            }
             if (!result.ok()) {
               throw TinkException(result.status());
             }
@@ -45,7 +58,11 @@ void PybindRegisterOutputStreamAdapter(pybind11::module* module) {
           },
           py::arg("data"))
       .def("close", [](OutputStreamAdapter* self) -> void {
-        absl::Status result = self->Close();
+        absl::Status result;
+        {
+          py::gil_scoped_release release;
+          result = self->Close();
+        }
         if (!result.ok()) {
           throw TinkException(result);
         }
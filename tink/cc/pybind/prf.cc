@@ -17,17 +17,24 @@
 #include "tink/cc/pybind/prf.h"
 
 #include <cstddef>
+#include <cstring>
 #include <string>
 #include <utility>
 
+#include "absl/status/status.h"
 #include "absl/status/statusor.h"
 #include "pybind11/pybind11.h"
 #include "tink/prf/prf_set.h"
+#include "tink/cc/pybind/batch.h"
+#include "tink/cc/pybind/buffer_view.h"
 #include "tink/cc/pybind/tink_exception.h"
 
 namespace crypto {
 namespace tink {
 
+using pybind11::google_tink::BatchInput;
+using pybind11::google_tink::BatchItemError;
+using pybind11::google_tink::BufferView;
 using pybind11::google_tink::TinkException;
 
 void PybindRegisterPrf(pybind11::module* module) {
@@ -39,18 +46,77 @@ void PybindRegisterPrf(pybind11::module* module) {
       // only need the function "compute_primary".
       .def(
           "compute",
-          [](const Prf& self, const py::bytes& input_data,
+          [](const Prf& self, const py::buffer& input_data,
              size_t output_length) -> py::bytes {
             // TODO(b/145925674)
-            absl::StatusOr<std::string> result =
-                self.Compute(std::string(input_data), output_length);
+            // 'input_data' may be any object implementing the buffer protocol,
+            // and is read in place.
+            BufferView input_data_view = BufferView::ReadOnly(input_data);
+            absl::StatusOr<std::string> result;
+            {
+              // The GIL is released while the thread-safe C++ primitive runs.
+              py::gil_scoped_release release;
+              result = self.Compute(input_data_view.view(), output_length);
+            }
             if (!result.ok()) {
               throw TinkException(result.status());
             }
             return *std::move(result);
           },
           py::arg("input_data"), py::arg("output_length"),
-          "Computes the value of the primary (and only) PRF.");
+          "Computes the value of the primary (and only) PRF.")
+      .def(
+          "compute_many",
+          [](const Prf& self, const py::object& inputs,
+             const py::object& offsets, size_t output_length) -> py::bytes {
+            BatchInput batch(inputs, offsets);
+            if (batch.size() == 0) {
+              return py::bytes();
+            }
+            // The first output is computed before allocating the result, so
+            // that an unsupported 'output_length' is reported as a Tink error.
+            absl::StatusOr<std::string> first_result;
+            {
+              py::gil_scoped_release release;
+              first_result = self.Compute(batch[0], output_length);
+            }
+            if (!first_result.ok()) {
+              throw TinkException(BatchItemError(0, first_result.status()));
+            }
+            // The outputs are written directly into the returned bytes
+            // object, which is not visible to other Python code yet.
+            py::bytes outputs(nullptr, batch.size() * output_length);
+            char* outputs_data = PyBytes_AS_STRING(outputs.ptr());
+            absl::Status status;
+            {
+              py::gil_scoped_release release;
+              absl::StatusOr<std::string> result = std::move(first_result);
+              for (size_t i = 0; i < batch.size(); ++i) {
+                if (i > 0) {
+                  result = self.Compute(batch[i], output_length);
+                }
+                if (!result.ok()) {
+                  status = BatchItemError(i, result.status());
+                  break;
+                }
+                if (result->size() != output_length) {
+                  status = BatchItemError(
+                      i, absl::InternalError("unexpected PRF output length"));
+                  break;
+                }
+                std::memcpy(outputs_data + i * output_length, result->data(),
+                            output_length);
+              }
+            }
+            if (!status.ok()) {
+              throw TinkException(status);
+            }
+            return outputs;
+          },
+          py::arg("inputs"), py::arg("offsets"), py::arg("output_length"),
+          "Computes the PRF of a batch of inputs, given either as a sequence "
+          "or, if 'offsets' is not None, as a flat batch. Returns the "
+          "concatenation of the outputs, each of 'output_length' bytes.");
 }
 
 }  // namespace tink
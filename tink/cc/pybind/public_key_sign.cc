@@ -50,7 +50,13 @@ void PybindRegisterPublicKeySign(pybind11::module* module) {
           [](const PublicKeySign& self,
              const py::bytes& data) -> py::bytes {
             // TODO(b/145925674)
-            absl::StatusOr<std::string> result = self.Sign(std::string(data));
+            std::string data_str(data);
+            absl::StatusOr<std::string> result;
+            {
+              // The GIL is released while the thread-safe C++ primitive runs.
+              py::gil_scoped_release release;
+              result = self.Sign(data_str);
+            }
             if (!result.ok()) {
               throw TinkException(result.status());
             }
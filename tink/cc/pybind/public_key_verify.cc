@@ -49,8 +49,14 @@ void PybindRegisterPublicKeyVerify(pybind11::module* module) {
           [](const PublicKeyVerify& self, const py::bytes& signature,
              const py::bytes& data) -> void {
             // TODO(b/145925674)
-            absl::Status result =
-                self.Verify(std::string(signature), std::string(data));
+            std::string signature_str(signature);
+            std::string data_str(data);
+            absl::Status result;
+            {
+              // The GIL is released while the thread-safe C++ primitive runs.
+              py::gil_scoped_release release;
+              result = self.Verify(signature_str, data_str);
+            }
             if (!result.ok()) {
               throw TinkException(result);
             }
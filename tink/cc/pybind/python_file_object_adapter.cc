@@ -16,6 +16,7 @@
 
 #include "tink/cc/pybind/python_file_object_adapter.h"
 
+#include <cstdint>
 #include <string>
 
 #include "absl/status/status.h"
@@ -47,7 +48,7 @@ class Pybind11PythonFileObjectAdapter : public PythonFileObjectAdapter {
         return absl::Status(absl::StatusCode::kUnimplemented,
                             "No Python overload is defined for write.");
       }
-      auto o = overload(pybind11::bytes(std::string(data)));
+      auto o = overload(pybind11::bytes(data.data(), data.size()));
       return o.cast<int>();
     } catch (const std::exception &e) {
       return absl::Status(absl::StatusCode::kUnknown, e.what());
@@ -91,6 +92,71 @@ class Pybind11PythonFileObjectAdapter : public PythonFileObjectAdapter {
       std::abort();
     }
   }
+
+  absl::StatusOr<int> ReadInto(char *buffer, int size) override {
+    try {
+      pybind11::gil_scoped_acquire gil;
+      pybind11::function overload = pybind11::get_overload(
+          static_cast<const PythonFileObjectAdapter *>(this), "readinto");
+      if (!overload) {
+        return absl::Status(absl::StatusCode::kUnimplemented,
+                            "No Python overload is defined for readinto.");
+      }
+      // The memoryview is released on every path, also if readinto raises, so
+      // that Python code cannot access 'buffer' after this function returns.
+      pybind11::memoryview view =
+          pybind11::memoryview::from_memory(buffer, size, /*readonly=*/false);
+      pybind11::object o;
+      try {
+        o = overload(view);
+      } catch (...) {
+        view.attr("release")();
+        throw;
+      }
+      view.attr("release")();
+      return o.cast<int>();
+    } catch (const std::exception &e) {
+      return absl::Status(absl::StatusCode::kUnknown, e.what());
+    } catch (...) {
+      std::abort();
+    }
+  }
+
+  absl::StatusOr<std::string> PRead(int64_t position, int count) override {
+    try {
+      pybind11::gil_scoped_acquire gil;
+      pybind11::function overload = pybind11::get_overload(
+          static_cast<const PythonFileObjectAdapter *>(this), "pread");
+      if (!overload) {
+        return absl::Status(absl::StatusCode::kUnimplemented,
+                            "No Python overload is defined for pread.");
+      }
+      auto o = overload(position, count);
+      return o.cast<std::string>();
+    } catch (const std::exception &e) {
+      return absl::Status(absl::StatusCode::kUnknown, e.what());
+    } catch (...) {
+      std::abort();
+    }
+  }
+
+  absl::StatusOr<int64_t> Size() override {
+    try {
+      pybind11::gil_scoped_acquire gil;
+      pybind11::function overload = pybind11::get_overload(
+          static_cast<const PythonFileObjectAdapter *>(this), "size");
+      if (!overload) {
+        return absl::Status(absl::StatusCode::kUnimplemented,
+                            "No Python overload is defined for size.");
+      }
+      auto o = overload();
+      return o.cast<int64_t>();
+    } catch (const std::exception &e) {
+      return absl::Status(absl::StatusCode::kUnknown, e.what());
+    } catch (...) {
+      std::abort();
+    }
+  }
 };
 
 void PybindRegisterPythonFileObjectAdapter(pybind11::module *module) {
@@ -123,7 +189,20 @@ void PybindRegisterPythonFileObjectAdapter(pybind11::module *module) {
           [](PythonFileObjectAdapter *self, int size) -> py::bytes {
             std::abort();
           },
-          py::arg("size"));
+          py::arg("size"))
+      .def(
+          "readinto",
+          [](PythonFileObjectAdapter *self, py::handle buffer) -> int {
+            std::abort();
+          },
+          py::arg("buffer"))
+      .def(
+          "pread",
+          [](PythonFileObjectAdapter *self, int64_t position,
+             int count) -> py::bytes { std::abort(); },
+          py::arg("position"), py::arg("count"))
+      .def("size",
+           [](PythonFileObjectAdapter *self) -> int64_t { std::abort(); });
 }
 
 }  // namespace tink
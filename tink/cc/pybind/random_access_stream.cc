@@ -0,0 +1,99 @@
+// Copyright 2026 Google LLC
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+///////////////////////////////////////////////////////////////////////////////
+
+
+#include "tink/cc/pybind/random_access_stream.h"
+
+#include <algorithm>
+#include <cstddef>
+#include <cstdint>
+#include <limits>
+#include <memory>
+
+#include "absl/status/status.h"
+#include "absl/status/statusor.h"
+#include "pybind11/pybind11.h"
+#include "tink/random_access_stream.h"
+#include "tink/util/buffer.h"
+#include "tink/cc/pybind/buffer_view.h"
+#include "tink/cc/pybind/tink_exception.h"
+
+namespace crypto {
+namespace tink {
+
+using pybind11::google_tink::BufferView;
+using pybind11::google_tink::TinkException;
+
+void PybindRegisterRandomAccessStream(pybind11::module* module) {
+  namespace py = pybind11;
+  py::module& m = *module;
+
+  py::class_<RandomAccessStream>(m, "RandomAccessStream")
+      .def(
+          "pread_into",
+          [](RandomAccessStream* self, int64_t position,
+             py::handle out) -> int {
+            BufferView out_view = BufferView::Writable(out);
+            int count = static_cast<int>(
+                std::min(out_view.size(),
+                         static_cast<size_t>(std::numeric_limits<int>::max())));
+            if (count == 0) {
+              return 0;
+            }
+            absl::Status status;
+            int read_count = 0;
+            {
+              // The plaintext is decrypted directly into 'out'.
+              py::gil_scoped_release release;
+              absl::StatusOr<std::unique_ptr<util::Buffer>> buffer =
+                  util::Buffer::NewNonOwning(out_view.mutable_data(), count);
+              if (buffer.ok()) {
+                status = self->PRead(position, count, buffer->get());
+                read_count = (*buffer)->size();
+              } else {
+                status = buffer.status();
+              }
+            }
+            // OUT_OF_RANGE means that fewer bytes were read because the end of
+            // the stream was reached.
+            if (!status.ok() &&
+                status.code() != absl::StatusCode::kOutOfRange) {
+              throw TinkException(status);
+            }
+            return read_count;
+          },
+          py::arg("position"), py::arg("out"),
+          "Reads the bytes at 'position' into the writable buffer 'out' and "
+          "returns their number, which is smaller than len(out) only at the "
+          "end of the stream.")
+      .def(
+          "size",
+          [](RandomAccessStream* self) -> int64_t {
+            absl::StatusOr<int64_t> size;
+            {
+              py::gil_scoped_release release;
+              size = self->size();
+            }
+            if (!size.ok()) {
+              throw TinkException(size.status());
+            }
+            return *size;
+          },
+          "Returns the size of the stream.");
+}
+
+}  // namespace tink
+}  // namespace crypto
@@ -0,0 +1,169 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Multi-threaded throughput benchmark for the pybind11 primitive bindings.
+
+The bindings release the GIL while the C++ primitive runs, so throughput should
+scale close to linearly with the number of threads, up to the number of cores.
+
+Example:
+  bazel run //tink/cc/pybind:threading_benchmark -- \
+      --payload_sizes=65536,1048576 --ops_per_thread=200
+"""
+
+from concurrent import futures
+import os
+import time
+from typing import Callable, Dict, List
+
+from absl import app
+from absl import flags
+
+import tink
+from tink import aead
+from tink import daead
+from tink import hybrid
+from tink import mac
+from tink import prf
+from tink import signature
+
+
+_PAYLOAD_SIZES = flags.DEFINE_list(
+    'payload_sizes', ['65536', '1048576'], 'Payload sizes in bytes.')
+_OPS_PER_THREAD = flags.DEFINE_integer(
+    'ops_per_thread', 100, 'Number of operations executed by each thread.')
+_MAX_THREADS = flags.DEFINE_integer(
+    'max_threads', os.cpu_count() or 1,
+    'Largest number of threads to measure. Defaults to the number of cores.')
+_PRIMITIVES = flags.DEFINE_list(
+    'primitives',
+    [
+        'aead_encrypt',
+        'aead_decrypt',
+        'daead_encrypt',
+        'mac_compute',
+        'mac_verify',
+        'prf_compute',
+        'hybrid_encrypt',
+        'hybrid_decrypt',
+        'sign',
+        'verify',
+    ],
+    'Operations to benchmark.',
+)
+
+
+def _operations(payload: bytes) -> Dict[str, Callable[[], object]]:
+  """Returns a single-operation callable for each benchmarked operation."""
+  aead_primitive = tink.new_keyset_handle(
+      aead.aead_key_templates.AES256_GCM).primitive(aead.Aead)
+  aead_ciphertext = aead_primitive.encrypt(payload, b'ad')
+
+  daead_primitive = tink.new_keyset_handle(
+      daead.deterministic_aead_key_templates.AES256_SIV).primitive(
+          daead.DeterministicAead)
+
+  mac_primitive = tink.new_keyset_handle(
+      mac.mac_key_templates.HMAC_SHA256_256BITTAG).primitive(mac.Mac)
+  tag = mac_primitive.compute_mac(payload)
+
+  prf_primitive = tink.new_keyset_handle(
+      prf.prf_key_templates.HMAC_SHA256).primitive(prf.PrfSet).primary()
+
+  hybrid_private_handle = tink.new_keyset_handle(
+      hybrid.hybrid_key_templates
+      .DHKEM_X25519_HKDF_SHA256_HKDF_SHA256_AES_256_GCM)
+  hybrid_decrypt = hybrid_private_handle.primitive(hybrid.HybridDecrypt)
+  hybrid_encrypt = hybrid_private_handle.public_keyset_handle().primitive(
+      hybrid.HybridEncrypt)
+  hybrid_ciphertext = hybrid_encrypt.encrypt(payload, b'context')
+
+  sign_handle = tink.new_keyset_handle(
+      signature.signature_key_templates.ECDSA_P256)
+  signer = sign_handle.primitive(signature.PublicKeySign)
+  verifier = sign_handle.public_keyset_handle().primitive(
+      signature.PublicKeyVerify)
+  sig = signer.sign(payload)
+
+  return {
+      'aead_encrypt': lambda: aead_primitive.encrypt(payload, b'ad'),
+      'aead_decrypt': lambda: aead_primitive.decrypt(aead_ciphertext, b'ad'),
+      'daead_encrypt': lambda: daead_primitive.encrypt_deterministically(
+          payload, b'ad'),
+      'mac_compute': lambda: mac_primitive.compute_mac(payload),
+      'mac_verify': lambda: mac_primitive.verify_mac(tag, payload),
+      'prf_compute': lambda: prf_primitive.compute(payload, 32),
+      'hybrid_encrypt': lambda: hybrid_encrypt.encrypt(payload, b'context'),
+      'hybrid_decrypt': lambda: hybrid_decrypt.decrypt(
+          hybrid_ciphertext, b'context'),
+      'sign': lambda: signer.sign(payload),
+      'verify': lambda: verifier.verify(sig, payload),
+  }
+
+
+def _thread_counts(max_threads: int) -> List[int]:
+  counts = []
+  n = 1
+  while n < max_threads:
+    counts.append(n)
+    n *= 2
+  counts.append(max_threads)
+  return counts
+
+
+def _measure(operation: Callable[[], object], threads: int,
+             ops_per_thread: int) -> float:
+  """Returns the number of operations per second using 'threads' threads."""
+
+  def worker():
+    for _ in range(ops_per_thread):
+      operation()
+
+  with futures.ThreadPoolExecutor(max_workers=threads) as executor:
+    start = time.perf_counter()
+    for f in [executor.submit(worker) for _ in range(threads)]:
+      f.result()
+    elapsed = time.perf_counter() - start
+  return threads * ops_per_thread / elapsed
+
+
+def main(argv):
+  del argv
+  aead.register()
+  daead.register()
+  hybrid.register()
+  mac.register()
+  prf.register()
+  signature.register()
+
+  thread_counts = _thread_counts(_MAX_THREADS.value)
+  print('%-16s %10s %8s %12s %12s %8s' %
+        ('operation', 'payload', 'threads', 'ops/s', 'MiB/s', 'speedup'))
+  for payload_size in (int(s) for s in _PAYLOAD_SIZES.value):
+    operations = _operations(os.urandom(payload_size))
+    for name in _PRIMITIVES.value:
+      operation = operations[name]
+      operation()  # Warm up.
+      baseline = None
+      for threads in thread_counts:
+        ops = _measure(operation, threads, _OPS_PER_THREAD.value)
+        if baseline is None:
+          baseline = ops
+        print('%-16s %10d %8d %12.1f %12.1f %7.2fx' %
+              (name, payload_size, threads, ops,
+               ops * payload_size / (1 << 20), ops / baseline))
+
+
+if __name__ == '__main__':
+  app.run(main)
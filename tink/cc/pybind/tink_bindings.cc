@@ -32,6 +32,7 @@
 #include "tink/cc/pybind/public_key_sign.h"
 #include "tink/cc/pybind/public_key_verify.h"
 #include "tink/cc/pybind/python_file_object_adapter.h"
+#include "tink/cc/pybind/random_access_stream.h"
 #include "tink/cc/pybind/streaming_aead.h"
 #include "tink/cc/pybind/tink_exception.h"
 
@@ -60,6 +61,7 @@ PYBIND11_MODULE(tink_bindings, m) {
   PybindRegisterCcKeyManager(&m);
   PybindRegisterPythonFileObjectAdapter(&m);
   PybindRegisterInputStreamAdapter(&m);
+  PybindRegisterRandomAccessStream(&m);
   PybindRegisterPublicKeyVerify(&m);
 }
 
@@ -17,6 +17,7 @@
 #ifndef TINK_PYTHON_TINK_CC_PYTHON_FILE_OBJECT_ADAPTER_H_
 #define TINK_PYTHON_TINK_CC_PYTHON_FILE_OBJECT_ADAPTER_H_
 
+#include <cstdint>
 #include <string>
 
 #include "absl/status/status.h"
@@ -42,6 +43,31 @@ class PythonFileObjectAdapter {
   // object is alreday at EOF.
   virtual absl::StatusOr<std::string> Read(int size) = 0;
 
+  // Like Read(), but reads into the 'size' bytes at 'buffer' and returns the
+  // number of bytes read, so that the same buffer can be reused for every
+  // call. The default implementation returns UNIMPLEMENTED, in which case
+  // callers fall back to Read().
+  virtual absl::StatusOr<int> ReadInto(char* buffer, int size) {
+    return absl::Status(absl::StatusCode::kUnimplemented,
+                        "ReadInto is not implemented.");
+  }
+
+  // Reads 'count' bytes starting at 'position' from the underlying Python file
+  // object, without changing its current position. Returns fewer bytes only at
+  // the end of the file. Only needed for random access, so the default
+  // implementation returns UNIMPLEMENTED.
+  virtual absl::StatusOr<std::string> PRead(int64_t position, int count) {
+    return absl::Status(absl::StatusCode::kUnimplemented,
+                        "PRead is not implemented.");
+  }
+
+  // Returns the size of the underlying Python file object. Only needed for
+  // random access, so the default implementation returns UNIMPLEMENTED.
+  virtual absl::StatusOr<int64_t> Size() {
+    return absl::Status(absl::StatusCode::kUnimplemented,
+                        "Size is not implemented.");
+  }
+
   virtual ~PythonFileObjectAdapter() = default;
 };
 
@@ -43,6 +43,7 @@ PythonInputStream::PythonInputStream(
     std::shared_ptr<PythonFileObjectAdapter> adapter, int buffer_size) {
   if (buffer_size <= 0) buffer_size = 128 * 1024;  // 128 KB
   adapter_ = adapter;
+  use_read_into_ = true;
   count_in_buffer_ = 0;
   count_backedup_ = 0;
   position_ = 0;
@@ -64,7 +65,7 @@ absl::StatusOr<int> PythonInputStream::Next(const void** data) {
   }
 
   // Read new bytes to buffer_.
-  auto read_result = adapter_->Read(buffer_.size());
+  auto read_result = ReadToBuffer();
   if (is_eof(read_result.status())) {
     return status_ = absl::Status(absl::StatusCode::kOutOfRange, "EOF");
   } else if (read_result.status().code() == absl::StatusCode::kOutOfRange) {
@@ -75,9 +76,7 @@ absl::StatusOr<int> PythonInputStream::Next(const void** data) {
   } else if (!read_result.ok()) {
     return status_ = read_result.status();
   }
-  std::string read_string = read_result.value();
-  int count_read = read_string.length();
-  buffer_.replace(0, count_read, read_string);
+  int count_read = read_result.value();
   buffer_offset_ = 0;
   count_backedup_ = 0;
   count_in_buffer_ = count_read;
@@ -86,6 +85,28 @@ absl::StatusOr<int> PythonInputStream::Next(const void** data) {
   return count_in_buffer_;
 }
 
+absl::StatusOr<int> PythonInputStream::ReadToBuffer() {
+  if (use_read_into_) {
+    // Reads directly into buffer_, without allocating a string per call.
+    int size = buffer_.size();
+    auto read_into_result = adapter_->ReadInto(&buffer_[0], size);
+    if (read_into_result.ok() &&
+        (read_into_result.value() < 0 || read_into_result.value() > size)) {
+      return absl::Status(absl::StatusCode::kInternal,
+                          "Invalid number of bytes returned by readinto");
+    }
+    if (read_into_result.status().code() != absl::StatusCode::kUnimplemented) {
+      return read_into_result;
+    }
+    use_read_into_ = false;
+  }
+  auto read_result = adapter_->Read(buffer_.size());
+  if (!read_result.ok()) return read_result.status();
+  int count_read = read_result->length();
+  buffer_.replace(0, count_read, *read_result);
+  return count_read;
+}
+
 void PythonInputStream::BackUp(int count) {
   if (!status_.ok() || count < 1 || count_backedup_ == count_in_buffer_) return;
   int actual_count = std::min(count, count_in_buffer_ - count_backedup_);
@@ -48,7 +48,11 @@ class PythonInputStream : public InputStream {
 
  private:
   absl::Status status_;
+  // Reads the next bytes into buffer_ and returns their number.
+  absl::StatusOr<int> ReadToBuffer();
+
   std::shared_ptr<PythonFileObjectAdapter> adapter_;
+  bool use_read_into_;  // false once adapter_->ReadInto() is UNIMPLEMENTED
   std::string buffer_;
   int64_t position_;  // current position in the file object (from the
                       // beginning)
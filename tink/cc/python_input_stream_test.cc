@@ -17,12 +17,15 @@
 #include "tink/cc/python_input_stream.h"
 
 #include <algorithm>
+#include <cstddef>
+#include <memory>
 #include <string>
 #include <utility>
 
 #include "gtest/gtest.h"
 #include "absl/memory/memory.h"
 #include "absl/status/status.h"
+#include "absl/status/statusor.h"
 #include "tink/subtle/random.h"
 #include "tink/cc/test_util.h"
 
@@ -45,6 +48,35 @@ absl::Status ReadTillEnd(PythonInputStream* input_stream,
   return next_result.status();
 }
 
+// A readable object which only implements ReadInto(), and counts its calls.
+class ReadIntoObject : public test::TestReadableObject {
+ public:
+  explicit ReadIntoObject(const std::string& data)
+      : test::TestReadableObject(""), data_(data) {}
+
+  absl::StatusOr<std::string> Read(int size) override {
+    return absl::Status(absl::StatusCode::kInternal, "Read must not be called");
+  }
+
+  absl::StatusOr<int> ReadInto(char* buffer, int size) override {
+    ++read_into_calls_;
+    if (position_ == data_.size() && size > 0) {
+      return absl::Status(absl::StatusCode::kUnknown, "EOFError");
+    }
+    int actual = std::min(size, static_cast<int>(data_.size() - position_));
+    data_.copy(buffer, actual, position_);
+    position_ += actual;
+    return actual;
+  }
+
+  int read_into_calls() const { return read_into_calls_; }
+
+ private:
+  std::string data_;
+  size_t position_ = 0;
+  int read_into_calls_ = 0;
+};
+
 TEST(PythonInputStreamTest, testReadingStreams) {
   for (int stream_size : {0, 10, 100, 1000, 10000, 100000, 1000000}) {
     std::string contents = subtle::Random::GetRandomBytes(stream_size);
@@ -153,6 +185,40 @@ TEST(PythonInputStreamTest, testBackupAndPosition) {
             std::string(static_cast<const char*>(buffer), buffer_size));
 }
 
+TEST(PythonInputStreamTest, testReadingStreamsWithReadInto) {
+  for (int stream_size : {0, 10, 1000, 1000000}) {
+    std::string contents = subtle::Random::GetRandomBytes(stream_size);
+    auto input = std::make_shared<ReadIntoObject>(contents);
+    auto input_stream = std::make_unique<PythonInputStream>(input, 1000);
+    std::string stream_contents;
+    auto status = ReadTillEnd(input_stream.get(), &stream_contents);
+    EXPECT_EQ(absl::StatusCode::kOutOfRange, status.code());
+    EXPECT_EQ("EOF", status.message());
+    EXPECT_EQ(contents, stream_contents);
+    // One call per 1000 bytes, and one which returns EOF.
+    EXPECT_EQ(input->read_into_calls(), (stream_size + 999) / 1000 + 1);
+  }
+}
+
+TEST(PythonInputStreamTest, testBackupWithReadInto) {
+  std::string contents = subtle::Random::GetRandomBytes(100);
+  auto input = std::make_unique<ReadIntoObject>(contents);
+  auto input_stream = std::make_unique<PythonInputStream>(std::move(input), 30);
+  const void* buffer;
+  auto next_result = input_stream->Next(&buffer);
+  ASSERT_TRUE(next_result.ok()) << next_result.status();
+  EXPECT_EQ(30, next_result.value());
+  input_stream->BackUp(10);
+  next_result = input_stream->Next(&buffer);
+  ASSERT_TRUE(next_result.ok()) << next_result.status();
+  EXPECT_EQ(contents.substr(20, 10),
+            std::string(static_cast<const char*>(buffer), 10));
+  next_result = input_stream->Next(&buffer);
+  ASSERT_TRUE(next_result.ok()) << next_result.status();
+  EXPECT_EQ(contents.substr(30, 30),
+            std::string(static_cast<const char*>(buffer), 30));
+}
+
 }  // namespace
 }  // namespace tink
 }  // namespace crypto
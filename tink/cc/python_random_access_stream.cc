@@ -0,0 +1,63 @@
+// Copyright 2026 Google LLC
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+///////////////////////////////////////////////////////////////////////////////
+
+
+#include "tink/cc/python_random_access_stream.h"
+
+#include <cstdint>
+#include <cstring>
+#include <string>
+
+#include "absl/status/status.h"
+#include "absl/status/statusor.h"
+#include "tink/util/buffer.h"
+
+namespace crypto {
+namespace tink {
+
+absl::Status PythonRandomAccessStream::PRead(
+    int64_t position, int count, crypto::tink::util::Buffer* dest_buffer) {
+  if (dest_buffer == nullptr) {
+    return absl::InvalidArgumentError("dest_buffer must be non-null");
+  }
+  if (count <= 0 || count > dest_buffer->allocated_size()) {
+    return absl::InvalidArgumentError("invalid count");
+  }
+  if (position < 0) {
+    return absl::InvalidArgumentError("position cannot be negative");
+  }
+  absl::Status status = dest_buffer->set_size(0);
+  if (!status.ok()) return status;
+  absl::StatusOr<std::string> data = adapter_->PRead(position, count);
+  if (!data.ok()) return data.status();
+  if (data->size() > static_cast<size_t>(count)) {
+    return absl::InternalError("PRead returned too many bytes");
+  }
+  std::memcpy(dest_buffer->get_mem_block(), data->data(), data->size());
+  status = dest_buffer->set_size(data->size());
+  if (!status.ok()) return status;
+  if (data->size() < static_cast<size_t>(count)) {
+    return absl::OutOfRangeError("EOF");
+  }
+  return absl::OkStatus();
+}
+
+absl::StatusOr<int64_t> PythonRandomAccessStream::size() {
+  return adapter_->Size();
+}
+
+}  // namespace tink
+}  // namespace crypto
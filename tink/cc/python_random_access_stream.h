@@ -0,0 +1,54 @@
+// Copyright 2026 Google LLC
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+///////////////////////////////////////////////////////////////////////////////
+
+
+#ifndef TINK_PYTHON_TINK_CC_PYTHON_RANDOM_ACCESS_STREAM_H_
+#define TINK_PYTHON_TINK_CC_PYTHON_RANDOM_ACCESS_STREAM_H_
+
+#include <cstdint>
+#include <memory>
+#include <utility>
+
+#include "absl/status/status.h"
+#include "absl/status/statusor.h"
+#include "tink/random_access_stream.h"
+#include "tink/util/buffer.h"
+#include "tink/cc/python_file_object_adapter.h"
+
+namespace crypto {
+namespace tink {
+
+// A RandomAccessStream that reads from a PythonFileObjectAdapter, using its
+// PRead() and Size() methods. Several streams can share one adapter.
+class PythonRandomAccessStream : public RandomAccessStream {
+ public:
+  explicit PythonRandomAccessStream(
+      std::shared_ptr<PythonFileObjectAdapter> adapter)
+      : adapter_(std::move(adapter)) {}
+
+  absl::Status PRead(int64_t position, int count,
+                     crypto::tink::util::Buffer* dest_buffer) override;
+
+  absl::StatusOr<int64_t> size() override;
+
+ private:
+  std::shared_ptr<PythonFileObjectAdapter> adapter_;
+};
+
+}  // namespace tink
+}  // namespace crypto
+
+#endif  // TINK_PYTHON_TINK_CC_PYTHON_RANDOM_ACCESS_STREAM_H_
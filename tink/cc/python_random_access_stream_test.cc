@@ -0,0 +1,93 @@
+// Copyright 2026 Google LLC
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+///////////////////////////////////////////////////////////////////////////////
+
+
+#include "tink/cc/python_random_access_stream.h"
+
+#include <memory>
+#include <string>
+
+#include "gtest/gtest.h"
+#include "absl/status/status.h"
+#include "tink/subtle/random.h"
+#include "tink/util/buffer.h"
+#include "tink/cc/test_util.h"
+
+namespace crypto {
+namespace tink {
+namespace {
+
+TEST(PythonRandomAccessStreamTest, testPRead) {
+  std::string contents = subtle::Random::GetRandomBytes(1000);
+  PythonRandomAccessStream stream(
+      std::make_shared<test::TestReadableObject>(contents));
+  auto buffer = util::Buffer::New(100);
+  ASSERT_TRUE(buffer.ok()) << buffer.status();
+  for (int position : {0, 1, 500, 900}) {
+    EXPECT_TRUE(stream.PRead(position, 100, buffer->get()).ok());
+    EXPECT_EQ(contents.substr(position, 100),
+              std::string((*buffer)->get_mem_block(), (*buffer)->size()));
+  }
+  auto size = stream.size();
+  ASSERT_TRUE(size.ok()) << size.status();
+  EXPECT_EQ(*size, 1000);
+}
+
+TEST(PythonRandomAccessStreamTest, testPReadAtEnd) {
+  std::string contents = subtle::Random::GetRandomBytes(1000);
+  PythonRandomAccessStream stream(
+      std::make_shared<test::TestReadableObject>(contents));
+  auto buffer = util::Buffer::New(100);
+  ASSERT_TRUE(buffer.ok()) << buffer.status();
+
+  absl::Status status = stream.PRead(950, 100, buffer->get());
+  EXPECT_EQ(status.code(), absl::StatusCode::kOutOfRange);
+  EXPECT_EQ(contents.substr(950),
+            std::string((*buffer)->get_mem_block(), (*buffer)->size()));
+
+  status = stream.PRead(1000, 100, buffer->get());
+  EXPECT_EQ(status.code(), absl::StatusCode::kOutOfRange);
+  EXPECT_EQ((*buffer)->size(), 0);
+}
+
+TEST(PythonRandomAccessStreamTest, testInvalidArguments) {
+  PythonRandomAccessStream stream(
+      std::make_shared<test::TestReadableObject>("data"));
+  auto buffer = util::Buffer::New(10);
+  ASSERT_TRUE(buffer.ok()) << buffer.status();
+  EXPECT_EQ(stream.PRead(-1, 1, buffer->get()).code(),
+            absl::StatusCode::kInvalidArgument);
+  EXPECT_EQ(stream.PRead(0, 0, buffer->get()).code(),
+            absl::StatusCode::kInvalidArgument);
+  EXPECT_EQ(stream.PRead(0, 11, buffer->get()).code(),
+            absl::StatusCode::kInvalidArgument);
+  EXPECT_EQ(stream.PRead(0, 1, nullptr).code(),
+            absl::StatusCode::kInvalidArgument);
+}
+
+TEST(PythonRandomAccessStreamTest, testUnimplemented) {
+  PythonRandomAccessStream stream(
+      std::make_shared<test::TestWritableObject>());
+  auto buffer = util::Buffer::New(10);
+  ASSERT_TRUE(buffer.ok()) << buffer.status();
+  EXPECT_EQ(stream.PRead(0, 1, buffer->get()).code(),
+            absl::StatusCode::kUnimplemented);
+  EXPECT_EQ(stream.size().status().code(), absl::StatusCode::kUnimplemented);
+}
+
+}  // namespace
+}  // namespace tink
+}  // namespace crypto
@@ -86,6 +86,15 @@ class TestReadableObject : public PythonFileObjectAdapter {
     return to_return;
   }
 
+  absl::StatusOr<std::string> PRead(int64_t position, int count) override {
+    if (position >= static_cast<int64_t>(buffer_.size())) {
+      return std::string();
+    }
+    return buffer_.substr(position, count);
+  }
+
+  absl::StatusOr<int64_t> Size() override { return buffer_.size(); }
+
  private:
   std::string buffer_;
   int position_;
@@ -36,6 +36,7 @@ use_tink_errors = _tink_error.use_tink_errors
 
 new_primitive_set = _primitive_set.new_primitive_set
 PrimitiveSet = _primitive_set.PrimitiveSet
+FrozenPrimitiveSet = _primitive_set.FrozenPrimitiveSet
 PrimitiveWrapper = _primitive_wrapper.PrimitiveWrapper
 
 crypto_format = _crypto_format
@@ -14,16 +14,106 @@
 
 """A container class for a set of primitives."""
 
-import collections
-from typing import Generic, List, Type, TypeVar, Optional, Dict
+from typing import (
+    Any, Dict, Generic, Iterator, List, Optional, Sequence, Tuple, Type,
+    TypeVar
+)
 
 from tink.proto import tink_pb2
 from tink.core import _crypto_format
 from tink.core import _tink_error
 
 P = TypeVar('P')
-Entry = collections.namedtuple(
-    'Entry', 'primitive, identifier, status, output_prefix_type, key_id')
+
+# The key status and the output prefix type are packed into a single int,
+# which stays below 256 so that it is one of the ints cached by CPython.
+_PREFIX_TYPE_SHIFT = 4
+_STATUS_MASK = (1 << _PREFIX_TYPE_SHIFT) - 1
+_MAX_PREFIX_TYPE = (1 << (8 - _PREFIX_TYPE_SHIFT)) - 1
+
+
+class Entry:
+  """An immutable entry of a PrimitiveSet.
+
+  Entries support the API of the namedtuple that was used before: the fields
+  in the same order, indexing, iteration, _fields, _replace and _asdict. They
+  use less memory: they have no per-instance dictionary, and the key status
+  and the output prefix type are stored in a single small int.
+  """
+
+  __slots__ = ('primitive', 'identifier', 'key_id', '_flags')
+
+  _fields = ('primitive', 'identifier', 'status', 'output_prefix_type',
+             'key_id')
+
+  primitive: Any
+  identifier: bytes
+  key_id: int
+  _flags: int
+
+  def __init__(self, primitive: Any, identifier: bytes,
+               status: tink_pb2.KeyStatusType,
+               output_prefix_type: tink_pb2.OutputPrefixType, key_id: int):
+    if (not 0 <= status <= _STATUS_MASK or
+        not 0 <= output_prefix_type <= _MAX_PREFIX_TYPE):
+      raise _tink_error.TinkError(
+          'Unsupported key status {} or output prefix type {}'.format(
+              status, output_prefix_type))
+    set_field = super().__setattr__
+    set_field('primitive', primitive)
+    set_field('identifier', identifier)
+    set_field('key_id', key_id)
+    set_field('_flags', status | output_prefix_type << _PREFIX_TYPE_SHIFT)
+
+  @property
+  def status(self) -> tink_pb2.KeyStatusType:
+    return self._flags & _STATUS_MASK
+
+  @property
+  def output_prefix_type(self) -> tink_pb2.OutputPrefixType:
+    return self._flags >> _PREFIX_TYPE_SHIFT
+
+  def __setattr__(self, name: str, value: Any) -> None:
+    raise AttributeError('Entry is immutable')
+
+  def __delattr__(self, name: str) -> None:
+    raise AttributeError('Entry is immutable')
+
+  def _values(self) -> Tuple[Any, ...]:
+    return (self.primitive, self.identifier, self.status,
+            self.output_prefix_type, self.key_id)
+
+  def _replace(self, **kwargs: Any) -> 'Entry':
+    values = self._asdict()
+    for name, value in kwargs.items():
+      if name not in values:
+        raise ValueError('Got unexpected field name: {!r}'.format(name))
+      values[name] = value
+    return Entry(**values)
+
+  def _asdict(self) -> Dict[str, Any]:
+    return dict(zip(self._fields, self._values()))
+
+  def __getitem__(self, index: Any) -> Any:
+    return self._values()[index]
+
+  def __len__(self) -> int:
+    return len(self._fields)
+
+  def __iter__(self) -> Iterator[Any]:
+    return iter(self._values())
+
+  def __eq__(self, other: Any) -> bool:
+    if not isinstance(other, Entry):
+      return NotImplemented
+    return self._values() == other._values()
+
+  def __hash__(self) -> int:
+    return hash(self._values())
+
+  def __repr__(self) -> str:
+    return ('Entry(primitive={!r}, identifier={!r}, status={!r}, '
+            'output_prefix_type={!r}, key_id={!r})').format(*self._values())
 
 
 def new_primitive_set(primitive_class):
@@ -43,6 +133,8 @@ class PrimitiveSet(Generic[P]):
   prefix determines the id of the primitive from the set.
   """
 
+  __slots__ = ('_primitives', '_primary', '_primitive_class')
+
   def __init__(self, primitive_class: Type[P]):
     self._primitives: Dict[bytes, List[Entry]] = {}
     self._primary: Optional[Entry] = None
@@ -51,21 +143,21 @@ class PrimitiveSet(Generic[P]):
   def primitive_class(self) -> Type[P]:
     return self._primitive_class
 
-  def primitive_from_identifier(self, identifier: bytes) -> List[Entry]:
+  def primitive_from_identifier(self, identifier: bytes) -> Sequence[Entry]:
     """Returns a copy of the list of entries for a given identifier."""
     # Copy the list so that if the user modifies the list, it does not affect
     # the internal data structure.
     return self._primitives.get(identifier, [])[:]
 
-  def all(self) -> List[List[Entry]]:
+  def all(self) -> Sequence[Sequence[Entry]]:
     """Returns a list of copies of all lists of entries in the primitive set."""
     return list(entries[:] for entries in self._primitives.values())
 
-  def primitive(self, key: tink_pb2.Keyset.Key) -> List[Entry]:
+  def primitive(self, key: tink_pb2.Keyset.Key) -> Sequence[Entry]:
     """Returns a copy of the list of entries for a given key."""
     return self.primitive_from_identifier(_crypto_format.output_prefix(key))
 
-  def raw_primitives(self) -> List[Entry]:
+  def raw_primitives(self) -> Sequence[Entry]:
     """Returns a copy of the list of entries of keys with raw prefix."""
     # All raw keys have the same identifier, which is just b''.
     return self.primitive_from_identifier(_crypto_format.RAW_PREFIX)
@@ -77,11 +169,14 @@ class PrimitiveSet(Generic[P]):
           'The primitive is not an instance of {}'.format(
               self._primitive_class))
     identifier = _crypto_format.output_prefix(key)
+    entries = self._primitives.get(identifier)
+    if entries:
+      # Share one identifier object between all entries with the same prefix.
+      identifier = entries[0].identifier
 
     entry = Entry(primitive, identifier, key.status, key.output_prefix_type,
                   key.key_id)
-    entries = self._primitives.setdefault(identifier, [])
-    entries.append(entry)
+    self._primitives.setdefault(identifier, []).append(entry)
     return entry
 
   def set_primary(self, entry: Entry) -> None:
@@ -91,3 +186,65 @@ class PrimitiveSet(Generic[P]):
     if not self._primary:
       raise _tink_error.TinkError('The primary entry is not set.')
     return self._primary
+
+  def freeze(self) -> 'FrozenPrimitiveSet[P]':
+    """Returns an immutable snapshot of the primitive set.
+
+    Later changes to this primitive set do not affect the snapshot.
+    """
+    return FrozenPrimitiveSet(self)
+
+
+_NO_ENTRIES: Tuple[Entry, ...] = ()
+
+
+class FrozenPrimitiveSet(PrimitiveSet[P]):
+  """An immutable snapshot of a PrimitiveSet.
+
+  The entries are stored in tuples which are computed once, when the snapshot
+  is created, and are returned without copying. Wrappers call
+  primitive_from_identifier and raw_primitives for every ciphertext they
+  decrypt, so this avoids allocating lists on that path.
+
+  The tuples hold the same entries as the lists returned by PrimitiveSet, but
+  callers must not rely on them being lists.
+  """
+
+  __slots__ = ('_entries', '_raw', '_all')
+
+  def __init__(self, primitive_set: PrimitiveSet[P]):
+    # The entries are kept in _entries only, so PrimitiveSet.__init__, which
+    # creates the _primitives dict, is not called.
+    self._primitive_class = primitive_set.primitive_class()
+    # pylint: disable=protected-access
+    self._entries: Dict[bytes, Tuple[Entry, ...]] = {
+        identifier: tuple(entries)
+        for identifier, entries in primitive_set._primitives.items()
+    }
+    self._primary = primitive_set._primary
+    # pylint: enable=protected-access
+    self._raw = self._entries.get(_crypto_format.RAW_PREFIX, _NO_ENTRIES)
+    self._all = tuple(self._entries.values())
+
+  def primitive_from_identifier(
+      self, identifier: bytes
+  ) -> Tuple[Entry, ...]:
+    """Returns the entries for a given identifier."""
+    return self._entries.get(identifier, _NO_ENTRIES)
+
+  def all(self) -> Tuple[Tuple[Entry, ...], ...]:
+    """Returns all tuples of entries in the primitive set."""
+    return self._all
+
+  def raw_primitives(self) -> Tuple[Entry, ...]:
+    """Returns the entries of keys with raw prefix."""
+    return self._raw
+
+  def add_primitive(self, primitive: P, key: tink_pb2.Keyset.Key) -> Entry:
+    raise _tink_error.TinkError('A frozen primitive set cannot be modified.')
+
+  def set_primary(self, entry: Entry) -> None:
+    raise _tink_error.TinkError('A frozen primitive set cannot be modified.')
+
+  def freeze(self) -> 'FrozenPrimitiveSet[P]':
+    return self
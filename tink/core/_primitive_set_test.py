@@ -19,6 +19,7 @@ from tink.proto import tink_pb2
 from tink import aead
 from tink import core
 from tink import mac
+from tink.core import _primitive_set
 from tink.testing import helper
 
 
@@ -243,5 +244,145 @@ class PrimitiveSetTest(absltest.TestCase):
         [(b'\x00\x00\x00\x00X', tink_pb2.LEGACY, 88)],
     ])
 
+  def test_entry_fields(self):
+    primitive_set = core.new_primitive_set(mac.Mac)
+    key = new_key(
+        MAC_TEMPLATE,
+        key_id=1234,
+        output_prefix_type=tink_pb2.LEGACY,
+        status=tink_pb2.DISABLED)
+    primitive = core.Registry.primitive(key.key_data, mac.Mac)
+    entry = primitive_set.add_primitive(primitive, key)
+    self.assertEqual(entry.primitive, primitive)
+    self.assertEqual(entry.identifier, core.crypto_format.output_prefix(key))
+    self.assertEqual(entry.status, tink_pb2.DISABLED)
+    self.assertEqual(entry.output_prefix_type, tink_pb2.LEGACY)
+    self.assertEqual(entry.key_id, 1234)
+    self.assertEqual(
+        tuple(entry),
+        (primitive, entry.identifier, tink_pb2.DISABLED, tink_pb2.LEGACY,
+         1234))
+
+  def test_entry_namedtuple_api(self):
+    primitive = helper.FakeMac()
+    entry = _primitive_set.Entry(primitive, b'id', tink_pb2.ENABLED,
+                                 tink_pb2.TINK, 1)
+    self.assertEqual(
+        entry._fields,
+        ('primitive', 'identifier', 'status', 'output_prefix_type', 'key_id'))
+    self.assertLen(entry, 5)
+    self.assertIs(entry[0], primitive)
+    self.assertEqual(entry[-1], 1)
+    self.assertEqual(entry[1:3], (b'id', tink_pb2.ENABLED))
+    self.assertEqual(
+        entry._asdict(),
+        {'primitive': primitive, 'identifier': b'id',
+         'status': tink_pb2.ENABLED, 'output_prefix_type': tink_pb2.TINK,
+         'key_id': 1})
+    disabled = entry._replace(status=tink_pb2.DISABLED)
+    self.assertEqual(disabled.status, tink_pb2.DISABLED)
+    self.assertEqual(disabled.key_id, 1)
+    self.assertEqual(entry.status, tink_pb2.ENABLED)
+    with self.assertRaises(ValueError):
+      entry._replace(unknown=1)
+
+  def test_entry_is_immutable_and_slotted(self):
+    primitive_set = core.new_primitive_set(mac.Mac)
+    key = new_key(MAC_TEMPLATE, key_id=1)
+    primitive = core.Registry.primitive(key.key_data, mac.Mac)
+    entry = primitive_set.add_primitive(primitive, key)
+    with self.assertRaises(AttributeError):
+      entry.key_id = 2
+    with self.assertRaises(AttributeError):
+      entry.status = tink_pb2.DISABLED
+    self.assertFalse(hasattr(entry, '__dict__'))
+
+  def test_entry_equality(self):
+    primitive = helper.FakeMac()
+    entry1 = _primitive_set.Entry(primitive, b'id', tink_pb2.ENABLED,
+                                  tink_pb2.TINK, 1)
+    entry2 = _primitive_set.Entry(primitive, b'id', tink_pb2.ENABLED,
+                                  tink_pb2.TINK, 1)
+    entry3 = _primitive_set.Entry(primitive, b'id', tink_pb2.DISABLED,
+                                  tink_pb2.TINK, 1)
+    self.assertEqual(entry1, entry2)
+    self.assertEqual(hash(entry1), hash(entry2))
+    self.assertNotEqual(entry1, entry3)
+
+  def test_entries_share_identifier(self):
+    primitive_set = core.new_primitive_set(mac.Mac)
+    key1 = new_key(MAC_TEMPLATE, key_id=1)
+    key2 = new_key(MAC_TEMPLATE, key_id=1)
+    entry1 = primitive_set.add_primitive(
+        core.Registry.primitive(key1.key_data, mac.Mac), key1)
+    entry2 = primitive_set.add_primitive(
+        core.Registry.primitive(key2.key_data, mac.Mac), key2)
+    self.assertIs(entry1.identifier, entry2.identifier)
+
+  def test_freeze(self):
+    primitive_set = core.new_primitive_set(mac.Mac)
+    key1 = new_key(MAC_TEMPLATE, key_id=1, output_prefix_type=tink_pb2.TINK)
+    primitive1 = core.Registry.primitive(key1.key_data, mac.Mac)
+    entry1 = primitive_set.add_primitive(primitive1, key1)
+    primitive_set.set_primary(entry1)
+    key2 = new_key(MAC_TEMPLATE, key_id=2, output_prefix_type=tink_pb2.RAW)
+    primitive2 = core.Registry.primitive(key2.key_data, mac.Mac)
+    entry2 = primitive_set.add_primitive(primitive2, key2)
+
+    frozen = primitive_set.freeze()
+
+    self.assertIsInstance(frozen, core.FrozenPrimitiveSet)
+    self.assertEqual(frozen.primitive_class(), mac.Mac)
+    self.assertEqual(frozen.primary(), entry1)
+    self.assertEqual(list(frozen.primitive(key1)), [entry1])
+    self.assertEqual(list(frozen.raw_primitives()), [entry2])
+    self.assertCountEqual(
+        [list(entries) for entries in frozen.all()], [[entry1], [entry2]])
+    self.assertEmpty(frozen.primitive_from_identifier(b'unknown'))
+    self.assertIs(frozen.freeze(), frozen)
+    self.assertFalse(hasattr(frozen, '_primitives'))
+
+  def test_frozen_lookups_do_not_allocate(self):
+    primitive_set = core.new_primitive_set(mac.Mac)
+    key = new_key(MAC_TEMPLATE, key_id=1, output_prefix_type=tink_pb2.RAW)
+    primitive = core.Registry.primitive(key.key_data, mac.Mac)
+    primitive_set.add_primitive(primitive, key)
+    frozen = primitive_set.freeze()
+    self.assertIs(frozen.raw_primitives(), frozen.raw_primitives())
+    self.assertIs(frozen.primitive(key), frozen.primitive(key))
+    self.assertIs(frozen.all(), frozen.all())
+    self.assertIs(
+        frozen.primitive_from_identifier(b'unknown'),
+        frozen.primitive_from_identifier(b'other'))
+
+  def test_freeze_is_a_snapshot(self):
+    primitive_set = core.new_primitive_set(mac.Mac)
+    key1 = new_key(MAC_TEMPLATE, key_id=1)
+    primitive1 = core.Registry.primitive(key1.key_data, mac.Mac)
+    primitive_set.add_primitive(primitive1, key1)
+    frozen = primitive_set.freeze()
+
+    key2 = new_key(MAC_TEMPLATE, key_id=1)
+    primitive2 = core.Registry.primitive(key2.key_data, mac.Mac)
+    entry2 = primitive_set.add_primitive(primitive2, key2)
+    primitive_set.set_primary(entry2)
+
+    self.assertLen(frozen.primitive(key1), 1)
+    self.assertLen(primitive_set.primitive(key1), 2)
+    with self.assertRaises(core.TinkError):
+      frozen.primary()
+
+  def test_frozen_is_immutable(self):
+    primitive_set = core.new_primitive_set(mac.Mac)
+    key = new_key(MAC_TEMPLATE, key_id=1)
+    primitive = core.Registry.primitive(key.key_data, mac.Mac)
+    entry = primitive_set.add_primitive(primitive, key)
+    frozen = primitive_set.freeze()
+    with self.assertRaises(core.TinkError):
+      frozen.add_primitive(primitive, key)
+    with self.assertRaises(core.TinkError):
+      frozen.set_primary(entry)
+
+
 if __name__ == '__main__':
   absltest.main()
@@ -262,6 +262,10 @@ class Registry:
   ) -> P:
     """Wraps a set of primitives into a single primitive.
 
+    The wrapper gets an immutable snapshot of primitive_set, see
+    PrimitiveSet.freeze, so later changes to primitive_set do not affect the
+    returned primitive.
+
     Args:
       primitive_set: A PrimitiveSet object.
       primitive_class: Class of the output primitive.
@@ -275,7 +279,7 @@ class Registry:
       input_primitive_class of the wrapper.
     """
     wrapper = cls._get_and_validate_wrapper(primitive_set, primitive_class)
-    return wrapper.wrap(primitive_set)
+    return wrapper.wrap(primitive_set.freeze())
 
   @classmethod
   def _wrap_with_monitoring_info(
@@ -289,5 +293,5 @@ class Registry:
     wrapper = cls._get_and_validate_wrapper(primitive_set, primitive_class)
     # pylint: disable-next=protected-access
     return wrapper._wrap_with_monitoring_info(
-        primitive_set, monitoring_keyset_info
+        primitive_set.freeze(), monitoring_keyset_info
     )
@@ -0,0 +1,112 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of the key lookups done by wrapped primitives on decryption.
+
+Compares a mutable PrimitiveSet, which copies the list of entries on every
+lookup, with the FrozenPrimitiveSet that the Registry passes to the wrappers.
+For every keyset size it measures the lookups alone and AEAD decryption of a
+small ciphertext, which is dominated by the per-call overhead.
+
+Example:
+  bazel run //tink/core:primitive_set_benchmark -- --key_counts=1,10,1000
+"""
+
+import os
+import time
+from typing import Callable, List
+
+from absl import app
+from absl import flags
+
+from tink import aead
+from tink import core
+from tink.aead import _aead_wrapper
+from tink.proto import tink_pb2
+
+
+_KEY_COUNTS = flags.DEFINE_list(
+    'key_counts', ['1', '10', '1000'], 'Numbers of keys in the keyset.')
+_OPS = flags.DEFINE_integer(
+    'ops', 100000, 'Number of operations of each measurement.')
+_PAYLOAD_SIZE = flags.DEFINE_integer(
+    'payload_size', 16, 'Size of the decrypted plaintext in bytes.')
+
+
+def _new_primitive_set(key_count: int) -> core.PrimitiveSet:
+  """Returns a set of AES-GCM primitives with TINK and RAW keys."""
+  pset = core.new_primitive_set(aead.Aead)
+  template = aead.aead_key_templates.AES128_GCM
+  for key_id in range(1, key_count + 1):
+    # Every tenth key is a RAW key, which is tried when no prefix matches.
+    if key_id % 10 == 0:
+      output_prefix_type = tink_pb2.RAW
+    else:
+      output_prefix_type = tink_pb2.TINK
+    key = tink_pb2.Keyset.Key(
+        key_data=core.Registry.new_key_data(template),
+        key_id=key_id,
+        status=tink_pb2.ENABLED,
+        output_prefix_type=output_prefix_type)
+    entry = pset.add_primitive(
+        core.Registry.primitive(key.key_data, aead.Aead), key)
+    pset.set_primary(entry)
+  return pset
+
+
+def _measure(operation: Callable[[], object], ops: int) -> float:
+  """Returns the number of operations per second."""
+  operation()  # Warm up.
+  start = time.perf_counter()
+  for _ in range(ops):
+    operation()
+  return ops / (time.perf_counter() - start)
+
+
+def _operations(pset: core.PrimitiveSet,
+                payload: bytes) -> List[Callable[[], object]]:
+  """Returns the lookup and decrypt operations measured for pset."""
+  primitive = _aead_wrapper.AeadWrapper().wrap(pset)
+  ciphertext = primitive.encrypt(payload, b'ad')
+  prefix = ciphertext[:core.crypto_format.NON_RAW_PREFIX_SIZE]
+
+  def lookup():
+    pset.primitive_from_identifier(prefix)
+    pset.raw_primitives()
+
+  return [lookup, lambda: primitive.decrypt(ciphertext, b'ad')]
+
+
+def main(argv):
+  del argv
+  aead.register()
+
+  payload = os.urandom(_PAYLOAD_SIZE.value)
+  print('%-6s %-10s %14s %14s %8s' %
+        ('keys', 'set', 'lookups/s', 'decrypts/s', 'speedup'))
+  for key_count in (int(s) for s in _KEY_COUNTS.value):
+    pset = _new_primitive_set(key_count)
+    baseline = None
+    for name, candidate in (('mutable', pset), ('frozen', pset.freeze())):
+      lookups, decrypts = (
+          _measure(operation, _OPS.value)
+          for operation in _operations(candidate, payload))
+      if baseline is None:
+        baseline = decrypts
+      print('%-6d %-10s %14.1f %14.1f %7.2fx' %
+            (key_count, name, lookups, decrypts, decrypts / baseline))
+
+
+if __name__ == '__main__':
+  app.run(main)
@@ -0,0 +1,83 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Memory benchmark of wrapped primitives.
+
+Reports the Python heap bytes held by each wrapped AEAD primitive, which
+includes its primitive set and entries, for keysets of different sizes. The
+memory used by the C++ primitives is not tracked by tracemalloc and is not
+included.
+
+Example:
+  bazel run //tink/core:primitive_set_memory_benchmark -- --key_counts=1,100
+"""
+
+import gc
+import tracemalloc
+
+from absl import app
+from absl import flags
+
+import tink
+from tink import aead
+from tink import cleartext_keyset_handle
+from tink import core
+from tink.proto import tink_pb2
+
+
+_KEY_COUNTS = flags.DEFINE_list(
+    'key_counts', ['1', '100'], 'Numbers of keys in the keyset.')
+_PRIMITIVES = flags.DEFINE_integer(
+    'primitives', 1000, 'Number of wrapped primitives kept alive at once.')
+
+
+def _new_keyset(key_count: int) -> tink_pb2.Keyset:
+  keyset = tink_pb2.Keyset(primary_key_id=key_count)
+  template = aead.aead_key_templates.AES128_GCM
+  for key_id in range(1, key_count + 1):
+    keyset.key.add(
+        key_data=core.Registry.new_key_data(template),
+        key_id=key_id,
+        status=tink_pb2.ENABLED,
+        output_prefix_type=tink_pb2.TINK)
+  return keyset
+
+
+def _bytes_per_primitive(handle: tink.KeysetHandle, count: int) -> float:
+  """Returns the traced bytes held by each of count wrapped primitives."""
+  gc.collect()
+  tracemalloc.start()
+  before = tracemalloc.get_traced_memory()[0]
+  primitives = [handle.primitive(aead.Aead) for _ in range(count)]
+  gc.collect()
+  after = tracemalloc.get_traced_memory()[0]
+  tracemalloc.stop()
+  del primitives
+  return (after - before) / count
+
+
+def main(argv):
+  del argv
+  aead.register()
+
+  print('%-6s %18s %14s' % ('keys', 'bytes/primitive', 'bytes/key'))
+  for key_count in (int(s) for s in _KEY_COUNTS.value):
+    handle = cleartext_keyset_handle.from_keyset(_new_keyset(key_count))
+    handle.primitive(aead.Aead)  # Warm up.
+    size = _bytes_per_primitive(handle, _PRIMITIVES.value)
+    print('%-6d %18.1f %14.1f' % (key_count, size, size / key_count))
+
+
+if __name__ == '__main__':
+  app.run(main)
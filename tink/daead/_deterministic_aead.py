@@ -15,6 +15,17 @@
 """This module defines the interface for Deterministic AEAD."""
 
 import abc
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+from tink import _batch
+from tink import _out_buffer
+from tink import core
+
+# The result of a batch: either a list with the result or the error of each
+# item, or, for flat batches, a tuple (data, offsets), see tink._batch.
+BatchResult = Union[
+    List[Union[bytes, core.TinkError]], Tuple[bytes, memoryview]
+]
 
 
 class DeterministicAead(metaclass=abc.ABCMeta):
@@ -39,6 +50,9 @@ class DeterministicAead(metaclass=abc.ABCMeta):
   Encryption with associated data ensures authenticity (who the sender is)
   and integrity (the data has not been tampered with) of that data, but not
   its secrecy. (see https://tools.ietf.org/html/rfc5116)
+
+  For the bytes-like arguments that keyset primitives accept, see
+  KeysetHandle.primitive.
   """
 
   @abc.abstractmethod
@@ -50,3 +64,120 @@ class DeterministicAead(metaclass=abc.ABCMeta):
   def decrypt_deterministically(self, ciphertext: bytes,
                                 associated_data: bytes) -> bytes:
     raise NotImplementedError()
+
+  def ciphertext_size(self, plaintext_length: int) -> int:
+    """Returns the length of the ciphertext of a plaintext of the given length.
+
+    Raises:
+      NotImplementedError if the length of the ciphertext is not determined by
+      the length of the plaintext.
+    """
+    raise NotImplementedError()
+
+  def encrypt_deterministically_into(self, plaintext: bytes,
+                                     associated_data: bytes, out) -> int:
+    """Like encrypt_deterministically, but writes the ciphertext into out.
+
+    The ciphertext is written to the beginning of the writable bytes-like
+    object out, which must be large enough to hold it, see ciphertext_size.
+
+    Returns:
+      the length of the ciphertext written to out.
+    Raises:
+      tink.TinkError if the encryption fails.
+      ValueError if out is too small.
+    """
+    return _out_buffer.copy_into(
+        self.encrypt_deterministically(plaintext, associated_data), out)
+
+  def decrypt_deterministically_into(self, ciphertext: bytes,
+                                     associated_data: bytes, out) -> int:
+    """Like decrypt_deterministically, but writes the plaintext into out.
+
+    The plaintext is written to the beginning of the writable bytes-like
+    object out. A buffer of the length of the ciphertext is always large
+    enough.
+
+    Returns:
+      the length of the plaintext written to out.
+    Raises:
+      tink.TinkError if the decryption fails.
+      ValueError if out is too small.
+    """
+    return _out_buffer.copy_into(
+        self.decrypt_deterministically(ciphertext, associated_data), out)
+
+  def encrypt_deterministically_many(
+      self,
+      plaintexts: Any,
+      associated_datas: Any,
+      offsets: Optional[Any] = None,
+  ) -> BatchResult:
+    """Encrypts a batch of plaintexts.
+
+    The primitives returned by a KeysetHandle encrypt the whole batch in a
+    single call into C++ that releases the GIL.
+
+    Args:
+      plaintexts: a sequence of bytes-like objects or, if offsets is given, a
+        single buffer that holds all plaintexts back to back.
+      associated_datas: a sequence of the same length with the associated data
+        of each plaintext or, if offsets is given, a single bytes-like object
+        that is the associated data of all plaintexts.
+      offsets: optional int64 offsets of the plaintexts in a flat buffer, in
+        the layout of Apache Arrow's LargeBinary arrays: plaintext i is
+        plaintexts[offsets[i]:offsets[i + 1]].
+    Returns:
+      without offsets, a list that contains, for each plaintext, either the
+      ciphertext as bytes or the tink.TinkError that caused its encryption to
+      fail. With offsets, a tuple (data, offsets) of the ciphertexts in the
+      same flat layout, where offsets is a memoryview of int64.
+    Raises:
+      tink.TinkError if offsets is given and an item cannot be encrypted.
+      ValueError if the shapes of the arguments do not match.
+    """
+    if offsets is not None:
+      return _batch.join([
+          self.encrypt_deterministically(plaintext, associated_datas)
+          for plaintext in _batch.split(plaintexts, _batch.to_offsets(offsets))
+      ])
+    _batch.check_same_length(plaintexts, associated_datas)
+    results = []
+    for plaintext, associated_data in zip(plaintexts, associated_datas):
+      try:
+        results.append(
+            self.encrypt_deterministically(plaintext, associated_data))
+      except core.TinkError as e:
+        results.append(e)
+    return results
+
+  def decrypt_deterministically_many(
+      self,
+      ciphertexts: Any,
+      associated_datas: Any,
+      offsets: Optional[Any] = None,
+  ) -> BatchResult:
+    """Decrypts a batch of ciphertexts.
+
+    See encrypt_deterministically_many for the layout of the arguments and of
+    the result.
+
+    Raises:
+      tink.TinkError if offsets is given and an item cannot be decrypted.
+      ValueError if the shapes of the arguments do not match.
+    """
+    if offsets is not None:
+      return _batch.join([
+          self.decrypt_deterministically(ciphertext, associated_datas)
+          for ciphertext in _batch.split(ciphertexts,
+                                         _batch.to_offsets(offsets))
+      ])
+    _batch.check_same_length(ciphertexts, associated_datas)
+    results = []
+    for ciphertext, associated_data in zip(ciphertexts, associated_datas):
+      try:
+        results.append(
+            self.decrypt_deterministically(ciphertext, associated_data))
+      except core.TinkError as e:
+        results.append(e)
+    return results
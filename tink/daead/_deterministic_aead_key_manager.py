@@ -14,6 +14,9 @@
 
 """Python wrapper of the wrapped C++ Deterministic AEAD key manager."""
 
+from typing import Any, Optional
+
+from tink import _batch
 from tink import core
 from tink.cc.pybind import tink_bindings
 from tink.daead import _deterministic_aead
@@ -25,6 +28,12 @@ class _DeterministicAeadCcToPyWrapper(_deterministic_aead.DeterministicAead):
 
   def __init__(self, cc_deterministic_aead):
     self._deterministic_aead = cc_deterministic_aead
+    self._ciphertext_overhead: Optional[int] = None
+
+  @property
+  def cc_primitive(self) -> tink_bindings.DeterministicAead:
+    """The C++ primitive, used by the keyset wrapper for flat batches."""
+    return self._deterministic_aead
 
   @core.use_tink_errors
   def encrypt_deterministically(self, plaintext: bytes,
@@ -38,6 +47,52 @@ class _DeterministicAeadCcToPyWrapper(_deterministic_aead.DeterministicAead):
     return self._deterministic_aead.decrypt_deterministically(
         ciphertext, associated_data)
 
+  @core.use_tink_errors
+  def encrypt_deterministically_into(self, plaintext: bytes,
+                                     associated_data: bytes, out) -> int:
+    return self._deterministic_aead.encrypt_deterministically_into(
+        plaintext, associated_data, out)
+
+  @core.use_tink_errors
+  def decrypt_deterministically_into(self, ciphertext: bytes,
+                                     associated_data: bytes, out) -> int:
+    return self._deterministic_aead.decrypt_deterministically_into(
+        ciphertext, associated_data, out)
+
+  def encrypt_deterministically_many(
+      self,
+      plaintexts: Any,
+      associated_datas: Any,
+      offsets: Optional[Any] = None,
+  ) -> _deterministic_aead.BatchResult:
+    if offsets is not None:
+      return super().encrypt_deterministically_many(
+          plaintexts, associated_datas, offsets)
+    return _batch.to_batch_results(
+        self._deterministic_aead.encrypt_deterministically_many(
+            plaintexts, associated_datas))
+
+  def decrypt_deterministically_many(
+      self,
+      ciphertexts: Any,
+      associated_datas: Any,
+      offsets: Optional[Any] = None,
+  ) -> _deterministic_aead.BatchResult:
+    if offsets is not None:
+      return super().decrypt_deterministically_many(
+          ciphertexts, associated_datas, offsets)
+    return _batch.to_batch_results(
+        self._deterministic_aead.decrypt_deterministically_many(
+            ciphertexts, associated_datas))
+
+  def ciphertext_size(self, plaintext_length: int) -> int:
+    # AES-SIV adds a constant number of bytes (the synthetic IV) to the
+    # plaintext, which is measured once by encrypting an empty message.
+    if self._ciphertext_overhead is None:
+      self._ciphertext_overhead = len(
+          self.encrypt_deterministically(b'', b''))
+    return plaintext_length + self._ciphertext_overhead
+
 
 def register():
   """Registers all deterministic AEAD key managers and the wrapper in the Python Registry."""
@@ -14,13 +14,44 @@
 
 """Deterministic AEAD wrapper."""
 
-from typing import Optional, Type
+from typing import Any, List, Optional, Sequence, Tuple, Type
 
+from tink import _batch
 from tink import _monitoring
+from tink import _out_buffer
+from tink import _raw_key_order
 from tink import core
+from tink.cc.pybind import tink_bindings
 from tink.daead import _deterministic_aead
 
 
+@core.use_tink_errors
+def _encrypt_flat(
+    cc_primitive: tink_bindings.DeterministicAead,
+    output_prefix: bytes,
+    plaintexts: Any,
+    offsets: memoryview,
+    associated_data: bytes,
+) -> Tuple[bytes, memoryview]:
+  data, result_offsets = cc_primitive.encrypt_deterministically_flat(
+      plaintexts, offsets, associated_data, output_prefix
+  )
+  return data, memoryview(result_offsets).cast('q')
+
+
+@core.use_tink_errors
+def _decrypt_flat(
+    candidates: List[Tuple[bytes, tink_bindings.DeterministicAead]],
+    ciphertexts: Any,
+    offsets: memoryview,
+    associated_data: bytes,
+) -> Tuple[bytes, memoryview]:
+  data, result_offsets = tink_bindings.decrypt_deterministically_flat(
+      candidates, ciphertexts, offsets, associated_data
+  )
+  return data, memoryview(result_offsets).cast('q')
+
+
 class _WrappedDeterministicAead(_deterministic_aead.DeterministicAead):
   """Implements DeterministicAead for a set of DeterministicAead primitives."""
 
@@ -29,10 +60,34 @@ class _WrappedDeterministicAead(_deterministic_aead.DeterministicAead):
       pset: core.PrimitiveSet,
       encryption_monitor: Optional[_monitoring.KeyUsageMonitor] = None,
       decryption_monitor: Optional[_monitoring.KeyUsageMonitor] = None,
+      adaptive_raw_key_order: bool = False,
   ):
     self._primitive_set = pset
     self._encryption_monitor = encryption_monitor
     self._decryption_monitor = decryption_monitor
+    self._raw_key_order = (
+        _raw_key_order.RawKeyOrder(pset.raw_primitives())
+        if adaptive_raw_key_order
+        else None
+    )
+
+  def _raw_entries(self) -> Sequence[Any]:
+    if self._raw_key_order:
+      return self._raw_key_order.entries()
+    return self._primitive_set.raw_primitives()
+
+  def raw_key_order_stats(self) -> Optional[_raw_key_order.RawKeyOrderStats]:
+    return self._raw_key_order.stats() if self._raw_key_order else None
+
+  def with_adaptive_raw_key_order(self) -> '_WrappedDeterministicAead':
+    if self._raw_key_order:
+      return self
+    return _WrappedDeterministicAead(
+        self._primitive_set,
+        self._encryption_monitor,
+        self._decryption_monitor,
+        adaptive_raw_key_order=True,
+    )
 
   def encrypt_deterministically(
       self, plaintext: bytes, associated_data: bytes
@@ -47,47 +102,153 @@ class _WrappedDeterministicAead(_deterministic_aead.DeterministicAead):
 
     return result
 
+  def encrypt_deterministically_into(
+      self, plaintext: bytes, associated_data: bytes, out
+  ) -> int:
+    primary = self._primitive_set.primary()
+    result = _out_buffer.write_prefixed_into(
+        primary.identifier,
+        lambda out_view: primary.primitive.encrypt_deterministically_into(
+            plaintext, associated_data, out_view
+        ),
+        out,
+    )
+
+    if self._encryption_monitor:
+      self._encryption_monitor.log(primary.key_id, len(plaintext))
+
+    return result
+
+  def encrypt_deterministically_many(
+      self,
+      plaintexts: Any,
+      associated_datas: Any,
+      offsets: Optional[Any] = None,
+  ) -> _deterministic_aead.BatchResult:
+    primary = self._primitive_set.primary()
+    if offsets is not None:
+      cc_primitive = getattr(primary.primitive, 'cc_primitive', None)
+      if cc_primitive is None:
+        return super().encrypt_deterministically_many(
+            plaintexts, associated_datas, offsets
+        )
+      offsets = _batch.to_offsets(offsets)
+      result = _encrypt_flat(
+          cc_primitive,
+          primary.identifier,
+          plaintexts,
+          offsets,
+          associated_datas,
+      )
+      if self._encryption_monitor:
+        for start, end in zip(offsets, offsets[1:]):
+          self._encryption_monitor.log(primary.key_id, end - start)
+      return result
+
+    results = primary.primitive.encrypt_deterministically_many(
+        plaintexts, associated_datas
+    )
+    identifier = primary.identifier
+    for i, result in enumerate(results):
+      if isinstance(result, core.TinkError):
+        continue
+      if identifier:
+        results[i] = identifier + result
+      if self._encryption_monitor:
+        self._encryption_monitor.log(primary.key_id, len(plaintexts[i]))
+    return results
+
+  def ciphertext_size(self, plaintext_length: int) -> int:
+    primary = self._primitive_set.primary()
+    return len(primary.identifier) + primary.primitive.ciphertext_size(
+        plaintext_length
+    )
+
   def decrypt_deterministically(
       self, ciphertext: bytes, associated_data: bytes
   ) -> bytes:
-    if len(ciphertext) > core.crypto_format.NON_RAW_PREFIX_SIZE:
-      prefix = ciphertext[: core.crypto_format.NON_RAW_PREFIX_SIZE]
-      ciphertext_no_prefix = ciphertext[
-          core.crypto_format.NON_RAW_PREFIX_SIZE :
-      ]
-      for entry in self._primitive_set.primitive_from_identifier(prefix):
-        try:
-          result = entry.primitive.decrypt_deterministically(
-              ciphertext_no_prefix, associated_data
-          )
-
-          if self._decryption_monitor:
-            self._decryption_monitor.log(
-                entry.key_id, len(ciphertext_no_prefix)
+    return _batch.decrypt_one_with_primitive_set(
+        self._primitive_set,
+        self._raw_entries(),
+        self._raw_key_order,
+        ciphertext,
+        lambda primitive, ciphertext: primitive.decrypt_deterministically(
+            ciphertext, associated_data
+        ),
+        self._decryption_monitor,
+    )
+
+  def decrypt_deterministically_into(
+      self, ciphertext: bytes, associated_data: bytes, out
+  ) -> int:
+    return _batch.decrypt_one_with_primitive_set(
+        self._primitive_set,
+        self._raw_entries(),
+        self._raw_key_order,
+        ciphertext,
+        lambda primitive, ciphertext_view: (
+            primitive.decrypt_deterministically_into(
+                ciphertext_view, associated_data, out
             )
+        ),
+        self._decryption_monitor,
+    )
 
-          return result
-        except core.TinkError:
-          pass
-    # Let's try all RAW keys.
-    for entry in self._primitive_set.raw_primitives():
-      try:
-        result = entry.primitive.decrypt_deterministically(
-            ciphertext, associated_data
+  def decrypt_deterministically_many(
+      self,
+      ciphertexts: Any,
+      associated_datas: Any,
+      offsets: Optional[Any] = None,
+  ) -> _deterministic_aead.BatchResult:
+    if offsets is not None:
+      candidates = self._flat_candidates()
+      # The native decryption does not report which key decrypted an item,
+      # which monitoring and the RAW key order need.
+      if (
+          candidates is None
+          or self._decryption_monitor
+          or self._raw_key_order
+      ):
+        return super().decrypt_deterministically_many(
+            ciphertexts, associated_datas, offsets
         )
+      return _decrypt_flat(
+          candidates, ciphertexts, _batch.to_offsets(offsets), associated_datas
+      )
 
-        if self._decryption_monitor:
-          self._decryption_monitor.log(entry.key_id, len(ciphertext))
-
-        return result
-      except core.TinkError:
-        pass
+    return _batch.decrypt_with_primitive_set(
+        self._primitive_set,
+        self._raw_entries(),
+        ciphertexts,
+        associated_datas,
+        lambda primitive, batch, datas: (
+            primitive.decrypt_deterministically_many(batch, datas)
+        ),
+        self._decryption_monitor,
+        self._raw_key_order,
+    )
 
-    # nothing works.
-    if self._decryption_monitor:
-      self._decryption_monitor.log_failure()
+  def _flat_candidates(
+      self,
+  ) -> Optional[List[Tuple[bytes, tink_bindings.DeterministicAead]]]:
+    """Returns the (output prefix, C++ primitive) pairs in the trial order.
 
-    raise core.TinkError('Decryption failed.')
+    Returns None if some key is not backed by a C++ primitive.
+    """
+    entries = [
+        entry
+        for entries in self._primitive_set.all()
+        for entry in entries
+        if entry.identifier
+    ]
+    entries.extend(self._raw_entries())
+    candidates = []
+    for entry in entries:
+      cc_primitive = getattr(entry.primitive, 'cc_primitive', None)
+      if cc_primitive is None:
+        return None
+      candidates.append((entry.identifier, cc_primitive))
+    return candidates
 
 
 class DeterministicAeadWrapper(
@@ -14,6 +14,8 @@
 
 """Tests for tink.python.tink.aead_wrapper."""
 
+import array
+
 from absl.testing import absltest
 from absl.testing import parameterized
 
@@ -48,6 +50,73 @@ class AeadWrapperTest(parameterized.TestCase):
         b'plaintext',
     )
 
+  @parameterized.parameters([DAEAD_TEMPLATE, RAW_DAEAD_TEMPLATE])
+  def test_encrypt_decrypt_bytes_like_objects(self, template):
+    keyset_handle = tink.new_keyset_handle(template)
+    primitive = keyset_handle.primitive(daead.DeterministicAead)
+    ciphertext = primitive.encrypt_deterministically(
+        bytearray(b'plaintext'), memoryview(b'associated_data')
+    )
+    self.assertEqual(
+        primitive.encrypt_deterministically(b'plaintext', b'associated_data'),
+        ciphertext,
+    )
+    self.assertEqual(
+        primitive.decrypt_deterministically(
+            memoryview(bytearray(ciphertext)), b'associated_data'
+        ),
+        b'plaintext',
+    )
+
+  @parameterized.parameters([DAEAD_TEMPLATE, RAW_DAEAD_TEMPLATE])
+  def test_encrypt_into_decrypt_into(self, template):
+    keyset_handle = tink.new_keyset_handle(template)
+    primitive = keyset_handle.primitive(daead.DeterministicAead)
+    ciphertext = primitive.encrypt_deterministically(
+        b'plaintext', b'associated_data'
+    )
+    self.assertLen(ciphertext, primitive.ciphertext_size(len(b'plaintext')))
+
+    out = bytearray(len(ciphertext) + 10)
+    self.assertEqual(
+        primitive.encrypt_deterministically_into(
+            b'plaintext', b'associated_data', out
+        ),
+        len(ciphertext),
+    )
+    self.assertEqual(out[: len(ciphertext)], ciphertext)
+
+    plaintext_out = bytearray(len(ciphertext))
+    self.assertEqual(
+        primitive.decrypt_deterministically_into(
+            ciphertext, b'associated_data', plaintext_out
+        ),
+        len(b'plaintext'),
+    )
+    self.assertEqual(plaintext_out[: len(b'plaintext')], b'plaintext')
+
+  @parameterized.parameters([DAEAD_TEMPLATE, RAW_DAEAD_TEMPLATE])
+  def test_encrypt_into_too_small_fails(self, template):
+    keyset_handle = tink.new_keyset_handle(template)
+    primitive = keyset_handle.primitive(daead.DeterministicAead)
+    ciphertext_size = primitive.ciphertext_size(len(b'plaintext'))
+    with self.assertRaises(ValueError):
+      primitive.encrypt_deterministically_into(
+          b'plaintext', b'associated_data', bytearray(ciphertext_size - 1)
+      )
+
+  @parameterized.parameters([DAEAD_TEMPLATE, RAW_DAEAD_TEMPLATE])
+  def test_encrypt_into_failure_leaves_out_unchanged(self, template):
+    keyset_handle = tink.new_keyset_handle(template)
+    primitive = keyset_handle.primitive(daead.DeterministicAead)
+    ciphertext_size = primitive.ciphertext_size(len(b'plaintext'))
+    out = bytearray(b'\xaa' * (ciphertext_size - 1))
+    with self.assertRaises(ValueError):
+      primitive.encrypt_deterministically_into(
+          b'plaintext', b'associated_data', out
+      )
+    self.assertEqual(out, b'\xaa' * (ciphertext_size - 1))
+
   @parameterized.parameters([DAEAD_TEMPLATE, RAW_DAEAD_TEMPLATE])
   def test_decrypt_unknown_ciphertext_fails(self, template):
     unknown_handle = tink.new_keyset_handle(template)
@@ -157,6 +226,185 @@ class AeadWrapperTest(parameterized.TestCase):
         p4.decrypt_deterministically(ciphertext4, b'ad'), b'plaintext'
     )
 
+  @parameterized.parameters([DAEAD_TEMPLATE, RAW_DAEAD_TEMPLATE])
+  def test_encrypt_many_decrypt_many(self, template):
+    keyset_handle = tink.new_keyset_handle(template)
+    primitive = keyset_handle.primitive(daead.DeterministicAead)
+    plaintexts = [b'', b'plaintext', bytearray(b'x' * 1000)]
+    associated_datas = [b'ad0', b'ad1', memoryview(b'ad2')]
+    ciphertexts = primitive.encrypt_deterministically_many(
+        plaintexts, associated_datas
+    )
+    self.assertEqual(
+        ciphertexts,
+        [
+            primitive.encrypt_deterministically(p, ad)
+            for p, ad in zip(plaintexts, associated_datas)
+        ],
+    )
+    self.assertEqual(
+        primitive.decrypt_deterministically_many(
+            ciphertexts, associated_datas
+        ),
+        plaintexts,
+    )
+
+  @parameterized.parameters([DAEAD_TEMPLATE, RAW_DAEAD_TEMPLATE])
+  def test_decrypt_many_reports_errors_per_item(self, template):
+    keyset_handle = tink.new_keyset_handle(template)
+    primitive = keyset_handle.primitive(daead.DeterministicAead)
+    ciphertexts = primitive.encrypt_deterministically_many(
+        [b'plaintext0', b'plaintext1'], [b'ad', b'ad']
+    )
+    results = primitive.decrypt_deterministically_many(
+        [ciphertexts[0], b'invalid', ciphertexts[1]],
+        [b'ad', b'ad', b'wrong_ad'],
+    )
+    self.assertLen(results, 3)
+    self.assertEqual(results[0], b'plaintext0')
+    self.assertIsInstance(results[1], tink.TinkError)
+    self.assertIsInstance(results[2], tink.TinkError)
+
+  def test_encrypt_many_different_lengths_fails(self):
+    primitive = tink.new_keyset_handle(DAEAD_TEMPLATE).primitive(
+        daead.DeterministicAead
+    )
+    with self.assertRaises(ValueError):
+      primitive.encrypt_deterministically_many([b'a', b'b'], [b'ad'])
+    with self.assertRaises(ValueError):
+      primitive.decrypt_deterministically_many([b'a', b'b'], [b'ad'])
+
+  @parameterized.parameters([DAEAD_TEMPLATE, RAW_DAEAD_TEMPLATE])
+  def test_encrypt_many_decrypt_many_flat(self, template):
+    keyset_handle = tink.new_keyset_handle(template)
+    primitive = keyset_handle.primitive(daead.DeterministicAead)
+    plaintexts = [b'alice', b'', b'bob', b'alice']
+    data = b''.join(plaintexts)
+    offsets = array.array('q', [0, 5, 5, 8, 13])
+
+    ciphertext_data, ciphertext_offsets = (
+        primitive.encrypt_deterministically_many(data, b'ad', offsets=offsets)
+    )
+    self.assertEqual(ciphertext_offsets.format, 'q')
+    self.assertLen(ciphertext_offsets, 5)
+    ciphertexts = [
+        ciphertext_data[start:end]
+        for start, end in zip(ciphertext_offsets, ciphertext_offsets[1:])
+    ]
+    self.assertEqual(
+        ciphertexts,
+        [primitive.encrypt_deterministically(p, b'ad') for p in plaintexts],
+    )
+
+    plaintext_data, plaintext_offsets = (
+        primitive.decrypt_deterministically_many(
+            bytearray(ciphertext_data), b'ad', offsets=ciphertext_offsets
+        )
+    )
+    self.assertEqual(plaintext_data, data)
+    self.assertEqual(plaintext_offsets.tolist(), offsets.tolist())
+
+  def test_encrypt_many_flat_accepts_list_of_offsets(self):
+    primitive = tink.new_keyset_handle(DAEAD_TEMPLATE).primitive(
+        daead.DeterministicAead
+    )
+    data, offsets = primitive.encrypt_deterministically_many(
+        b'xxab', b'ad', offsets=[2, 3, 4]
+    )
+    self.assertEqual(
+        data,
+        primitive.encrypt_deterministically(b'a', b'ad')
+        + primitive.encrypt_deterministically(b'b', b'ad'),
+    )
+    self.assertLen(offsets, 3)
+
+  def test_decrypt_many_flat_with_key_rotation(self):
+    builder = keyset_builder.new_keyset_builder()
+    older_key_id = builder.add_new_key(RAW_DAEAD_TEMPLATE)
+    builder.set_primary_key(older_key_id)
+    p1 = builder.keyset_handle().primitive(daead.DeterministicAead)
+    newer_key_id = builder.add_new_key(DAEAD_TEMPLATE)
+    builder.set_primary_key(newer_key_id)
+    p2 = builder.keyset_handle().primitive(daead.DeterministicAead)
+
+    c1 = p1.encrypt_deterministically(b'plaintext1', b'ad')
+    c2 = p2.encrypt_deterministically(b'plaintext2', b'ad')
+    data, offsets = p2.decrypt_deterministically_many(
+        c1 + c2 + c1,
+        b'ad',
+        offsets=[0, len(c1), len(c1 + c2), len(c1 + c2 + c1)],
+    )
+    self.assertEqual(data, b'plaintext1plaintext2plaintext1')
+    self.assertEqual(offsets.tolist(), [0, 10, 20, 30])
+
+    with self.assertRaises(tink.TinkError):
+      p1.decrypt_deterministically_many(
+          c1 + c2, b'ad', offsets=[0, len(c1), len(c1 + c2)]
+      )
+
+  def test_decrypt_many_flat_invalid_offsets_fails(self):
+    primitive = tink.new_keyset_handle(DAEAD_TEMPLATE).primitive(
+        daead.DeterministicAead
+    )
+    with self.assertRaises(ValueError):
+      primitive.decrypt_deterministically_many(b'abc', b'ad', offsets=[0, 4])
+    with self.assertRaises(ValueError):
+      primitive.decrypt_deterministically_many(
+          b'abc', b'ad', offsets=array.array('i', [0, 3])
+      )
+
+  def test_adaptive_raw_key_order(self):
+    builder = keyset_builder.new_keyset_builder()
+    ciphertexts = []
+    for _ in range(3):
+      key_id = builder.add_new_key(RAW_DAEAD_TEMPLATE)
+      builder.set_primary_key(key_id)
+      ciphertexts.append(
+          builder.keyset_handle()
+          .primitive(daead.DeterministicAead)
+          .encrypt_deterministically(b'plaintext', b'ad')
+      )
+    primitive = tink.with_adaptive_raw_key_order(
+        builder.keyset_handle().primitive(daead.DeterministicAead)
+    )
+
+    for ciphertext in [ciphertexts[0], ciphertexts[2], ciphertexts[2]]:
+      self.assertEqual(
+          primitive.decrypt_deterministically(ciphertext, b'ad'), b'plaintext'
+      )
+    with self.assertRaises(tink.TinkError):
+      primitive.decrypt_deterministically(ciphertexts[0], b'wrong ad')
+
+    self.assertEqual(
+        tink.raw_key_order_stats(primitive),
+        tink.RawKeyOrderStats(
+            hits=2, misses=1, failures=1, failed_attempts=5
+        ),
+    )
+    # Batch decryption records each item as if it was decrypted on its own:
+    # the last key, now tried first, decrypts the last item at once, the first
+    # key after one failed attempt and the second key after two.
+    self.assertEqual(
+        primitive.decrypt_deterministically_many(
+            ciphertexts, [b'ad'] * 3
+        ),
+        [b'plaintext'] * 3,
+    )
+    self.assertEqual(
+        tink.raw_key_order_stats(primitive),
+        tink.RawKeyOrderStats(
+            hits=3, misses=3, failures=1, failed_attempts=8
+        ),
+    )
+    # Decryption with offsets also records the outcomes.
+    data, _ = primitive.decrypt_deterministically_many(
+        ciphertexts[1] + ciphertexts[2],
+        b'ad',
+        offsets=[0, len(ciphertexts[1]), 2 * len(ciphertexts[1])],
+    )
+    self.assertEqual(data, b'plaintext' * 2)
+    self.assertEqual(tink.raw_key_order_stats(primitive).hits, 4)
+
 
 class KeyUsageMonitorTest(absltest.TestCase):
 
@@ -199,6 +447,23 @@ class KeyUsageMonitorTest(absltest.TestCase):
         )],
     )
 
+  def test_key_usage_monitor_log_flat(self):
+    keyset_handle = _keyset_handle._new_keyset_handle_with_annotations(
+        DAEAD_TEMPLATE, {'test': 'test'}
+    )
+    key_id = keyset_handle.keyset_info().key_info[0].key_id
+    primitive = keyset_handle.primitive(daead.DeterministicAead)
+
+    data, offsets = primitive.encrypt_deterministically_many(
+        b'abc', b'ad', offsets=[0, 1, 3]
+    )
+    primitive.decrypt_deterministically_many(data, b'ad', offsets=offsets)
+
+    self.assertSequenceEqual(
+        self.encryption_key_usage_monitor.log_calls, [(key_id, 1), (key_id, 2)]
+    )
+    self.assertLen(self.decryption_key_usage_monitor.log_calls, 2)
+
   def test_key_usage_monitor_log_failure(self):
     keyset_handle = _keyset_handle._new_keyset_handle_with_annotations(
         DAEAD_TEMPLATE, {'test': 'test'}
@@ -14,9 +14,11 @@
 
 """HybridDecrypt wrapper."""
 
-from typing import Optional, Type
+from typing import Any, Optional, Sequence, Type
 
+from tink import _batch
 from tink import _monitoring
+from tink import _raw_key_order
 from tink import core
 from tink.hybrid import _hybrid_decrypt
 from tink.hybrid import _hybrid_encrypt
@@ -29,42 +31,44 @@ class _WrappedHybridDecrypt(_hybrid_decrypt.HybridDecrypt):
       self,
       pset: core.PrimitiveSet,
       monitor: Optional[_monitoring.KeyUsageMonitor] = None,
+      adaptive_raw_key_order: bool = False,
   ):
     self._primitive_set = pset
     self._monitor = monitor
+    self._raw_key_order = (
+        _raw_key_order.RawKeyOrder(pset.raw_primitives())
+        if adaptive_raw_key_order
+        else None
+    )
 
-  def decrypt(self, ciphertext: bytes, context_info: bytes) -> bytes:
-    if len(ciphertext) > core.crypto_format.NON_RAW_PREFIX_SIZE:
-      prefix = ciphertext[: core.crypto_format.NON_RAW_PREFIX_SIZE]
-      ciphertext_no_prefix = ciphertext[
-          core.crypto_format.NON_RAW_PREFIX_SIZE :
-      ]
-      for entry in self._primitive_set.primitive_from_identifier(prefix):
-        try:
-          result = entry.primitive.decrypt(ciphertext_no_prefix, context_info)
-          if self._monitor:
-            self._monitor.log(entry.key_id, len(ciphertext_no_prefix))
-
-          return result
-        except core.TinkError:
-          pass
-    # Let's try all RAW keys.
-    for entry in self._primitive_set.raw_primitives():
-      try:
-        result = entry.primitive.decrypt(ciphertext, context_info)
-
-        if self._monitor:
-          self._monitor.log(entry.key_id, len(ciphertext))
-
-        return result
-      except core.TinkError:
-        pass
-
-    # nothing works.
-    if self._monitor:
-      self._monitor.log_failure()
+  def _raw_entries(self) -> Sequence[Any]:
+    if self._raw_key_order:
+      return self._raw_key_order.entries()
+    return self._primitive_set.raw_primitives()
+
+  def raw_key_order_stats(self) -> Optional[_raw_key_order.RawKeyOrderStats]:
+    return self._raw_key_order.stats() if self._raw_key_order else None
 
-    raise core.TinkError('Decryption failed.')
+  def with_adaptive_raw_key_order(self) -> '_WrappedHybridDecrypt':
+    if self._raw_key_order:
+      return self
+    return _WrappedHybridDecrypt(
+        self._primitive_set, self._monitor, adaptive_raw_key_order=True
+    )
+
+  def decrypt(self, ciphertext: bytes, context_info: bytes) -> bytes:
+    # The hybrid primitives take bytes, so the ciphertext without its output
+    # prefix is copied.
+    return _batch.decrypt_one_with_primitive_set(
+        self._primitive_set,
+        self._raw_entries(),
+        self._raw_key_order,
+        ciphertext,
+        lambda primitive, ciphertext: primitive.decrypt(
+            bytes(ciphertext), context_info
+        ),
+        self._monitor,
+    )
 
 
 class HybridDecryptWrapper(
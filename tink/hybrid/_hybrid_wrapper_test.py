@@ -241,6 +241,34 @@ class HybridWrapperTest(parameterized.TestCase):
     with self.assertRaises(tink.TinkError):
       enc_without_primary.encrypt(b'plaintext', b'context')
 
+  def test_adaptive_raw_key_order(self):
+    builder = keyset_builder.new_keyset_builder()
+    ciphertexts = []
+    for _ in range(3):
+      key_id = builder.add_new_key(RAW_TEMPLATE)
+      builder.set_primary_key(key_id)
+      public_handle = builder.keyset_handle().public_keyset_handle()
+      ciphertexts.append(
+          public_handle.primitive(hybrid.HybridEncrypt).encrypt(
+              b'plaintext', b'context'
+          )
+      )
+    hybrid_dec = tink.with_adaptive_raw_key_order(
+        builder.keyset_handle().primitive(hybrid.HybridDecrypt)
+    )
+
+    for ciphertext in [ciphertexts[0], ciphertexts[2], ciphertexts[2]]:
+      self.assertEqual(hybrid_dec.decrypt(ciphertext, b'context'), b'plaintext')
+    with self.assertRaises(tink.TinkError):
+      hybrid_dec.decrypt(ciphertexts[0], b'wrong context')
+
+    self.assertEqual(
+        tink.raw_key_order_stats(hybrid_dec),
+        tink.RawKeyOrderStats(
+            hits=2, misses=1, failures=1, failed_attempts=5
+        ),
+    )
+
 
 class KeyUsageMonitorTest(absltest.TestCase):
 
@@ -25,3 +25,4 @@ except ImportError as import_error:
 AwsKmsClient = _aws_kms_client.AwsKmsClient
 
 new_client = _aws_kms_client.new_client
+new_async_aead = _aws_kms_client.new_async_aead
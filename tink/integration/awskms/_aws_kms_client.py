@@ -14,6 +14,7 @@
 """A client for AWS KMS."""
 
 import binascii
+from concurrent import futures
 import configparser
 import re
 from typing import Any, Dict, Optional, Tuple
@@ -96,6 +97,9 @@ class _KmsClient(tink.KmsClient):
       return True
     return key_uri == self._key_uri
 
+  def key_uri_prefix(self) -> str:
+    return AWS_KEYURI_PREFIX
+
   def get_aead(self, key_uri: str) -> aead.Aead:
     if not self.does_support(key_uri):
       if self._key_uri:
@@ -114,6 +118,36 @@ def new_client(
   return _KmsClient(boto3_client, key_uri)
 
 
+def new_async_aead(
+    *,
+    boto3_client: Any,
+    key_uri: str,
+    executor: Optional[futures.Executor] = None,
+) -> aead.AsyncAead:
+  """Creates an AsyncAead for the key at key_uri from a boto3 client.
+
+  boto3 has no asyncio API, so the calls to AWS KMS are made on the threads
+  of executor, or of the default executor of the event loop if it is None.
+  boto3 clients can be shared by threads.
+
+  Args:
+    boto3_client: The boto3 KMS client used to call AWS KMS.
+    key_uri: The URI of the key.
+    executor: The executor on which the calls are made.
+
+  Returns:
+    An AsyncAead backed by the key.
+
+  Raises:
+    TinkError: If the key uri is not valid.
+  """
+  if not _has_aws_key_uri_format(key_uri):
+    raise tink.TinkError('invalid key URI')
+  return aead.as_async(
+      _AwsKmsAead(boto3_client, _key_uri_to_key_arn(key_uri)), executor
+  )
+
+
 def _parse_config(config_path: str) -> Tuple[str, str]:
   """Returns ('aws_access_key_id', 'aws_secret_access_key') from a config."""
   config = configparser.ConfigParser()
@@ -187,6 +221,9 @@ class AwsKmsClient(tink.KmsClient):
       return True
     return key_uri == self._key_uri
 
+  def key_uri_prefix(self) -> str:
+    return AWS_KEYURI_PREFIX
+
   def get_aead(self, key_uri: str) -> aead.Aead:
     """Returns an Aead-primitive backed by KMS key specified by 'key_uri'.
 
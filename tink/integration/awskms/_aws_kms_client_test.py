@@ -13,15 +13,19 @@
 # limitations under the License.
 """Tests for tink.python.tink.integration.aws_kms_client."""
 
+import asyncio
 import os
 import tempfile
 
 from absl.testing import absltest
 import boto3
+from botocore import exceptions
 
 import tink
+from tink import aead
 from tink.integration import awskms
 from tink.integration.awskms import _aws_kms_client
+from tink.testing import fake_kms
 from tink.testing import helper
 
 
@@ -50,6 +54,43 @@ GCP_KEY_URI = (
     'keyRings/unit-and-integration-testing/cryptoKeys/aead-key'
 )
 
+FAKE_KMS_URI = 'fake-kms://CM2b3_MDElQKSAowdHlwZS5nb29nbGVhcGlzLmNvbS9nb29nbGUuY3J5cHRvLnRpbmsuQWVzR2NtS2V5EhIaEIK75t5L-adlUwVhWvRuWUwYARABGM2b3_MDIAE'
+
+
+def setUpModule():
+  aead.register()
+
+
+class _FakeBoto3KmsClient:
+  """A stand-in for a boto3 KMS client backed by a fake KMS."""
+
+  def __init__(self):
+    self._aead = fake_kms.FakeKmsClient().get_aead(FAKE_KMS_URI)
+    self.key_ids = []
+
+  def _context(self, encryption_context):
+    return repr(sorted(encryption_context.items())).encode()
+
+  def encrypt(self, **kwargs):
+    self.key_ids.append(kwargs['KeyId'])
+    return {
+        'CiphertextBlob': self._aead.encrypt(
+            kwargs['Plaintext'], self._context(kwargs['EncryptionContext'])
+        )
+    }
+
+  def decrypt(self, **kwargs):
+    self.key_ids.append(kwargs['KeyId'])
+    try:
+      plaintext = self._aead.decrypt(
+          kwargs['CiphertextBlob'], self._context(kwargs['EncryptionContext'])
+      )
+    except tink.TinkError as e:
+      raise exceptions.ClientError(
+          {'Error': {'Code': 'InvalidCiphertextException'}}, 'Decrypt'
+      ) from e
+    return {'Plaintext': plaintext}
+
 
 class AwsKmsClientTest(absltest.TestCase):
 
@@ -235,5 +276,55 @@ aws_secret_access_key = other_key""")
       _aws_kms_client._parse_config(config_file.name)
 
 
+class AwsKmsAsyncAeadTest(absltest.TestCase):
+
+  def test_encrypt_decrypt(self):
+    boto3_client = _FakeBoto3KmsClient()
+    aws_aead = awskms.new_async_aead(boto3_client=boto3_client, key_uri=KEY_URI)
+
+    async def run():
+      ciphertext = await aws_aead.encrypt(b'plaintext', b'aad')
+      return await aws_aead.decrypt(ciphertext, b'aad')
+
+    self.assertEqual(asyncio.run(run()), b'plaintext')
+    self.assertEqual(
+        boto3_client.key_ids,
+        [_aws_kms_client._key_uri_to_key_arn(KEY_URI)] * 2,
+    )
+
+  def test_decrypt_with_wrong_associated_data_fails(self):
+    aws_aead = awskms.new_async_aead(
+        boto3_client=_FakeBoto3KmsClient(), key_uri=KEY_URI
+    )
+
+    async def run():
+      ciphertext = await aws_aead.encrypt(b'plaintext', b'aad')
+      await aws_aead.decrypt(ciphertext, b'bad aad')
+
+    with self.assertRaises(tink.TinkError):
+      asyncio.run(run())
+
+  def test_invalid_key_uri_fails(self):
+    with self.assertRaises(tink.TinkError):
+      awskms.new_async_aead(
+          boto3_client=_FakeBoto3KmsClient(), key_uri=GCP_KEY_URI
+      )
+
+  def test_envelope_encryption(self):
+    env_aead = aead.AsyncKmsEnvelopeAead(
+        aead.aead_key_templates.AES256_GCM,
+        awskms.new_async_aead(
+            boto3_client=_FakeBoto3KmsClient(), key_uri=KEY_URI
+        ),
+    )
+    plaintexts = [b'%d' % i for i in range(10)]
+
+    async def run():
+      ciphertexts = await env_aead.encrypt_many(plaintexts, [b'aad'] * 10)
+      return await env_aead.decrypt_many(ciphertexts, [b'aad'] * 10)
+
+    self.assertEqual(asyncio.run(run()), plaintexts)
+
+
 if __name__ == '__main__':
   absltest.main()
@@ -28,6 +28,7 @@ except ImportError as import_error:
 
 GcpKmsClient = _gcp_kms_client.GcpKmsClient
 new_client = _gcp_kms_client.new_client
+new_async_aead = _gcp_kms_client.new_async_aead
 new_gcp_kms_mac = _gcp_kms_mac.new_gcp_kms_mac
 new_gcp_kms_public_key_sign = (
     _gcp_kms_public_key_sign.new_gcp_kms_public_key_sign
@@ -14,13 +14,18 @@
 
 """Tests for tink.python.tink.integration.gcp_kms_aead."""
 
+import asyncio
+
 from absl.testing import absltest
 from absl.testing import parameterized
 from google.api_core import exceptions as core_exceptions
 from google.cloud import kms_v1
 
+from tink import aead
 from tink import core
+from tink.integration import gcpkms
 from tink.integration.gcpkms import _gcp_kms_client
+from tink.testing import fake_kms
 
 
 GCP_KEY_NAME = 'projects/p1/locations/global/keyRings/kr1/cryptoKeys/ck1'
@@ -29,6 +34,7 @@ CIPHERTEXT = b'ciphertext'
 ASSOCIATED_DATA = b'associated_data'
 STRING_63 = 'A' * 63
 STRING_64 = 'A' * 64
+FAKE_KMS_URI = 'fake-kms://CM2b3_MDElQKSAowdHlwZS5nb29nbGVhcGlzLmNvbS9nb29nbGUuY3J5cHRvLnRpbmsuQWVzR2NtS2V5EhIaEIK75t5L-adlUwVhWvRuWUwYARABGM2b3_MDIAE'
 FAKE_PROJECT_ID = '~@#$%^&*()_+|}{POI}?><213:"L{O}µ÷åß∑' * 5
 
 
@@ -36,6 +42,39 @@ class CustomException(core_exceptions.GoogleAPIError):
   pass
 
 
+def setUpModule():
+  aead.register()
+
+
+class _FakeKmsAsyncClient:
+  """A stand-in for KeyManagementServiceAsyncClient backed by a fake KMS."""
+
+  def __init__(self):
+    self._aead = fake_kms.FakeKmsClient().get_aead(FAKE_KMS_URI)
+    self.requests = []
+
+  async def encrypt(self, request):
+    self.requests.append(request)
+    await asyncio.sleep(0)
+    return kms_v1.types.EncryptResponse(
+        name=request['name'],
+        ciphertext=self._aead.encrypt(
+            request['plaintext'], request['additional_authenticated_data']
+        ),
+    )
+
+  async def decrypt(self, request):
+    self.requests.append(request)
+    await asyncio.sleep(0)
+    try:
+      plaintext = self._aead.decrypt(
+          request['ciphertext'], request['additional_authenticated_data']
+      )
+    except core.TinkError as e:
+      raise core_exceptions.InvalidArgument(str(e))
+    return kms_v1.types.DecryptResponse(plaintext=plaintext)
+
+
 class GcpKmsAeadTest(parameterized.TestCase):
 
   def setUp(self):
@@ -113,5 +152,67 @@ class GcpKmsAeadTest(parameterized.TestCase):
     self.assertEqual(plaintext, PLAINTEXT)
 
 
+class GcpKmsAsyncAeadTest(absltest.TestCase):
+
+  def test_encrypt_decrypt(self):
+    client = _FakeKmsAsyncClient()
+    gcp_aead = gcpkms.new_async_aead(
+        kms_v1_async_client=client, key_uri='gcp-kms://' + GCP_KEY_NAME
+    )
+
+    async def run():
+      ciphertext = await gcp_aead.encrypt(PLAINTEXT, ASSOCIATED_DATA)
+      return await gcp_aead.decrypt(ciphertext, ASSOCIATED_DATA)
+
+    self.assertEqual(asyncio.run(run()), PLAINTEXT)
+    self.assertEqual(
+        [request['name'] for request in client.requests], [GCP_KEY_NAME] * 2
+    )
+
+  def test_decryption_fails(self):
+    gcp_aead = gcpkms.new_async_aead(
+        kms_v1_async_client=_FakeKmsAsyncClient(),
+        key_uri='gcp-kms://' + GCP_KEY_NAME,
+    )
+    with self.assertRaises(core.TinkError):
+      asyncio.run(gcp_aead.decrypt(CIPHERTEXT, ASSOCIATED_DATA))
+
+  def test_decryption_with_key_version_fails(self):
+    gcp_aead = gcpkms.new_async_aead(
+        kms_v1_async_client=_FakeKmsAsyncClient(),
+        key_uri='gcp-kms://' + GCP_KEY_NAME + '/cryptoKeyVersions/1',
+    )
+    with self.assertRaises(core.TinkError):
+      asyncio.run(gcp_aead.decrypt(CIPHERTEXT, ASSOCIATED_DATA))
+
+  def test_invalid_key_uri_fails(self):
+    with self.assertRaises(core.TinkError):
+      gcpkms.new_async_aead(
+          kms_v1_async_client=_FakeKmsAsyncClient(), key_uri=GCP_KEY_NAME
+      )
+    with self.assertRaises(core.TinkError):
+      gcpkms.new_async_aead(
+          kms_v1_async_client=_FakeKmsAsyncClient(),
+          key_uri='gcp-kms://wrong/kms/key/format',
+      )
+
+  def test_envelope_encryption(self):
+    client = _FakeKmsAsyncClient()
+    env_aead = aead.AsyncKmsEnvelopeAead(
+        aead.aead_key_templates.AES256_GCM,
+        gcpkms.new_async_aead(
+            kms_v1_async_client=client, key_uri='gcp-kms://' + GCP_KEY_NAME
+        ),
+    )
+    plaintexts = [b'%d' % i for i in range(10)]
+
+    async def run():
+      ciphertexts = await env_aead.encrypt_many(plaintexts, [b''] * 10)
+      return await env_aead.decrypt_many(ciphertexts, [b''] * 10)
+
+    self.assertEqual(asyncio.run(run()), plaintexts)
+    self.assertLen(client.requests, 20)
+
+
 if __name__ == '__main__':
   absltest.main()
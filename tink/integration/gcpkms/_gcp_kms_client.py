@@ -34,23 +34,33 @@ _KMS_KEY_REGEX = re.compile(
 )
 
 
+def _check_key_name(key_name: str) -> None:
+  if not key_name:
+    raise tink.TinkError('key_name cannot be null.')
+  if not (
+      _KMS_KEY_REGEX.match(key_name)
+      or _gcp_kms_util.KMS_KEY_VERSION_REGEX.match(key_name)
+  ):
+    raise tink.TinkError(
+        'Invalid key_name format: {}.\nKMS keys should follow the format: '
+        '"projects/<project-id>/locations/<location>/keyRings/<keyring>/'
+        'cryptoKeys/<key-name>"'.format(key_name)
+    )
+
+
+_KEY_VERSION_DECRYPTION_ERROR = (
+    'A CryptoKeyVersion was specified. Decryption is only supported when '
+    'a CryptoKey is specified.'
+)
+
+
 class _GcpKmsAead(aead.Aead):
   """Implements the Aead interface for GCP KMS."""
 
   def __init__(
       self, client: kms_v1.KeyManagementServiceClient, key_name: str
   ) -> None:
-    if not key_name:
-      raise tink.TinkError('key_name cannot be null.')
-    if not (
-        _KMS_KEY_REGEX.match(key_name)
-        or _gcp_kms_util.KMS_KEY_VERSION_REGEX.match(key_name)
-    ):
-      raise tink.TinkError(
-          'Invalid key_name format: {}.\nKMS keys should follow the format: '
-          '"projects/<project-id>/locations/<location>/keyRings/<keyring>/'
-          'cryptoKeys/<key-name>"'.format(key_name)
-      )
+    _check_key_name(key_name)
     if not client:
       raise tink.TinkError('client cannot be null.')
     self.client = client
@@ -74,10 +84,7 @@ class _GcpKmsAead(aead.Aead):
 
   def decrypt(self, ciphertext: bytes, associated_data: bytes) -> bytes:
     if self.key_version_specified:
-      raise tink.TinkError(
-          'A CryptoKeyVersion was specified. Decryption is only supported when '
-          'a CryptoKey is specified.'
-      )
+      raise tink.TinkError(_KEY_VERSION_DECRYPTION_ERROR)
     try:
       response = self.client.decrypt(
           request={
@@ -91,6 +98,50 @@ class _GcpKmsAead(aead.Aead):
       raise tink.TinkError(e)
 
 
+class _GcpKmsAsyncAead(aead.AsyncAead):
+  """Implements the AsyncAead interface for GCP KMS."""
+
+  def __init__(
+      self, client: kms_v1.KeyManagementServiceAsyncClient, key_name: str
+  ) -> None:
+    _check_key_name(key_name)
+    if not client:
+      raise tink.TinkError('client cannot be null.')
+    self.client = client
+    self.name = key_name
+    self.key_version_specified = bool(
+        _gcp_kms_util.KMS_KEY_VERSION_REGEX.match(key_name)
+    )
+
+  async def encrypt(self, plaintext: bytes, associated_data: bytes) -> bytes:
+    try:
+      response = await self.client.encrypt(
+          request={
+              'name': self.name,
+              'plaintext': plaintext,
+              'additional_authenticated_data': associated_data,
+          }
+      )
+      return response.ciphertext
+    except core_exceptions.GoogleAPIError as e:
+      raise tink.TinkError(e)
+
+  async def decrypt(self, ciphertext: bytes, associated_data: bytes) -> bytes:
+    if self.key_version_specified:
+      raise tink.TinkError(_KEY_VERSION_DECRYPTION_ERROR)
+    try:
+      response = await self.client.decrypt(
+          request={
+              'name': self.name,
+              'ciphertext': ciphertext,
+              'additional_authenticated_data': associated_data,
+          }
+      )
+      return response.plaintext
+    except core_exceptions.GoogleAPIError as e:
+      raise tink.TinkError(e)
+
+
 class GcpKmsClient(tink.KmsClient):
   """Basic GCP client for AEAD."""
 
@@ -161,6 +212,9 @@ class GcpKmsClient(tink.KmsClient):
       return key_uri.startswith(GCP_KEYURI_PREFIX)
     return key_uri == self._key_uri
 
+  def key_uri_prefix(self) -> str:
+    return GCP_KEYURI_PREFIX
+
   def get_aead(self, key_uri: str) -> aead.Aead:
     """Returns an Aead-primitive backed by KMS key specified by 'key_uri'.
 
@@ -227,6 +281,9 @@ class _KmsClient(tink.KmsClient):
       return key_uri.startswith(GCP_KEYURI_PREFIX)
     return key_uri == self._key_uri
 
+  def key_uri_prefix(self) -> str:
+    return GCP_KEYURI_PREFIX
+
   def get_aead(self, key_uri: str) -> aead.Aead:
     if self._key_uri and self._key_uri != key_uri:
       raise tink.TinkError(
@@ -246,3 +303,30 @@ def new_client(
 ) -> tink.KmsClient:
   """Creates a new Tink KmsClient from a KeyManagementServiceClient."""
   return _KmsClient(kms_v1_client, key_uri)
+
+
+def new_async_aead(
+    *,
+    kms_v1_async_client: kms_v1.KeyManagementServiceAsyncClient,
+    key_uri: str,
+) -> aead.AsyncAead:
+  """Creates an AsyncAead from a KeyManagementServiceAsyncClient.
+
+  Its calls to the KMS are awaited on the event loop, so many of them can run
+  concurrently without blocking it, e.g. in an aead.AsyncKmsEnvelopeAead.
+
+  Args:
+    kms_v1_async_client: The client used to call the KMS.
+    key_uri: The URI of the key, i.e. a CryptoKey or CryptoKeyVersion prefixed
+      with 'gcp-kms://'. Decryption is only supported for a CryptoKey.
+
+  Returns:
+    An AsyncAead backed by the key.
+
+  Raises:
+    TinkError: If the key uri is not valid.
+  """
+  if not key_uri.startswith(GCP_KEYURI_PREFIX):
+    raise tink.TinkError('Invalid key_uri.')
+  key_id = key_uri[len(GCP_KEYURI_PREFIX) :]
+  return _GcpKmsAsyncAead(kms_v1_async_client, key_id)
@@ -23,3 +23,4 @@ except ImportError as import_error:
   ) from import_error
 
 new_aead = _hcvault_kms_aead.new_aead
+new_async_aead = _hcvault_kms_aead.new_async_aead
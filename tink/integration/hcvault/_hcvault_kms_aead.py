@@ -15,8 +15,9 @@
 """A client for Hashicorp Vault."""
 
 import base64
+from concurrent import futures
 import re
-from typing import Tuple
+from typing import Optional, Tuple
 import urllib.parse
 import hvac
 import tink
@@ -72,6 +73,24 @@ def new_aead(key_path: str, client: hvac.Client) -> aead.Aead:
   return _HcVaultKmsAead(client, key_path)
 
 
+def new_async_aead(
+    key_path: str,
+    client: hvac.Client,
+    executor: Optional[futures.Executor] = None,
+) -> aead.AsyncAead:
+  """Returns an AsyncAead for the key at key_path.
+
+  hvac has no asyncio API, so the requests to Vault are made on the threads of
+  executor, or of the default executor of the event loop if it is None.
+
+  Args:
+    key_path: Key path of the form "{mount}/keys/{key_name}".
+    client: The hvac client used to call Vault.
+    executor: The executor on which the requests are made.
+  """
+  return aead.as_async(_HcVaultKmsAead(client, key_path), executor)
+
+
 class _HcVaultKmsAead(aead.Aead):
   """Implements the Aead interface for Hashicorp Vault."""
 
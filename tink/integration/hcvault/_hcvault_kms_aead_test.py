@@ -13,6 +13,7 @@
 # limitations under the License.
 """Tests for _hcvault_kms_aead.py."""
 
+import asyncio
 import base64
 import http.server
 import json
@@ -145,6 +146,41 @@ class HcVaultKmsAeadTest(parameterized.TestCase):
     with self.assertRaises(tink.TinkError):
       _ = vaultaead2.decrypt(ciphertext1, associated_data)
 
+  def test_async_encrypt_decrypt(self):
+    client = hvac.Client(url=_VAULT_URI, token=_TOKEN, verify=False)
+    vaultaead = hcvault.new_async_aead(_KEY_PATH, client)
+
+    async def run():
+      ciphertext = await vaultaead.encrypt(b'plaintext', b'')
+      return ciphertext, await vaultaead.decrypt(ciphertext, b'')
+
+    ciphertext, plaintext = asyncio.run(run())
+    self.assertEqual(plaintext, b'plaintext')
+    self.assertEqual(
+        hcvault.new_aead(_KEY_PATH, client).decrypt(ciphertext, b''),
+        b'plaintext',
+    )
+
+  def test_async_encrypt_fails_with_nonempty_associated_data(self):
+    client = hvac.Client(url=_VAULT_URI, token=_TOKEN, verify=False)
+    vaultaead = hcvault.new_async_aead(_KEY_PATH, client)
+    with self.assertRaises(tink.TinkError):
+      asyncio.run(vaultaead.encrypt(b'plaintext', b'non-empty'))
+
+  def test_async_envelope_encryption(self):
+    client = hvac.Client(url=_VAULT_URI, token=_TOKEN, verify=False)
+    env_aead = aead.AsyncKmsEnvelopeAead(
+        aead.aead_key_templates.AES256_GCM,
+        hcvault.new_async_aead(_KEY_PATH, client),
+    )
+    plaintexts = [b'%d' % i for i in range(10)]
+
+    async def run():
+      ciphertexts = await env_aead.encrypt_many(plaintexts, [b'aad'] * 10)
+      return await env_aead.decrypt_many(ciphertexts, [b'aad'] * 10)
+
+    self.assertEqual(asyncio.run(run()), plaintexts)
+
   @parameterized.named_parameters([
       ('simple', '/transit/keys/key-1', 'transit', 'key-1'),
       ('simple_no_leading_slash', 'transit/keys/key-1', 'transit', 'key-1'),
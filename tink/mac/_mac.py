@@ -14,6 +14,16 @@
 """This module defines the interface for MACs (Message Authentication Codes)."""
 
 import abc
+from typing import Any, Optional, Sequence
+
+from tink import _batch
+from tink import core
+
+
+def _items(data: Any, offsets: Optional[Any]) -> Sequence[Any]:
+  if offsets is None:
+    return data
+  return _batch.split(data, _batch.to_offsets(offsets))
 
 
 class Mac(metaclass=abc.ABCMeta):
@@ -21,6 +31,9 @@ class Mac(metaclass=abc.ABCMeta):
 
   This interface should be used for authentication only, and not for other
   purposes (e.g., it should not be used to generate pseudorandom bytes).
+
+  For the bytes-like arguments that keyset primitives accept, see
+  KeysetHandle.primitive.
   """
 
   @abc.abstractmethod
@@ -49,3 +62,57 @@ class Mac(metaclass=abc.ABCMeta):
       verification fails.
     """
     raise NotImplementedError()
+
+  def compute_mac_many(self, data: Any, offsets: Optional[Any] = None) -> bytes:
+    """Computes the MACs of a batch of messages.
+
+    The primitives returned by a KeysetHandle compute the whole batch in a
+    single call into C++ that releases the GIL.
+
+    Args:
+      data: a sequence of bytes-like objects or, if offsets is given, a single
+        buffer that holds all messages back to back.
+      offsets: optional int64 offsets of the messages in a flat buffer, in the
+        layout of Apache Arrow's LargeBinary arrays: message i is
+        data[offsets[i]:offsets[i + 1]].
+    Returns:
+      the concatenation of the MACs, which all have the same length: the MAC
+      of message i is the i-th of the len(result) // n equally sized chunks of
+      the result, which can be viewed as an n x tag size NumPy array.
+    Raises:
+      tink.TinkError if the computation fails.
+    """
+    return b''.join(self.compute_mac(item) for item in _items(data, offsets))
+
+  def verify_mac_many(
+      self, mac_values: Any, data: Any, offsets: Optional[Any] = None
+  ) -> bytes:
+    """Verifies the MACs of a batch of messages.
+
+    Args:
+      mac_values: either a sequence with the MAC of each message, or a buffer
+        that holds the MACs of all messages back to back, which must all have
+        the same length, like the result of compute_mac_many.
+      data: a sequence of bytes-like objects or, if offsets is given, a single
+        buffer that holds all messages back to back, see compute_mac_many.
+      offsets: optional int64 offsets of the messages in data.
+    Returns:
+      a mask with one byte per message, which is 1 if its MAC is valid and 0
+      otherwise. It can be viewed as a NumPy array of bool without a copy.
+    Raises:
+      ValueError if the number of MACs and messages do not match.
+    """
+    items = _items(data, offsets)
+    mac_offsets = _batch.equal_size_offsets(mac_values, len(items))
+    if mac_offsets is None:
+      _batch.check_same_length(mac_values, items)
+    else:
+      mac_values = _batch.split(mac_values, mac_offsets)
+    valid = bytearray(len(items))
+    for i, (mac_value, item) in enumerate(zip(mac_values, items)):
+      try:
+        self.verify_mac(mac_value, item)
+        valid[i] = 1
+      except core.TinkError:
+        pass
+    return bytes(valid)
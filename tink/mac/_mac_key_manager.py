@@ -13,6 +13,9 @@
 # limitations under the License.
 """Python wrapper of the wrapped C++ MAC key manager."""
 
+from typing import Any, Optional
+
+from tink import _batch
 from tink import core
 from tink.cc.pybind import tink_bindings
 from tink.mac import _mac
@@ -33,6 +36,17 @@ class _MacCcToPyWrapper(_mac.Mac):
   def verify_mac(self, mac_value: bytes, data: bytes) -> None:
     self._cc_mac.verify_mac(mac_value, data)
 
+  @core.use_tink_errors
+  def compute_mac_many(self, data: Any, offsets: Optional[Any] = None) -> bytes:
+    if offsets is not None:
+      offsets = _batch.to_offsets(offsets)
+    return self._cc_mac.compute_mac_many(data, offsets)
+
+  @property
+  def cc_primitive(self) -> tink_bindings.Mac:
+    """The C++ primitive, used by the keyset wrapper for batches."""
+    return self._cc_mac
+
 
 def register():
   tink_bindings.register()
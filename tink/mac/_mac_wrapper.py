@@ -13,14 +13,26 @@
 # limitations under the License.
 """MAC wrapper."""
 
-from typing import Optional, Type
+from typing import Any, List, Optional, Tuple, Type
 
 from tink.proto import tink_pb2
+from tink import _batch
 from tink import _monitoring
 from tink import core
+from tink.cc.pybind import tink_bindings
 from tink.mac import _mac
 
 
+@core.use_tink_errors
+def _compute_mac_many(
+    cc_primitive: tink_bindings.Mac,
+    data: Any,
+    offsets: Optional[memoryview],
+    output_prefix: bytes,
+) -> bytes:
+  return cc_primitive.compute_mac_many(data, offsets, output_prefix)
+
+
 class _WrappedMac(_mac.Mac):
   """Implements Mac for a set of Mac primitives."""
 
@@ -38,7 +50,7 @@ class _WrappedMac(_mac.Mac):
     primary = self._primitive_set.primary()
     if primary.output_prefix_type == tink_pb2.LEGACY:
       result = primary.identifier + primary.primitive.compute_mac(
-          data + core.crypto_format.LEGACY_START_BYTE
+          bytes(data) + core.crypto_format.LEGACY_START_BYTE
       )
     else:
       result = primary.identifier + primary.primitive.compute_mac(data)
@@ -55,12 +67,12 @@ class _WrappedMac(_mac.Mac):
       # This also rejects raw MAC with size of 4 bytes or fewer. Those MACs are
       # clearly insecure, thus should be discouraged.
       raise core.TinkError('tag too short')
-    prefix = mac_value[: core.crypto_format.NON_RAW_PREFIX_SIZE]
+    prefix = bytes(mac_value[: core.crypto_format.NON_RAW_PREFIX_SIZE])
     mac_no_prefix = mac_value[core.crypto_format.NON_RAW_PREFIX_SIZE :]
     for entry in self._primitive_set.primitive_from_identifier(prefix):
       try:
         if entry.output_prefix_type == tink_pb2.LEGACY:
-          entry.primitive.verify_mac(mac_no_prefix, data + b'\x00')
+          entry.primitive.verify_mac(mac_no_prefix, bytes(data) + b'\x00')
         else:
           entry.primitive.verify_mac(mac_no_prefix, data)
 
@@ -88,6 +100,74 @@ class _WrappedMac(_mac.Mac):
 
     raise core.TinkError('invalid MAC')
 
+  def compute_mac_many(self, data: Any, offsets: Optional[Any] = None) -> bytes:
+    primary = self._primitive_set.primary()
+    cc_primitive = getattr(primary.primitive, 'cc_primitive', None)
+    if cc_primitive is None or primary.output_prefix_type == tink_pb2.LEGACY:
+      return super().compute_mac_many(data, offsets)
+
+    if offsets is not None:
+      offsets = _batch.to_offsets(offsets)
+    result = _compute_mac_many(cc_primitive, data, offsets, primary.identifier)
+
+    if self._compute_monitor:
+      if offsets is None:
+        lengths = [len(item) for item in data]
+      else:
+        lengths = [end - start for start, end in zip(offsets, offsets[1:])]
+      for length in lengths:
+        self._compute_monitor.log(primary.key_id, length)
+
+    return result
+
+  def verify_mac_many(
+      self, mac_values: Any, data: Any, offsets: Optional[Any] = None
+  ) -> bytes:
+    candidates = self._batch_candidates()
+    # The native verification does not report which key verified a MAC,
+    # which monitoring needs.
+    if candidates is None or self._verify_monitor:
+      return super().verify_mac_many(mac_values, data, offsets)
+
+    if offsets is not None:
+      offsets = _batch.to_offsets(offsets)
+      count = len(offsets) - 1
+    else:
+      count = len(data)
+    mac_offsets = _batch.equal_size_offsets(mac_values, count)
+    return tink_bindings.verify_mac_many(
+        candidates,
+        mac_values,
+        mac_offsets,
+        data,
+        offsets,
+        # Like verify_mac, this also rejects short raw MACs.
+        core.crypto_format.NON_RAW_PREFIX_SIZE + 1,
+    )
+
+  def _batch_candidates(
+      self,
+  ) -> Optional[List[Tuple[bytes, tink_bindings.Mac]]]:
+    """Returns the (output prefix, C++ primitive) pairs in the trial order.
+
+    Returns None if some key is not backed by a C++ primitive or uses the
+    LEGACY output prefix type, which changes the data.
+    """
+    entries = [
+        entry
+        for entries in self._primitive_set.all()
+        for entry in entries
+        if entry.identifier
+    ]
+    entries.extend(self._primitive_set.raw_primitives())
+    candidates = []
+    for entry in entries:
+      cc_primitive = getattr(entry.primitive, 'cc_primitive', None)
+      if cc_primitive is None or entry.output_prefix_type == tink_pb2.LEGACY:
+        return None
+      candidates.append((entry.identifier, cc_primitive))
+    return candidates
+
 
 class MacWrapper(core.PrimitiveWrapper[_mac.Mac, _mac.Mac]):
   """MacWrapper is the implementation of PrimitiveWrapper for the Mac primitive.
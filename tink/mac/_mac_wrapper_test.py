@@ -13,6 +13,8 @@
 # limitations under the License.
 """Tests for tink.python.tink._mac_wrapper."""
 
+import array
+
 from absl.testing import absltest
 from absl.testing import parameterized
 
@@ -46,6 +48,19 @@ class MacWrapperTest(parameterized.TestCase):
     # No exception raised, no return value.
     self.assertIsNone(primitive.verify_mac(tag, b'data'))
 
+  @parameterized.parameters(
+      [MAC_TEMPLATE, RAW_MAC_TEMPLATE, LEGACY_MAC_TEMPLATE]
+  )
+  def test_compute_verify_mac_bytes_like_objects(self, template):
+    keyset_handle = tink.new_keyset_handle(template)
+    primitive = keyset_handle.primitive(mac.Mac)
+    tag = primitive.compute_mac(memoryview(b'data'))
+    self.assertEqual(primitive.compute_mac(b'data'), tag)
+    self.assertIsNone(primitive.verify_mac(bytearray(tag), bytearray(b'data')))
+    self.assertIsNone(
+        primitive.verify_mac(memoryview(tag), memoryview(b'data'))
+    )
+
   @parameterized.parameters(
       [MAC_TEMPLATE, RAW_MAC_TEMPLATE, LEGACY_MAC_TEMPLATE]
   )
@@ -130,6 +145,88 @@ class MacWrapperTest(parameterized.TestCase):
     mac3.verify_mac(mac_value4, b'plaintext')
     mac4.verify_mac(mac_value4, b'plaintext')
 
+  @parameterized.parameters(
+      [MAC_TEMPLATE, RAW_MAC_TEMPLATE, LEGACY_MAC_TEMPLATE]
+  )
+  def test_compute_verify_mac_many(self, template):
+    keyset_handle = tink.new_keyset_handle(template)
+    primitive = keyset_handle.primitive(mac.Mac)
+    data = [b'', b'line1', bytearray(b'line2'), memoryview(b'x' * 1000)]
+    macs = primitive.compute_mac_many(data)
+    expected_macs = [primitive.compute_mac(d) for d in data]
+    self.assertEqual(macs, b''.join(expected_macs))
+
+    self.assertEqual(primitive.verify_mac_many(macs, data), b'\x01' * 4)
+    self.assertEqual(
+        primitive.verify_mac_many(expected_macs, data), b'\x01' * 4
+    )
+
+  @parameterized.parameters(
+      [MAC_TEMPLATE, RAW_MAC_TEMPLATE, LEGACY_MAC_TEMPLATE]
+  )
+  def test_compute_verify_mac_many_flat(self, template):
+    keyset_handle = tink.new_keyset_handle(template)
+    primitive = keyset_handle.primitive(mac.Mac)
+    data = b'line1line22line333'
+    offsets = array.array('q', [0, 5, 11, 18])
+    macs = primitive.compute_mac_many(data, offsets=offsets)
+    self.assertEqual(
+        macs,
+        b''.join(
+            primitive.compute_mac(d) for d in [b'line1', b'line22', b'line333']
+        ),
+    )
+    self.assertEqual(
+        primitive.verify_mac_many(macs, data, offsets=offsets), b'\x01' * 3
+    )
+
+  @parameterized.parameters(
+      [MAC_TEMPLATE, RAW_MAC_TEMPLATE, LEGACY_MAC_TEMPLATE]
+  )
+  def test_verify_mac_many_returns_mask(self, template):
+    keyset_handle = tink.new_keyset_handle(template)
+    primitive = keyset_handle.primitive(mac.Mac)
+    unknown_primitive = tink.new_keyset_handle(template).primitive(mac.Mac)
+    mac_values = [
+        primitive.compute_mac(b'data0'),
+        unknown_primitive.compute_mac(b'data1'),
+        primitive.compute_mac(b'other data'),
+        b'tag',
+        primitive.compute_mac(b'data4'),
+    ]
+    self.assertEqual(
+        primitive.verify_mac_many(
+            mac_values, [b'data0', b'data1', b'data2', b'data3', b'data4']
+        ),
+        b'\x01\x00\x00\x00\x01',
+    )
+
+  def test_verify_mac_many_with_key_rotation(self):
+    builder = keyset_builder.new_keyset_builder()
+    older_key_id = builder.add_new_key(RAW_MAC_TEMPLATE)
+    builder.set_primary_key(older_key_id)
+    mac1 = builder.keyset_handle().primitive(mac.Mac)
+    newer_key_id = builder.add_new_key(MAC_TEMPLATE)
+    builder.set_primary_key(newer_key_id)
+    mac2 = builder.keyset_handle().primitive(mac.Mac)
+
+    mac_values = [mac1.compute_mac(b'data1'), mac2.compute_mac(b'data2')]
+    self.assertEqual(
+        mac2.verify_mac_many(mac_values, [b'data1', b'data2']), b'\x01\x01'
+    )
+    self.assertEqual(
+        mac1.verify_mac_many(mac_values, [b'data1', b'data2']), b'\x01\x00'
+    )
+
+  def test_verify_mac_many_wrong_number_of_macs_fails(self):
+    primitive = tink.new_keyset_handle(MAC_TEMPLATE).primitive(mac.Mac)
+    macs = primitive.compute_mac_many([b'a', b'b'])
+    with self.assertRaises(ValueError):
+      primitive.verify_mac_many(macs, [b'a', b'b', b'c', b'd'])
+    with self.assertRaises(ValueError):
+      primitive.verify_mac_many([macs], [b'a', b'b'])
+
+
 
 class KeyUsageMonitorTest(absltest.TestCase):
 
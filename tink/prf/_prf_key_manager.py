@@ -14,6 +14,9 @@
 
 """Python wrapper of the wrapped C++ PRF Set key manager."""
 
+from typing import Any, Optional
+
+from tink import _batch
 from tink import core
 from tink.cc.pybind import tink_bindings
 from tink.prf import _prf_set
@@ -30,6 +33,14 @@ class PrfCcToPyWrapper(_prf_set.Prf):
   def compute(self, input_data: bytes, output_length: int) -> bytes:
     return self._cc_primitive.compute(input_data, output_length)
 
+  @core.use_tink_errors
+  def compute_many(
+      self, inputs: Any, output_length: int, offsets: Optional[Any] = None
+  ) -> bytes:
+    if offsets is not None:
+      offsets = _batch.to_offsets(offsets)
+    return self._cc_primitive.compute_many(inputs, offsets, output_length)
+
 
 def register() -> None:
   """Registers all PrfSet key managers and PrfSet wrapper in the Registry."""
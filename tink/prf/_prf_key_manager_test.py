@@ -14,6 +14,8 @@
 
 """Tests for tink.python.tink.prf.prf_set_key_manager."""
 
+import array
+
 from absl.testing import absltest
 from absl.testing import parameterized
 from tink.proto import common_pb2
@@ -68,6 +70,20 @@ class PrfKeyManagerTest(parameterized.TestCase):
         prfs[primitive.primary_id()].compute(b'input_data', output_length=15),
         output)
 
+  @parameterized.parameters([
+      prf.prf_key_templates.AES_CMAC, prf.prf_key_templates.HMAC_SHA256,
+      prf.prf_key_templates.HMAC_SHA512, prf.prf_key_templates.HKDF_SHA256
+  ])
+  def test_compute_bytes_like_objects(self, template):
+    keyset_handle = tink.new_keyset_handle(template)
+    primitive = keyset_handle.primitive(prf.PrfSet).primary()
+    output = primitive.compute(b'input_data', output_length=15)
+    self.assertEqual(
+        primitive.compute(bytearray(b'input_data'), output_length=15), output)
+    self.assertEqual(
+        primitive.compute(memoryview(b'xinput_data')[1:], output_length=15),
+        output)
+
   @parameterized.parameters([
       prf.prf_key_templates.AES_CMAC, prf.prf_key_templates.HMAC_SHA256,
       prf.prf_key_templates.HMAC_SHA512, prf.prf_key_templates.HKDF_SHA256
@@ -83,5 +99,43 @@ class PrfKeyManagerTest(parameterized.TestCase):
     with self.assertRaises(tink.TinkError):
       p.compute(b'input_data', output_length=1234567)
 
+  @parameterized.parameters([
+      prf.prf_key_templates.AES_CMAC, prf.prf_key_templates.HMAC_SHA256,
+      prf.prf_key_templates.HMAC_SHA512, prf.prf_key_templates.HKDF_SHA256
+  ])
+  def test_compute_many(self, template):
+    keyset_handle = tink.new_keyset_handle(template)
+    primitive = keyset_handle.primitive(prf.PrfSet).primary()
+    inputs = [b'', b'row1', bytearray(b'row22'), memoryview(b'x' * 1000)]
+    outputs = primitive.compute_many(inputs, output_length=16)
+    self.assertEqual(
+        outputs,
+        b''.join(primitive.compute(i, output_length=16) for i in inputs))
+
+  @parameterized.parameters([
+      prf.prf_key_templates.AES_CMAC, prf.prf_key_templates.HMAC_SHA256,
+      prf.prf_key_templates.HKDF_SHA256
+  ])
+  def test_compute_many_flat(self, template):
+    keyset_handle = tink.new_keyset_handle(template)
+    primitive = keyset_handle.primitive(prf.PrfSet).primary()
+    outputs = primitive.compute_many(
+        b'row1row22', output_length=8, offsets=array.array('q', [0, 4, 9]))
+    self.assertEqual(
+        outputs,
+        primitive.compute(b'row1', output_length=8) +
+        primitive.compute(b'row22', output_length=8))
+    self.assertEqual(primitive.compute_many([], output_length=8), b'')
+
+  @parameterized.parameters([
+      prf.prf_key_templates.AES_CMAC, prf.prf_key_templates.HMAC_SHA256,
+      prf.prf_key_templates.HMAC_SHA512, prf.prf_key_templates.HKDF_SHA256
+  ])
+  def test_compute_many_output_too_long_raises_error(self, template):
+    keyset_handle = tink.new_keyset_handle(template)
+    primitive = keyset_handle.primitive(prf.PrfSet).primary()
+    with self.assertRaises(tink.TinkError):
+      primitive.compute_many([b'a', b'b'], output_length=1234567)
+
 if __name__ == '__main__':
   absltest.main()
@@ -14,7 +14,9 @@
 """This module defines the interface for PrfSet."""
 
 import abc
-from typing import Mapping
+from typing import Any, Mapping, Optional
+
+from tink import _batch
 
 
 class Prf(metaclass=abc.ABCMeta):
@@ -38,6 +40,9 @@ class Prf(metaclass=abc.ABCMeta):
   message, using the MAC interface is recommended for that use case, as it has
   support for verification, avoiding the security problems that often happen
   during verification. It also allows for non-deterministic MAC algorithms.
+
+  For the bytes-like input_data that keyset PRFs accept, see
+  KeysetHandle.primitive.
   """
 
   @abc.abstractmethod
@@ -58,6 +63,35 @@ class Prf(metaclass=abc.ABCMeta):
     """
     raise NotImplementedError()
 
+  def compute_many(
+      self, inputs: Any, output_length: int, offsets: Optional[Any] = None
+  ) -> bytes:
+    """Computes the PRF on a batch of inputs.
+
+    The PRFs returned by a KeysetHandle compute the whole batch in a single
+    call into C++ that releases the GIL, and write the outputs directly into
+    the returned bytes object.
+
+    Args:
+      inputs: a sequence of bytes-like objects or, if offsets is given, a
+        single buffer that holds all inputs back to back.
+      output_length: The desired length of each output in bytes, see compute.
+      offsets: optional int64 offsets of the inputs in a flat buffer, in the
+        layout of Apache Arrow's LargeBinary arrays: input i is
+        inputs[offsets[i]:offsets[i + 1]].
+
+    Returns:
+      the concatenation of the n outputs, n * output_length bytes in total.
+      Output i is result[i * output_length:(i + 1) * output_length]; the
+      result can be viewed as an n x output_length NumPy array of uint8
+      without a copy, for example with numpy.frombuffer.
+    """
+    if offsets is not None:
+      inputs = _batch.split(inputs, _batch.to_offsets(offsets))
+    return b''.join(
+        self.compute(input_data, output_length) for input_data in inputs
+    )
+
 
 class PrfSet(metaclass=abc.ABCMeta):
   """A Tink Keyset can be converted into a set of PRFs using this primitive.
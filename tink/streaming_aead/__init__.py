@@ -14,10 +14,20 @@
 
 """StreamingAead package."""
 
+from tink.streaming_aead import _async_streaming_aead
+from tink.streaming_aead import _file_encryption
 from tink.streaming_aead import _streaming_aead
 from tink.streaming_aead import _streaming_aead_key_manager
 from tink.streaming_aead import _streaming_aead_key_templates as streaming_aead_key_templates
+from tink.streaming_aead import _streaming_aead_parameters
+from tink.streaming_aead import _streaming_aead_wrapper
 
 
 StreamingAead = _streaming_aead.StreamingAead
+AsyncStreamingAead = _async_streaming_aead.AsyncStreamingAead
 register = _streaming_aead_key_manager.register
+key_attempts = _streaming_aead_wrapper.key_attempts
+with_options = _streaming_aead_wrapper.with_options
+ciphertext_size_for = _streaming_aead_parameters.ciphertext_size_for
+encrypt_file = _file_encryption.encrypt_file
+decrypt_file = _file_encryption.decrypt_file
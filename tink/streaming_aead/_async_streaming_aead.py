@@ -0,0 +1,255 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Streaming AEAD for asyncio streams.
+
+The encrypting and decrypting streams of StreamingAead block, so they run on
+the threads of an executor, and the event loop only awaits them. The C++
+primitives release the GIL while they encrypt and decrypt.
+"""
+
+import asyncio
+import collections
+from concurrent import futures
+import contextlib
+import io
+from typing import AsyncIterable, AsyncIterator, Deque, Optional, Union
+
+from tink.streaming_aead import _chunk_io
+from tink.streaming_aead import _streaming_aead
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+DEFAULT_MAX_WORKERS = 4
+
+ChunkSource = Union[asyncio.StreamReader, AsyncIterable[bytes]]
+
+
+async def _chunks(source: ChunkSource, chunk_size: int) -> AsyncIterator[bytes]:
+  if isinstance(source, asyncio.StreamReader):
+    while data := await source.read(chunk_size):
+      yield data
+  else:
+    async for data in source:
+      yield data
+
+
+async def _next_chunk(chunks: AsyncIterator[bytes]) -> Optional[bytes]:
+  try:
+    return await chunks.__anext__()
+  except StopAsyncIteration:
+    return None
+
+
+class _ChunkSource(io.RawIOBase):
+  """A nonblocking file object which reads the chunks added to it.
+
+  The event loop adds the chunks, and an executor thread reads them while it
+  decrypts. readinto returns None once the added chunks are read, so that
+  the decrypting stream returns None too, instead of waiting on the thread
+  for the next chunk.
+  """
+
+  nonblocking = True
+
+  def __init__(self):
+    super().__init__()
+    self._chunks: Deque[memoryview] = collections.deque()
+    self._eof = False
+
+  def add(self, chunk: Optional[bytes]) -> None:
+    """Adds a chunk, or marks the end of the ciphertext if chunk is None."""
+    if chunk is None:
+      self._eof = True
+    elif chunk:
+      self._chunks.append(memoryview(chunk).cast('B'))
+
+  # b has type "Buffer", which is not yet supported by pytype.
+  def readinto(self, b) -> Optional[int]:  # pyrefly: ignore[bad-override]
+    if not self._chunks:
+      return 0 if self._eof else None
+    view = memoryview(b).cast('B')
+    chunk = self._chunks[0]
+    n = min(len(view), len(chunk))
+    view[:n] = chunk[:n]
+    if n == len(chunk):
+      self._chunks.popleft()
+    else:
+      self._chunks[0] = chunk[n:]
+    return n
+
+  def readable(self) -> bool:
+    return True
+
+
+class AsyncStreamingAead:
+  """Encrypts and decrypts asyncio streams with a StreamingAead primitive.
+
+  The plaintext or ciphertext is taken from an asyncio.StreamReader or an
+  async iterable of bytes, and the result is returned as an async iterator of
+  chunks, or written to an asyncio.StreamWriter.
+
+  Encryption and decryption run on an executor, so at most max_workers
+  streams encrypt or decrypt at the same time. The plaintext and ciphertext
+  are awaited on the event loop, never on a worker, so a stream can decrypt
+  the output of another one, even with a single worker.
+
+  Example:
+    async_primitive = streaming_aead.AsyncStreamingAead(primitive)
+    async for chunk in async_primitive.encrypt(reader, associated_data):
+      ...
+  """
+
+  def __init__(self,
+               primitive: _streaming_aead.StreamingAead,
+               max_workers: int = DEFAULT_MAX_WORKERS,
+               chunk_size: int = DEFAULT_CHUNK_SIZE,
+               executor: Optional[futures.Executor] = None):
+    """Create a new AsyncStreamingAead.
+
+    Args:
+      primitive: The StreamingAead primitive.
+      max_workers: The number of threads of the executor which is created if
+        executor is None.
+      chunk_size: The maximum size of the chunks read from StreamReaders and
+        of the returned plaintext chunks.
+      executor: The executor on which to encrypt and decrypt. It is not shut
+        down by close().
+    """
+    if max_workers <= 0 or chunk_size <= 0:
+      raise ValueError('max_workers and chunk_size must be positive')
+    self._primitive = primitive
+    self._chunk_size = chunk_size
+    self._own_executor = executor is None
+    self._executor = executor or futures.ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix='tink-streaming-aead')
+
+  async def encrypt(self, plaintext: ChunkSource,
+                    associated_data: bytes) -> AsyncIterator[bytes]:
+    """Encrypts plaintext and yields the chunks of the ciphertext.
+
+    Args:
+      plaintext: The plaintext, as a StreamReader or an async iterable of
+        bytes.
+      associated_data: Associated data to be used by the AEAD encryption.
+
+    Yields:
+      The chunks of the ciphertext.
+
+    Raises:
+      tink.TinkError if the encryption fails.
+    """
+    loop = asyncio.get_running_loop()
+    sink = _chunk_io.ChunkSink()
+    es = await loop.run_in_executor(self._executor,
+                                    self._primitive.new_encrypting_stream,
+                                    sink, associated_data)
+    try:
+      async for chunk in _chunks(plaintext, self._chunk_size):
+        await loop.run_in_executor(self._executor, es.write, chunk)
+        for ciphertext in sink.take():
+          yield ciphertext
+    finally:
+      await loop.run_in_executor(self._executor, es.close)
+    for ciphertext in sink.take():
+      yield ciphertext
+
+  async def decrypt(self, ciphertext: ChunkSource,
+                    associated_data: bytes) -> AsyncIterator[bytes]:
+    """Decrypts ciphertext and yields the chunks of the plaintext.
+
+    Plaintext is only yielded after it was authenticated, but like for
+    new_decrypting_stream, a TinkError can be raised after some chunks were
+    yielded if the ciphertext was modified or truncated.
+
+    Args:
+      ciphertext: The ciphertext, as a StreamReader or an async iterable of
+        bytes.
+      associated_data: Associated data to be used by the AEAD decryption.
+
+    Yields:
+      The chunks of the plaintext, of at most chunk_size bytes.
+
+    Raises:
+      tink.TinkError if the decryption fails.
+    """
+    loop = asyncio.get_running_loop()
+    source = _ChunkSource()
+    chunks = _chunks(ciphertext, self._chunk_size)
+    ds = await loop.run_in_executor(self._executor,
+                                    self._primitive.new_decrypting_stream,
+                                    source, associated_data)
+    try:
+      async with contextlib.aclosing(chunks):
+        while True:
+          data = await loop.run_in_executor(self._executor, ds.read,
+                                            self._chunk_size)
+          if data is None:
+            # All ciphertext received so far is decrypted. The next chunk is
+            # awaited here, with no worker waiting for it.
+            source.add(await _next_chunk(chunks))
+            continue
+          if not data:
+            break
+          yield data
+    finally:
+      await loop.run_in_executor(self._executor, ds.close)
+
+  async def _write(self, chunks: AsyncIterator[bytes],
+                   writer: asyncio.StreamWriter) -> None:
+    async with contextlib.aclosing(chunks):
+      async for chunk in chunks:
+        writer.write(chunk)
+        await writer.drain()
+
+  async def encrypt_to(self, plaintext: ChunkSource,
+                       writer: asyncio.StreamWriter,
+                       associated_data: bytes) -> None:
+    """Encrypts plaintext and writes the ciphertext to writer.
+
+    writer is not closed.
+
+    Args:
+      plaintext: The plaintext, as a StreamReader or an async iterable of
+        bytes.
+      writer: The StreamWriter to which the ciphertext is written.
+      associated_data: Associated data to be used by the AEAD encryption.
+
+    Raises:
+      tink.TinkError if the encryption fails.
+    """
+    await self._write(self.encrypt(plaintext, associated_data), writer)
+
+  async def decrypt_to(self, ciphertext: ChunkSource,
+                       writer: asyncio.StreamWriter,
+                       associated_data: bytes) -> None:
+    """Decrypts ciphertext and writes the plaintext to writer.
+
+    writer is not closed. If the decryption fails, some plaintext may have
+    been written already.
+
+    Args:
+      ciphertext: The ciphertext, as a StreamReader or an async iterable of
+        bytes.
+      writer: The StreamWriter to which the plaintext is written.
+      associated_data: Associated data to be used by the AEAD decryption.
+
+    Raises:
+      tink.TinkError if the decryption fails.
+    """
+    await self._write(self.decrypt(ciphertext, associated_data), writer)
+
+  def close(self) -> None:
+    """Shuts down the executor, unless it was passed to the constructor."""
+    if self._own_executor:
+      self._executor.shutdown(wait=False)
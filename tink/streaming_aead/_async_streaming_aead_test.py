@@ -0,0 +1,245 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for tink.python.tink.streaming_aead._async_streaming_aead."""
+
+import asyncio
+import io
+from typing import AsyncIterator, List
+from unittest import mock
+
+from absl.testing import absltest
+
+import tink
+from tink import streaming_aead
+from tink.testing import bytes_io
+
+
+TEMPLATE = streaming_aead.streaming_aead_key_templates.AES128_GCM_HKDF_4KB
+
+
+def setUpModule():
+  streaming_aead.register()
+
+
+async def _chunked(data: bytes, chunk_size: int) -> AsyncIterator[bytes]:
+  for i in range(0, len(data), chunk_size):
+    # Gives the event loop the chance to run other tasks in between.
+    await asyncio.sleep(0)
+    yield data[i:i + chunk_size]
+
+
+def _reader(data: bytes) -> asyncio.StreamReader:
+  reader = asyncio.StreamReader()
+  reader.feed_data(data)
+  reader.feed_eof()
+  return reader
+
+
+async def _join(chunks: AsyncIterator[bytes]) -> bytes:
+  return b''.join([chunk async for chunk in chunks])
+
+
+class _FakeStreamWriter:
+  """Records the data written to it, like an asyncio.StreamWriter."""
+
+  def __init__(self):
+    self.chunks: List[bytes] = []
+    self.drained = 0
+
+  def write(self, data: bytes) -> None:
+    self.chunks.append(data)
+
+  async def drain(self) -> None:
+    self.drained += 1
+
+
+def _new_primitive() -> streaming_aead.StreamingAead:
+  return tink.new_keyset_handle(TEMPLATE).primitive(
+      streaming_aead.StreamingAead)
+
+
+class AsyncStreamingAeadTest(absltest.TestCase):
+
+  def test_encrypt_decrypt(self):
+    primitive = _new_primitive()
+    async_primitive = streaming_aead.AsyncStreamingAead(
+        primitive, chunk_size=1000)
+    self.addCleanup(async_primitive.close)
+    plaintext = b' '.join(b'%d' % i for i in range(10 * 1000))
+
+    async def run():
+      ciphertext = await _join(
+          async_primitive.encrypt(_chunked(plaintext, 777), b'aad'))
+      chunks = [
+          chunk async for chunk in async_primitive.decrypt(
+              _reader(ciphertext), b'aad')
+      ]
+      return ciphertext, chunks
+
+    ciphertext, chunks = asyncio.run(run())
+    self.assertEqual(b''.join(chunks), plaintext)
+    self.assertLessEqual(max(len(chunk) for chunk in chunks), 1000)
+    with primitive.new_decrypting_stream(io.BytesIO(ciphertext), b'aad') as ds:
+      self.assertEqual(ds.read(), plaintext)
+
+  def test_decrypt_sync_ciphertext(self):
+    primitive = _new_primitive()
+    async_primitive = streaming_aead.AsyncStreamingAead(primitive)
+    self.addCleanup(async_primitive.close)
+    ciphertext_dest = bytes_io.BytesIOWithValueAfterClose()
+    with primitive.new_encrypting_stream(ciphertext_dest, b'aad') as es:
+      es.write(b'plaintext')
+    ciphertext = ciphertext_dest.value_after_close()
+
+    plaintext = asyncio.run(
+        _join(async_primitive.decrypt(_chunked(ciphertext, 3), b'aad')))
+    self.assertEqual(plaintext, b'plaintext')
+
+  def test_encrypt_decrypt_empty(self):
+    async_primitive = streaming_aead.AsyncStreamingAead(_new_primitive())
+    self.addCleanup(async_primitive.close)
+
+    async def run():
+      ciphertext = await _join(async_primitive.encrypt(_reader(b''), b'aad'))
+      return await _join(async_primitive.decrypt(_reader(ciphertext), b'aad'))
+
+    self.assertEqual(asyncio.run(run()), b'')
+
+  def test_encrypt_to_decrypt_to_writer(self):
+    async_primitive = streaming_aead.AsyncStreamingAead(_new_primitive())
+    self.addCleanup(async_primitive.close)
+    plaintext = b'0123456789' * 10000
+
+    async def run():
+      ciphertext_writer = _FakeStreamWriter()
+      await async_primitive.encrypt_to(
+          _reader(plaintext), ciphertext_writer, b'aad')
+      plaintext_writer = _FakeStreamWriter()
+      await async_primitive.decrypt_to(
+          _reader(b''.join(ciphertext_writer.chunks)), plaintext_writer,
+          b'aad')
+      return plaintext_writer
+
+    plaintext_writer = asyncio.run(run())
+    self.assertEqual(b''.join(plaintext_writer.chunks), plaintext)
+    self.assertLen(plaintext_writer.chunks, plaintext_writer.drained)
+
+  def test_concurrent_streams(self):
+    async_primitive = streaming_aead.AsyncStreamingAead(
+        _new_primitive(), max_workers=2)
+    self.addCleanup(async_primitive.close)
+    plaintexts = [b'%d' % i * 10000 for i in range(10)]
+
+    async def roundtrip(plaintext):
+      ciphertext = await _join(
+          async_primitive.encrypt(_chunked(plaintext, 5000), b'aad'))
+      return await _join(
+          async_primitive.decrypt(_chunked(ciphertext, 5000), b'aad'))
+
+    async def run():
+      return await asyncio.gather(*[roundtrip(p) for p in plaintexts])
+
+    self.assertEqual(asyncio.run(run()), plaintexts)
+
+  def test_decrypt_encrypted_chunks_with_one_worker(self):
+    async_primitive = streaming_aead.AsyncStreamingAead(
+        _new_primitive(), max_workers=1, chunk_size=1000)
+    self.addCleanup(async_primitive.close)
+    plaintext = b' '.join(b'%d' % i for i in range(10 * 1000))
+
+    async def run():
+      # The decryption takes the chunks of the encryption while they are
+      # encrypted, and both run on the same worker.
+      ciphertext = async_primitive.encrypt(_chunked(plaintext, 777), b'aad')
+      return await _join(async_primitive.decrypt(ciphertext, b'aad'))
+
+    self.assertEqual(
+        asyncio.run(asyncio.wait_for(run(), timeout=60)), plaintext)
+
+  def test_encrypt_with_pipelined_stream(self):
+    primitive = streaming_aead.with_options(
+        _new_primitive(), parallel_workers=2, parallel_chunk_size=10000)
+    async_primitive = streaming_aead.AsyncStreamingAead(
+        primitive, chunk_size=1000)
+    self.addCleanup(async_primitive.close)
+    plaintext = b' '.join(b'%d' % i for i in range(100 * 1000))
+
+    ciphertext = asyncio.run(
+        _join(async_primitive.encrypt(_chunked(plaintext, 777), b'aad')))
+    with primitive.new_decrypting_stream(io.BytesIO(ciphertext), b'aad') as ds:
+      self.assertEqual(ds.read(), plaintext)
+
+  def test_encrypt_stops_early_closes_stream(self):
+    primitive = _new_primitive()
+    async_primitive = streaming_aead.AsyncStreamingAead(
+        primitive, chunk_size=100)
+    self.addCleanup(async_primitive.close)
+    streams = []
+
+    def new_encrypting_stream(ciphertext_destination, associated_data):
+      streams.append(primitive.new_encrypting_stream(
+          ciphertext_destination, associated_data))
+      return streams[-1]
+
+    async def run():
+      with mock.patch.object(primitive, 'new_encrypting_stream',
+                             side_effect=new_encrypting_stream):
+        chunks = async_primitive.encrypt(_reader(b'x' * 100000), b'aad')
+        await chunks.__anext__()
+        await chunks.aclose()
+
+    asyncio.run(run())
+    self.assertLen(streams, 1)
+    self.assertTrue(streams[0].closed)
+
+  def test_decrypt_stops_early(self):
+    primitive = _new_primitive()
+    async_primitive = streaming_aead.AsyncStreamingAead(
+        primitive, chunk_size=100)
+    self.addCleanup(async_primitive.close)
+    ciphertext_dest = bytes_io.BytesIOWithValueAfterClose()
+    with primitive.new_encrypting_stream(ciphertext_dest, b'aad') as es:
+      es.write(b'x' * 100000)
+    ciphertext = ciphertext_dest.value_after_close()
+
+    async def run():
+      chunks = async_primitive.decrypt(_chunked(ciphertext, 1000), b'aad')
+      first = await chunks.__anext__()
+      await chunks.aclose()
+      return first
+
+    self.assertEqual(asyncio.run(run()), b'x' * 100)
+
+  def test_decrypt_wrong_associated_data_fails(self):
+    async_primitive = streaming_aead.AsyncStreamingAead(_new_primitive())
+    self.addCleanup(async_primitive.close)
+
+    async def run():
+      ciphertext = await _join(
+          async_primitive.encrypt(_reader(b'plaintext'), b'aad'))
+      await _join(async_primitive.decrypt(_reader(ciphertext), b'bad aad'))
+
+    with self.assertRaises(tink.TinkError):
+      asyncio.run(run())
+
+  def test_invalid_arguments_fail(self):
+    with self.assertRaises(ValueError):
+      streaming_aead.AsyncStreamingAead(_new_primitive(), max_workers=0)
+    with self.assertRaises(ValueError):
+      streaming_aead.AsyncStreamingAead(_new_primitive(), chunk_size=0)
+
+
+if __name__ == '__main__':
+  absltest.main()
@@ -0,0 +1,81 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""File objects that adapt streams to iterators of chunks."""
+
+import io
+import threading
+from typing import Iterable, List
+
+
+class ChunkSink(io.RawIOBase):
+  """A writable file object which collects the written chunks.
+
+  It can be written on one thread while the chunks are taken on another, as
+  for the pipelined encrypting streams, which write on a background thread.
+  """
+
+  def __init__(self):
+    super().__init__()
+    self._chunks: List[bytes] = []
+    self._lock = threading.Lock()
+
+  # b has type "Buffer", which is not yet supported by pytype.
+  def write(self, b) -> int:
+    if self.closed:  # pylint:disable=using-constant-test
+      raise ValueError('write on closed file')
+    chunk = bytes(b)
+    with self._lock:
+      self._chunks.append(chunk)
+    return len(chunk)
+
+  def take(self) -> List[bytes]:
+    """Returns the chunks written since the last call."""
+    with self._lock:
+      chunks, self._chunks = self._chunks, []
+    return chunks
+
+  def writable(self) -> bool:
+    return True
+
+
+class ChunkSource(io.RawIOBase):
+  """A readable file object which reads the chunks of an iterable.
+
+  Each chunk is taken from the iterable only when the previous one has been
+  read completely, so chunks are consumed lazily.
+  """
+
+  def __init__(self, chunks: Iterable[bytes]):
+    super().__init__()
+    self._chunks = iter(chunks)
+    self._chunk = memoryview(b'')
+    self._eof = False
+
+  # b has type "Buffer", which is not yet supported by pytype.
+  def readinto(self, b) -> int:  # pyrefly: ignore[bad-override]
+    view = memoryview(b).cast('B')
+    while not self._chunk and not self._eof:
+      chunk = next(self._chunks, None)
+      if chunk is None:
+        self._eof = True
+      else:
+        self._chunk = memoryview(chunk).cast('B')
+    n = min(len(view), len(self._chunk))
+    view[:n] = self._chunk[:n]
+    self._chunk = self._chunk[n:]
+    return n
+
+  def readable(self) -> bool:
+    return True
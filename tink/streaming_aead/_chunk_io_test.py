@@ -0,0 +1,106 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for tink.python.tink.streaming_aead._chunk_io."""
+
+import threading
+
+from absl.testing import absltest
+
+from tink.streaming_aead import _chunk_io
+
+
+class ChunkSinkTest(absltest.TestCase):
+
+  def test_take(self):
+    sink = _chunk_io.ChunkSink()
+    self.assertTrue(sink.writable())
+    self.assertEqual(sink.write(b'abc'), 3)
+    self.assertEqual(sink.write(memoryview(b'de')), 2)
+    self.assertEqual(sink.take(), [b'abc', b'de'])
+    self.assertEqual(sink.take(), [])
+    sink.write(bytearray(b'f'))
+    self.assertEqual(sink.take(), [b'f'])
+
+  def test_take_while_another_thread_writes(self):
+    sink = _chunk_io.ChunkSink()
+    chunks = [b'%d' % i for i in range(100000)]
+
+    def write_all():
+      for chunk in chunks:
+        sink.write(chunk)
+
+    writer = threading.Thread(target=write_all)
+    writer.start()
+    taken = []
+    while writer.is_alive():
+      taken.extend(sink.take())
+    writer.join()
+    taken.extend(sink.take())
+    self.assertEqual(taken, chunks)
+
+  def test_write_after_close_fails(self):
+    sink = _chunk_io.ChunkSink()
+    sink.write(b'abc')
+    sink.close()
+    with self.assertRaises(ValueError):
+      sink.write(b'de')
+    self.assertEqual(sink.take(), [b'abc'])
+
+
+class ChunkSourceTest(absltest.TestCase):
+
+  def test_read(self):
+    source = _chunk_io.ChunkSource([b'abc', b'', bytearray(b'de'), b'fgh'])
+    self.assertTrue(source.readable())
+    self.assertEqual(source.read(2), b'ab')
+    self.assertEqual(source.read(5), b'c')
+    self.assertEqual(source.read(5), b'de')
+    self.assertEqual(source.read(), b'fgh')
+    self.assertEqual(source.read(5), b'')
+
+  def test_readinto(self):
+    source = _chunk_io.ChunkSource([memoryview(b'abcdef')])
+    buffer = bytearray(4)
+    self.assertEqual(source.readinto(buffer), 4)
+    self.assertEqual(buffer, b'abcd')
+    self.assertEqual(source.readinto(buffer), 2)
+    self.assertEqual(buffer[:2], b'ef')
+    self.assertEqual(source.readinto(buffer), 0)
+
+  def test_chunks_are_consumed_lazily(self):
+    consumed = []
+
+    def chunks():
+      for i in range(3):
+        consumed.append(i)
+        yield b'%d' % i * 10
+
+    source = _chunk_io.ChunkSource(chunks())
+    self.assertEqual(consumed, [])
+    self.assertEqual(source.read(5), b'00000')
+    self.assertEqual(consumed, [0])
+    self.assertEqual(source.read(10), b'00000')
+    self.assertEqual(consumed, [0])
+    self.assertEqual(source.read(10), b'1' * 10)
+    self.assertEqual(consumed, [0, 1])
+
+  def test_empty(self):
+    self.assertEqual(_chunk_io.ChunkSource([]).read(), b'')
+    self.assertEqual(_chunk_io.ChunkSource([b'', b'']).read(10), b'')
+
+
+if __name__ == '__main__':
+  absltest.main()
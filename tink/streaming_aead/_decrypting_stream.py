@@ -25,21 +25,24 @@ from tink.streaming_aead import _file_object_adapter
 
 
 @core.use_tink_errors
-def _get_input_stream_adapter(cc_primitive, aad, source):
+def _get_input_stream_adapter(cc_primitive, aad, source, read_ahead_size):
   """Implemented as a separate method to ensure correct error transform."""
   return tink_bindings.new_cc_decrypting_stream(
-      cc_primitive, aad, source)
+      cc_primitive, aad, source, read_ahead_size)
 
 
 class RawDecryptingStream(io.RawIOBase):
   """A file-like object which decrypts reads from an underlying object.
 
   It reads the ciphertext from the wrapped file-like object, and decrypts it.
+  Reads wait until the ciphertext source has data, unless the source has a
+  true nonblocking attribute. Then they return None instead, like the reads
+  of non-blocking raw streams.
   """
 
   def __init__(self, stream_aead: tink_bindings.StreamingAead,
                ciphertext_source: BinaryIO, associated_data: bytes, *,
-               close_ciphertext_source: bool):
+               close_ciphertext_source: bool, read_ahead_size: int = 0):
     """Create a new RawDecryptingStream.
 
     Args:
@@ -50,26 +53,32 @@ class RawDecryptingStream(io.RawIOBase):
       associated_data: The associated data to use for decryption.
       close_ciphertext_source: Whether ciphertext_source should be closed when
         close() is called.
+      read_ahead_size: The number of bytes requested from ciphertext_source by
+        each read. If it is 0, a default of 128 KiB is used.
     """
     super().__init__()
     self._ciphertext_source = ciphertext_source
     self._close_ciphertext_source = close_ciphertext_source
+    self._nonblocking = bool(getattr(ciphertext_source, 'nonblocking', False))
+    if read_ahead_size < 0:
+      raise ValueError('read_ahead_size must not be negative')
     if not ciphertext_source.readable():
       raise ValueError('ciphertext_source must be readable')
     cc_ciphertext_source = _file_object_adapter.FileObjectAdapter(
         ciphertext_source)
     self._input_stream_adapter = _get_input_stream_adapter(
-        stream_aead, associated_data, cc_ciphertext_source)
+        stream_aead, associated_data, cc_ciphertext_source, read_ahead_size)
 
   @core.use_tink_errors
   def _read_from_input_stream_adapter(self, size: int) -> bytes:
     """Implemented as a separate method to ensure correct error transform."""
     return self._input_stream_adapter.read(size)
 
-  def read(self, size: Optional[int] = -1) -> bytes:
+  def read(self, size: Optional[int] = -1) -> Optional[bytes]:
     """Read and return up to size bytes, where size is an int.
 
-    It blocks until at least one byte can be returned.
+    It blocks until at least one byte can be returned, unless the ciphertext
+    source is nonblocking.
 
     Args:
       size: Maximum number of bytes to read. As a convenience, if size is
@@ -77,6 +86,8 @@ class RawDecryptingStream(io.RawIOBase):
 
     Returns:
       Bytes read. If b'' is returned and size was not 0, this indicates EOF.
+      None is returned if the ciphertext source is nonblocking and has no
+      data at the moment.
 
     Raises:
       TinkError if there was a permanent error.
@@ -98,26 +109,47 @@ class RawDecryptingStream(io.RawIOBase):
         data = self._read_from_input_stream_adapter(size)
         if data:
           return data
+        if self._nonblocking:
+          return None
     except tink_bindings.PythonTinkStreamFinishedException:
       return b''
 
-  def readinto(self, b: bytearray) -> int:  # pyrefly: ignore[bad-override]
+  @core.use_tink_errors
+  def _read_into_from_input_stream_adapter(self, b) -> int:
+    """Implemented as a separate method to ensure correct error transform."""
+    return self._input_stream_adapter.read_into(b)
+
+  # b has type "Buffer", which is not yet supported by pytype.
+  def readinto(self, b) -> Optional[int]:  # pyrefly: ignore[bad-override]
     """Read bytes into a pre-allocated bytes-like object b.
 
+    The plaintext is decrypted directly into b, without intermediate bytes
+    objects. Like read(), it blocks until at least one byte can be returned,
+    unless the ciphertext source is nonblocking.
+
     Args:
-      b: Bytes-like object to which data will be read.
+      b: Writable bytes-like object to which data will be read.
 
     Returns:
-      Number of bytes read. It returns 0 if EOF is reached, and None if no data
-      is available at the moment.
+      Number of bytes read. It returns 0 if EOF is reached, and None if the
+      ciphertext source is nonblocking and has no data at the moment.
 
     Raises:
       TinkError if there was a permanent error.
     """
-    data = self.read(len(b))
-    n = len(data)
-    b[:n] = data
-    return n
+    if self.closed:  # pylint:disable=using-constant-test
+      raise ValueError('read on closed file.')
+    if not memoryview(b).nbytes:
+      return 0
+    try:
+      while True:
+        n = self._read_into_from_input_stream_adapter(b)
+        if n:
+          return n
+        if self._nonblocking:
+          return None
+    except tink_bindings.PythonTinkStreamFinishedException:
+      return 0
 
   def close(self) -> None:
     """Close the stream. Has no effect on a closed stream."""
@@ -134,3 +166,124 @@ class RawDecryptingStream(io.RawIOBase):
   # b has type "Buffer", which is not yet supported by pytype.
   def write(self, b) -> Optional[int]:
     raise io.UnsupportedOperation()
+
+
+@core.use_tink_errors
+def _get_random_access_stream(cc_primitive, aad, source):
+  """Implemented as a separate method to ensure correct error transform."""
+  return tink_bindings.new_cc_decrypting_random_access_stream(
+      cc_primitive, aad, source)
+
+
+class RawSeekableDecryptingStream(io.RawIOBase):
+  """A seekable file-like object which decrypts reads from an underlying object.
+
+  Only the segments of the ciphertext that contain the requested plaintext are
+  read and decrypted, so it supports reading from any position of the
+  plaintext. The ciphertext source must be seekable, and is read without
+  changing its position.
+  """
+
+  def __init__(self, stream_aead: tink_bindings.StreamingAead,
+               ciphertext_source: BinaryIO, associated_data: bytes, *,
+               close_ciphertext_source: bool, ciphertext_offset: int = 0):
+    """Create a new RawSeekableDecryptingStream.
+
+    Args:
+      stream_aead: C++ StreamingAead primitive from which a C++ decrypting
+        RandomAccessStream will be obtained.
+      ciphertext_source: A readable and seekable file-like object from which
+        ciphertext bytes will be read, for example a file or an mmap.mmap.
+      associated_data: The associated data to use for decryption.
+      close_ciphertext_source: Whether ciphertext_source should be closed when
+        close() is called.
+      ciphertext_offset: The position in ciphertext_source at which the
+        ciphertext starts.
+    """
+    super().__init__()
+    self._ciphertext_source = ciphertext_source
+    self._close_ciphertext_source = close_ciphertext_source
+    if not _is_readable_and_seekable(ciphertext_source):
+      raise ValueError('ciphertext_source must be readable and seekable')
+    cc_ciphertext_source = _file_object_adapter.FileObjectAdapter(
+        ciphertext_source, offset=ciphertext_offset)
+    self._random_access_stream = _get_random_access_stream(
+        stream_aead, associated_data, cc_ciphertext_source)
+    self._position = 0
+
+  @core.use_tink_errors
+  def _pread_into(self, position: int, b) -> int:
+    return self._random_access_stream.pread_into(position, b)
+
+  @core.use_tink_errors
+  def size(self) -> int:
+    """Returns the size of the plaintext."""
+    return self._random_access_stream.size()
+
+  # b has type "Buffer", which is not yet supported by pytype.
+  def readinto(self, b) -> int:  # pyrefly: ignore[bad-override]
+    """Decrypts the bytes at the current position into b.
+
+    Args:
+      b: Writable bytes-like object to which data will be read.
+
+    Returns:
+      Number of bytes read, which is smaller than len(b) only at the end of the
+      stream.
+
+    Raises:
+      TinkError if there was a permanent error.
+    """
+    if self.closed:  # pylint:disable=using-constant-test
+      raise ValueError('read on closed file.')
+    n = self._pread_into(self._position, b)
+    self._position += n
+    return n
+
+  def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+    """Changes the position of the stream and returns the new position."""
+    if self.closed:  # pylint:disable=using-constant-test
+      raise ValueError('seek on closed file.')
+    if whence == io.SEEK_SET:
+      position = offset
+    elif whence == io.SEEK_CUR:
+      position = self._position + offset
+    elif whence == io.SEEK_END:
+      position = self.size() + offset
+    else:
+      raise ValueError(
+          'invalid whence ({}, should be 0, 1 or 2)'.format(whence))
+    if position < 0:
+      raise ValueError('negative seek position {}'.format(position))
+    self._position = position
+    return position
+
+  def tell(self) -> int:
+    if self.closed:  # pylint:disable=using-constant-test
+      raise ValueError('tell on closed file.')
+    return self._position
+
+  def close(self) -> None:
+    """Close the stream. Has no effect on a closed stream."""
+    if self.closed:  # pylint:disable=using-constant-test
+      return
+    if self._close_ciphertext_source:
+      self._ciphertext_source.close()
+    super().close()
+
+  def readable(self) -> bool:
+    return True
+
+  def seekable(self) -> bool:
+    return True
+
+  # b has type "Buffer", which is not yet supported by pytype.
+  def write(self, b) -> Optional[int]:
+    raise io.UnsupportedOperation()
+
+
+def _is_readable_and_seekable(file_object: BinaryIO) -> bool:
+  # mmap.mmap objects do not have readable() and seekable() methods.
+  readable = getattr(file_object, 'readable', lambda: True)
+  seekable = getattr(file_object, 'seekable', lambda: True)
+  return readable() and seekable()
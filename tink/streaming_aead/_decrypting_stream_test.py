@@ -87,6 +87,74 @@ class DecryptingStreamTest(absltest.TestCase):
     self.assertFalse(ds.seekable())
     self.assertFalse(ds.isatty())
 
+  def test_seekable_unsupported_operation(self):
+    f = io.BytesIO(B_SOMETHING_)
+    ds = get_raw_primitive().new_raw_seekable_decrypting_stream(
+        f, B_AAD_, close_ciphertext_source=True)
+
+    with self.assertRaises(io.UnsupportedOperation):
+      ds.truncate()
+    with self.assertRaises(io.UnsupportedOperation):
+      ds.write(b'data')
+    with self.assertRaises(io.UnsupportedOperation):
+      ds.fileno()
+    with self.assertRaises(ValueError):
+      ds.seek(-1)
+    with self.assertRaises(ValueError):
+      ds.seek(0, 3)
+
+  def test_seekable_closed_methods_raise(self):
+    f = io.BytesIO(B_SOMETHING_)
+    ds = get_raw_primitive().new_raw_seekable_decrypting_stream(
+        f, B_AAD_, close_ciphertext_source=True)
+
+    ds.close()
+    self.assertTrue(f.closed)
+    with self.assertRaisesRegex(ValueError, 'closed'):
+      ds.read()
+    with self.assertRaisesRegex(ValueError, 'closed'):
+      ds.seek(0)
+    with self.assertRaisesRegex(ValueError, 'closed'):
+      ds.tell()
+
+  def test_seekable_inquiries(self):
+    f = io.BytesIO(B_SOMETHING_)
+    ds = get_raw_primitive().new_raw_seekable_decrypting_stream(
+        f, B_AAD_, close_ciphertext_source=True)
+
+    self.assertTrue(ds.readable())
+    self.assertFalse(ds.writable())
+    self.assertTrue(ds.seekable())
+    self.assertFalse(ds.isatty())
+    self.assertEqual(ds.tell(), 0)
+
+  def test_seekable_requires_seekable_source(self):
+    f = io.BufferedReader(io.BytesIO(B_SOMETHING_))
+    f.seekable = lambda: False
+    with self.assertRaises(ValueError):
+      get_raw_primitive().new_raw_seekable_decrypting_stream(
+          f, B_AAD_, close_ciphertext_source=True)
+
+  def test_buffer_released_when_readinto_raises(self):
+    views = []
+
+    class FailingSource(io.RawIOBase):
+
+      def readable(self):
+        return True
+
+      def readinto(self, b):
+        views.append(b)
+        raise ValueError('readinto failed')
+
+    ds = get_raw_decrypting_stream(FailingSource(), B_AAD_)
+    with self.assertRaises(core.TinkError):
+      ds.read(10)
+    self.assertNotEmpty(views)
+    for view in views:
+      with self.assertRaises(ValueError):
+        view[0]  # pylint: disable=pointless-statement
+
 
 if __name__ == '__main__':
   absltest.main()
@@ -62,9 +62,11 @@ class RawEncryptingStream(io.RawIOBase):
     self._cc_encrypting_stream = _new_cc_encrypting_stream(
         stream_aead, associated_data, cc_ciphertext_destination)
 
+  # b has type "Buffer", which is not yet supported by pytype.
   @core.use_tink_errors
-  def _write_to_cc_encrypting_stream(self, b: bytes) -> int:
-    return self._cc_encrypting_stream.write(bytes(b))
+  def _write_to_cc_encrypting_stream(self, b) -> int:
+    # The C++ stream reads the buffer of b directly, without a copy.
+    return self._cc_encrypting_stream.write(b)
 
   @core.use_tink_errors
   def _close_cc_encrypting_stream(self) -> None:
@@ -93,7 +95,7 @@ class RawEncryptingStream(io.RawIOBase):
       raise TypeError('a bytes-like object is required, not {}'.format(
           type(b).__name__))
     written = self._write_to_cc_encrypting_stream(b)
-    if written < 0 or written > len(b):
+    if written < 0 or written > memoryview(b).nbytes:
       raise core.TinkError('Incorrect number of bytes written')
     return written
 
@@ -13,6 +13,7 @@
 # limitations under the License.
 """Tests for tink.python.tink.streaming_aead.encrypting_stream."""
 
+import array
 import io
 from typing import cast
 
@@ -21,6 +22,7 @@ from absl.testing import absltest
 from tink import core
 from tink import streaming_aead
 from tink.streaming_aead import _raw_streaming_aead
+from tink.testing import bytes_io
 
 # Using malformed UTF-8 sequences to ensure there is no accidental decoding.
 B_X80 = b'\x80'
@@ -46,6 +48,21 @@ class EncryptingStreamTest(absltest.TestCase):
       with self.assertRaisesRegex(TypeError, 'bytes-like object is required'):
         es.write(cast(bytes, 'This is a string, not a bytes object'))
 
+  def test_write_bytes_like_objects(self):
+    plaintext = b'0123456789' * 1000
+    chunks = [plaintext[:10], bytearray(plaintext[10:3000]),
+              memoryview(plaintext)[3000:9000],
+              memoryview(array.array('I', plaintext[9000:]))]
+    dest = bytes_io.BytesIOWithValueAfterClose()
+    primitive = get_raw_primitive()
+    with primitive.new_raw_encrypting_stream(dest, B_AAD_) as es:
+      for chunk in chunks:
+        self.assertEqual(es.write(chunk), memoryview(chunk).nbytes)
+    ciphertext = dest.value_after_close()
+    with primitive.new_raw_decrypting_stream(
+        io.BytesIO(ciphertext), B_AAD_, close_ciphertext_source=True) as ds:
+      self.assertEqual(ds.readall(), plaintext)
+
   def test_flush(self):
     f = io.BytesIO()
     with get_raw_primitive().new_raw_encrypting_stream(f, B_ASSOC_) as es:
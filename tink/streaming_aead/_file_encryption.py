@@ -0,0 +1,194 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Encryption and decryption of whole files through memory maps.
+
+The input file is memory-mapped, and its segments are passed to the streams
+as views of the mapping, without read() calls on a file object. The output
+file is preallocated with its final size and memory-mapped as well, so the
+streams write into the mapping instead of calling write() on a file.
+"""
+
+import contextlib
+import io
+import mmap
+import os
+from typing import BinaryIO, Optional
+
+from tink import core
+from tink.streaming_aead import _streaming_aead
+
+# The number of bytes passed to or requested from a stream at once.
+_CHUNK_SIZE = 1024 * 1024
+
+
+class _MappedWriter(io.RawIOBase):
+  """A writable file object which writes to a preallocated memory map."""
+
+  def __init__(self, mapping: mmap.mmap):
+    super().__init__()
+    self._mapping = mapping
+    self.position = 0
+
+  # b has type "Buffer", which is not yet supported by pytype.
+  def write(self, b) -> int:
+    view = memoryview(b).cast('B')
+    end = self.position + len(view)
+    if end > len(self._mapping):
+      raise core.TinkError('the output is larger than its preallocated size')
+    self._mapping[self.position:end] = view
+    self.position = end
+    return len(view)
+
+  def writable(self) -> bool:
+    return True
+
+
+def _map(file_object: BinaryIO, size: int, access: int) -> Optional[mmap.mmap]:
+  # Empty files cannot be memory-mapped.
+  if not size:
+    return None
+  return mmap.mmap(file_object.fileno(), size, access=access)
+
+
+def _write_from(stream: BinaryIO, mapping: Optional[mmap.mmap]) -> None:
+  """Writes the content of mapping to stream."""
+  if mapping is None:
+    return
+  # The views are released explicitly, since a mapping cannot be closed while
+  # views of it exist.
+  with memoryview(mapping) as view:
+    for position in range(0, len(view), _CHUNK_SIZE):
+      with view[position:position + _CHUNK_SIZE] as chunk:
+        stream.write(chunk)
+
+
+def _read_into(stream: BinaryIO, mapping: Optional[mmap.mmap]) -> None:
+  """Fills mapping with bytes read from stream."""
+  if mapping is None:
+    return
+  with memoryview(mapping) as view:
+    position = 0
+    while position < len(view):
+      with view[position:position + _CHUNK_SIZE] as chunk:
+        n = stream.readinto(chunk)
+      if not n:
+        raise core.TinkError('the plaintext is shorter than expected')
+      position += n
+
+
+def encrypt_file(primitive: _streaming_aead.StreamingAead, src_path: str,
+                 dst_path: str, associated_data: bytes) -> None:
+  """Encrypts the file at src_path into a new file at dst_path.
+
+  dst_path is preallocated with the size of the ciphertext, if
+  primitive.ciphertext_size knows it. The ciphertext is the same as the one
+  written by primitive.new_encrypting_stream. If the encryption fails,
+  dst_path is removed.
+
+  Args:
+    primitive: The StreamingAead primitive.
+    src_path: The path of the plaintext file.
+    dst_path: The path of the ciphertext file, which is overwritten if it
+      exists.
+    associated_data: Associated data to be used by the AEAD encryption.
+
+  Raises:
+    tink.TinkError if the encryption fails.
+    OSError if a file cannot be read or written.
+  """
+  with open(src_path, 'rb') as src:
+    plaintext_size = os.fstat(src.fileno()).st_size
+    try:
+      ciphertext_size = primitive.ciphertext_size(plaintext_size)
+    except NotImplementedError:
+      ciphertext_size = None
+    src_mapping = _map(src, plaintext_size, mmap.ACCESS_READ)
+    try:
+      with open(dst_path, 'w+b') as dst:
+        if ciphertext_size is None:
+          with primitive.new_encrypting_stream(dst, associated_data) as es:
+            _write_from(es, src_mapping)
+          return
+        dst.truncate(ciphertext_size)
+        dst_mapping = _map(dst, ciphertext_size, mmap.ACCESS_WRITE)
+        if dst_mapping is None:
+          raise core.TinkError('invalid ciphertext size')
+        try:
+          writer = _MappedWriter(dst_mapping)
+          with primitive.new_encrypting_stream(writer, associated_data) as es:
+            _write_from(es, src_mapping)
+          dst_mapping.flush()
+        finally:
+          dst_mapping.close()
+        if writer.position != ciphertext_size:
+          dst.truncate(writer.position)
+    except BaseException:
+      with contextlib.suppress(OSError):
+        os.remove(dst_path)
+      raise
+    finally:
+      if src_mapping is not None:
+        src_mapping.close()
+
+
+def decrypt_file(primitive: _streaming_aead.StreamingAead, src_path: str,
+                 dst_path: str, associated_data: bytes) -> None:
+  """Decrypts the file at src_path into a new file at dst_path.
+
+  The ciphertext is decrypted with primitive.new_seekable_decrypting_stream,
+  which determines the size of the plaintext, so dst_path is preallocated
+  and the plaintext is decrypted directly into its memory map. If the
+  decryption fails, dst_path is removed, so that no unauthenticated or partial
+  plaintext is left behind.
+
+  Args:
+    primitive: The StreamingAead primitive.
+    src_path: The path of the ciphertext file.
+    dst_path: The path of the plaintext file, which is overwritten if it
+      exists.
+    associated_data: Associated data to be used by the AEAD decryption. It
+      must match the associated_data supplied for the encryption.
+
+  Raises:
+    tink.TinkError if the decryption fails.
+    OSError if a file cannot be read or written.
+  """
+  with open(src_path, 'rb') as src:
+    ciphertext_size = os.fstat(src.fileno()).st_size
+    src_mapping = _map(src, ciphertext_size, mmap.ACCESS_READ)
+    try:
+      # Closing the decrypting stream closes src_mapping.
+      with open(dst_path, 'w+b') as dst, \
+          primitive.new_seekable_decrypting_stream(
+              src_mapping or io.BytesIO(), associated_data) as ds:
+        plaintext_size = ds.seek(0, io.SEEK_END)
+        ds.seek(0)
+        dst.truncate(plaintext_size)
+        dst_mapping = _map(dst, plaintext_size, mmap.ACCESS_WRITE)
+        try:
+          _read_into(ds, dst_mapping)
+          if dst_mapping is not None:
+            dst_mapping.flush()
+        finally:
+          if dst_mapping is not None:
+            dst_mapping.close()
+    except BaseException:
+      with contextlib.suppress(OSError):
+        os.remove(dst_path)
+      raise
+    finally:
+      if src_mapping is not None:
+        src_mapping.close()
@@ -0,0 +1,147 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for tink.python.tink.streaming_aead._file_encryption."""
+
+import io
+import os
+from typing import BinaryIO
+
+from absl.testing import absltest
+from absl.testing import parameterized
+
+import tink
+from tink import streaming_aead
+
+TEMPLATE = streaming_aead.streaming_aead_key_templates.AES128_GCM_HKDF_4KB
+
+
+def setUpModule():
+  streaming_aead.register()
+
+
+def _new_primitive() -> streaming_aead.StreamingAead:
+  return tink.new_keyset_handle(TEMPLATE).primitive(
+      streaming_aead.StreamingAead)
+
+
+def _read(path: str) -> bytes:
+  with open(path, 'rb') as f:
+    return f.read()
+
+
+class _StreamsOnly(streaming_aead.StreamingAead):
+  """Delegates the streams, but does not know the size of ciphertexts."""
+
+  def __init__(self, primitive: streaming_aead.StreamingAead):
+    self._primitive = primitive
+
+  def new_encrypting_stream(self, ciphertext_destination: BinaryIO,
+                            associated_data: bytes) -> BinaryIO:
+    return self._primitive.new_encrypting_stream(ciphertext_destination,
+                                                 associated_data)
+
+  def new_decrypting_stream(self, ciphertext_source: BinaryIO,
+                            associated_data: bytes) -> BinaryIO:
+    return self._primitive.new_decrypting_stream(ciphertext_source,
+                                                 associated_data)
+
+  def new_seekable_decrypting_stream(self, ciphertext_source: BinaryIO,
+                                     associated_data: bytes) -> io.RawIOBase:
+    return self._primitive.new_seekable_decrypting_stream(ciphertext_source,
+                                                          associated_data)
+
+
+class FileEncryptionTest(parameterized.TestCase):
+
+  @parameterized.parameters([0, 1, 4056, 4057, 100 * 1000, 3 * 1024 * 1024])
+  def test_encrypt_file_decrypt_file(self, plaintext_size):
+    primitive = _new_primitive()
+    plaintext = os.urandom(plaintext_size)
+    src_path = self.create_tempfile(content=plaintext).full_path
+    ciphertext_path = self.create_tempfile().full_path
+    dst_path = self.create_tempfile().full_path
+
+    streaming_aead.encrypt_file(primitive, src_path, ciphertext_path, b'aad')
+    ciphertext = _read(ciphertext_path)
+    self.assertLen(ciphertext, primitive.ciphertext_size(plaintext_size))
+    with primitive.new_decrypting_stream(io.BytesIO(ciphertext), b'aad') as ds:
+      self.assertEqual(ds.read(), plaintext)
+
+    streaming_aead.decrypt_file(primitive, ciphertext_path, dst_path, b'aad')
+    self.assertEqual(_read(dst_path), plaintext)
+
+  def test_overwrites_existing_file(self):
+    primitive = _new_primitive()
+    src_path = self.create_tempfile(content=b'plaintext').full_path
+    ciphertext_path = self.create_tempfile(content=b'x' * 10000).full_path
+    dst_path = self.create_tempfile(content=b'y' * 10000).full_path
+    streaming_aead.encrypt_file(primitive, src_path, ciphertext_path, b'aad')
+    streaming_aead.decrypt_file(primitive, ciphertext_path, dst_path, b'aad')
+    self.assertEqual(_read(dst_path), b'plaintext')
+
+  def test_primitive_without_ciphertext_size(self):
+    primitive = _StreamsOnly(_new_primitive())
+    plaintext = os.urandom(10000)
+    src_path = self.create_tempfile(content=plaintext).full_path
+    ciphertext_path = self.create_tempfile().full_path
+    dst_path = self.create_tempfile().full_path
+    streaming_aead.encrypt_file(primitive, src_path, ciphertext_path, b'aad')
+    streaming_aead.decrypt_file(primitive, ciphertext_path, dst_path, b'aad')
+    self.assertEqual(_read(dst_path), plaintext)
+
+  def test_key_id_header(self):
+    primitive = streaming_aead.with_options(
+        _new_primitive(), key_id_header=True)
+    src_path = self.create_tempfile(content=b'plaintext').full_path
+    ciphertext_path = self.create_tempfile().full_path
+    dst_path = self.create_tempfile().full_path
+    streaming_aead.encrypt_file(primitive, src_path, ciphertext_path, b'aad')
+    self.assertEqual(_read(ciphertext_path)[:1], b'\x01')
+    streaming_aead.decrypt_file(primitive, ciphertext_path, dst_path, b'aad')
+    self.assertEqual(_read(dst_path), b'plaintext')
+
+  def test_decrypt_file_wrong_associated_data_removes_output(self):
+    primitive = _new_primitive()
+    src_path = self.create_tempfile(content=b'plaintext').full_path
+    ciphertext_path = self.create_tempfile().full_path
+    dst_path = self.create_tempfile().full_path
+    streaming_aead.encrypt_file(primitive, src_path, ciphertext_path, b'aad')
+    with self.assertRaises(tink.TinkError):
+      streaming_aead.decrypt_file(primitive, ciphertext_path, dst_path,
+                                  b'bad aad')
+    self.assertFalse(os.path.exists(dst_path))
+
+  def test_decrypt_file_truncated_ciphertext_removes_output(self):
+    primitive = _new_primitive()
+    src_path = self.create_tempfile(content=os.urandom(10000)).full_path
+    ciphertext_path = self.create_tempfile().full_path
+    dst_path = self.create_tempfile().full_path
+    streaming_aead.encrypt_file(primitive, src_path, ciphertext_path, b'aad')
+    os.truncate(ciphertext_path, os.path.getsize(ciphertext_path) - 1)
+    with self.assertRaises(tink.TinkError):
+      streaming_aead.decrypt_file(primitive, ciphertext_path, dst_path, b'aad')
+    self.assertFalse(os.path.exists(dst_path))
+
+  def test_decrypt_empty_file_fails(self):
+    src_path = self.create_tempfile().full_path
+    dst_path = self.create_tempfile().full_path
+    with self.assertRaises(tink.TinkError):
+      streaming_aead.decrypt_file(_new_primitive(), src_path, dst_path, b'aad')
+    self.assertFalse(os.path.exists(dst_path))
+
+
+if __name__ == '__main__':
+  absltest.main()
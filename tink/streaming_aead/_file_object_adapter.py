@@ -14,22 +14,47 @@
 """FileObjectAdapter class.
 
 Used in conjunction with PythonOutputStream/PythonInputStream to allow a C++
-OutputStream/InputStream to interact with a Python file-like object.
+OutputStream/InputStream to interact with a Python file-like object, and with
+PythonRandomAccessStream to allow random access to a seekable one.
+
+PythonInputStream reads through readinto(), which reuses one buffer for all
+calls, and only falls back to read() if readinto() is not implemented.
 """
 
 import io
-from typing import BinaryIO
+import os
+import threading
+from typing import BinaryIO, Optional
 
 from tink.cc.pybind import tink_bindings
 
+# Serializes the seek() and read() calls of pread() and size() on file objects
+# without a file descriptor. It is shared by all adapters because several of
+# them can wrap the same file object, e.g. for parallel decryption.
+_POSITION_LOCK = threading.Lock()
+
 
 class FileObjectAdapter(tink_bindings.PythonFileObjectAdapter):
   """Adapts a Python file object for use in C++."""
 
-  def __init__(self, file_object: BinaryIO):
+  def __init__(self, file_object: BinaryIO, offset: int = 0):
+    """Create a new FileObjectAdapter.
+
+    Args:
+      file_object: The file object to adapt.
+      offset: The position in file_object at which pread() and size() start,
+        i.e. pread(0, n) reads the n bytes after the first offset bytes.
+    """
     # Required to fix CLIF "Value invalidated due to capture by std::unique_ptr"
     super().__init__()
+    if offset < 0:
+      raise ValueError('offset must be non-negative')
     self._file_object = file_object
+    self._offset = offset
+    self._fd: Optional[int] = None
+    self._fd_checked = False
+    # Set to None once the file object turns out not to support readinto.
+    self._readinto = getattr(file_object, 'readinto', None)
 
   def write(self, data: bytes) -> int:
     """Writes to underlying file object and returns number of bytes written."""
@@ -75,3 +100,106 @@ class FileObjectAdapter(tink_bindings.PythonFileObjectAdapter):
       return data
     except io.BlockingIOError:
       return b''
+
+  def readinto(self, buffer: memoryview) -> int:
+    """Reads at most len(buffer) bytes from the underlying file object.
+
+    C++ calls this with a view of the same buffer on every call, so that no
+    bytes object is allocated per call if the file object supports readinto.
+    Otherwise, it falls back to read().
+
+    Args:
+      buffer: A writable memoryview to which the bytes are read.
+
+    Returns:
+      The number of bytes read into buffer. 0 is returned if no bytes are
+      available at the moment.
+
+    Raises:
+      EOFError if the file object is already at EOF.
+    """
+    if self._readinto is not None:
+      try:
+        n = self._readinto(buffer)
+      except (NotImplementedError, io.UnsupportedOperation):
+        self._readinto = None
+      except io.BlockingIOError:
+        return 0
+      else:
+        if n is None:
+          return 0
+        if n < 0 or n > len(buffer):
+          raise ValueError('invalid value returned by readinto')
+        if not n and len(buffer):
+          raise EOFError('EOF')
+        return n
+    data = self.read(len(buffer))
+    buffer[:len(data)] = data
+    return len(data)
+
+  def _pread_fd(self) -> Optional[int]:
+    """Returns the file descriptor to use with os.pread, if there is one."""
+    if not self._fd_checked:
+      self._fd_checked = True
+      if hasattr(os, 'pread'):
+        try:
+          self._fd = self._file_object.fileno()
+        except (AttributeError, OSError, ValueError):
+          self._fd = None
+    return self._fd
+
+  def pread(self, position: int, count: int) -> bytes:
+    """Reads 'count' bytes at 'position' from the underlying file object.
+
+    The position of the file object is not changed. If the file object has a
+    file descriptor, os.pread is used and the file object is not touched.
+
+    Args:
+      position: A non-negative integer, the offset of the first byte to read.
+      count: A non-negative integer, the number of bytes to read.
+
+    Returns:
+      Bytes that were read. Fewer than 'count' bytes are only returned if the
+      end of the file object is reached.
+    """
+    if position < 0 or count < 0:
+      raise ValueError('position and count must be non-negative')
+    position += self._offset
+    fd = self._pread_fd()
+    chunks = []
+    remaining = count
+    if fd is not None:
+      while remaining > 0:
+        data = os.pread(fd, remaining, position + count - remaining)
+        if not data:
+          break
+        chunks.append(data)
+        remaining -= len(data)
+      return b''.join(chunks)
+    with _POSITION_LOCK:
+      current_position = self._file_object.tell()
+      try:
+        self._file_object.seek(position)
+        while remaining > 0:
+          data = self._file_object.read(remaining)
+          if not data:
+            break
+          chunks.append(data)
+          remaining -= len(data)
+      finally:
+        self._file_object.seek(current_position)
+    return b''.join(chunks)
+
+  def size(self) -> int:
+    """Returns the size of the underlying file object after offset in bytes."""
+    fd = self._pread_fd()
+    if fd is not None:
+      return max(0, os.fstat(fd).st_size - self._offset)
+    with _POSITION_LOCK:
+      current_position = self._file_object.tell()
+      try:
+        # mmap.mmap.seek() returns None, so the size is read with tell().
+        self._file_object.seek(0, io.SEEK_END)
+        return max(0, self._file_object.tell() - self._offset)
+      finally:
+        self._file_object.seek(current_position)
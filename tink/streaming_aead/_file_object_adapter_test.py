@@ -144,6 +144,103 @@ class FileObjectAdapterTest(absltest.TestCase):
 
     self.assertEqual(adapter.read(10), b'')
 
+  def test_readinto(self):
+    file_object = io.BytesIO(b'something')
+    adapter = _file_object_adapter.FileObjectAdapter(file_object)
+    buffer = bytearray(4)
+
+    self.assertEqual(adapter.readinto(memoryview(buffer)), 4)
+    self.assertEqual(buffer, b'some')
+    self.assertEqual(adapter.readinto(memoryview(buffer)), 4)
+    self.assertEqual(buffer, b'thin')
+    self.assertEqual(adapter.readinto(memoryview(buffer)), 1)
+    self.assertEqual(buffer[:1], b'g')
+    with self.assertRaises(EOFError):
+      adapter.readinto(memoryview(buffer))
+
+  def test_readinto_falls_back_to_read(self):
+
+    class ReadOnly(io.RawIOBase):
+
+      def __init__(self, data):
+        super().__init__()
+        self._data = io.BytesIO(data)
+
+      def read(self, size=-1):
+        return self._data.read(size)
+
+    adapter = _file_object_adapter.FileObjectAdapter(ReadOnly(b'something'))
+    buffer = bytearray(5)
+
+    self.assertEqual(adapter.readinto(memoryview(buffer)), 5)
+    self.assertEqual(buffer, b'somet')
+    self.assertEqual(adapter.readinto(memoryview(buffer)), 4)
+    self.assertEqual(buffer[:4], b'hing')
+    with self.assertRaises(EOFError):
+      adapter.readinto(memoryview(buffer))
+
+  def test_readinto_returns_none(self):
+    file_object = mock.Mock()
+    file_object.readinto = mock.Mock(return_value=None)
+    adapter = _file_object_adapter.FileObjectAdapter(file_object)
+
+    self.assertEqual(adapter.readinto(memoryview(bytearray(10))), 0)
+
+  def test_readinto_raises_blocking_error(self):
+    file_object = mock.Mock()
+    file_object.readinto = mock.Mock(
+        side_effect=io.BlockingIOError(None, None))
+    adapter = _file_object_adapter.FileObjectAdapter(file_object)
+
+    self.assertEqual(adapter.readinto(memoryview(bytearray(10))), 0)
+
+  def test_readinto_returns_invalid_number_raises_error(self):
+    file_object = mock.Mock()
+    file_object.readinto = mock.Mock(return_value=11)
+    adapter = _file_object_adapter.FileObjectAdapter(file_object)
+
+    with self.assertRaises(ValueError):
+      adapter.readinto(memoryview(bytearray(10)))
+
+  def test_pread_and_size(self):
+    file_object = io.BytesIO(b'0123456789')
+    file_object.seek(3)
+    adapter = _file_object_adapter.FileObjectAdapter(file_object)
+
+    self.assertEqual(adapter.pread(0, 4), b'0123')
+    self.assertEqual(adapter.pread(8, 4), b'89')
+    self.assertEqual(adapter.pread(10, 4), b'')
+    self.assertEqual(adapter.size(), 10)
+    # The position of the file object is not changed.
+    self.assertEqual(file_object.tell(), 3)
+
+  def test_pread_and_size_of_file(self):
+    path = self.create_tempfile(content=b'0123456789').full_path
+    with open(path, 'rb') as file_object:
+      adapter = _file_object_adapter.FileObjectAdapter(file_object)
+      self.assertEqual(adapter.pread(2, 3), b'234')
+      self.assertEqual(adapter.pread(8, 4), b'89')
+      self.assertEqual(adapter.size(), 10)
+      self.assertEqual(file_object.tell(), 0)
+
+  def test_pread_and_size_with_offset(self):
+    file_object = io.BytesIO(b'0123456789')
+    adapter = _file_object_adapter.FileObjectAdapter(file_object, offset=3)
+    self.assertEqual(adapter.pread(0, 4), b'3456')
+    self.assertEqual(adapter.pread(5, 4), b'89')
+    self.assertEqual(adapter.size(), 7)
+
+    path = self.create_tempfile(content=b'0123456789').full_path
+    with open(path, 'rb') as f:
+      adapter = _file_object_adapter.FileObjectAdapter(f, offset=3)
+      self.assertEqual(adapter.pread(0, 4), b'3456')
+      self.assertEqual(adapter.size(), 7)
+
+  def test_pread_negative_position_fails(self):
+    adapter = _file_object_adapter.FileObjectAdapter(io.BytesIO(b'0123'))
+    with self.assertRaises(ValueError):
+      adapter.pread(-1, 2)
+
 
 if __name__ == '__main__':
   absltest.main()
@@ -0,0 +1,298 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""File-like objects that encrypt and decrypt on worker threads.
+
+The C++ streams release the GIL while they encrypt and decrypt, so that they
+run in parallel with Python code and with each other.
+"""
+
+import collections
+from concurrent import futures
+import io
+import threading
+from typing import Callable, Deque, List, Optional
+
+
+class PipelinedEncryptingStream(io.RawIOBase):
+  """Writes to a raw encrypting stream on a background thread.
+
+  The segments of a ciphertext are encrypted one after the other by the C++
+  encrypting stream, but on a thread that runs in parallel with the code that
+  produces the plaintext. Written data is queued until the background thread
+  has encrypted it, and write() blocks while max_in_flight_bytes are queued.
+  Errors of the background thread are raised by the next call to write(),
+  flush() or close().
+  """
+
+  def __init__(self, raw: io.RawIOBase, max_in_flight_bytes: int):
+    """Create a new PipelinedEncryptingStream.
+
+    Args:
+      raw: The raw encrypting stream to which the data is written. It is closed
+        by close().
+      max_in_flight_bytes: The maximum number of bytes which are queued.
+    """
+    super().__init__()
+    if max_in_flight_bytes <= 0:
+      raise ValueError('max_in_flight_bytes must be positive')
+    self._raw = raw
+    self._max_in_flight_bytes = max_in_flight_bytes
+    self._in_flight_bytes = 0
+    self._pending: Deque[bytes] = collections.deque()
+    self._error: Optional[Exception] = None
+    self._finishing = False
+    self._condition = threading.Condition()
+    self._thread = threading.Thread(target=self._run, daemon=True)
+    self._thread.start()
+
+  def _run(self) -> None:
+    while True:
+      with self._condition:
+        while not self._pending and not self._finishing:
+          self._condition.wait()
+        if not self._pending:
+          return
+        data = self._pending[0]
+      try:
+        remaining = data
+        while remaining:
+          written = self._raw.write(remaining)
+          remaining = remaining[written or 0:]
+      except Exception as e:  # pylint: disable=broad-except
+        with self._condition:
+          self._error = e
+          self._pending.clear()
+          self._in_flight_bytes = 0
+          self._condition.notify_all()
+        return
+      with self._condition:
+        self._pending.popleft()
+        self._in_flight_bytes -= len(data)
+        self._condition.notify_all()
+
+  def _raise_error(self) -> None:
+    if self._error is not None:
+      raise self._error
+
+  # b has type "Buffer", which is not yet supported by pytype.
+  def write(self, b) -> int:
+    """Queues b for encryption and returns its length in bytes.
+
+    Args:
+      b: The buffer to write. It is copied, so it can be reused by the caller.
+    Returns:
+      The number of bytes written, which is always the length of b in bytes.
+    Raises:
+      TinkError: if there was a permanent error.
+    """
+    if self.closed:  # pylint:disable=using-constant-test
+      raise ValueError('write on closed file')
+    data = bytes(b)
+    with self._condition:
+      while (self._in_flight_bytes and
+             self._in_flight_bytes + len(data) > self._max_in_flight_bytes and
+             self._error is None):
+        self._condition.wait()
+      self._raise_error()
+      self._pending.append(data)
+      self._in_flight_bytes += len(data)
+      self._condition.notify_all()
+    return len(data)
+
+  def flush(self) -> None:
+    """Waits until all queued data is encrypted."""
+    super().flush()
+    with self._condition:
+      while self._pending and self._error is None:
+        self._condition.wait()
+      # close() raises the error itself, after closing raw.
+      if not self._finishing:
+        self._raise_error()
+
+  def close(self) -> None:
+    """Flush and close the stream. Has no effect on a closed stream."""
+    if self.closed:  # pylint:disable=using-constant-test
+      return
+    with self._condition:
+      self._finishing = True
+      self._condition.notify_all()
+    self._thread.join()
+    try:
+      self._raw.close()
+    except Exception as e:
+      if self._error is None:
+        raise
+      # Closing raw usually fails because the background thread failed, so
+      # the error of the background thread is kept as the cause.
+      raise e from self._error
+    finally:
+      super().close()
+    self._raise_error()
+
+  def writable(self) -> bool:
+    return True
+
+
+class ParallelDecryptingStream(io.RawIOBase):
+  """Decrypts the chunks of a ciphertext on a pool of threads.
+
+  The plaintext is split into chunks of chunk_size bytes, which are decrypted
+  by up to max_workers threads. Each thread reads from its own seekable
+  decrypting stream, and the chunks are returned in order. Decryption runs at
+  most max_in_flight_bytes ahead of the reader, rounded up to a whole chunk.
+
+  Only forward reads are supported. A chunk which does not start and end at a
+  segment boundary shares its first and last segments with the neighbouring
+  chunks, so these segments are decrypted twice. chunk_size should therefore
+  be much larger than the ciphertext segment size.
+  """
+
+  def __init__(self, stream: io.RawIOBase,
+               new_stream: Callable[[], io.RawIOBase], chunk_size: int,
+               max_workers: int, max_in_flight_bytes: int):
+    """Create a new ParallelDecryptingStream.
+
+    Args:
+      stream: A seekable decrypting stream, used to find the size of the
+        plaintext on the first read. It is closed by close().
+      new_stream: Returns a new seekable decrypting stream of the same
+        ciphertext. It is called at most once by every worker thread, and the
+        returned streams are closed by close().
+      chunk_size: The number of plaintext bytes decrypted by each task.
+      max_workers: The number of worker threads.
+      max_in_flight_bytes: The maximum number of plaintext bytes which are
+        decrypted ahead of the reader.
+    """
+    super().__init__()
+    if chunk_size <= 0 or max_workers <= 0 or max_in_flight_bytes <= 0:
+      raise ValueError(
+          'chunk_size, max_workers and max_in_flight_bytes must be positive')
+    self._stream = stream
+    self._new_stream = new_stream
+    self._chunk_size = chunk_size
+    self._max_chunks_in_flight = max(1, max_in_flight_bytes // chunk_size)
+    self._max_workers = max_workers
+    self._executor: Optional[futures.ThreadPoolExecutor] = None
+    self._local = threading.local()
+    self._worker_streams: List[io.RawIOBase] = []
+    self._worker_streams_lock = threading.Lock()
+    self._pending: Deque[futures.Future] = collections.deque()
+    self._size = -1
+    self._next_position = 0
+    self._chunk = memoryview(b'')
+    self._offset = 0
+
+  @property
+  def key_attempts(self) -> Optional[int]:
+    """The key_attempts of the first stream, if it has this property."""
+    return getattr(self._stream, 'key_attempts', None)
+
+  def _worker_stream(self) -> io.RawIOBase:
+    stream = getattr(self._local, 'stream', None)
+    if stream is None:
+      stream = self._new_stream()
+      self._local.stream = stream
+      with self._worker_streams_lock:
+        self._worker_streams.append(stream)
+    return stream
+
+  def _decrypt_chunk(self, position: int, size: int) -> memoryview:
+    stream = self._worker_stream()
+    stream.seek(position)
+    view = memoryview(bytearray(size))
+    n = 0
+    while n < size:
+      read = stream.readinto(view[n:])
+      if not read:
+        break
+      n += read
+    return view[:n]
+
+  def _submit_ahead(self) -> None:
+    while (len(self._pending) < self._max_chunks_in_flight and
+           self._next_position < self._size):
+      size = min(self._chunk_size, self._size - self._next_position)
+      self._pending.append(
+          self._executor.submit(self._decrypt_chunk, self._next_position,
+                                size))
+      self._next_position += size
+
+  def _next_chunk(self) -> bool:
+    """Waits for the next chunk. Returns False at the end of the stream."""
+    if self._size < 0:
+      # Finds the matching key, and raises a TinkError if there is none.
+      self._size = self._stream.seek(0, io.SEEK_END)
+      self._executor = futures.ThreadPoolExecutor(
+          max_workers=self._max_workers)
+      self._submit_ahead()
+    while self._offset == len(self._chunk):
+      if not self._pending:
+        return False
+      self._chunk = self._pending.popleft().result()
+      self._offset = 0
+      self._submit_ahead()
+    return True
+
+  # b has type "Buffer", which is not yet supported by pytype.
+  def readinto(self, b) -> int:  # pyrefly: ignore[bad-override]
+    """Read bytes into a pre-allocated bytes-like object b.
+
+    Args:
+      b: Writable bytes-like object to which data will be read.
+
+    Returns:
+      Number of bytes read, which is smaller than len(b) only at the end of the
+      stream.
+
+    Raises:
+      TinkError if there was a permanent error.
+    """
+    if self.closed:  # pylint:disable=using-constant-test
+      raise ValueError('read on closed file.')
+    view = memoryview(b).cast('B')
+    n = 0
+    while n < len(view) and self._next_chunk():
+      count = min(len(view) - n, len(self._chunk) - self._offset)
+      view[n:n + count] = self._chunk[self._offset:self._offset + count]
+      self._offset += count
+      n += count
+    return n
+
+  def readall(self) -> bytes:
+    """Read until the end of the stream, without intermediate copies."""
+    if self.closed:  # pylint:disable=using-constant-test
+      raise ValueError('read on closed file.')
+    chunks = []
+    while self._next_chunk():
+      chunks.append(self._chunk[self._offset:])
+      self._offset = len(self._chunk)
+    return b''.join(chunks)
+
+  def close(self) -> None:
+    if self.closed:  # pylint:disable=using-constant-test
+      return
+    try:
+      if self._executor:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+      for stream in self._worker_streams:
+        stream.close()
+      self._stream.close()
+    finally:
+      self._pending.clear()
+      self._chunk = memoryview(b'')
+      super().close()
+
+  def readable(self) -> bool:
+    return True
@@ -0,0 +1,214 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for tink.python.tink.streaming_aead._parallel_streams."""
+
+import io
+import threading
+
+from absl.testing import absltest
+
+from tink.streaming_aead import _parallel_streams
+
+
+class _RecordingBytesIO(io.BytesIO):
+  """A BytesIO which keeps its value after it is closed."""
+
+  def __init__(self):
+    super().__init__()
+    self.was_closed = False
+    self.value = b''
+
+  def close(self):
+    self.was_closed = True
+    self.value = self.getvalue()
+    super().close()
+
+
+class _FailingWriter(io.RawIOBase):
+
+  def write(self, b):
+    raise ValueError('write failed')
+
+  def writable(self):
+    return True
+
+
+class _FailingCloseWriter(_FailingWriter):
+
+  def close(self):
+    super().close()
+    raise OSError('close failed')
+
+
+class _BlockingWriter(io.RawIOBase):
+  """Blocks all writes until release is set."""
+
+  def __init__(self):
+    super().__init__()
+    self.release = threading.Event()
+    self.data = bytearray()
+
+  def write(self, b):
+    self.release.wait()
+    self.data += b
+    return len(b)
+
+  def writable(self):
+    return True
+
+
+class PipelinedEncryptingStreamTest(absltest.TestCase):
+
+  def test_write_close(self):
+    raw = _RecordingBytesIO()
+    stream = _parallel_streams.PipelinedEncryptingStream(raw, 10)
+    buffer = bytearray(b'abcd')
+    self.assertEqual(stream.write(buffer), 4)
+    buffer[:] = b'efgh'  # The stream must have copied the data.
+    self.assertEqual(stream.write(buffer), 4)
+    self.assertEqual(stream.write(b'x' * 100), 100)
+    stream.close()
+    self.assertTrue(stream.closed)
+    self.assertTrue(raw.was_closed)
+    self.assertEqual(raw.value, b'abcdefgh' + b'x' * 100)
+
+  def test_flush_waits_for_writes(self):
+    raw = _RecordingBytesIO()
+    with _parallel_streams.PipelinedEncryptingStream(raw, 10) as stream:
+      stream.write(b'abc')
+      stream.flush()
+      self.assertEqual(raw.getvalue(), b'abc')
+
+  def test_write_blocks_when_too_much_is_in_flight(self):
+    raw = _BlockingWriter()
+    stream = _parallel_streams.PipelinedEncryptingStream(raw, 10)
+    stream.write(b'0123456789')
+    written = threading.Event()
+
+    def write():
+      stream.write(b'a')
+      written.set()
+
+    thread = threading.Thread(target=write)
+    thread.start()
+    self.assertFalse(written.wait(0.1))
+    raw.release.set()
+    thread.join()
+    stream.close()
+    self.assertEqual(raw.data, b'0123456789a')
+
+  def test_error_is_raised_by_next_call(self):
+    stream = _parallel_streams.PipelinedEncryptingStream(_FailingWriter(), 10)
+    stream.write(b'abc')
+    with self.assertRaisesRegex(ValueError, 'write failed'):
+      stream.flush()
+    with self.assertRaisesRegex(ValueError, 'write failed'):
+      stream.write(b'abc')
+    with self.assertRaisesRegex(ValueError, 'write failed'):
+      stream.close()
+    self.assertTrue(stream.closed)
+
+  def test_close_error_is_chained_to_error(self):
+    stream = _parallel_streams.PipelinedEncryptingStream(
+        _FailingCloseWriter(), 10)
+    stream.write(b'abc')
+    with self.assertRaisesRegex(OSError, 'close failed') as cm:
+      stream.close()
+    self.assertIsInstance(cm.exception.__cause__, ValueError)
+    self.assertTrue(stream.closed)
+
+  def test_invalid_max_in_flight_bytes_fails(self):
+    with self.assertRaises(ValueError):
+      _parallel_streams.PipelinedEncryptingStream(io.BytesIO(), 0)
+
+
+class ParallelDecryptingStreamTest(absltest.TestCase):
+
+  def _new_stream(self, data, chunk_size=7, max_workers=3,
+                  max_in_flight_bytes=20):
+    first = _RecordingBytesIO()
+    first.write(data)
+    created = []
+
+    def new_stream():
+      stream = _RecordingBytesIO()
+      stream.write(data)
+      created.append(stream)
+      return stream
+
+    stream = _parallel_streams.ParallelDecryptingStream(
+        first, new_stream, chunk_size, max_workers, max_in_flight_bytes)
+    return stream, first, created
+
+  def test_read(self):
+    data = bytes(range(256)) * 10
+    stream, first, created = self._new_stream(data)
+    self.assertEqual(stream.read(5), data[:5])
+    self.assertEqual(stream.read(10), data[5:15])
+    self.assertEqual(stream.readall(), data[15:])
+    self.assertEqual(stream.read(10), b'')
+    self.assertLessEqual(len(created), 3)
+    stream.close()
+    self.assertTrue(first.was_closed)
+    self.assertTrue(all(s.was_closed for s in created))
+
+  def test_buffered_read(self):
+    data = bytes(range(256)) * 1000
+    stream, _, _ = self._new_stream(data, chunk_size=1000,
+                                    max_in_flight_bytes=5000)
+    with io.BufferedReader(stream) as reader:
+      self.assertEqual(reader.read(), data)
+
+  def test_read_empty(self):
+    stream, _, created = self._new_stream(b'')
+    self.assertEqual(stream.read(10), b'')
+    self.assertEqual(stream.readall(), b'')
+    self.assertEmpty(created)
+    stream.close()
+
+  def test_error_is_raised_by_read(self):
+
+    def new_stream():
+      raise ValueError('no stream')
+
+    first = io.BytesIO(b'0123456789')
+    stream = _parallel_streams.ParallelDecryptingStream(
+        first, new_stream, 4, 2, 8)
+    with self.assertRaisesRegex(ValueError, 'no stream'):
+      stream.read(4)
+    stream.close()
+
+  def test_closed_methods_raise(self):
+    stream, _, _ = self._new_stream(b'abc')
+    stream.close()
+    with self.assertRaisesRegex(ValueError, 'closed'):
+      stream.read(1)
+    with self.assertRaisesRegex(ValueError, 'closed'):
+      stream.readall()
+
+  def test_invalid_arguments_fail(self):
+    with self.assertRaises(ValueError):
+      _parallel_streams.ParallelDecryptingStream(
+          io.BytesIO(), io.BytesIO, 0, 1, 1)
+    with self.assertRaises(ValueError):
+      _parallel_streams.ParallelDecryptingStream(
+          io.BytesIO(), io.BytesIO, 1, 0, 1)
+    with self.assertRaises(ValueError):
+      _parallel_streams.ParallelDecryptingStream(
+          io.BytesIO(), io.BytesIO, 1, 1, 0)
+
+
+if __name__ == '__main__':
+  absltest.main()
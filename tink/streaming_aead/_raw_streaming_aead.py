@@ -74,7 +74,8 @@ class RawStreamingAead(metaclass=abc.ABCMeta):
       self,
       ciphertext_source: BinaryIO,
       associated_data: bytes,
-      close_ciphertext_source: bool) -> io.RawIOBase:
+      close_ciphertext_source: bool,
+      read_ahead_size: int = 0) -> io.RawIOBase:
     """Returns a raw decrypting stream that reads from ciphertext_source.
 
     The returned stream implements a readable io.RawIOBase interface. Users
@@ -86,7 +87,9 @@ class RawStreamingAead(metaclass=abc.ABCMeta):
     at EOF yet but no data is available at the moment, it is expected to either
     block until data is available, return None or raise a BlockingIOError.
     The standard io.BufferedIOBase and io.RawIOBase base classes exhibit these
-    behaviours and are hence supported.
+    behaviours and are hence supported. The returned stream waits until data
+    is available, unless ciphertext_source has a true nonblocking attribute:
+    then its reads return None while no data is available.
 
     Args:
       ciphertext_source: A readable binary file object from which ciphertext
@@ -95,6 +98,8 @@ class RawStreamingAead(metaclass=abc.ABCMeta):
         must match the associated_data supplied for the encryption.
       close_ciphertext_source: Whether ciphertext_source should be closed when
       close() is called.
+      read_ahead_size: The number of bytes requested from ciphertext_source by
+        each read, or 0 for the default of the implementation.
 
     Returns:
       A readable implementation of the io.RawIOBase interface that wraps around
@@ -104,3 +109,55 @@ class RawStreamingAead(metaclass=abc.ABCMeta):
       tink.TinkError if the creation fails.
     """
     raise NotImplementedError()
+
+  def new_raw_seekable_decrypting_stream(
+      self,
+      ciphertext_source: BinaryIO,
+      associated_data: bytes,
+      close_ciphertext_source: bool,
+      ciphertext_offset: int = 0) -> io.RawIOBase:
+    """Returns a seekable raw decrypting stream over ciphertext_source.
+
+    Unlike new_raw_decrypting_stream, the returned stream supports seek() and
+    tell(), and a read only decrypts the segments of the ciphertext that hold
+    the requested plaintext. ciphertext_source is accessed at absolute
+    positions and its own position is not relied upon.
+
+    Args:
+      ciphertext_source: A readable and seekable binary file object from which
+        ciphertext will be read, for example a file or an mmap.mmap.
+      associated_data: Associated data to be used by the AEAD decryption. It
+        must match the associated_data supplied for the encryption.
+      close_ciphertext_source: Whether ciphertext_source should be closed when
+      close() is called.
+      ciphertext_offset: The position in ciphertext_source at which the
+        ciphertext starts.
+
+    Returns:
+      A readable and seekable implementation of the io.RawIOBase interface.
+    Raises:
+      tink.TinkError if the creation fails.
+      NotImplementedError if the implementation does not support random access.
+    """
+    raise NotImplementedError()
+
+  def ciphertext_size(self, plaintext_size: int) -> int:
+    """Returns the size of the ciphertext of plaintext_size bytes of plaintext.
+
+    Args:
+      plaintext_size: The size of the plaintext in bytes.
+
+    Returns:
+      The size of the ciphertext written by a raw encrypting stream.
+    Raises:
+      NotImplementedError if the implementation does not know the size.
+    """
+    raise NotImplementedError()
+
+  def ciphertext_segment_size(self) -> int:
+    """Returns the size of the ciphertext segments in bytes.
+
+    Raises:
+      NotImplementedError if the implementation does not know the size.
+    """
+    raise NotImplementedError()
@@ -21,16 +21,83 @@ class RewindableInputStream(io.RawIOBase):
   """Implements a readable io.RawIOBase wrapper that supports rewinding.
 
   The wrapped input_stream can either be a io.RawIOBase or io.BufferedIOBase.
+
+  The bytes read from input_stream are buffered until disable_rewind() is
+  called. If rewind_window_size is set, at most that many bytes are buffered:
+  once more bytes are read, the buffer is freed and rewind() fails.
   """
 
-  def __init__(self, input_stream: BinaryIO):
+  def __init__(self, input_stream: BinaryIO,
+               rewind_window_size: Optional[int] = None):
+    """Create a new RewindableInputStream.
+
+    Args:
+      input_stream: The readable file object to wrap.
+      rewind_window_size: The maximum number of bytes that can be read before
+        rewind() is called, or None for no limit.
+    """
     super().__init__()
     if not input_stream.readable():
       raise ValueError('input_stream must be readable')
+    if rewind_window_size is not None and rewind_window_size < 0:
+      raise ValueError('rewind_window_size must not be negative')
     self._input_stream = input_stream
+    # Set to None once input_stream turns out not to support readinto.
+    self._input_readinto = getattr(input_stream, 'readinto', None)
+    self._rewind_window_size = rewind_window_size
     self._buffer = bytearray()
     self._pos = 0
     self._rewindable = True
+    self._window_exceeded = False
+    self._peak_buffered_bytes = 0
+
+  @property
+  def nonblocking(self) -> bool:
+    """Whether input_stream asks its readers not to wait for data."""
+    return bool(getattr(self._input_stream, 'nonblocking', False))
+
+  @property
+  def peak_buffered_bytes(self) -> int:
+    """The largest number of bytes which were buffered for rewinding."""
+    return self._peak_buffered_bytes
+
+  def _read_from_buffer(self, size: int) -> memoryview:
+    """Returns a view of up to size bytes of the buffer, without copying.
+
+    The caller must release the returned view, since the buffer can not be
+    resized while it exists.
+
+    Args:
+      size: The maximum number of bytes to return.
+    """
+    new_pos = min(len(self._buffer), self._pos + size)
+    with memoryview(self._buffer) as view:
+      data = view[self._pos:new_pos]
+    self._pos = new_pos
+    return data
+
+  def _free_buffer_if_unused(self) -> None:
+    if not self._rewindable and self._buffer:
+      # buffer is not needed anymore
+      self._buffer = bytearray()
+      self._pos = 0
+
+  def _add_to_buffer(self, data) -> None:
+    """Appends data, which was read from input_stream, to the buffer."""
+    if not self._rewindable:
+      return
+    if (self._rewind_window_size is not None and
+        len(self._buffer) + len(data) > self._rewind_window_size):
+      # The data before data can not be replayed completely anymore.
+      self._window_exceeded = True
+      self._rewindable = False
+      self._buffer = bytearray()
+      self._pos = 0
+      return
+    self._buffer.extend(data)
+    self._pos += len(data)
+    self._peak_buffered_bytes = max(self._peak_buffered_bytes,
+                                    len(self._buffer))
 
   def read(self, size: int = -1) -> Optional[bytes]:
     """Read and return up to size bytes when size >= 0.
@@ -50,15 +117,10 @@ class RewindableInputStream(io.RawIOBase):
       return self.readall()  # implemented in io.RawIOBase
     if self._pos < len(self._buffer):
       # buffer has some data left. Return up to 'size' bytes from the buffer
-      new_pos = min(len(self._buffer), self._pos + size)
-      b = self._buffer[self._pos:new_pos]
-      self._pos = new_pos
-      return bytes(b)
+      with self._read_from_buffer(size) as data:
+        return bytes(data)
     # no data left in buffer
-    if not self._rewindable and self._buffer:
-      # buffer is not needed anymore
-      self._buffer = bytearray()
-      self._pos = 0
+    self._free_buffer_if_unused()
     try:
       data = self._input_stream.read(size)
     except BlockingIOError:
@@ -67,12 +129,52 @@ class RewindableInputStream(io.RawIOBase):
     if data is None:
       # self._input_stream is a RawIOBase and has currently no data
       return None
-    if self._rewindable:
-      self._buffer.extend(data)
-      self._pos += len(data)
+    self._add_to_buffer(data)
     return data
 
+  # b has type "Buffer", which is not yet supported by pytype.
+  def readinto(self, b) -> Optional[int]:  # pyrefly: ignore[bad-override]
+    """Read bytes into a pre-allocated bytes-like object b.
+
+    Buffered bytes are copied into b directly from the buffer. Once they are
+    consumed, it reads from input_stream directly into b if input_stream
+    supports readinto.
+
+    Args:
+      b: Writable bytes-like object to which data will be read.
+    Returns:
+      Number of bytes read. 0 is returned on EOF, and None if there is
+      currently no data available, but EOF is not reached yet.
+    """
+    view = memoryview(b).cast('B')
+    if self._pos < len(self._buffer):
+      with self._read_from_buffer(len(view)) as data:
+        view[:len(data)] = data
+        return len(data)
+    if self._input_readinto is None:
+      data = self.read(len(view))
+      if data is None:
+        return None
+      view[:len(data)] = data
+      return len(data)
+    self._free_buffer_if_unused()
+    try:
+      n = self._input_readinto(view)
+    except BlockingIOError:
+      # self._input_stream is a BufferedIOBase and has currently no data
+      return None
+    except (NotImplementedError, io.UnsupportedOperation):
+      self._input_readinto = None
+      return self.readinto(view)
+    if n:
+      self._add_to_buffer(view[:n])
+    return n
+
   def rewind(self) -> None:
+    if self._window_exceeded:
+      raise ValueError(
+          'rewind is not possible, more than {} bytes were read'.format(
+              self._rewind_window_size))
     if not self._rewindable:
       raise ValueError('rewind is disabled')
     self._pos = 0
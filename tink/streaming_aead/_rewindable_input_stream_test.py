@@ -113,6 +113,82 @@ class RewindableInputStreamTest(parameterized.TestCase):
       f.disable_rewind()
       self.assertEqual(b'The quick brown fox', f.read())
 
+  @parameterized.parameters([False, True])
+  def test_readinto_rewind(self, seekable):
+    with _rewindable(b'The quick brown fox', seekable) as f:
+      buffer = bytearray(6)
+      self.assertEqual(f.readinto(buffer), 6)
+      self.assertEqual(buffer, b'The qu')
+      f.rewind()
+      self.assertEqual(f.readinto(memoryview(buffer)[:4]), 4)
+      self.assertEqual(buffer[:4], b'The ')
+      f.disable_rewind()
+      self.assertEqual(f.readinto(buffer), 2)
+      self.assertEqual(buffer[:2], b'qu')
+      self.assertEqual(f.readinto(buffer), 6)
+      self.assertEqual(buffer, b'ick br')
+      self.assertEqual(f.read(), b'own fox')
+      self.assertEqual(f.readinto(buffer), 0)
+
+  def test_readinto_slow_raw(self):
+    input_stream = bytes_io.SlowReadableRawBytes(b'The quick brown fox')
+    with _rewindable_input_stream.RewindableInputStream(
+        cast(BinaryIO, input_stream)) as f:
+      buffer = bytearray(100)
+      output = bytearray()
+      while True:
+        n = f.readinto(buffer)
+        if n == 0:
+          break
+        if n is not None:
+          output += buffer[:n]
+      self.assertEqual(output, b'The quick brown fox')
+      f.rewind()
+      self.assertEqual(f.read(), b'The quick brown fox')
+
+  @parameterized.parameters([False, True])
+  def test_rewind_window(self, seekable):
+    b = io.BytesIO(b'The quick brown fox')
+    if not seekable:
+      b = NonSeekableBytesIO(b'The quick brown fox')
+    with _rewindable_input_stream.RewindableInputStream(
+        cast(BinaryIO, b), rewind_window_size=10) as f:
+      self.assertEqual(f.read(4), b'The ')
+      self.assertEqual(f.readinto(bytearray(6)), 6)
+      f.rewind()
+      self.assertEqual(f.read(4), b'The ')
+      self.assertEqual(f.peak_buffered_bytes, 10)
+      self.assertEqual(f.read(6), b'quick ')
+      # This read exceeds the window, so the buffer is freed.
+      self.assertEqual(f.read(5), b'brown')
+      self.assertEmpty(f._buffer)
+      with self.assertRaisesRegex(ValueError, 'more than 10 bytes'):
+        f.rewind()
+      self.assertEqual(f.read(), b' fox')
+      self.assertEqual(f.peak_buffered_bytes, 10)
+
+  def test_rewind_window_readinto(self):
+    with _rewindable(b'The quick brown fox', False) as f:
+      self.assertEqual(f.peak_buffered_bytes, 0)
+    with _rewindable_input_stream.RewindableInputStream(
+        cast(BinaryIO, io.BytesIO(b'The quick brown fox')),
+        rewind_window_size=5) as f:
+      buffer = bytearray(4)
+      self.assertEqual(f.readinto(buffer), 4)
+      f.rewind()
+      self.assertEqual(f.readinto(buffer), 4)
+      self.assertEqual(f.readinto(buffer), 4)
+      self.assertEqual(buffer, b'quic')
+      with self.assertRaises(ValueError):
+        f.rewind()
+      self.assertEqual(f.read(), b'k brown fox')
+      self.assertEqual(f.peak_buffered_bytes, 4)
+
+  def test_negative_rewind_window_fails(self):
+    with self.assertRaises(ValueError):
+      _rewindable_input_stream.RewindableInputStream(
+          cast(BinaryIO, io.BytesIO(b'')), rewind_window_size=-1)
+
   def test_nonreadable_input_fail(self):
     with tempfile.TemporaryFile('wb') as f:
       with self.assertRaises(ValueError):
@@ -14,7 +14,13 @@
 """This module defines the interface for Streaming AEAD."""
 
 import abc
-from typing import BinaryIO
+import io
+from typing import BinaryIO, Iterable, Iterator
+
+from tink.streaming_aead import _chunk_io
+
+# The maximum size of the plaintext chunks returned by decrypt_iter.
+DECRYPT_ITER_CHUNK_SIZE = 64 * 1024
 
 
 class StreamingAead(metaclass=abc.ABCMeta):
@@ -98,3 +104,100 @@ class StreamingAead(metaclass=abc.ABCMeta):
       tink.TinkError if the creation fails.
     """
     raise NotImplementedError()
+
+  def new_seekable_decrypting_stream(self, ciphertext_source: BinaryIO,
+                                     associated_data: bytes) -> io.RawIOBase:
+    """Returns a seekable decrypting stream that reads from ciphertext_source.
+
+    The returned stream implements a readable and seekable io.RawIOBase
+    interface. A read decrypts only the segments of the ciphertext that contain
+    the requested plaintext, so parts of a large ciphertext, for example the
+    footer of a file, can be read without decrypting everything before them.
+    For buffered reads, it can be wrapped with io.BufferedReader.
+
+    ciphertext_source is read at absolute positions, so it must be seekable,
+    for example a file opened in binary mode or an mmap.mmap.
+
+    Args:
+      ciphertext_source: A readable and seekable binary file object from which
+        ciphertext will be read.
+      associated_data: Associated data to be used by the AEAD decryption. It
+        must match the associated_data supplied for the encryption.
+
+    Returns:
+      A readable and seekable implementation of the io.RawIOBase interface
+      that wraps around 'ciphertext_source', such that any bytes read from the
+      wrapper are AEAD-decrypted using 'associated_data' as associated
+      authenticated data.
+      Closing the wrapper also closes the ciphertext_source.
+    Raises:
+      tink.TinkError if the creation fails.
+      ValueError if ciphertext_source is not readable and seekable.
+      NotImplementedError if the implementation does not support random access.
+    """
+    raise NotImplementedError()
+
+  def ciphertext_size(self, plaintext_size: int) -> int:
+    """Returns the size of the ciphertext of plaintext_size bytes of plaintext.
+
+    This can be used to preallocate the destination of new_encrypting_stream,
+    see also streaming_aead.ciphertext_size_for.
+
+    Args:
+      plaintext_size: The size of the plaintext in bytes.
+
+    Returns:
+      The size of the ciphertext in bytes.
+    Raises:
+      NotImplementedError if the size of the ciphertext is not known.
+    """
+    raise NotImplementedError()
+
+  def encrypt_iter(self, chunks: Iterable[bytes],
+                   associated_data: bytes) -> Iterator[bytes]:
+    """Encrypts an iterable of plaintext chunks and yields ciphertext chunks.
+
+    The chunks are encrypted lazily: a plaintext chunk is only taken from
+    chunks when the ciphertext of the previous one has been consumed, so the
+    memory used does not depend on the length of the plaintext. The
+    ciphertext is the same as the one written by new_encrypting_stream.
+
+    Args:
+      chunks: An iterable of bytes-like objects, the plaintext.
+      associated_data: Associated data to be used by the AEAD encryption.
+
+    Yields:
+      The chunks of the ciphertext. Their sizes do not match the sizes of the
+      plaintext chunks.
+    Raises:
+      tink.TinkError if the encryption fails.
+    """
+    sink = _chunk_io.ChunkSink()
+    with self.new_encrypting_stream(sink, associated_data) as es:
+      for chunk in chunks:
+        es.write(chunk)
+        yield from sink.take()
+    yield from sink.take()
+
+  def decrypt_iter(self, chunks: Iterable[bytes],
+                   associated_data: bytes) -> Iterator[bytes]:
+    """Decrypts an iterable of ciphertext chunks and yields plaintext chunks.
+
+    Like for new_decrypting_stream, plaintext is only returned after it was
+    authenticated, but a TinkError can be raised after some chunks were
+    yielded if the ciphertext was modified or truncated.
+
+    Args:
+      chunks: An iterable of bytes-like objects, the ciphertext.
+      associated_data: Associated data to be used by the AEAD decryption. It
+        must match the associated_data supplied for the encryption.
+
+    Yields:
+      The chunks of the plaintext, of at most DECRYPT_ITER_CHUNK_SIZE bytes.
+    Raises:
+      tink.TinkError if the decryption fails.
+    """
+    with self.new_decrypting_stream(
+        _chunk_io.ChunkSource(chunks), associated_data) as ds:
+      while data := ds.read(DECRYPT_ITER_CHUNK_SIZE):
+        yield data
@@ -14,21 +14,27 @@
 """Python wrapper of the wrapped C++ Streaming AEAD key manager."""
 
 import io
-from typing import BinaryIO
+from typing import BinaryIO, Optional
 
 from tink import core
 from tink.cc.pybind import tink_bindings
+from tink.proto import tink_pb2
 from tink.streaming_aead import _decrypting_stream
 from tink.streaming_aead import _encrypting_stream
 from tink.streaming_aead import _raw_streaming_aead
+from tink.streaming_aead import _streaming_aead_parameters
 from tink.streaming_aead import _streaming_aead_wrapper
 
 
 class _StreamingAeadCcToPyWrapper(_raw_streaming_aead.RawStreamingAead):
   """Transforms C++ StreamingAead into a RawStreamingAead Python primitive."""
 
-  def __init__(self, cc_streaming_aead: tink_bindings.StreamingAead):
+  def __init__(
+      self,
+      cc_streaming_aead: tink_bindings.StreamingAead,
+      params: Optional[_streaming_aead_parameters.StreamingParams] = None):
     self._cc_streaming_aead = cc_streaming_aead
+    self._params = params
 
   def new_raw_encrypting_stream(self, ciphertext_destination: BinaryIO,
                                 associated_data: bytes) -> io.RawIOBase:
@@ -40,32 +46,78 @@ class _StreamingAeadCcToPyWrapper(_raw_streaming_aead.RawStreamingAead):
       self,
       ciphertext_source: BinaryIO,
       associated_data: bytes,
-      close_ciphertext_source: bool) -> io.RawIOBase:
+      close_ciphertext_source: bool,
+      read_ahead_size: int = 0) -> io.RawIOBase:
     return _decrypting_stream.RawDecryptingStream(
         self._cc_streaming_aead,
         ciphertext_source,
         associated_data,
-        close_ciphertext_source=close_ciphertext_source)
+        close_ciphertext_source=close_ciphertext_source,
+        read_ahead_size=read_ahead_size)
+
+  def new_raw_seekable_decrypting_stream(
+      self,
+      ciphertext_source: BinaryIO,
+      associated_data: bytes,
+      close_ciphertext_source: bool,
+      ciphertext_offset: int = 0) -> io.RawIOBase:
+    return _decrypting_stream.RawSeekableDecryptingStream(
+        self._cc_streaming_aead,
+        ciphertext_source,
+        associated_data,
+        close_ciphertext_source=close_ciphertext_source,
+        ciphertext_offset=ciphertext_offset)
+
+  def ciphertext_size(self, plaintext_size: int) -> int:
+    if self._params is None:
+      raise NotImplementedError()
+    return _streaming_aead_parameters.ciphertext_size_for(
+        self._params, plaintext_size)
+
+  def ciphertext_segment_size(self) -> int:
+    if self._params is None:
+      raise NotImplementedError()
+    return self._params.ciphertext_segment_size
+
+
+class _StreamingAeadKeyManager(
+    core.KeyManagerCcToPyWrapper[_raw_streaming_aead.RawStreamingAead]):
+  """Passes the parameters of the keys to the primitives."""
+
+  def __init__(self, type_url: str):
+    super().__init__(
+        tink_bindings.StreamingAeadKeyManager.from_cc_registry(type_url),
+        _raw_streaming_aead.RawStreamingAead, _StreamingAeadCcToPyWrapper)
+
+  @core.use_tink_errors
+  def primitive(
+      self,
+      key_data: tink_pb2.KeyData) -> _raw_streaming_aead.RawStreamingAead:
+    cc_streaming_aead = self._cc_key_manager.primitive(
+        key_data.SerializeToString())
+    return _StreamingAeadCcToPyWrapper(
+        cc_streaming_aead,
+        _streaming_aead_parameters.params_from_key_data(key_data))
 
 
 def from_cc_registry(
     type_url: str) -> core.KeyManager[_raw_streaming_aead.RawStreamingAead]:
-  return core.KeyManagerCcToPyWrapper(
-      tink_bindings.StreamingAeadKeyManager.from_cc_registry(type_url),
-      _raw_streaming_aead.RawStreamingAead, _StreamingAeadCcToPyWrapper)
+  return _StreamingAeadKeyManager(type_url)
 
 
 def register() -> None:
-  """Registers Streaming AEAD key managers and the wrapper in the Registry."""
+  """Registers Streaming AEAD key managers and the wrapper in the Registry.
+
+  The options of the StreamingAead primitives, such as parallel decryption,
+  are set per primitive with streaming_aead.with_options.
+  """
   tink_bindings.register()
   for ident in (
       'AesCtrHmacStreamingKey',
       'AesGcmHkdfStreamingKey',
   ):
     type_url = 'type.googleapis.com/google.crypto.tink.{}'.format(ident)
-    key_manager = core.KeyManagerCcToPyWrapper(
-        tink_bindings.StreamingAeadKeyManager.from_cc_registry(type_url),
-        _raw_streaming_aead.RawStreamingAead, _StreamingAeadCcToPyWrapper)
+    key_manager = _StreamingAeadKeyManager(type_url)
     core.Registry.register_key_manager(key_manager, new_key_allowed=True)
   core.Registry.register_primitive_wrapper(
       _streaming_aead_wrapper.StreamingAeadWrapper())
@@ -13,6 +13,7 @@
 # limitations under the License.
 """Tests for tink.python.tink.streaming_aead_key_manager."""
 
+import array
 import io
 
 from absl.testing import absltest
@@ -148,6 +149,81 @@ class StreamingAeadKeyManagerTest(parameterized.TestCase):
       self.assertEqual(n, 4)
       self.assertEqual(data, b'textn')
 
+  def test_raw_encrypt_decrypt_readinto_buffers(self):
+    raw_primitive = new_raw_primitive()
+    plaintext = bytes(range(200)) * 100
+    aad = b'aad'
+
+    ct_destination = bytes_io.BytesIOWithValueAfterClose()
+    with raw_primitive.new_raw_encrypting_stream(ct_destination, aad) as es:
+      es.write(plaintext)
+    ciphertext = ct_destination.value_after_close()
+
+    for buffer in [bytearray(1000), memoryview(bytearray(1000)),
+                   array.array('B', bytes(1000))]:
+      ct_source = io.BytesIO(ciphertext)
+      output = bytearray()
+      with raw_primitive.new_raw_decrypting_stream(
+          ct_source, aad, close_ciphertext_source=True) as ds:
+        while n := ds.readinto(buffer):
+          output += memoryview(buffer)[:n]
+        self.assertEqual(ds.readinto(buffer), 0)
+        self.assertEqual(ds.readinto(bytearray()), 0)
+      self.assertEqual(output, plaintext)
+
+  @parameterized.parameters([1, 100, 1000, 1 << 20])
+  def test_raw_decrypt_read_ahead_size(self, read_ahead_size):
+    raw_primitive = new_raw_primitive()
+    plaintext = bytes(range(200)) * 100
+
+    ct_destination = bytes_io.BytesIOWithValueAfterClose()
+    with raw_primitive.new_raw_encrypting_stream(ct_destination, b'aad') as es:
+      es.write(plaintext)
+
+    for ct_source in [
+        io.BytesIO(ct_destination.value_after_close()),
+        bytes_io.SlowReadableRawBytes(ct_destination.value_after_close())
+    ]:
+      with raw_primitive.new_raw_decrypting_stream(
+          ct_source, b'aad', close_ciphertext_source=True,
+          read_ahead_size=read_ahead_size) as ds:
+        self.assertEqual(ds.readall(), plaintext)
+
+  def test_raw_decrypt_negative_read_ahead_size_fails(self):
+    raw_primitive = new_raw_primitive()
+    with self.assertRaises(ValueError):
+      raw_primitive.new_raw_decrypting_stream(
+          io.BytesIO(b'ciphertext'), b'aad', close_ciphertext_source=True,
+          read_ahead_size=-1)
+
+  def test_ciphertext_segment_size(self):
+    self.assertEqual(new_raw_primitive().ciphertext_segment_size(), 4096)
+    key_data = core.Registry.new_key_data(
+        streaming_aead.streaming_aead_key_templates.AES256_GCM_HKDF_1MB)
+    raw_primitive = core.Registry.primitive(
+        key_data, _raw_streaming_aead.RawStreamingAead)
+    self.assertEqual(raw_primitive.ciphertext_segment_size(), 1024 * 1024)
+
+  def test_raw_readinto_closed_fails(self):
+    raw_primitive = new_raw_primitive()
+    ds = raw_primitive.new_raw_decrypting_stream(
+        io.BytesIO(b'ciphertext'), b'aad', close_ciphertext_source=True)
+    ds.close()
+    with self.assertRaisesRegex(ValueError, 'closed'):
+      ds.readinto(bytearray(10))
+
+  def test_raw_readinto_wrong_aad_fails(self):
+    raw_primitive = new_raw_primitive()
+    ct_destination = bytes_io.BytesIOWithValueAfterClose()
+    with raw_primitive.new_raw_encrypting_stream(ct_destination, b'aad') as es:
+      es.write(b'plaintext')
+
+    with raw_primitive.new_raw_decrypting_stream(
+        io.BytesIO(ct_destination.value_after_close()), b'bad aad',
+        close_ciphertext_source=True) as ds:
+      with self.assertRaises(core.TinkError):
+        ds.readinto(bytearray(10))
+
   def test_raw_encrypt_decrypt_empty(self):
     raw_primitive = new_raw_primitive()
     plaintext = b''
@@ -221,6 +297,55 @@ class StreamingAeadKeyManagerTest(parameterized.TestCase):
       with self.assertRaises(core.TinkError):
         ds.read()
 
+  def test_raw_seekable_decrypt_seek_and_read(self):
+    raw_primitive = new_raw_primitive()
+    plaintext = bytes(range(256)) * 100
+    aad = b'aad'
+
+    ct_destination = bytes_io.BytesIOWithValueAfterClose()
+    with raw_primitive.new_raw_encrypting_stream(ct_destination, aad) as es:
+      es.write(plaintext)
+
+    for close_ciphertext_source in [True, False]:
+      ct_source = io.BytesIO(ct_destination.value_after_close())
+      with raw_primitive.new_raw_seekable_decrypting_stream(
+          ct_source, aad,
+          close_ciphertext_source=close_ciphertext_source) as ds:
+        self.assertEqual(ds.seek(0, io.SEEK_END), len(plaintext))
+        self.assertEqual(ds.read(10), b'')
+        self.assertEqual(ds.seek(-10, io.SEEK_END), len(plaintext) - 10)
+        self.assertEqual(ds.read(), plaintext[-10:])
+        self.assertEqual(ds.seek(10000), 10000)
+        self.assertEqual(ds.read(5000), plaintext[10000:15000])
+        self.assertEqual(ds.tell(), 15000)
+        self.assertEqual(ds.seek(-15000, io.SEEK_CUR), 0)
+        self.assertEqual(ds.readall(), plaintext)
+      self.assertEqual(ct_source.closed, close_ciphertext_source)
+
+  def test_raw_seekable_decrypt_empty(self):
+    raw_primitive = new_raw_primitive()
+    ct_destination = bytes_io.BytesIOWithValueAfterClose()
+    with raw_primitive.new_raw_encrypting_stream(ct_destination, b'') as es:
+      es.write(b'')
+
+    ct_source = io.BytesIO(ct_destination.value_after_close())
+    with raw_primitive.new_raw_seekable_decrypting_stream(
+        ct_source, b'', close_ciphertext_source=True) as ds:
+      self.assertEqual(ds.read(5), b'')
+      self.assertEqual(ds.seek(0, io.SEEK_END), 0)
+
+  def test_raw_seekable_decrypt_wrong_aad(self):
+    raw_primitive = new_raw_primitive()
+    ct_destination = bytes_io.BytesIOWithValueAfterClose()
+    with raw_primitive.new_raw_encrypting_stream(ct_destination, b'aad') as es:
+      es.write(b'plaintext')
+
+    ct_source = io.BytesIO(ct_destination.value_after_close())
+    with raw_primitive.new_raw_seekable_decrypting_stream(
+        ct_source, b'bad aad', close_ciphertext_source=True) as ds:
+      with self.assertRaises(core.TinkError):
+        ds.read()
+
   @parameterized.parameters([
       streaming_aead.streaming_aead_key_templates.AES128_GCM_HKDF_4KB,
       streaming_aead.streaming_aead_key_templates.AES128_GCM_HKDF_1MB,
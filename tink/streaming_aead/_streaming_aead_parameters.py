@@ -0,0 +1,98 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Properties of ciphertexts that follow from the streaming key parameters."""
+
+from typing import Union
+
+from tink.proto import aes_ctr_hmac_streaming_pb2
+from tink.proto import aes_gcm_hkdf_streaming_pb2
+from tink.proto import tink_pb2
+
+_AES_GCM_HKDF_STREAMING_KEY_TYPE_URL = (
+    'type.googleapis.com/google.crypto.tink.AesGcmHkdfStreamingKey')
+_AES_CTR_HMAC_STREAMING_KEY_TYPE_URL = (
+    'type.googleapis.com/google.crypto.tink.AesCtrHmacStreamingKey')
+
+# The header of a ciphertext is its length byte, a salt of derived_key_size
+# bytes and the nonce prefix.
+_NONCE_PREFIX_SIZE = 7
+_GCM_TAG_SIZE = 16
+
+StreamingParams = Union[aes_gcm_hkdf_streaming_pb2.AesGcmHkdfStreamingParams,
+                        aes_ctr_hmac_streaming_pb2.AesCtrHmacStreamingParams]
+
+
+def params_from_key_template(
+    key_template: tink_pb2.KeyTemplate) -> StreamingParams:
+  """Returns the parameters of the keys generated from key_template."""
+  if key_template.type_url == _AES_GCM_HKDF_STREAMING_KEY_TYPE_URL:
+    return aes_gcm_hkdf_streaming_pb2.AesGcmHkdfStreamingKeyFormat.FromString(
+        key_template.value).params
+  if key_template.type_url == _AES_CTR_HMAC_STREAMING_KEY_TYPE_URL:
+    return aes_ctr_hmac_streaming_pb2.AesCtrHmacStreamingKeyFormat.FromString(
+        key_template.value).params
+  raise ValueError('unsupported key type: {}'.format(key_template.type_url))
+
+
+def params_from_key_data(key_data: tink_pb2.KeyData) -> StreamingParams:
+  """Returns the parameters of the streaming key in key_data."""
+  if key_data.type_url == _AES_GCM_HKDF_STREAMING_KEY_TYPE_URL:
+    return aes_gcm_hkdf_streaming_pb2.AesGcmHkdfStreamingKey.FromString(
+        key_data.value).params
+  if key_data.type_url == _AES_CTR_HMAC_STREAMING_KEY_TYPE_URL:
+    return aes_ctr_hmac_streaming_pb2.AesCtrHmacStreamingKey.FromString(
+        key_data.value).params
+  raise ValueError('unsupported key type: {}'.format(key_data.type_url))
+
+
+def ciphertext_size_for(params: Union[StreamingParams, tink_pb2.KeyTemplate],
+                        plaintext_size: int) -> int:
+  """Returns the size of the ciphertext of a plaintext of plaintext_size bytes.
+
+  The size is the same for all keys with these parameters, so it can be used
+  to preallocate the destination of an encryption.
+
+  Args:
+    params: The AesGcmHkdfStreamingParams or AesCtrHmacStreamingParams of the
+      encrypting key, or the key template from which it was generated.
+    plaintext_size: The size of the plaintext in bytes.
+
+  Returns:
+    The size of the ciphertext in bytes.
+
+  Raises:
+    ValueError if plaintext_size is negative or the parameters are invalid.
+  """
+  if isinstance(params, tink_pb2.KeyTemplate):
+    params = params_from_key_template(params)
+  if plaintext_size < 0:
+    raise ValueError('plaintext_size must be non-negative')
+  if isinstance(params, aes_gcm_hkdf_streaming_pb2.AesGcmHkdfStreamingParams):
+    tag_size = _GCM_TAG_SIZE
+  else:
+    tag_size = params.hmac_params.tag_size
+  header_size = 1 + params.derived_key_size + _NONCE_PREFIX_SIZE
+  segment_size = params.ciphertext_segment_size
+  if segment_size <= header_size + tag_size:
+    raise ValueError('ciphertext_segment_size is too small')
+  # The header takes the place of plaintext in the first segment. Every
+  # segment is followed by a tag, and only the last one may be shorter.
+  full_segments, rest = divmod(header_size + plaintext_size,
+                               segment_size - tag_size)
+  size = full_segments * segment_size
+  if rest:
+    size += rest + tag_size
+  return size
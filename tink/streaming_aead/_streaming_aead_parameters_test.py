@@ -0,0 +1,110 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for tink.python.tink.streaming_aead._streaming_aead_parameters."""
+
+from absl.testing import absltest
+from absl.testing import parameterized
+
+from tink.proto import aes_gcm_hkdf_streaming_pb2
+from tink.proto import tink_pb2
+import tink
+from tink import aead
+from tink import streaming_aead
+from tink.streaming_aead import _streaming_aead_parameters
+from tink.testing import bytes_io
+
+TEMPLATES = streaming_aead.streaming_aead_key_templates
+
+# Sizes around the segment boundaries of the 4 KB templates. The first segment
+# holds 4024 to 4056 bytes of plaintext, depending on the header and tag sizes
+# of the template, and the following segments 4064 or 4080 bytes.
+PLAINTEXT_SIZES = [0, 1, 4023, 4024, 4025, 4040, 4041, 4055, 4056, 4057,
+                   8104, 8105, 8136, 8137, 100 * 1000]
+
+
+def setUpModule():
+  streaming_aead.register()
+  aead.register()
+
+
+def _ciphertext_size(primitive: streaming_aead.StreamingAead,
+                     plaintext_size: int) -> int:
+  dest = bytes_io.BytesIOWithValueAfterClose()
+  with primitive.new_encrypting_stream(dest, b'aad') as es:
+    es.write(b'x' * plaintext_size)
+  return len(dest.value_after_close())
+
+
+class StreamingAeadParametersTest(parameterized.TestCase):
+
+  @parameterized.parameters([
+      TEMPLATES.AES128_GCM_HKDF_4KB,
+      TEMPLATES.AES256_GCM_HKDF_4KB,
+      TEMPLATES.AES128_CTR_HMAC_SHA256_4KB,
+      TEMPLATES.AES256_CTR_HMAC_SHA256_4KB,
+  ])
+  def test_ciphertext_size_for(self, template):
+    primitive = tink.new_keyset_handle(template).primitive(
+        streaming_aead.StreamingAead)
+    params = _streaming_aead_parameters.params_from_key_template(template)
+    for plaintext_size in PLAINTEXT_SIZES:
+      expected = _ciphertext_size(primitive, plaintext_size)
+      self.assertEqual(
+          streaming_aead.ciphertext_size_for(params, plaintext_size), expected)
+      self.assertEqual(
+          streaming_aead.ciphertext_size_for(template, plaintext_size),
+          expected)
+      self.assertEqual(primitive.ciphertext_size(plaintext_size), expected)
+
+  def test_ciphertext_size_for_1mb_segments(self):
+    template = TEMPLATES.AES256_GCM_HKDF_1MB
+    primitive = tink.new_keyset_handle(template).primitive(
+        streaming_aead.StreamingAead)
+    for plaintext_size in [0, 1048520, 1048521, 3 * 1024 * 1024]:
+      self.assertEqual(
+          streaming_aead.ciphertext_size_for(template, plaintext_size),
+          _ciphertext_size(primitive, plaintext_size))
+
+  def test_ciphertext_size_with_key_id_header(self):
+    primitive = streaming_aead.with_options(
+        tink.new_keyset_handle(TEMPLATES.AES128_GCM_HKDF_4KB).primitive(
+            streaming_aead.StreamingAead),
+        key_id_header=True)
+    for plaintext_size in [0, 5000]:
+      self.assertEqual(
+          primitive.ciphertext_size(plaintext_size),
+          _ciphertext_size(primitive, plaintext_size))
+
+  def test_negative_plaintext_size_fails(self):
+    with self.assertRaises(ValueError):
+      streaming_aead.ciphertext_size_for(TEMPLATES.AES128_GCM_HKDF_4KB, -1)
+
+  def test_too_small_segment_size_fails(self):
+    params = aes_gcm_hkdf_streaming_pb2.AesGcmHkdfStreamingParams(
+        ciphertext_segment_size=40, derived_key_size=16)
+    with self.assertRaises(ValueError):
+      streaming_aead.ciphertext_size_for(params, 0)
+
+  def test_unsupported_key_template_fails(self):
+    with self.assertRaises(ValueError):
+      streaming_aead.ciphertext_size_for(aead.aead_key_templates.AES128_GCM, 0)
+    with self.assertRaises(ValueError):
+      _streaming_aead_parameters.params_from_key_data(
+          tink_pb2.KeyData(type_url='type.googleapis.com/unknown'))
+
+
+if __name__ == '__main__':
+  absltest.main()
@@ -13,25 +13,173 @@
 # limitations under the License.
 """Streaming AEAD wrapper."""
 
+import collections
 import io
-from typing import cast, BinaryIO, Optional, Type
+import struct
+from typing import (
+    cast, Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+)
 
 from tink import core
+from tink.streaming_aead import _chunk_io
+from tink.streaming_aead import _decrypting_stream
+from tink.streaming_aead import _file_object_adapter
+from tink.streaming_aead import _parallel_streams
 from tink.streaming_aead import _raw_streaming_aead
 from tink.streaming_aead import _rewindable_input_stream
 from tink.streaming_aead import _streaming_aead
 
+# Large enough that decrypting the segments shared by two chunks twice is cheap
+# also for 1 MiB segments.
+DEFAULT_PARALLEL_CHUNK_SIZE = 8 * 1024 * 1024
+DEFAULT_MAX_IN_FLIGHT_BYTES = 64 * 1024 * 1024
+# The read-ahead of the C++ decrypting streams if read_ahead_size is 0.
+_DEFAULT_READ_AHEAD_SIZE = 128 * 1024
+
+# In the key ID header mode, ciphertexts start with the output prefix of a
+# TINK key with the ID of the key that encrypted them. The ciphertexts of the
+# C++ primitives never start with TINK_START_BYTE, since their first byte is
+# the size of their header.
+_KEY_ID_HEADER_SIZE = core.crypto_format.NON_RAW_PREFIX_SIZE
+
+
+class _Options(
+    collections.namedtuple(
+        '_Options',
+        'parallel_workers, parallel_chunk_size, max_in_flight_bytes, '
+        'read_ahead_size, key_id_header, rewind_window_size, '
+        'write_buffer_size',
+        defaults=(0, DEFAULT_PARALLEL_CHUNK_SIZE, DEFAULT_MAX_IN_FLIGHT_BYTES,
+                  0, False, None, 0),
+    )
+):
+  """The options of a StreamingAead primitive, see with_options."""
+
+  __slots__ = ()
+
+
+def _check_options(options: _Options) -> None:
+  """Raises ValueError if options are invalid."""
+  if options.parallel_workers < 0:
+    raise ValueError('parallel_workers must not be negative')
+  if options.read_ahead_size < 0:
+    raise ValueError('read_ahead_size must not be negative')
+  if (options.rewind_window_size is not None and
+      options.rewind_window_size <= max(options.read_ahead_size,
+                                        _KEY_ID_HEADER_SIZE)):
+    raise ValueError('rewind_window_size must be larger than read_ahead_size')
+  if options.write_buffer_size < 0:
+    raise ValueError('write_buffer_size must not be negative')
+  if options.parallel_chunk_size <= 0 or options.max_in_flight_bytes <= 0:
+    raise ValueError(
+        'parallel_chunk_size and max_in_flight_bytes must be positive')
+
+
+def _key_id_header(key_id: int) -> bytes:
+  """Returns the header that starts ciphertexts in the key ID header mode."""
+  return struct.pack('>cL', core.crypto_format.TINK_START_BYTE, key_id)
+
+
+def _parse_key_id_header(header: bytes) -> Optional[int]:
+  """Returns the key ID of a key ID header, or None if it is not one."""
+  if (len(header) != _KEY_ID_HEADER_SIZE or
+      header[:1] != core.crypto_format.TINK_START_BYTE):
+    return None
+  return struct.unpack('>L', header[1:])[0]
+
+
+def _primitives_by_key_id(
+    primitive_set: core.PrimitiveSet
+) -> Dict[int, List[_raw_streaming_aead.RawStreamingAead]]:
+  primitives = {}
+  for entry_list in primitive_set.all():
+    for e in entry_list:
+      primitives.setdefault(e.key_id, []).append(e.primitive)
+  return primitives
+
+
+def _all_primitives(
+    primitive_set: core.PrimitiveSet
+) -> Iterator[_raw_streaming_aead.RawStreamingAead]:
+  # For legacy reasons (Tink always encrypted with non-RAW keys) we use all
+  # primitives, even those which have output_prefix_type != RAW.
+  for entry_list in primitive_set.all():
+    for e in entry_list:
+      yield e.primitive
+
+
+def _candidates(
+    primitive_set: core.PrimitiveSet,
+    primitives_by_key_id: Dict[int, List[_raw_streaming_aead.RawStreamingAead]],
+    header: bytes
+) -> Iterator[Tuple[_raw_streaming_aead.RawStreamingAead, int]]:
+  """Yields the primitives to try and the offsets of their ciphertexts.
+
+  If header is a key ID header, the primitives with that key ID are tried
+  first. If they fail, or if there is no key ID header, all primitives are
+  tried on the whole ciphertext, as for ciphertexts without a header.
+
+  Args:
+    primitive_set: The primitive set of StreamingAead primitives.
+    primitives_by_key_id: The primitives of primitive_set by key ID.
+    header: The first bytes of the ciphertext.
+  """
+  key_id = _parse_key_id_header(header)
+  if key_id is not None:
+    for primitive in primitives_by_key_id.get(key_id, ()):
+      yield primitive, _KEY_ID_HEADER_SIZE
+  for primitive in _all_primitives(primitive_set):
+    yield primitive, 0
+
+
+def _rewind_window_size(primitive_set: core.PrimitiveSet,
+                        read_ahead_size: int) -> Optional[int]:
+  """Returns a rewind window in which all keys of primitive_set can be tried.
+
+  A key that fails reads at most the key ID header, the ciphertext header,
+  the first segment and one read-ahead. The ciphertext size of an empty
+  plaintext bounds the size of the ciphertext header.
+
+  Args:
+    primitive_set: The primitive set of StreamingAead primitives.
+    read_ahead_size: The read_ahead_size of the decrypting streams.
+
+  Returns:
+    The size of the window, or None for no limit if the segment size of a
+    primitive is not known.
+  """
+  largest = 0
+  for primitive in _all_primitives(primitive_set):
+    try:
+      size = primitive.ciphertext_size(0) + primitive.ciphertext_segment_size()
+    except NotImplementedError:
+      return None
+    largest = max(largest, size)
+  return (_KEY_ID_HEADER_SIZE + largest +
+          (read_ahead_size or _DEFAULT_READ_AHEAD_SIZE))
+
 
 class _DecryptingStreamWrapper(io.RawIOBase):
   """A file-like object which decrypts reads from an underlying object.
 
   It uses a primitive set of streaming AEADs, and decrypts the stream with the
-  matching key in the keyset. Closing this wrapper also closes
-  ciphertext_source.
+  matching key in the keyset. If the ciphertext starts with a key ID header,
+  the key with that ID is tried first. Otherwise, the keys are tried one after
+  the other, and ciphertext_source is rewound after each failure. At most
+  rewind_window_size bytes of ciphertext are buffered for rewinding, so a key
+  can only be tried after a failed one if the failed key read less. Closing
+  this wrapper also closes ciphertext_source.
   """
 
-  def __init__(self, primitive_set: core.PrimitiveSet,
-               ciphertext_source: BinaryIO, associated_data: bytes):
+  def __init__(
+      self,
+      primitive_set: core.PrimitiveSet,
+      ciphertext_source: BinaryIO,
+      associated_data: bytes,
+      read_ahead_size: int = 0,
+      primitives_by_key_id: Optional[
+          Dict[int, List[_raw_streaming_aead.RawStreamingAead]]] = None,
+      rewind_window_size: Optional[int] = None):
     """Create a new _DecryptingStreamWrapper.
 
     Args:
@@ -39,31 +187,80 @@ class _DecryptingStreamWrapper(io.RawIOBase):
       ciphertext_source: A readable file-like object from which ciphertext bytes
         will be read.
       associated_data: The associated data to use for decryption.
+      read_ahead_size: The number of bytes requested from ciphertext_source by
+        each read, or 0 for the default of the primitives.
+      primitives_by_key_id: The primitives of primitive_set by key ID. It is
+        computed from primitive_set if it is None.
+      rewind_window_size: The maximum number of bytes buffered to try another
+        key, or None for no limit.
     """
     super().__init__()
     if not ciphertext_source.readable():
       raise ValueError('ciphertext_source must be readable')
     self._ciphertext_source = _rewindable_input_stream.RewindableInputStream(
-        ciphertext_source)
+        ciphertext_source, rewind_window_size)
     self._associated_data = associated_data
+    self._read_ahead_size = read_ahead_size
+    self._primitive_set = primitive_set
+    if primitives_by_key_id is None:
+      primitives_by_key_id = _primitives_by_key_id(primitive_set)
+    self._primitives_by_key_id = primitives_by_key_id
+    self._header = b''
+    self._remaining_candidates = None
+    self._key_attempts = 0
     self._matching_stream = None
-    self._remaining_primitives = []
-    # For legacy reasons (Tink always encrypted with non-RAW keys) we use all
-    # primitives, even those which have output_prefix_type != RAW.
-    for entry_list in primitive_set.all():
-      for e in entry_list:
-        self._remaining_primitives.append(e.primitive)
-    self._attempting_stream = self._next_decrypting_stream()
-
-  def _next_decrypting_stream(self) -> io.RawIOBase:
-    """Takes the next remaining primitive and returns a decrypting stream."""
-    if not self._remaining_primitives:
-      raise ValueError('No primitive remaining.')
+    self._attempting_stream = None
+
+  @property
+  def key_attempts(self) -> int:
+    """The number of keys which were tried to decrypt the ciphertext."""
+    return self._key_attempts
+
+  def _read_header(self) -> bool:
+    """Reads the first bytes of the ciphertext to find the keys to try.
+
+    Returns:
+      False if ciphertext_source has no data at the moment. The bytes read so
+      far are kept, and the next call continues with the rest of the header.
+    """
+    while len(self._header) < _KEY_ID_HEADER_SIZE:
+      data = self._ciphertext_source.read(
+          _KEY_ID_HEADER_SIZE - len(self._header))
+      if data is None:
+        return False
+      if not data:
+        break
+      self._header += data
+    self._remaining_candidates = _candidates(
+        self._primitive_set, self._primitives_by_key_id, self._header)
+    return True
+
+  def _next_decrypting_stream(self) -> Optional[io.RawIOBase]:
+    """Returns a decrypting stream with the next key, or None if none remain."""
+    candidate = next(self._remaining_candidates, None)
+    if candidate is None:
+      return None
+    primitive, offset = candidate
     # ciphertext_source should never be closed by any of the raw decrypting
     # streams, to be able to use it for another decrypting stream.
     # ciphertext_source will be closed in close().
-    # self._ciphertext_source needs to be at the starting position.
-    return self._remaining_primitives.pop(0).new_raw_decrypting_stream(
+    try:
+      self._ciphertext_source.rewind()
+    except ValueError as exc:
+      raise core.TinkError('Cannot try another key: {}'.format(exc)) from exc
+    if offset:
+      # The header was read before, so this returns it from the buffer.
+      self._ciphertext_source.read(offset)
+    self._key_attempts += 1
+    if self._read_ahead_size:
+      return primitive.new_raw_decrypting_stream(
+          self._ciphertext_source,
+          self._associated_data,
+          close_ciphertext_source=False,
+          read_ahead_size=self._read_ahead_size)
+    # Implementations of RawStreamingAead outside of Tink may not support
+    # read_ahead_size.
+    return primitive.new_raw_decrypting_stream(
         self._ciphertext_source,
         self._associated_data,
         close_ciphertext_source=False)
@@ -89,6 +286,10 @@ class _DecryptingStreamWrapper(io.RawIOBase):
       return bytes()
     if self._matching_stream:
       return self._matching_stream.read(size)
+    if self._remaining_candidates is None:
+      if not self._read_header():
+        return None
+      self._attempting_stream = self._next_decrypting_stream()
     # if self._matching_stream is not set, we are currently reading from
     # self._attempting_stream but no data has been read successfully yet.
     while True:
@@ -108,15 +309,18 @@ class _DecryptingStreamWrapper(io.RawIOBase):
         self._ciphertext_source.disable_rewind()
         return data
       except core.TinkError as exc:
-        if not self._remaining_primitives:
+        # Try another key.
+        next_stream = self._next_decrypting_stream()
+        if not next_stream:
           raise core.TinkError(
               'No matching key found for the ciphertext in the stream') from exc
-        # Try another key.
-        self._ciphertext_source.rewind()
-        self._attempting_stream = self._next_decrypting_stream()
+        self._attempting_stream = next_stream
 
   def readinto(self, b: bytearray) -> Optional[int]:  # pyrefly: ignore[bad-override]
     """Read bytes into a pre-allocated bytes-like object b."""
+    if self._matching_stream and not self.closed:
+      # Once the key is known, the plaintext is decrypted directly into b.
+      return self._matching_stream.readinto(b)
     data = self.read(len(b))
     if data is None:
       return None
@@ -124,6 +328,214 @@ class _DecryptingStreamWrapper(io.RawIOBase):
     b[:n] = data
     return n
 
+  def readall(self) -> bytes:
+    """Read and return all bytes until EOF.
+
+    Unlike read(), it does not return None while ciphertext_source has no
+    data at the moment, but tries again, as the raw decrypting streams do.
+    """
+    chunks = []
+    while True:
+      data = self.read(io.DEFAULT_BUFFER_SIZE)
+      if data is None:
+        continue
+      if not data:
+        return b''.join(chunks)
+      chunks.append(data)
+
+  def close(self) -> None:
+    if self.closed:  # pylint:disable=using-constant-test
+      return
+    if self._matching_stream:
+      self._matching_stream.close()
+    if self._attempting_stream:
+      self._attempting_stream.close()
+    self._ciphertext_source.close()
+    super().close()
+
+  def readable(self) -> bool:
+    return True
+
+
+class _SeekableDecryptingStreamWrapper(io.RawIOBase):
+  """A seekable file-like object which decrypts reads from an underlying object.
+
+  It uses a primitive set of streaming AEADs, and decrypts the stream with the
+  matching key in the keyset. Like _DecryptingStreamWrapper, it selects the key
+  with the key ID header of the ciphertext if there is one, and otherwise tries
+  the keys one after the other on the first read. Since the ciphertext is read
+  at absolute positions, ciphertext_source does not need to be rewound.
+  Closing this wrapper also closes ciphertext_source.
+  """
+
+  def __init__(
+      self,
+      primitive_set: core.PrimitiveSet,
+      ciphertext_source: BinaryIO,
+      associated_data: bytes,
+      primitives_by_key_id: Optional[
+          Dict[int, List[_raw_streaming_aead.RawStreamingAead]]] = None):
+    """Create a new _SeekableDecryptingStreamWrapper.
+
+    Args:
+      primitive_set: The primitive set of StreamingAead primitives.
+      ciphertext_source: A readable and seekable file-like object from which
+        ciphertext bytes will be read.
+      associated_data: The associated data to use for decryption.
+      primitives_by_key_id: The primitives of primitive_set by key ID. It is
+        computed from primitive_set if it is None.
+
+    Raises:
+      ValueError: if ciphertext_source is not readable and seekable.
+    """
+    super().__init__()
+    # Checked here, and not only when the first key is tried, so that the error
+    # is not mistaken for a key that does not match.
+    if not _decrypting_stream._is_readable_and_seekable(ciphertext_source):  # pylint: disable=protected-access
+      raise ValueError('ciphertext_source must be readable and seekable')
+    self._ciphertext_source = ciphertext_source
+    self._associated_data = associated_data
+    self._primitive_set = primitive_set
+    if primitives_by_key_id is None:
+      primitives_by_key_id = _primitives_by_key_id(primitive_set)
+    self._primitives_by_key_id = primitives_by_key_id
+    self._matching_stream = None
+    self._matching_primitive = None
+    self._matching_offset = 0
+    self._position = 0
+    self._remaining_candidates = None
+    self._key_attempts = 0
+    self._attempting_primitive = None
+    self._attempting_offset = 0
+    self._attempting_stream = None
+
+  @property
+  def key_attempts(self) -> int:
+    """The number of keys which were tried to decrypt the ciphertext."""
+    return self._key_attempts
+
+  def _new_stream(self, primitive: _raw_streaming_aead.RawStreamingAead,
+                  offset: int) -> io.RawIOBase:
+    # ciphertext_source will be closed in close().
+    if offset:
+      return primitive.new_raw_seekable_decrypting_stream(
+          self._ciphertext_source,
+          self._associated_data,
+          close_ciphertext_source=False,
+          ciphertext_offset=offset)
+    # Implementations of RawStreamingAead outside of Tink may not support
+    # ciphertext_offset.
+    return primitive.new_raw_seekable_decrypting_stream(
+        self._ciphertext_source,
+        self._associated_data,
+        close_ciphertext_source=False)
+
+  def _next_decrypting_stream(self) -> Optional[io.RawIOBase]:
+    """Returns a decrypting stream with the next key, or None if none remain."""
+    if self._remaining_candidates is None:
+      header = _file_object_adapter.FileObjectAdapter(
+          self._ciphertext_source).pread(0, _KEY_ID_HEADER_SIZE)
+      self._remaining_candidates = _candidates(
+          self._primitive_set, self._primitives_by_key_id, header)
+    candidate = next(self._remaining_candidates, None)
+    if candidate is None:
+      return None
+    self._attempting_primitive, self._attempting_offset = candidate
+    self._key_attempts += 1
+    return self._new_stream(self._attempting_primitive, self._attempting_offset)
+
+  def _read_with_matching_key(self, b) -> int:
+    """Reads into b at the current position, trying keys until one matches."""
+    if self._attempting_stream is None:
+      self._attempting_stream = self._next_decrypting_stream()
+    while True:
+      try:
+        if not self._attempting_stream:
+          # this should not happen.
+          raise ValueError('self._attempting_stream is None')
+        self._attempting_stream.seek(self._position)
+        n = self._attempting_stream.readinto(b)
+        # A read without an error authenticated at least one segment.
+        self._matching_stream = self._attempting_stream
+        self._matching_primitive = self._attempting_primitive
+        self._matching_offset = self._attempting_offset
+        self._attempting_stream = None  # pyrefly: ignore[bad-assignment]
+        return n
+      except core.TinkError as exc:
+        self._attempting_stream.close()
+        # Try another key.
+        next_stream = self._next_decrypting_stream()
+        if not next_stream:
+          raise core.TinkError(
+              'No matching key found for the ciphertext in the stream') from exc
+        self._attempting_stream = next_stream
+
+  def _ensure_matching_stream(self) -> io.RawIOBase:
+    if not self._matching_stream:
+      self._read_with_matching_key(bytearray(1))
+    return self._matching_stream
+
+  def new_matching_stream(self) -> io.RawIOBase:
+    """Returns a new seekable stream which decrypts with the matching key.
+
+    The returned stream does not close ciphertext_source.
+
+    Raises:
+      TinkError if no key matches the ciphertext.
+    """
+    self._ensure_matching_stream()
+    return self._new_stream(self._matching_primitive, self._matching_offset)
+
+  # b has type "Buffer", which is not yet supported by pytype.
+  def readinto(self, b) -> int:  # pyrefly: ignore[bad-override]
+    """Decrypts the bytes at the current position into b.
+
+    Args:
+      b: Writable bytes-like object to which data will be read.
+
+    Returns:
+      Number of bytes read, which is smaller than len(b) only at the end of the
+      stream.
+
+    Raises:
+      TinkError if there was a permanent error.
+      ValueError if the file is closed.
+    """
+    if self.closed:  # pylint:disable=using-constant-test
+      raise ValueError('read on closed file.')
+    if not memoryview(b).nbytes:
+      return 0
+    if self._matching_stream:
+      self._matching_stream.seek(self._position)
+      n = self._matching_stream.readinto(b)
+    else:
+      n = self._read_with_matching_key(b)
+    self._position += n
+    return n
+
+  def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+    """Changes the position of the stream and returns the new position."""
+    if self.closed:  # pylint:disable=using-constant-test
+      raise ValueError('seek on closed file.')
+    if whence == io.SEEK_SET:
+      position = offset
+    elif whence == io.SEEK_CUR:
+      position = self._position + offset
+    elif whence == io.SEEK_END:
+      position = self._ensure_matching_stream().seek(offset, io.SEEK_END)
+    else:
+      raise ValueError(
+          'invalid whence ({}, should be 0, 1 or 2)'.format(whence))
+    if position < 0:
+      raise ValueError('negative seek position {}'.format(position))
+    self._position = position
+    return position
+
+  def tell(self) -> int:
+    if self.closed:  # pylint:disable=using-constant-test
+      raise ValueError('tell on closed file.')
+    return self._position
+
   def close(self) -> None:
     if self.closed:  # pylint:disable=using-constant-test
       return
@@ -137,30 +549,240 @@ class _DecryptingStreamWrapper(io.RawIOBase):
   def readable(self) -> bool:
     return True
 
+  def seekable(self) -> bool:
+    return True
+
+
+def _is_seekable_at_start(file_object: BinaryIO) -> bool:
+  """Returns True if file_object is seekable and positioned at its start."""
+  try:
+    return bool(file_object.seekable()) and file_object.tell() == 0
+  except (AttributeError, OSError, ValueError):
+    return False
+
+
+def _write_all(file_object: BinaryIO, data: bytes) -> None:
+  view = memoryview(data)
+  while view:
+    try:
+      written = file_object.write(view)
+    except BlockingIOError as e:
+      written = e.characters_written
+    view = view[written or 0:]
+
+
+def key_attempts(stream: BinaryIO) -> Optional[int]:
+  """Returns the number of keys which were tried to decrypt a stream.
+
+  Args:
+    stream: a stream returned by StreamingAead.new_decrypting_stream or
+      StreamingAead.new_seekable_decrypting_stream.
+
+  Returns:
+    The number of keys which were tried so far, including the matching key.
+    It is 1 for ciphertexts with a key ID header of a key in the keyset, and
+    0 before the first read. None if stream is not a decrypting stream of the
+    StreamingAead wrapper.
+  """
+  raw = getattr(stream, 'raw', stream)
+  return getattr(raw, 'key_attempts', None)
+
+
+def with_options(primitive: _streaming_aead.StreamingAead,
+                 **options: Any) -> _streaming_aead.StreamingAead:
+  """Returns a StreamingAead with the keys of primitive and other options.
+
+  The options only apply to the returned primitive: primitive and the other
+  primitives of the keyset are not changed. Options that are not passed keep
+  their values in primitive. Decryption does not depend on the options that
+  were used for encryption, except that a rewind_window_size which is set
+  must be large enough to try the keys of the keyset.
+
+  Example:
+    primitive = streaming_aead.with_options(
+        keyset_handle.primitive(streaming_aead.StreamingAead),
+        parallel_workers=4)
+
+  Args:
+    primitive: a StreamingAead returned by KeysetHandle.primitive.
+    **options: the options to change, of the following:
+      parallel_workers: if positive, the primitive encrypts on a background
+        thread, and decrypts ciphertext sources which are seekable and
+        positioned at their start with this number of threads. Other sources
+        are decrypted sequentially. 0 by default.
+      parallel_chunk_size: the number of plaintext bytes decrypted by each task
+        of a parallel decryption, and buffered by parallel encryption. It
+        should be much larger than the ciphertext segment size.
+      max_in_flight_bytes: the maximum number of plaintext bytes buffered by a
+        parallel stream.
+      read_ahead_size: the number of bytes requested from the ciphertext
+        source by each read of a sequential decryption. 0, the default, means
+        128 KiB. Larger values reduce the number of calls into Python for fast
+        sources such as local files.
+      key_id_header: if true, ciphertexts start with a 5 byte header that
+        holds the ID of the primary key, in the format of the output prefix of
+        TINK keys, so that decryption selects the key without trying the
+        others. Such ciphertexts can only be decrypted by Tink Python.
+        Decryption always recognizes the header, whatever this option is, see
+        key_attempts. False by default.
+      rewind_window_size: the maximum number of ciphertext bytes that a
+        sequential decryption buffers to try the next key after a key failed.
+        It must be larger than the sum of the ciphertext header, the first
+        segment and read_ahead_size of the keys that are tried. It bounds the
+        memory of each decrypting stream. None, the default, means a window
+        which is derived from the keyset, so that all its keys can be tried.
+      write_buffer_size: the number of plaintext bytes that sequential
+        encrypting streams pass to the C++ stream at once. 0, the default,
+        means the ciphertext segment size of the primary key.
+
+  Returns:
+    A StreamingAead with the keys of primitive.
+  Raises:
+    tink.TinkError if primitive was not returned by KeysetHandle.primitive.
+    ValueError if an option is unknown or has an invalid value.
+  """
+  if not isinstance(primitive, _WrappedStreamingAead):
+    raise core.TinkError(
+        'with_options needs a StreamingAead returned by KeysetHandle.primitive')
+  return primitive.with_options(**options)
+
 
 class _WrappedStreamingAead(_streaming_aead.StreamingAead):
   """Implements StreamingAead by wrapping a set of RawStreamingAead."""
 
-  def __init__(self, primitives_set: core.PrimitiveSet):
+  def __init__(
+      self,
+      primitives_set: core.PrimitiveSet,
+      options: _Options = _Options(),
+      primitives_by_key_id: Optional[
+          Dict[int, List[_raw_streaming_aead.RawStreamingAead]]] = None):
     self._primitive_set = primitives_set
+    self._options = options
+    # Computed once, so that decrypting streams select the key of a key ID
+    # header without iterating over the keyset.
+    if primitives_by_key_id is None:
+      primitives_by_key_id = _primitives_by_key_id(primitives_set)
+    self._primitives_by_key_id = primitives_by_key_id
+    self._rewind_window_size = options.rewind_window_size
+    if self._rewind_window_size is None:
+      self._rewind_window_size = _rewind_window_size(
+          primitives_set, options.read_ahead_size)
+
+  def with_options(self, **options: Any) -> '_WrappedStreamingAead':
+    new_options = self._options._replace(**options)
+    _check_options(new_options)
+    return _WrappedStreamingAead(self._primitive_set, new_options,
+                                 self._primitives_by_key_id)
 
   def new_encrypting_stream(self, ciphertext_destination: BinaryIO,
                             associated_data: bytes) -> BinaryIO:
-    raw = self._primitive_set.primary().primitive.new_raw_encrypting_stream(
+    primary = self._primitive_set.primary()
+    if self._options.key_id_header:
+      _write_all(ciphertext_destination, _key_id_header(primary.key_id))
+    raw = primary.primitive.new_raw_encrypting_stream(
         ciphertext_destination, associated_data)
-    return cast(BinaryIO, io.BufferedWriter(raw))
+    if self._options.parallel_workers:
+      pipelined = _parallel_streams.PipelinedEncryptingStream(
+          raw, self._options.max_in_flight_bytes)
+      return cast(BinaryIO, io.BufferedWriter(
+          pipelined, buffer_size=self._options.parallel_chunk_size))
+    return cast(BinaryIO, io.BufferedWriter(
+        raw, buffer_size=self._buffer_size_for(primary.primitive)))
+
+  def _buffer_size_for(
+      self, primitive: _raw_streaming_aead.RawStreamingAead) -> int:
+    # Buffering a whole segment passes each segment to C++ in one call.
+    if self._options.write_buffer_size:
+      return self._options.write_buffer_size
+    try:
+      return primitive.ciphertext_segment_size()
+    except NotImplementedError:
+      return io.DEFAULT_BUFFER_SIZE
 
   def new_decrypting_stream(self, ciphertext_source: BinaryIO,
                             associated_data: bytes) -> BinaryIO:
+    if (self._options.parallel_workers and
+        _is_seekable_at_start(ciphertext_source)):
+      seekable = _SeekableDecryptingStreamWrapper(
+          self._primitive_set, ciphertext_source, associated_data,
+          self._primitives_by_key_id)
+      raw = _parallel_streams.ParallelDecryptingStream(
+          seekable, seekable.new_matching_stream,
+          self._options.parallel_chunk_size, self._options.parallel_workers,
+          self._options.max_in_flight_bytes)
+      return cast(BinaryIO, io.BufferedReader(raw))  # pyrefly: ignore[bad-specialization]
     raw = _DecryptingStreamWrapper(self._primitive_set, ciphertext_source,
-                                   associated_data)
+                                   associated_data,
+                                   self._options.read_ahead_size,
+                                   self._primitives_by_key_id,
+                                   self._rewind_window_size)
     return cast(BinaryIO, io.BufferedReader(raw))  # pyrefly: ignore[bad-specialization]
 
+  def new_seekable_decrypting_stream(self, ciphertext_source: BinaryIO,
+                                     associated_data: bytes) -> io.RawIOBase:
+    return _SeekableDecryptingStreamWrapper(self._primitive_set,
+                                            ciphertext_source, associated_data,
+                                            self._primitives_by_key_id)
+
+  def ciphertext_size(self, plaintext_size: int) -> int:
+    size = self._primitive_set.primary().primitive.ciphertext_size(
+        plaintext_size)
+    if self._options.key_id_header:
+      size += _KEY_ID_HEADER_SIZE
+    return size
+
+  def encrypt_iter(self, chunks: Iterable[bytes],
+                   associated_data: bytes) -> Iterator[bytes]:
+    # Writes to the raw encrypting stream directly: the C++ stream buffers
+    # the plaintext of a segment anyway.
+    sink = _chunk_io.ChunkSink()
+    primary = self._primitive_set.primary()
+    if self._options.key_id_header:
+      sink.write(_key_id_header(primary.key_id))
+    raw = primary.primitive.new_raw_encrypting_stream(sink, associated_data)
+    finished = False
+    try:
+      for chunk in chunks:
+        view = memoryview(chunk).cast('B')
+        while view:
+          view = view[raw.write(view) or 0:]
+        yield from sink.take()
+      raw.close()
+      finished = True
+    finally:
+      if not finished:
+        # The iteration was stopped early or failed. The sink is closed first,
+        # so that closing raw cannot write a final segment, which would turn
+        # the partial ciphertext into a valid one.
+        sink.close()
+        try:
+          raw.close()
+        except core.TinkError:
+          pass
+    yield from sink.take()
+
+  def decrypt_iter(self, chunks: Iterable[bytes],
+                   associated_data: bytes) -> Iterator[bytes]:
+    # Reads from the raw decrypting stream directly, which returns the
+    # plaintext of the decrypted segments without another buffer.
+    raw = _DecryptingStreamWrapper(self._primitive_set,
+                                   _chunk_io.ChunkSource(chunks),
+                                   associated_data,
+                                   self._options.read_ahead_size,
+                                   self._primitives_by_key_id,
+                                   self._rewind_window_size)
+    with raw:
+      while data := raw.read(_streaming_aead.DECRYPT_ITER_CHUNK_SIZE):
+        yield data
+
 
 class StreamingAeadWrapper(
     core.PrimitiveWrapper[_raw_streaming_aead.RawStreamingAead,
                           _streaming_aead.StreamingAead]):
-  """StreamingAeadWrapper is the PrimitiveWrapper for StreamingAead."""
+  """StreamingAeadWrapper is the PrimitiveWrapper for StreamingAead.
+
+  The wrapped primitives use the default options, see with_options.
+  """
 
   def wrap(self,
            primitives_set: core.PrimitiveSet) -> _streaming_aead.StreamingAead:
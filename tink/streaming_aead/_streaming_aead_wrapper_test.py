@@ -14,7 +14,9 @@
 """Tests for tink.python.tink.streaming_aead._streaming_aead_wrapper."""
 
 import io
+import mmap
 from typing import BinaryIO, cast
+from unittest import mock
 
 from absl.testing import absltest
 from absl.testing import parameterized
@@ -24,18 +26,38 @@ from tink.proto import tink_pb2
 import tink
 from tink import secret_key_access
 from tink import streaming_aead
+from tink.streaming_aead import _encrypting_stream
+from tink.streaming_aead import _streaming_aead
 from tink.testing import bytes_io
 from tink.testing import keyset_builder
 
 
 TEMPLATE = streaming_aead.streaming_aead_key_templates.AES128_GCM_HKDF_4KB
 TYPE_URL = 'type.googleapis.com/google.crypto.tink.AesGcmHkdfStreamingKey'
+LARGE_SEGMENT_TEMPLATE = tink_pb2.KeyTemplate(
+    type_url=TYPE_URL,
+    value=aes_gcm_hkdf_streaming_pb2.AesGcmHkdfStreamingKeyFormat(
+        key_size=16,
+        params=aes_gcm_hkdf_streaming_pb2.AesGcmHkdfStreamingParams(
+            ciphertext_segment_size=4 * 1024 * 1024,
+            derived_key_size=16,
+            hkdf_hash_type=common_pb2.HashType.SHA256,
+        ),
+    ).SerializeToString(),
+    output_prefix_type=tink_pb2.RAW,
+)
 
 
 def setUpModule():
   streaming_aead.register()
 
 
+def _primitive(keyset_handle: tink.KeysetHandle,
+               **options) -> streaming_aead.StreamingAead:
+  return streaming_aead.with_options(
+      keyset_handle.primitive(streaming_aead.StreamingAead), **options)
+
+
 def _encrypt(primitive: streaming_aead.StreamingAead, plaintext: bytes,
              associated_data: bytes) -> bytes:
   ciphertext_dest = bytes_io.BytesIOWithValueAfterClose()
@@ -81,6 +103,19 @@ class StreamingAeadWrapperTest(parameterized.TestCase):
     self.assertTrue(ciphertext_src.closed)
     self.assertEqual(output, long_plaintext)
 
+  def test_decrypt_readinto_success(self):
+    keyset_handle = tink.new_keyset_handle(TEMPLATE)
+    primitive = keyset_handle.primitive(streaming_aead.StreamingAead)
+    plaintext = b' '.join(b'%d' % i for i in range(100 * 1000))
+    ciphertext = _encrypt(primitive, plaintext, b'aad')
+
+    buffer = bytearray(100000)
+    output = bytearray()
+    with primitive.new_decrypting_stream(io.BytesIO(ciphertext), b'aad') as ds:
+      while n := ds.readinto(buffer):
+        output += buffer[:n]
+    self.assertEqual(output, plaintext)
+
   def test_encrypt_decrypt_with_slow_bytes_io_success(self):
     keyset_handle = tink.new_keyset_handle(TEMPLATE)
     primitive = keyset_handle.primitive(streaming_aead.StreamingAead)
@@ -129,6 +164,20 @@ class StreamingAeadWrapperTest(parameterized.TestCase):
     self.assertTrue(ciphertext_src.closed)
     self.assertEqual(output, plaintext)
 
+  def test_read_returns_none_while_source_has_no_data(self):
+    keyset_handle = tink.new_keyset_handle(TEMPLATE)
+    primitive = keyset_handle.primitive(streaming_aead.StreamingAead)
+    plaintext = b' '.join(b'%d' % i for i in range(10 * 1000))
+    ciphertext = _encrypt(primitive, plaintext, b'aad')
+
+    # The first read of SlowReadableRawBytes returns None, before any byte of
+    # the header.
+    ciphertext_src = cast(BinaryIO, bytes_io.SlowReadableRawBytes(ciphertext))
+    with primitive.new_decrypting_stream(ciphertext_src, b'aad') as ds:
+      self.assertIsNone(ds.read(10))
+      self.assertEqual(ds.read(10), plaintext[:10])
+      self.assertEqual(ds.read(), plaintext[10:])
+
   def test_encrypt_decrypt_bad_aad(self):
     keyset_handle = tink.new_keyset_handle(TEMPLATE)
     primitive = keyset_handle.primitive(streaming_aead.StreamingAead)
@@ -256,6 +305,446 @@ class StreamingAeadWrapperTest(parameterized.TestCase):
         cast(BinaryIO, input_stream_factory(ciphertext4)), b'aad4') as ds:
       self.assertEqual(ds.read(), plaintext4)
 
+  def test_seekable_decrypt_success(self):
+    keyset_handle = tink.new_keyset_handle(TEMPLATE)
+    primitive = keyset_handle.primitive(streaming_aead.StreamingAead)
+    plaintext = b' '.join(b'%d' % i for i in range(100 * 100))
+    ciphertext = _encrypt(primitive, plaintext, b'aad')
+
+    ciphertext_src = io.BytesIO(ciphertext)
+    with primitive.new_seekable_decrypting_stream(ciphertext_src,
+                                                  b'aad') as ds:
+      self.assertTrue(ds.seekable())
+      self.assertEqual(ds.seek(-20, io.SEEK_END), len(plaintext) - 20)
+      self.assertEqual(ds.read(), plaintext[-20:])
+      ds.seek(12345)
+      self.assertEqual(ds.read(1000), plaintext[12345:13345])
+      self.assertEqual(ds.tell(), 13345)
+      ds.seek(0)
+      with io.BufferedReader(ds) as reader:
+        self.assertEqual(reader.read(), plaintext)
+    self.assertTrue(ciphertext_src.closed)
+
+  def test_seekable_decrypt_mmap_success(self):
+    keyset_handle = tink.new_keyset_handle(TEMPLATE)
+    primitive = keyset_handle.primitive(streaming_aead.StreamingAead)
+    plaintext = b' '.join(b'%d' % i for i in range(100 * 100))
+    ciphertext_file = self.create_tempfile(
+        content=_encrypt(primitive, plaintext, b'aad'), mode='wb')
+
+    with open(ciphertext_file.full_path, 'rb') as f:
+      with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        ds = primitive.new_seekable_decrypting_stream(
+            cast(BinaryIO, m), b'aad')
+        ds.seek(30000)
+        self.assertEqual(ds.read(100), plaintext[30000:30100])
+        ds.close()
+
+  def test_seekable_decrypt_requires_seekable_source(self):
+    primitive = tink.new_keyset_handle(TEMPLATE).primitive(
+        streaming_aead.StreamingAead)
+    ciphertext_src = io.BufferedReader(
+        io.BytesIO(_encrypt(primitive, b'plaintext', b'aad')))
+    ciphertext_src.seekable = lambda: False
+    with self.assertRaises(ValueError):
+      primitive.new_seekable_decrypting_stream(ciphertext_src, b'aad')
+
+  def test_seekable_decrypt_unknown_key_fails(self):
+    unknown_primitive = tink.new_keyset_handle(TEMPLATE).primitive(
+        streaming_aead.StreamingAead)
+    ciphertext = _encrypt(unknown_primitive, b'plaintext', b'aad')
+
+    primitive = tink.new_keyset_handle(TEMPLATE).primitive(
+        streaming_aead.StreamingAead)
+    with primitive.new_seekable_decrypting_stream(
+        io.BytesIO(ciphertext), b'aad') as ds:
+      with self.assertRaises(tink.TinkError):
+        ds.read()
+      with self.assertRaises(tink.TinkError):
+        ds.seek(0, io.SEEK_END)
+
+  def test_seekable_decrypt_with_key_rotation(self):
+    builder = keyset_builder.new_keyset_builder()
+    older_key_id = builder.add_new_key(TEMPLATE)
+    builder.set_primary_key(older_key_id)
+    p1 = builder.keyset_handle().primitive(streaming_aead.StreamingAead)
+
+    newer_key_id = builder.add_new_key(TEMPLATE)
+    builder.set_primary_key(newer_key_id)
+    p2 = builder.keyset_handle().primitive(streaming_aead.StreamingAead)
+
+    plaintext = b' '.join(b'%d' % i for i in range(100 * 101))
+    for encrypting_primitive in [p1, p2]:
+      ciphertext = _encrypt(encrypting_primitive, plaintext, b'aad')
+      with p2.new_seekable_decrypting_stream(
+          io.BytesIO(ciphertext), b'aad') as ds:
+        ds.seek(-100, io.SEEK_END)
+        self.assertEqual(ds.read(), plaintext[-100:])
+        ds.seek(5000)
+        self.assertEqual(ds.read(10), plaintext[5000:5010])
+
+    ciphertext = _encrypt(p2, plaintext, b'aad')
+    with p1.new_seekable_decrypting_stream(
+        io.BytesIO(ciphertext), b'aad') as ds:
+      ds.seek(5000)
+      with self.assertRaises(tink.TinkError):
+        ds.read(10)
+
+  def test_parallel_encrypt_decrypt_success(self):
+    options = dict(parallel_workers=4, parallel_chunk_size=10000,
+                   max_in_flight_bytes=40000)
+    builder = keyset_builder.new_keyset_builder()
+    older_key_id = builder.add_new_key(TEMPLATE)
+    builder.set_primary_key(older_key_id)
+    p1 = _primitive(builder.keyset_handle(), **options)
+    builder.set_primary_key(builder.add_new_key(TEMPLATE))
+    p2 = _primitive(builder.keyset_handle(), **options)
+
+    plaintext = b' '.join(b'%d' % i for i in range(100 * 1000))
+    for encrypting_primitive in [p1, p2]:
+      ciphertext = _encrypt(encrypting_primitive, plaintext, b'aad')
+      ciphertext_src = io.BytesIO(ciphertext)
+      with p2.new_decrypting_stream(ciphertext_src, b'aad') as ds:
+        self.assertEqual(ds.read(12345), plaintext[:12345])
+        self.assertEqual(ds.read(), plaintext[12345:])
+      self.assertTrue(ciphertext_src.closed)
+      # Non-seekable sources are decrypted sequentially.
+      with p2.new_decrypting_stream(
+          cast(BinaryIO, bytes_io.SlowReadableRawBytes(ciphertext)),
+          b'aad') as ds:
+        self.assertEqual(ds.read(), plaintext)
+
+    ciphertext = _encrypt(p2, plaintext, b'aad')
+    with p1.new_decrypting_stream(io.BytesIO(ciphertext), b'aad') as ds:
+      with self.assertRaises(tink.TinkError):
+        ds.read()
+    with p2.new_decrypting_stream(io.BytesIO(ciphertext), b'bad aad') as ds:
+      with self.assertRaises(tink.TinkError):
+        ds.read()
+
+  def test_parallel_decrypt_corrupted_ciphertext_fails(self):
+    primitive = _primitive(
+        tink.new_keyset_handle(TEMPLATE), parallel_workers=4,
+        parallel_chunk_size=10000)
+    plaintext = b' '.join(b'%d' % i for i in range(100 * 1000))
+    ciphertext = bytearray(_encrypt(primitive, plaintext, b'aad'))
+    ciphertext[len(ciphertext) // 2] ^= 1
+    with primitive.new_decrypting_stream(
+        io.BytesIO(bytes(ciphertext)), b'aad') as ds:
+      with self.assertRaises(tink.TinkError):
+        ds.read()
+
+  def test_parallel_invalid_arguments_fail(self):
+    keyset_handle = tink.new_keyset_handle(TEMPLATE)
+    with self.assertRaises(ValueError):
+      _primitive(keyset_handle, parallel_workers=-1)
+    with self.assertRaises(ValueError):
+      _primitive(keyset_handle, parallel_workers=1, parallel_chunk_size=0)
+
+  def test_read_ahead_size_encrypt_decrypt_success(self):
+    builder = keyset_builder.new_keyset_builder()
+    older_key_id = builder.add_new_key(TEMPLATE)
+    builder.set_primary_key(older_key_id)
+    p1 = _primitive(builder.keyset_handle(), read_ahead_size=1000)
+    builder.set_primary_key(builder.add_new_key(TEMPLATE))
+    p2 = _primitive(builder.keyset_handle(), read_ahead_size=1000)
+
+    plaintext = b' '.join(b'%d' % i for i in range(10 * 1000))
+    for encrypting_primitive in [p1, p2]:
+      ciphertext = _encrypt(encrypting_primitive, plaintext, b'aad')
+      with p2.new_decrypting_stream(io.BytesIO(ciphertext), b'aad') as ds:
+        self.assertEqual(ds.read(), plaintext)
+      with p2.new_decrypting_stream(
+          cast(BinaryIO, bytes_io.SlowReadableRawBytes(ciphertext)),
+          b'aad') as ds:
+        self.assertEqual(ds.read(), plaintext)
+
+  def test_negative_read_ahead_size_fails(self):
+    with self.assertRaises(ValueError):
+      _primitive(tink.new_keyset_handle(TEMPLATE), read_ahead_size=-1)
+
+  def test_with_options(self):
+    keyset_handle = tink.new_keyset_handle(TEMPLATE)
+    primitive = keyset_handle.primitive(streaming_aead.StreamingAead)
+    with_header = streaming_aead.with_options(primitive, key_id_header=True)
+    parallel = streaming_aead.with_options(with_header, parallel_workers=2)
+    plaintext = b' '.join(b'%d' % i for i in range(10 * 1000))
+
+    # The options only apply to the returned primitives.
+    self.assertNotEqual(_encrypt(primitive, plaintext, b'aad')[:1], b'\x01')
+    self.assertEqual(
+        with_header.ciphertext_size(0), primitive.ciphertext_size(0) + 5)
+    # Options that are not passed are kept.
+    ciphertext = _encrypt(parallel, plaintext, b'aad')
+    self.assertEqual(ciphertext[:1], b'\x01')
+    with parallel.new_decrypting_stream(io.BytesIO(ciphertext), b'aad') as ds:
+      self.assertEqual(ds.read(), plaintext)
+
+  def test_with_options_invalid_arguments_fail(self):
+    primitive = tink.new_keyset_handle(TEMPLATE).primitive(
+        streaming_aead.StreamingAead)
+    with self.assertRaises(ValueError):
+      streaming_aead.with_options(primitive, unknown_option=1)
+    with self.assertRaises(tink.TinkError):
+      streaming_aead.with_options(
+          mock.create_autospec(streaming_aead.StreamingAead, instance=True),
+          parallel_workers=1)
+
+  def test_key_id_header_selects_key(self):
+    builder = keyset_builder.new_keyset_builder()
+    key_ids = [builder.add_new_key(TEMPLATE) for _ in range(20)]
+    builder.set_primary_key(key_ids[-1])
+    primitive = builder.keyset_handle().primitive(streaming_aead.StreamingAead)
+    plaintext = b' '.join(b'%d' % i for i in range(10 * 1000))
+
+    legacy_ciphertext = _encrypt(primitive, plaintext, b'aad')
+    with primitive.new_decrypting_stream(
+        io.BytesIO(legacy_ciphertext), b'aad') as ds:
+      self.assertEqual(streaming_aead.key_attempts(ds), 0)
+      self.assertEqual(ds.read(), plaintext)
+      self.assertEqual(streaming_aead.key_attempts(ds), 20)
+
+    ciphertext = _encrypt(
+        streaming_aead.with_options(primitive, key_id_header=True), plaintext,
+        b'aad')
+    self.assertEqual(ciphertext[:5], b'\x01' + key_ids[-1].to_bytes(4, 'big'))
+    self.assertLen(ciphertext, len(legacy_ciphertext) + 5)
+
+    # Decryption recognizes the header without the key_id_header option.
+
+    with primitive.new_decrypting_stream(io.BytesIO(ciphertext), b'aad') as ds:
+      self.assertEqual(ds.read(), plaintext)
+      self.assertEqual(streaming_aead.key_attempts(ds), 1)
+    with primitive.new_decrypting_stream(
+        cast(BinaryIO, bytes_io.SlowReadableRawBytes(ciphertext)),
+        b'aad') as ds:
+      self.assertEqual(ds.read(), plaintext)
+      self.assertEqual(streaming_aead.key_attempts(ds), 1)
+    with primitive.new_seekable_decrypting_stream(
+        io.BytesIO(ciphertext), b'aad') as ds:
+      ds.seek(5000)
+      self.assertEqual(ds.read(10), plaintext[5000:5010])
+      self.assertEqual(ds.seek(0, io.SEEK_END), len(plaintext))
+      self.assertEqual(streaming_aead.key_attempts(ds), 1)
+    # Ciphertexts without a header are still decrypted.
+    with primitive.new_decrypting_stream(
+        io.BytesIO(legacy_ciphertext), b'aad') as ds:
+      self.assertEqual(ds.read(), plaintext)
+      self.assertEqual(streaming_aead.key_attempts(ds), 20)
+
+  def test_key_id_header_parallel_decrypt(self):
+    builder = keyset_builder.new_keyset_builder()
+    builder.add_new_key(TEMPLATE)
+    builder.set_primary_key(builder.add_new_key(TEMPLATE))
+    primitive = _primitive(
+        builder.keyset_handle(), parallel_workers=4, parallel_chunk_size=10000,
+        key_id_header=True)
+    plaintext = b' '.join(b'%d' % i for i in range(100 * 1000))
+    ciphertext = _encrypt(primitive, plaintext, b'aad')
+    with primitive.new_decrypting_stream(io.BytesIO(ciphertext), b'aad') as ds:
+      self.assertEqual(ds.read(), plaintext)
+      self.assertEqual(streaming_aead.key_attempts(ds), 1)
+
+  def test_key_id_header_of_unknown_key_fails(self):
+    p1 = _primitive(tink.new_keyset_handle(TEMPLATE), key_id_header=True)
+    p2 = tink.new_keyset_handle(TEMPLATE).primitive(
+        streaming_aead.StreamingAead)
+    ciphertext = _encrypt(p1, b'plaintext', b'aad')
+    with p2.new_decrypting_stream(io.BytesIO(ciphertext), b'aad') as ds:
+      with self.assertRaises(tink.TinkError):
+        ds.read()
+      self.assertEqual(streaming_aead.key_attempts(ds), 1)
+    with p1.new_decrypting_stream(
+        io.BytesIO(ciphertext), b'wrong aad') as ds:
+      with self.assertRaises(tink.TinkError):
+        ds.read()
+      # The key of the header, then the key on the whole ciphertext.
+      self.assertEqual(streaming_aead.key_attempts(ds), 2)
+
+  def test_rewind_window_bounds_buffered_bytes(self):
+    builder = keyset_builder.new_keyset_builder()
+    builder.add_new_key(TEMPLATE)
+    builder.set_primary_key(builder.add_new_key(TEMPLATE))
+    primitive = builder.keyset_handle().primitive(streaming_aead.StreamingAead)
+    plaintext = b' '.join(b'%d' % i for i in range(100 * 1000))
+    # The first key of the keyset fails, so the ciphertext is rewound once.
+    ciphertext = _encrypt(primitive, plaintext, b'aad')
+
+    with primitive.new_decrypting_stream(io.BytesIO(ciphertext), b'aad') as ds:
+      self.assertEqual(ds.read(), plaintext)
+      self.assertEqual(streaming_aead.key_attempts(ds), 2)
+      # The default window covers the 4 KB segment and the read-ahead.
+      self.assertBetween(
+          ds.raw._ciphertext_source.peak_buffered_bytes, 1,
+          4 * 1024 + 128 * 1024 + 100)
+
+    primitive = streaming_aead.with_options(
+        primitive, rewind_window_size=1000, read_ahead_size=500)
+    # The first key reads more than the 4 KB segment, so the second key can not
+    # be tried.
+    with primitive.new_decrypting_stream(io.BytesIO(ciphertext), b'aad') as ds:
+      with self.assertRaisesRegex(tink.TinkError, 'Cannot try another key'):
+        ds.read()
+      self.assertLessEqual(ds.raw._ciphertext_source.peak_buffered_bytes, 1000)
+
+  def test_default_rewind_window_covers_large_segments(self):
+    builder = keyset_builder.new_keyset_builder()
+    builder.add_new_key(LARGE_SEGMENT_TEMPLATE)
+    builder.set_primary_key(builder.add_new_key(LARGE_SEGMENT_TEMPLATE))
+    primitive = builder.keyset_handle().primitive(streaming_aead.StreamingAead)
+    plaintext = b' '.join(b'%d' % i for i in range(1000 * 1000))
+    # The first key of the keyset fails after it read its first 4 MiB segment,
+    # then the primary key is tried.
+    ciphertext = _encrypt(primitive, plaintext, b'aad')
+    self.assertGreater(len(ciphertext), 4 * 1024 * 1024)
+    with primitive.new_decrypting_stream(io.BytesIO(ciphertext), b'aad') as ds:
+      self.assertEqual(ds.read(), plaintext)
+      self.assertEqual(streaming_aead.key_attempts(ds), 2)
+    self.assertEqual(
+        b''.join(primitive.decrypt_iter([ciphertext], b'aad')), plaintext)
+
+  def test_rewind_window_smaller_than_read_ahead_fails(self):
+    with self.assertRaises(ValueError):
+      _primitive(
+          tink.new_keyset_handle(TEMPLATE), rewind_window_size=1000,
+          read_ahead_size=1000)
+
+  @parameterized.parameters([(0, 3), (64 * 1024, 40)])
+  def test_write_buffer_size(self, write_buffer_size, max_raw_writes):
+    primitive = _primitive(
+        tink.new_keyset_handle(
+            streaming_aead.streaming_aead_key_templates.AES128_GCM_HKDF_1MB),
+        write_buffer_size=write_buffer_size)
+    plaintext = b'0123456789' * 200 * 1000
+    with mock.patch.object(
+        _encrypting_stream.RawEncryptingStream, 'write', autospec=True,
+        side_effect=_encrypting_stream.RawEncryptingStream.write) as write:
+      ciphertext_dest = bytes_io.BytesIOWithValueAfterClose()
+      with primitive.new_encrypting_stream(ciphertext_dest, b'aad') as es:
+        for i in range(0, len(plaintext), 1000):
+          es.write(plaintext[i:i + 1000])
+      ciphertext = ciphertext_dest.value_after_close()
+    # By default, the 2 MB of plaintext are passed on a 1 MB segment at a time.
+    self.assertLessEqual(write.call_count, max_raw_writes)
+    with primitive.new_decrypting_stream(io.BytesIO(ciphertext), b'aad') as ds:
+      self.assertEqual(ds.read(), plaintext)
+
+  def test_negative_write_buffer_size_fails(self):
+    with self.assertRaises(ValueError):
+      _primitive(tink.new_keyset_handle(TEMPLATE), write_buffer_size=-1)
+
+  def test_encrypt_iter_decrypt_iter(self):
+    primitive = tink.new_keyset_handle(TEMPLATE).primitive(
+        streaming_aead.StreamingAead)
+    plaintext = b' '.join(b'%d' % i for i in range(100 * 1000))
+    chunks = [plaintext[i:i + 1000] for i in range(0, len(plaintext), 1000)]
+
+    ciphertext = b''.join(primitive.encrypt_iter(iter(chunks), b'aad'))
+    with primitive.new_decrypting_stream(io.BytesIO(ciphertext), b'aad') as ds:
+      self.assertEqual(ds.read(), plaintext)
+
+    output = list(primitive.decrypt_iter(
+        [ciphertext[i:i + 777] for i in range(0, len(ciphertext), 777)],
+        b'aad'))
+    self.assertEqual(b''.join(output), plaintext)
+    self.assertLessEqual(
+        max(len(c) for c in output), _streaming_aead.DECRYPT_ITER_CHUNK_SIZE)
+    self.assertEqual(
+        b''.join(primitive.decrypt_iter(
+            [_encrypt(primitive, plaintext, b'aad')], b'aad')), plaintext)
+
+  def test_encrypt_iter_decrypt_iter_default_implementation(self):
+    primitive = tink.new_keyset_handle(TEMPLATE).primitive(
+        streaming_aead.StreamingAead)
+    chunks = [b'plain', bytearray(b'text'), memoryview(b'!')]
+    ciphertext = b''.join(
+        _streaming_aead.StreamingAead.encrypt_iter(primitive, chunks, b'aad'))
+    self.assertEqual(
+        b''.join(primitive.decrypt_iter([ciphertext], b'aad')), b'plaintext!')
+    self.assertEqual(
+        b''.join(_streaming_aead.StreamingAead.decrypt_iter(
+            primitive, primitive.encrypt_iter(chunks, b'aad'), b'aad')),
+        b'plaintext!')
+
+  def test_encrypt_iter_is_lazy(self):
+    primitive = tink.new_keyset_handle(TEMPLATE).primitive(
+        streaming_aead.StreamingAead)
+    consumed = []
+
+    def plaintext_chunks():
+      for i in range(1000):
+        consumed.append(i)
+        yield b'x' * 1000
+
+    ciphertext_chunks = primitive.encrypt_iter(plaintext_chunks(), b'aad')
+    self.assertEmpty(consumed)
+    ciphertext = next(ciphertext_chunks)
+    # A 4 KB segment is written once 5 chunks of 1000 bytes were consumed.
+    self.assertLess(len(consumed), 10)
+    ciphertext += b''.join(ciphertext_chunks)
+    self.assertLen(consumed, 1000)
+
+    decrypted = primitive.decrypt_iter(
+        (ciphertext[i:i + 100] for i in range(0, len(ciphertext), 100)),
+        b'aad')
+    self.assertEqual(b''.join(decrypted), b'x' * 1000 * 1000)
+
+  def test_encrypt_iter_stopped_early(self):
+    primitive = tink.new_keyset_handle(TEMPLATE).primitive(
+        streaming_aead.StreamingAead)
+    ciphertext_chunks = primitive.encrypt_iter(
+        (b'x' * 1000 for _ in range(1000)), b'aad')
+    ciphertext = next(ciphertext_chunks)
+    ciphertext_chunks.close()
+    self.assertEmpty(list(ciphertext_chunks))
+    with self.assertRaises(tink.TinkError):
+      b''.join(primitive.decrypt_iter([ciphertext], b'aad'))
+
+  def test_encrypt_iter_plaintext_error_is_raised(self):
+    primitive = tink.new_keyset_handle(TEMPLATE).primitive(
+        streaming_aead.StreamingAead)
+
+    def plaintext_chunks():
+      yield b'x' * 10000
+      raise ValueError('plaintext error')
+
+    with self.assertRaisesRegex(ValueError, 'plaintext error'):
+      b''.join(primitive.encrypt_iter(plaintext_chunks(), b'aad'))
+
+  def test_encrypt_iter_decrypt_iter_empty(self):
+    primitive = tink.new_keyset_handle(TEMPLATE).primitive(
+        streaming_aead.StreamingAead)
+    ciphertext = b''.join(primitive.encrypt_iter([], b'aad'))
+    self.assertEqual(list(primitive.decrypt_iter([ciphertext], b'aad')), [])
+
+  def test_decrypt_iter_key_rotation_and_key_id_header(self):
+    builder = keyset_builder.new_keyset_builder()
+    older_key_id = builder.add_new_key(TEMPLATE)
+    builder.set_primary_key(older_key_id)
+    p1 = builder.keyset_handle().primitive(streaming_aead.StreamingAead)
+    builder.set_primary_key(builder.add_new_key(TEMPLATE))
+    p2 = builder.keyset_handle().primitive(streaming_aead.StreamingAead)
+    for encrypting_primitive in [p1, p2]:
+      ciphertext = b''.join(
+          encrypting_primitive.encrypt_iter([b'plaintext'], b'aad'))
+      self.assertEqual(
+          b''.join(p2.decrypt_iter([ciphertext], b'aad')), b'plaintext')
+
+    ciphertext = b''.join(
+        streaming_aead.with_options(p2, key_id_header=True).encrypt_iter(
+            [b'plaintext'], b'aad'))
+    self.assertEqual(ciphertext[:1], b'\x01')
+    with p2.new_decrypting_stream(io.BytesIO(ciphertext), b'aad') as ds:
+      self.assertEqual(ds.read(), b'plaintext')
+      self.assertEqual(streaming_aead.key_attempts(ds), 1)
+
+  def test_decrypt_iter_wrong_associated_data_fails(self):
+    primitive = tink.new_keyset_handle(TEMPLATE).primitive(
+        streaming_aead.StreamingAead)
+    ciphertext = b''.join(primitive.encrypt_iter([b'plaintext'], b'aad'))
+    with self.assertRaises(tink.TinkError):
+      list(primitive.decrypt_iter([ciphertext], b'bad aad'))
+
   def test_decrypt_tink_output_prefix(self):
     key = aes_gcm_hkdf_streaming_pb2.AesGcmHkdfStreamingKey(
         version=0,
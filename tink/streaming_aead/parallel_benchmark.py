@@ -0,0 +1,95 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Throughput benchmark of sequential and parallel streaming AEAD.
+
+Encrypts a plaintext of --size_mib MiB into a file in --dir, and decrypts it
+again, for every number of parallel workers in --workers. 0 workers is the
+sequential implementation.
+
+Example:
+  bazel run //tink/streaming_aead:parallel_benchmark -- \
+      --size_mib=10240 --workers=0,2,4,8 --dir=/mnt/scratch
+"""
+
+import os
+import tempfile
+import time
+
+from absl import app
+from absl import flags
+
+import tink
+from tink import streaming_aead
+
+
+_SIZE_MIB = flags.DEFINE_integer(
+    'size_mib', 10 * 1024, 'Size of the plaintext in MiB.')
+_WORKERS = flags.DEFINE_list(
+    'workers', ['0', '2', '4', str(os.cpu_count() or 1)],
+    'Numbers of parallel workers. 0 measures the sequential implementation.')
+_DIR = flags.DEFINE_string(
+    'dir', None, 'Directory of the ciphertext file. Defaults to a temporary '
+    'directory.')
+
+_MIB = 1024 * 1024
+
+
+def _encrypt(primitive: streaming_aead.StreamingAead, path: str) -> float:
+  """Encrypts --size_mib MiB to path and returns the throughput in MiB/s."""
+  block = os.urandom(_MIB)
+  start = time.perf_counter()
+  with open(path, 'wb') as f:
+    with primitive.new_encrypting_stream(f, b'aad') as es:
+      for _ in range(_SIZE_MIB.value):
+        es.write(block)
+  return _SIZE_MIB.value / (time.perf_counter() - start)
+
+
+def _decrypt(primitive: streaming_aead.StreamingAead, path: str) -> float:
+  """Decrypts path and returns the throughput in MiB/s."""
+  buffer = bytearray(_MIB)
+  total = 0
+  start = time.perf_counter()
+  with open(path, 'rb') as f:
+    with primitive.new_decrypting_stream(f, b'aad') as ds:
+      while n := ds.readinto(buffer):
+        total += n
+  elapsed = time.perf_counter() - start
+  if total != _SIZE_MIB.value * _MIB:
+    raise ValueError('Decrypted {} bytes instead of {}'.format(
+        total, _SIZE_MIB.value * _MIB))
+  return _SIZE_MIB.value / elapsed
+
+
+def main(argv):
+  del argv
+  streaming_aead.register()
+  keyset_handle = tink.new_keyset_handle(
+      streaming_aead.streaming_aead_key_templates.AES256_GCM_HKDF_1MB)
+
+  with tempfile.TemporaryDirectory(dir=_DIR.value) as directory:
+    path = os.path.join(directory, 'ciphertext')
+    print('%-8s %16s %16s' % ('workers', 'encrypt MiB/s', 'decrypt MiB/s'))
+    for workers in (int(s) for s in _WORKERS.value):
+      primitive = streaming_aead.with_options(
+          keyset_handle.primitive(streaming_aead.StreamingAead),
+          parallel_workers=workers)
+      encrypt = _encrypt(primitive, path)
+      decrypt = _decrypt(primitive, path)
+      print('%-8d %16.1f %16.1f' % (workers, encrypt, decrypt))
+
+
+if __name__ == '__main__':
+  app.run(main)
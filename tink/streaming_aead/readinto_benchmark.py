@@ -0,0 +1,107 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of read() and readinto() on decrypting streams.
+
+For both methods it reports the decryption throughput, and the peak number of
+Python heap bytes allocated while reading, measured with tracemalloc in a
+separate run. read() allocates a bytes object for every call, while readinto()
+decrypts into a buffer which the caller allocated before the measurement.
+
+Example:
+  bazel run //tink/streaming_aead:readinto_benchmark -- \
+      --size_mib=256 --read_size=1048576
+"""
+
+import io
+import os
+import time
+import tracemalloc
+from typing import BinaryIO, Callable
+
+from absl import app
+from absl import flags
+
+import tink
+from tink import streaming_aead
+from tink.testing import bytes_io
+
+
+_SIZE_MIB = flags.DEFINE_integer(
+    'size_mib', 256, 'Size of the plaintext in MiB.')
+_READ_SIZE = flags.DEFINE_integer(
+    'read_size', 1024 * 1024, 'Number of bytes requested by every read.')
+
+_MIB = 1024 * 1024
+
+
+_Method = Callable[[BinaryIO, bytearray], None]
+
+
+def _read(ds: BinaryIO, buffer: bytearray) -> None:
+  del buffer  # Unused.
+  while ds.read(_READ_SIZE.value):
+    pass
+
+
+def _readinto(ds: BinaryIO, buffer: bytearray) -> None:
+  while ds.readinto(buffer):
+    pass
+
+
+def _measure(primitive: streaming_aead.StreamingAead, ciphertext: bytes,
+             method: _Method) -> float:
+  """Returns the throughput of method in MiB/s."""
+  buffer = bytearray(_READ_SIZE.value)
+  start = time.perf_counter()
+  with primitive.new_decrypting_stream(io.BytesIO(ciphertext), b'aad') as ds:
+    method(ds, buffer)
+  return _SIZE_MIB.value / (time.perf_counter() - start)
+
+
+def _peak_bytes(primitive: streaming_aead.StreamingAead, ciphertext: bytes,
+                method: _Method) -> int:
+  """Returns the peak traced bytes allocated while reading with method."""
+  buffer = bytearray(_READ_SIZE.value)
+  with primitive.new_decrypting_stream(io.BytesIO(ciphertext), b'aad') as ds:
+    tracemalloc.start()
+    method(ds, buffer)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+  return peak
+
+
+def main(argv):
+  del argv
+  streaming_aead.register()
+  primitive = tink.new_keyset_handle(
+      streaming_aead.streaming_aead_key_templates.AES256_GCM_HKDF_1MB
+  ).primitive(streaming_aead.StreamingAead)
+
+  ciphertext_dest = bytes_io.BytesIOWithValueAfterClose()
+  block = os.urandom(_MIB)
+  with primitive.new_encrypting_stream(ciphertext_dest, b'aad') as es:
+    for _ in range(_SIZE_MIB.value):
+      es.write(block)
+  ciphertext = ciphertext_dest.value_after_close()
+
+  print('%-10s %14s %18s' % ('method', 'MiB/s', 'peak Python bytes'))
+  for name, method in (('read', _read), ('readinto', _readinto)):
+    throughput = _measure(primitive, ciphertext, method)
+    peak = _peak_bytes(primitive, ciphertext, method)
+    print('%-10s %14.1f %18d' % (name, throughput, peak))
+
+
+if __name__ == '__main__':
+  app.run(main)
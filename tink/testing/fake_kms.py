@@ -42,6 +42,9 @@ class FakeKmsClient(tink.KmsClient):
       return True
     return key_uri == self._key_uri
 
+  def key_uri_prefix(self) -> str:
+    return FAKE_KMS_PREFIX
+
   def get_aead(self, key_uri: str) -> aead.Aead:
     if not key_uri.startswith(FAKE_KMS_PREFIX):
       raise tink.TinkError('invalid key URI')